@@ -0,0 +1,130 @@
+"""
+체크포인트 벤치마크
+
+100단계 작업 계획을 흉내 내어 단계마다 체크포인트를 만들고 주기적으로 롤백하면서,
+기존 전체 복사 방식과 상태 저널(delta) 방식의 실행 시간과 최대 메모리 사용량을 비교합니다.
+
+사용법:
+    python -m benchmarks.checkpoint_benchmark --steps 100 --state-keys 20000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.workflow_manager import StepResult, StepStatus, WorkflowContext
+
+
+class CopyingWorkflowContext(WorkflowContext):
+    """기존 방식: 체크포인트마다 상태/실행 경로/결과 전체 복사"""
+    
+    def __post_init__(self):
+        self.state = dict(self.state)
+    
+    def create_checkpoint(self, checkpoint_id: str) -> None:
+        with self.lock:
+            self.checkpoints[checkpoint_id] = {
+                'state': self.state.copy(),
+                'execution_path': self.execution_path.copy(),
+                'results': {k: v for k, v in self.results.items()},
+                'time': time.time()
+            }
+    
+    def restore_checkpoint(self, checkpoint_id: str) -> bool:
+        if checkpoint_id not in self.checkpoints:
+            return False
+        
+        with self.lock:
+            checkpoint = self.checkpoints[checkpoint_id]
+            self.state = checkpoint['state'].copy()
+            
+            checkpoint_path = checkpoint['execution_path']
+            for step_id in self.execution_path[len(checkpoint_path):]:
+                if step_id in self.results:
+                    del self.results[step_id]
+            
+            self.execution_path = checkpoint_path.copy()
+        return True
+
+
+def run_plan(context_class: type, steps: int, state_keys: int, rollback_every: int) -> Dict[str, Any]:
+    """단계마다 체크포인트를 만드는 작업 계획 실행 흉내
+    
+    Args:
+        context_class: 작업 흐름 컨텍스트 클래스
+        steps: 단계 수
+        state_keys: 초기 상태 키 수 (수집한 데이터 등)
+        rollback_every: 롤백 주기 (해당 단계에서 한 번 실패 후 직전 체크포인트로 복원)
+        
+    Returns:
+        실행 시간, 최대 메모리, 체크포인트 작업 시간
+    """
+    initial_state = {f"row_{i}": {'id': i, 'text': f"항목 {i}"} for i in range(state_keys)}
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    checkpoint_time = 0.0
+    
+    context = context_class(workflow_id='benchmark', state=initial_state)
+    step = 0
+    failed_once = set()
+    while step < steps:
+        step_id = f"step_{step}"
+        
+        t = time.perf_counter()
+        context.create_checkpoint(step_id)
+        checkpoint_time += time.perf_counter() - t
+        
+        output = {'current_url': f"https://example.com/{step}", f"page_{step}": list(range(100))}
+        context.update_state(output)
+        
+        if rollback_every and step % rollback_every == rollback_every - 1 and step not in failed_once:
+            # 단계 실패 → 체크포인트로 롤백 후 재실행
+            failed_once.add(step)
+            context.set_step_result(step_id, StepResult(status=StepStatus.FAILED, error="benchmark"))
+            t = time.perf_counter()
+            context.restore_checkpoint(step_id)
+            checkpoint_time += time.perf_counter() - t
+            continue
+        
+        context.set_step_result(step_id, StepResult(status=StepStatus.COMPLETED, output=output))
+        step += 1
+    
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {'time': elapsed, 'checkpoint_time': checkpoint_time, 'peak_memory': peak,
+            'final_keys': len(context.state)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="체크포인트 방식별 시간/메모리 비교")
+    parser.add_argument('--steps', type=int, default=100, help="작업 계획 단계 수")
+    parser.add_argument('--state-keys', type=int, default=20000, help="초기 상태 키 수")
+    parser.add_argument('--rollback-every', type=int, default=10, help="롤백 주기 (0이면 롤백 없음)")
+    args = parser.parse_args()
+    
+    results = {
+        'copy': run_plan(CopyingWorkflowContext, args.steps, args.state_keys, args.rollback_every),
+        'journal': run_plan(WorkflowContext, args.steps, args.state_keys, args.rollback_every)
+    }
+    assert results['copy']['final_keys'] == results['journal']['final_keys']
+    
+    print(f"단계: {args.steps}, 초기 상태 키: {args.state_keys}, 롤백 주기: {args.rollback_every}")
+    print(f"{'방식':<10}{'전체(ms)':>12}{'체크포인트(ms)':>16}{'최대 메모리(MB)':>18}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['time'] * 1000:>12.1f}{result['checkpoint_time'] * 1000:>16.1f}"
+              f"{result['peak_memory'] / 1024 / 1024:>18.1f}")
+    
+    copy_result, journal_result = results['copy'], results['journal']
+    print(f"체크포인트 시간 {copy_result['checkpoint_time'] / max(journal_result['checkpoint_time'], 1e-9):.0f}배 단축, "
+          f"최대 메모리 {(copy_result['peak_memory'] - journal_result['peak_memory']) / 1024 / 1024:.1f}MB 절감")
+
+
+if __name__ == '__main__':
+    main()
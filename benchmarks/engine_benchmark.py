@@ -0,0 +1,319 @@
+"""
+작업 흐름 엔진 벤치마크
+
+가짜 자동화/인식 플러그인으로 브라우저 지연과 분리된 WorkflowManager.execute_workflow 자체의 비용을 측정합니다.
+계획 모양(linear, dag, loop, state_heavy)과 크기별로 초당 단계 수, 단계당 엔진 오버헤드(흉내 낸 지연 제외),
+반복 실행 시 메모리 증가량과 최대 메모리, 단계당 체크포인트 비용(체크포인트 생성 호출 시간을 직접 측정)을 기록합니다.
+결과는 JSON으로 저장되며, --compare로 이전 결과와 비교해 지표별 회귀를 확인할 수 있습니다.
+
+사용법:
+    python -m benchmarks.engine_benchmark --shapes linear dag --sizes 10 100 --output results/engine.json
+    python -m benchmarks.engine_benchmark --latency 5 --action-latency navigate=200 --compare results/engine.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_plugins import SimulatedLatency, install_fake_plugins
+from benchmarks.synthetic_plans import PLAN_SHAPES, build_plan, register_benchmark_steps
+from core.plugin_system import PluginManager
+from core.workflow_journal import WorkflowJournal
+from core.workflow_manager import WorkflowContext, WorkflowManager, WorkflowStatus
+
+# 비교 지표: (결과 키, 이름, 클수록 좋은지 여부, 회귀로 보기 위한 최소 절대 변화량)
+# 최소 변화량은 측정 잡음이 큰 작은 값의 비율 변화를 회귀로 보지 않기 위한 것
+COMPARED_METRICS = (
+    ('steps_per_sec', '초당 단계 수', True, 0.0),
+    ('overhead_per_step_ms', '단계당 오버헤드(ms)', False, 0.005),
+    ('checkpoint_cost_per_step_ms', '단계당 체크포인트(ms)', False, 0.005),
+    ('memory_growth_per_run', '실행당 메모리 증가(B)', False, 1024.0),
+    ('peak_memory', '최대 메모리(B)', False, 16 * 1024.0)
+)
+
+
+class EngineBench:
+    """가짜 플러그인을 설치한 작업 흐름 관리자로 계획을 반복 실행하는 측정기"""
+    
+    def __init__(self, latency: SimulatedLatency, list_size: int, journal_dir: str = None):
+        """측정기 초기화
+        
+        Args:
+            latency: 가짜 플러그인 지연 시간 흉내
+            list_size: 가짜 extract_list 행 수 (loop 계획 최대 크기)
+            journal_dir: 저널 디렉토리 (None이면 저널 없이 측정)
+        """
+        self.logger = logging.getLogger('benchmark')
+        self.logger.setLevel(logging.WARNING)
+        
+        plugin_manager = PluginManager(logger=self.logger)
+        self.latency = install_fake_plugins(plugin_manager, latency, list_size)
+        self.journal = WorkflowJournal(directory=journal_dir, logger=self.logger) if journal_dir else None
+        self.manager = WorkflowManager(plugin_manager, logger=self.logger, journal=self.journal,
+                                       tracing_enabled=False)
+        register_benchmark_steps(self.manager)
+    
+    def run_once(self, plan: Dict[str, Any]) -> Tuple[float, float]:
+        """계획 한 번 실행
+        
+        Args:
+            plan: 작업 계획
+        
+        Returns:
+            (실행 시간(초), 흉내 낸 지연 시간(초))
+        
+        Raises:
+            RuntimeError: 작업 흐름이 완료되지 않은 경우
+        """
+        self.latency.reset()
+        start = time.perf_counter()
+        workflow_id = self.manager.create_workflow(plan, {'workflow_plan': plan})
+        result = self.manager.execute_workflow(workflow_id)
+        elapsed = time.perf_counter() - start
+        self.manager.cleanup_workflow(workflow_id)
+        
+        if result.get('status') != WorkflowStatus.COMPLETED.value:
+            raise RuntimeError(f"벤치마크 작업 흐름 실패: {result.get('error')}")
+        return elapsed, self.latency.total
+    
+    def time_plan(self, plan: Dict[str, Any], repeat: int) -> Tuple[float, float]:
+        """계획을 repeat번 실행한 실행 시간/지연 시간 중앙값 (첫 실행은 준비 실행으로 제외)"""
+        self.run_once(plan)
+        runs = [self.run_once(plan) for _ in range(repeat)]
+        return statistics.median(run[0] for run in runs), statistics.median(run[1] for run in runs)
+    
+    def time_checkpoints(self, plan: Dict[str, Any], repeat: int) -> float:
+        """체크포인트 생성 호출 시간 직접 측정
+        
+        두 실행의 시간 차이가 아니라 WorkflowContext.create_checkpoint 호출 자체를 재므로 음수가 되지 않습니다.
+        
+        Args:
+            plan: 체크포인트를 만드는 작업 계획
+            repeat: 측정 반복 횟수 (첫 실행은 준비 실행으로 제외)
+        
+        Returns:
+            실행 한 번의 체크포인트 생성 시간 합계 중앙값(초)
+        """
+        original = WorkflowContext.create_checkpoint
+        durations: List[float] = []  # 병렬 단계에서도 안전하도록 호출마다 추가
+        
+        def timed_create_checkpoint(context: WorkflowContext, checkpoint_id: str) -> None:
+            start = time.perf_counter()
+            try:
+                original(context, checkpoint_id)
+            finally:
+                durations.append(time.perf_counter() - start)
+        
+        WorkflowContext.create_checkpoint = timed_create_checkpoint
+        try:
+            self.run_once(plan)
+            totals = []
+            for _ in range(repeat):
+                durations.clear()
+                self.run_once(plan)
+                totals.append(sum(durations))
+        finally:
+            WorkflowContext.create_checkpoint = original
+        return statistics.median(totals)
+    
+    def measure_memory(self, plan: Dict[str, Any], runs: int) -> Dict[str, float]:
+        """반복 실행 시 메모리 증가량과 실행 한 번의 최대 메모리 측정
+        
+        Args:
+            plan: 작업 계획
+            runs: 반복 실행 횟수
+        
+        Returns:
+            실행당 메모리 증가량(바이트), 최대 메모리(바이트)
+        """
+        tracemalloc.start()
+        try:
+            self.run_once(plan)
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self.run_once(plan)
+            _, peak = tracemalloc.get_traced_memory()
+            
+            for _ in range(runs - 1):
+                self.run_once(plan)
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        return {'memory_growth_per_run': (current - baseline) / max(1, runs),
+                'peak_memory': peak - baseline}
+    
+    def close(self) -> None:
+        """저널 닫기"""
+        if self.journal:
+            self.journal.close()
+
+
+def benchmark_case(bench: EngineBench, shape: str, size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """계획 모양/크기 하나 측정
+    
+    Args:
+        bench: 측정기
+        shape: 계획 모양
+        size: 계획 크기
+        args: 명령행 인자
+    
+    Returns:
+        측정 결과
+    """
+    plan, steps = build_plan(shape, size, payload_size=args.payload_size)
+    checkpoint_plan, _ = build_plan(shape, size, checkpoint=True, payload_size=args.payload_size)
+    
+    elapsed, latency = bench.time_plan(plan, args.repeat)
+    checkpoint_time = bench.time_checkpoints(checkpoint_plan, args.repeat)
+    memory = bench.measure_memory(plan, args.memory_runs)
+    
+    return {
+        'shape': shape,
+        'size': size,
+        'steps': steps,
+        'time': elapsed,
+        'simulated_latency': latency,
+        'steps_per_sec': steps / elapsed if elapsed > 0 else 0.0,
+        # DAG/반복 병렬 실행에서는 지연이 겹치므로 순차 계획에서만 정확함
+        'overhead_per_step_ms': (elapsed - latency) / steps * 1000,
+        'checkpoint_cost_per_step_ms': checkpoint_time / steps * 1000,
+        'memory_growth_per_run': memory['memory_growth_per_run'],
+        'peak_memory': memory['peak_memory']
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except Exception:
+        return None
+
+
+def _parse_action_latencies(values: List[str]) -> Dict[str, float]:
+    """'액션=밀리초' 목록을 액션 -> 초 사전으로 변환"""
+    latencies = {}
+    for value in values:
+        action, _, ms = value.partition('=')
+        if not ms:
+            raise argparse.ArgumentTypeError(f"액션 지연 형식 오류 (액션=밀리초): {value}")
+        latencies[action] = float(ms) / 1000
+    return latencies
+
+
+def compare_results(current: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[str]:
+    """이전 결과와 지표별로 비교해 회귀 목록 출력 (COMPARED_METRICS)
+    
+    Args:
+        current: 현재 측정 결과
+        baseline: 이전 측정 결과
+        threshold: 회귀로 볼 변화 비율 (0.1이면 10%)
+    
+    Returns:
+        회귀한 항목 설명 목록
+    """
+    previous = {(result['shape'], result['size']): result for result in baseline}
+    regressions = []
+    
+    print(f"\n{'계획':<20}{'지표':<24}{'현재':>14}{'이전':>14}{'변화':>10}")
+    for result in current:
+        old = previous.get((result['shape'], result['size']))
+        if old is None:
+            continue
+        
+        name = f"{result['shape']}/{result['size']}"
+        for key, label, higher_is_better, min_delta in COMPARED_METRICS:
+            if key not in result or key not in old:
+                continue
+            value, old_value = result[key], old[key]
+            change = value / old_value - 1 if old_value else 0.0
+            print(f"{name:<20}{label:<24}{value:>14.3f}{old_value:>14.3f}{change:>+10.1%}")
+            
+            worse = -change if higher_is_better else change
+            if worse > threshold and abs(value - old_value) > min_delta:
+                regressions.append(f"{name}: {label} {change:+.1%}")
+    
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="가짜 플러그인으로 작업 흐름 엔진 오버헤드 측정")
+    parser.add_argument('--shapes', nargs='+', default=list(PLAN_SHAPES), choices=list(PLAN_SHAPES),
+                        help="측정할 계획 모양")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 100], help="계획 크기 (단계 수/반복 수)")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--memory-runs', type=int, default=20, help="메모리 증가량 측정 반복 횟수")
+    parser.add_argument('--payload-size', type=int, default=1024, help="계산 단계 출력 크기(바이트)")
+    parser.add_argument('--latency', type=float, default=0.0, help="모든 액션의 흉내 지연(밀리초)")
+    parser.add_argument('--action-latency', nargs='*', default=[], help="액션별 흉내 지연 (예: navigate=200)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="지연 변동 비율 (고정 시드)")
+    parser.add_argument('--journal', action='store_true', help="디스크 저널을 켜고 측정")
+    parser.add_argument('--output', help="결과 JSON 파일 (기본: benchmarks/results/engine-<시각>.json)")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--threshold', type=float, default=0.1, help="회귀로 볼 지표 악화 비율")
+    args = parser.parse_args()
+    
+    latency = SimulatedLatency(_parse_action_latencies(args.action_latency), default=args.latency / 1000,
+                               jitter=args.jitter)
+    journal_dir = tempfile.mkdtemp(prefix='bench-journal-') if args.journal else None
+    bench = EngineBench(latency, list_size=max(args.sizes), journal_dir=journal_dir)
+    
+    results = []
+    print(f"{'계획':<20}{'단계':>8}{'단계/초':>12}{'오버헤드(ms)':>14}{'체크포인트(ms)':>16}"
+          f"{'메모리 증가(KB/회)':>20}{'최대 메모리(KB)':>18}")
+    try:
+        for shape in args.shapes:
+            for size in args.sizes:
+                result = benchmark_case(bench, shape, size, args)
+                results.append(result)
+                print(f"{shape + '/' + str(size):<20}{result['steps']:>8}{result['steps_per_sec']:>12.1f}"
+                      f"{result['overhead_per_step_ms']:>14.3f}{result['checkpoint_cost_per_step_ms']:>16.3f}"
+                      f"{result['memory_growth_per_run'] / 1024:>20.1f}{result['peak_memory'] / 1024:>18.1f}")
+    finally:
+        bench.close()
+        if journal_dir:
+            shutil.rmtree(journal_dir, ignore_errors=True)
+    
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results',
+                                         f"engine-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'meta': {
+                'time': datetime.now().isoformat(),
+                'commit': _git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'args': vars(args)
+            },
+            'results': results
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline.get('results', []), args.threshold)
+        if regressions:
+            print("\n회귀 발견:\n  " + "\n  ".join(regressions))
+            return 1
+        print("\n회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+벤치마크용 가짜 플러그인
+
+브라우저 없이 작업 흐름 엔진 자체의 오버헤드를 측정하기 위한 메모리 내 자동화/인식 플러그인입니다.
+액션별 지연 시간을 설정해 브라우저 지연을 흉내 낼 수 있으며, 지터는 고정 시드로 계산되어 실행마다 같습니다.
+자동화 플러그인은 playwright_automation ID로 등록되어 기본 단계 핸들러가 그대로 사용합니다.
+"""
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+from core.plugin_system import PluginInfo, PluginType
+from plugins.automation.base import AutomationPlugin
+from plugins.recognition.base import RecognitionMethod, RecognitionPlugin, RecognitionResult, RecognitionTarget
+
+
+class SimulatedLatency:
+    """액션별 지연 시간 흉내 (스레드 안전, 고정 시드 지터)"""
+    
+    def __init__(self, latencies: Dict[str, float] = None, default: float = 0.0, jitter: float = 0.0,
+                 seed: int = 0):
+        """지연 시간 초기화
+        
+        Args:
+            latencies: 액션 -> 지연 시간(초)
+            default: 지정되지 않은 액션의 지연 시간(초)
+            jitter: 지연 시간 변동 비율 (0.1이면 ±10%)
+            seed: 지터 난수 시드
+        """
+        self.latencies = dict(latencies or {})
+        self.default = default
+        self.jitter = jitter
+        self.total = 0.0  # 흉내 낸 지연 시간 합계(초)
+        self.calls: Dict[str, int] = {}  # 액션 -> 호출 횟수
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def wait(self, action: str) -> None:
+        """액션 지연 시간만큼 대기"""
+        delay = self.latencies.get(action, self.default)
+        with self._lock:
+            if delay > 0 and self.jitter > 0:
+                delay *= 1.0 + self._random.uniform(-self.jitter, self.jitter)
+            self.total += delay
+            self.calls[action] = self.calls.get(action, 0) + 1
+        if delay > 0:
+            time.sleep(delay)
+    
+    def reset(self) -> None:
+        """합계/호출 횟수 초기화"""
+        with self._lock:
+            self.total = 0.0
+            self.calls = {}
+
+
+class FakeAutomationPlugin(AutomationPlugin):
+    """메모리 내 가짜 브라우저 자동화 플러그인"""
+    
+    def __init__(self, latency: SimulatedLatency = None, list_size: int = 20):
+        """플러그인 초기화
+        
+        Args:
+            latency: 지연 시간 흉내 (None이면 지연 없음)
+            list_size: extract_list가 반환할 행 수
+        """
+        super().__init__()
+        self.latency = latency or SimulatedLatency()
+        self.list_size = list_size
+        self.url = 'about:blank'
+    
+    @classmethod
+    def get_plugin_info(cls) -> PluginInfo:
+        return PluginInfo(
+            id="playwright_automation",
+            name="Fake Playwright",
+            description="벤치마크용 메모리 내 브라우저 자동화",
+            version="1.0.0",
+            plugin_type=PluginType.AUTOMATION
+        )
+    
+    def initialize(self, config: Dict[str, Any] = None) -> bool:
+        return super().initialize(config)
+    
+    def cleanup(self) -> None:
+        super().cleanup()
+    
+    def execute_action(self, action_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        if not self._initialized:
+            return self._create_result(False, "Plugin not initialized")
+        
+        params = params or {}
+        self.latency.wait(action_type)
+        
+        if action_type == 'navigate':
+            self.url = params.get('url', self.url)
+            return self._create_result(True, url=self.url, status=200)
+        if action_type == 'get_url':
+            return self._create_result(True, url=self.url)
+        if action_type == 'get_page':
+            return self._create_result(True, page={'url': self.url})
+        if action_type == 'extract_list':
+            items = [{'index': i, 'text': f"행 {i}", 'url': f"{self.url}#row-{i}"} for i in range(self.list_size)]
+            return self._create_result(True, items=items, count=len(items), total=len(items), has_next=False)
+        if action_type == 'evaluate':
+            return self._create_result(True, result=True)
+        if action_type == 'find_element':
+            return self._create_result(True, element={'selector': params.get('selector')})
+        if action_type in ('click', 'type', 'press', 'keyboard_press', 'wait_for_load', 'wait_for_selector',
+                           'screenshot'):
+            return self._create_result(True)
+        
+        return self._create_result(False, f"지원하지 않는 액션: {action_type}")
+
+
+class FakeRecognitionPlugin(RecognitionPlugin):
+    """항상 같은 요소를 찾는 가짜 선택자 인식 플러그인"""
+    
+    def __init__(self, latency: SimulatedLatency = None, confidence: float = 0.95):
+        """플러그인 초기화
+        
+        Args:
+            latency: 지연 시간 흉내 (None이면 지연 없음)
+            confidence: 인식 신뢰도
+        """
+        super().__init__()
+        self.latency = latency or SimulatedLatency()
+        self.confidence = confidence
+    
+    @classmethod
+    def get_plugin_info(cls) -> PluginInfo:
+        return PluginInfo(
+            id="fake_selector_recognition",
+            name="Fake Selector",
+            description="벤치마크용 가짜 선택자 인식",
+            version="1.0.0",
+            plugin_type=PluginType.RECOGNITION,
+            priority=100
+        )
+    
+    def initialize(self, config: Dict[str, Any] = None) -> bool:
+        return super().initialize(config)
+    
+    def cleanup(self) -> None:
+        super().cleanup()
+    
+    def recognize(self, context: Any, target: Union[Dict[str, Any], RecognitionTarget],
+                  timeout: float = None) -> RecognitionResult:
+        self.latency.wait('recognize')
+        description = target.description if isinstance(target, RecognitionTarget) else str(target)
+        return RecognitionResult(
+            success=True,
+            confidence=self.confidence,
+            method=RecognitionMethod.SELECTOR,
+            target=target if isinstance(target, RecognitionTarget) else None,
+            element={'selector': f"[data-bench='{description}']", 'tag': 'button'},
+            location=(10, 10, 100, 30)
+        )
+
+
+def install_fake_plugins(plugin_manager: Any, latency: Optional[SimulatedLatency] = None,
+                         list_size: int = 20) -> SimulatedLatency:
+    """가짜 플러그인 등록 및 초기화
+    
+    Args:
+        plugin_manager: 플러그인 관리자
+        latency: 두 플러그인이 공유할 지연 시간 흉내 (None이면 지연 없음)
+        list_size: extract_list가 반환할 행 수
+    
+    Returns:
+        지연 시간 흉내 (흉내 낸 지연 시간 합계 확인용)
+    """
+    latency = latency or SimulatedLatency()
+    for plugin in (FakeAutomationPlugin(latency, list_size), FakeRecognitionPlugin(latency)):
+        plugin_manager.register_plugin(plugin)
+        plugin_manager.initialize_plugin(plugin.get_plugin_info().id)
+    return latency
@@ -0,0 +1,167 @@
+"""
+벤치마크용 합성 작업 계획
+
+크기와 모양을 바꿔 가며 작업 흐름 엔진을 측정하기 위한 작업 계획 생성기입니다.
+- linear: 탐색 → 인식 → 키 입력 → 로드 대기를 반복하는 순차 계획
+- dag: 탐색 뒤 여러 갈래의 계산 단계가 갈라졌다가 합쳐지는 DAG 계획
+- loop: 목록을 추출해 행마다 본문 단계를 실행하는 foreach 계획
+- state_heavy: 앞 단계 출력을 참조하며 큰 값을 상태에 쌓는 계산 단계 계획
+계산 단계(bench_compute)는 플러그인을 부르지 않는 단계로, register_benchmark_steps()로 등록합니다.
+"""
+from typing import Any, Callable, Dict, Tuple
+
+
+def _compute_handler(context: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    """계산 단계 핸들러: payload_size 바이트의 값을 output_key로 출력"""
+    size = int(params.get('payload_size', 0))
+    return {params.get('output_key', 'bench_value'): 'x' * size, 'bench_source': params.get('source')}
+
+
+def register_benchmark_steps(workflow_manager: Any) -> None:
+    """벤치마크 전용 단계 유형 등록
+    
+    Args:
+        workflow_manager: 작업 흐름 관리자
+    """
+    workflow_manager.register_step_handler('bench_compute', _compute_handler)
+
+
+def _step(step_id: str, step_type: str, params: Dict[str, Any], checkpoint: bool, **extra: Any) -> Dict[str, Any]:
+    step = {'id': step_id, 'type': step_type, 'params': params}
+    if checkpoint:
+        step['checkpoint'] = True
+    step.update(extra)
+    return step
+
+
+def linear_plan(size: int, checkpoint: bool = False, payload_size: int = 0) -> Tuple[Dict[str, Any], int]:
+    """순차 계획 (탐색/인식/키 입력/로드 대기 반복)
+    
+    Args:
+        size: 단계 수
+        checkpoint: 단계마다 체크포인트 생성 여부
+        payload_size: 사용하지 않음 (다른 생성기와 인터페이스 통일)
+    
+    Returns:
+        (작업 계획, 실행될 단계 수)
+    """
+    steps = []
+    for i in range(size):
+        kind = i % 4
+        if kind == 0:
+            steps.append(_step(f"nav_{i}", 'web_navigation', {'url': f"https://bench.local/page/{i}"}, checkpoint))
+        elif kind == 1:
+            steps.append(_step(f"find_{i}", 'element_recognition',
+                               {'target': {'type': 'button', 'description': f"버튼 {i}"}, 'strategies': ['selector']},
+                               checkpoint))
+        elif kind == 2:
+            steps.append(_step(f"key_{i}", 'key_press', {'key': 'Enter', 'element_from_step': f"find_{i - 1}"},
+                               checkpoint))
+        else:
+            steps.append(_step(f"load_{i}", 'wait_for_load', {'timeout': 5.0}, checkpoint))
+    return {'steps': steps}, size
+
+
+def dag_plan(size: int, checkpoint: bool = False, payload_size: int = 0, width: int = 4) -> Tuple[Dict[str, Any], int]:
+    """DAG 계획 (탐색 → width개 갈래의 계산 단계 → 합치기)
+    
+    Args:
+        size: 단계 수 (탐색/합치기 포함)
+        checkpoint: 단계마다 체크포인트 생성 여부
+        payload_size: 계산 단계 출력 크기(바이트)
+        width: 갈래 수
+    
+    Returns:
+        (작업 계획, 실행될 단계 수)
+    """
+    steps = [_step('nav', 'web_navigation', {'url': "https://bench.local/dag"}, checkpoint)]
+    branch_steps = max(width, size - 2)
+    tails = []
+    for i in range(branch_steps):
+        branch = i % width
+        previous = tails[branch] if branch < len(tails) else 'nav'
+        step_id = f"branch_{branch}_{i // width}"
+        steps.append(_step(step_id, 'bench_compute',
+                           {'payload_size': payload_size, 'output_key': f"branch_{branch}", 'source': step_id},
+                           checkpoint, depends_on=[previous]))
+        if branch < len(tails):
+            tails[branch] = step_id
+        else:
+            tails.append(step_id)
+    steps.append(_step('join', 'bench_compute', {'output_key': 'joined', 'source': 'join'}, checkpoint,
+                       depends_on=tails))
+    return {'execution_mode': 'dag', 'steps': steps}, len(steps)
+
+
+def loop_plan(size: int, checkpoint: bool = False, payload_size: int = 0) -> Tuple[Dict[str, Any], int]:
+    """foreach 계획 (목록 추출 후 행마다 인식/계산 본문 실행)
+    
+    Args:
+        size: 반복 횟수 (가짜 플러그인의 extract_list 행 수보다 크면 행 수로 제한)
+        checkpoint: 반복 전후 단계의 체크포인트 생성 여부 (본문 단계는 체크포인트를 쓸 수 없음)
+        payload_size: 본문 계산 단계 출력 크기(바이트)
+    
+    Returns:
+        (작업 계획, 실행될 단계 수 (본문 단계 포함))
+    """
+    body = [
+        {'id': 'row_find', 'type': 'element_recognition',
+         'params': {'target': {'type': 'link', 'description': '$row.text'}, 'strategies': ['selector']}},
+        {'id': 'row_compute', 'type': 'bench_compute',
+         'params': {'payload_size': payload_size, 'output_key': 'row_value', 'source': '$row.url'}}
+    ]
+    steps = [
+        _step('nav', 'web_navigation', {'url': "https://bench.local/list"}, checkpoint),
+        _step('rows', 'foreach', {'extract': {'selector': 'tr.row', 'fields': {'text': 'td', 'url': 'a@href'}},
+                                  'as': 'row', 'max_items': size, 'sink': {'type': 'memory', 'max_records': 100}},
+              checkpoint, steps=body)
+    ]
+    return {'steps': steps}, 2 + size * len(body)
+
+
+def state_heavy_plan(size: int, checkpoint: bool = False, payload_size: int = 4096) -> Tuple[Dict[str, Any], int]:
+    """상태 누적 계획 (계산 단계마다 새 상태 키에 큰 값을 출력하고 직전 출력을 참조)
+    
+    Args:
+        size: 단계 수
+        checkpoint: 단계마다 체크포인트 생성 여부
+        payload_size: 단계 출력 크기(바이트)
+    
+    Returns:
+        (작업 계획, 실행될 단계 수)
+    """
+    steps = []
+    for i in range(size):
+        source = f"$value_{i - 1}" if i > 0 else None
+        steps.append(_step(f"compute_{i}", 'bench_compute',
+                           {'payload_size': payload_size, 'output_key': f"value_{i}", 'source': source},
+                           checkpoint))
+    return {'steps': steps}, size
+
+
+PLAN_SHAPES: Dict[str, Callable[..., Tuple[Dict[str, Any], int]]] = {
+    'linear': linear_plan,
+    'dag': dag_plan,
+    'loop': loop_plan,
+    'state_heavy': state_heavy_plan
+}
+
+
+def build_plan(shape: str, size: int, checkpoint: bool = False, payload_size: int = 0) -> Tuple[Dict[str, Any], int]:
+    """모양 이름으로 작업 계획 생성
+    
+    Args:
+        shape: 계획 모양 (PLAN_SHAPES의 키)
+        size: 계획 크기
+        checkpoint: 단계마다 체크포인트 생성 여부
+        payload_size: 계산 단계 출력 크기(바이트)
+    
+    Returns:
+        (작업 계획, 실행될 단계 수)
+    
+    Raises:
+        ValueError: 알 수 없는 모양
+    """
+    if shape not in PLAN_SHAPES:
+        raise ValueError(f"알 수 없는 계획 모양: {shape} (사용 가능: {', '.join(PLAN_SHAPES)})")
+    return PLAN_SHAPES[shape](size, checkpoint=checkpoint, payload_size=payload_size)
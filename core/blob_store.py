@@ -0,0 +1,158 @@
+"""
+단계 출력 블롭 저장소 모듈
+
+이 모듈은 큰 단계 출력 값(DOM, 페이지 텍스트 등)을 디스크에 저장하고 핸들(BlobRef)로 참조하는 저장소를 구현합니다.
+작업 흐름 컨텍스트는 단계 결과에 값 대신 핸들만 보관하므로, 단계가 많은 작업 흐름에서도 메모리 사용량이 늘지 않습니다.
+블롭은 작업 흐름 ID별 디렉토리에 저장되어 작업 흐름 정리 시 함께 삭제됩니다.
+"""
+import logging
+import os
+import pickle
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    """디스크 블롭 핸들"""
+    namespace: str  # 네임스페이스 (작업 흐름 ID)
+    blob_id: str  # 블롭 ID
+    size: int  # 직렬화된 크기(바이트)
+    
+    def to_json(self) -> Dict[str, Any]:
+        """JSON 표현 (저널/작업 결과용)"""
+        return {'__blob__': self.blob_id, 'namespace': self.namespace, 'size': self.size}
+    
+    @classmethod
+    def from_json(cls, data: Any) -> Optional['BlobRef']:
+        """JSON 표현에서 핸들 복원 (블롭 표현이 아니면 None)"""
+        if isinstance(data, dict) and '__blob__' in data:
+            return cls(namespace=data.get('namespace', ''), blob_id=data['__blob__'], size=data.get('size', 0))
+        return None
+
+
+def estimate_size(value: Any, limit: int) -> int:
+    """값의 대략적인 메모리 크기(바이트) 추정
+    
+    문자열/바이트 길이를 재귀적으로 합산하며, limit을 넘으면 바로 반환합니다.
+    
+    Args:
+        value: 값
+        limit: 추정을 멈출 크기
+    
+    Returns:
+        추정 크기
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    
+    total = 0
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple)):
+        items = ((None, item) for item in value)
+    else:
+        return 8
+    
+    for key, item in items:
+        total += estimate_size(item, limit - total) + (len(key) if isinstance(key, str) else 8)
+        if total > limit:
+            break
+    return total
+
+
+class BlobStore:
+    """디스크 블롭 저장소"""
+    
+    def __init__(self, directory: str, logger=None):
+        """저장소 초기화
+        
+        Args:
+            directory: 블롭 디렉토리
+            logger: 로거 객체
+        """
+        self.directory = directory
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        
+        # 통계
+        self._written = 0
+        self._bytes_written = 0
+        self._reads = 0
+        
+        os.makedirs(directory, exist_ok=True)
+    
+    def _namespace_dir(self, namespace: str) -> str:
+        """네임스페이스 디렉토리 경로"""
+        safe_namespace = "".join(c if c.isalnum() or c in '-_.' else '_' for c in namespace)
+        return os.path.join(self.directory, safe_namespace)
+    
+    def put(self, namespace: str, value: Any) -> Optional[BlobRef]:
+        """값 저장
+        
+        Args:
+            namespace: 네임스페이스 (작업 흐름 ID)
+            value: 저장할 값
+        
+        Returns:
+            블롭 핸들 또는 None (직렬화할 수 없는 값)
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.debug(f"블롭으로 저장할 수 없는 값: {type(value).__name__} - {str(e)}")
+            return None
+        
+        blob_id = uuid.uuid4().hex
+        directory = self._namespace_dir(namespace)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{blob_id}.pkl"), 'wb') as f:
+            f.write(data)
+        
+        with self._lock:
+            self._written += 1
+            self._bytes_written += len(data)
+        return BlobRef(namespace=namespace, blob_id=blob_id, size=len(data))
+    
+    def get(self, ref: BlobRef) -> Any:
+        """값 읽기
+        
+        Args:
+            ref: 블롭 핸들
+        
+        Returns:
+            저장된 값
+        
+        Raises:
+            FileNotFoundError: 블롭이 삭제된 경우
+        """
+        with open(os.path.join(self._namespace_dir(ref.namespace), f"{ref.blob_id}.pkl"), 'rb') as f:
+            value = pickle.load(f)
+        
+        with self._lock:
+            self._reads += 1
+        return value
+    
+    def remove_namespace(self, namespace: str) -> None:
+        """네임스페이스의 블롭 전체 삭제
+        
+        Args:
+            namespace: 네임스페이스 (작업 흐름 ID)
+        """
+        shutil.rmtree(self._namespace_dir(namespace), ignore_errors=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계
+        
+        Returns:
+            저장한 블롭 수, 저장한 바이트 수, 읽기 횟수
+        """
+        with self._lock:
+            return {
+                'written': self._written,
+                'bytes_written': self._bytes_written,
+                'reads': self._reads
+            }
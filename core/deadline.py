@@ -0,0 +1,233 @@
+"""
+기한(deadline) 관리 모듈
+
+이 모듈은 작업 흐름과 단계의 실행 기한 및 협조적 취소를 구현합니다.
+기한은 상위 기한(작업 흐름)보다 늦을 수 없으며, 상위 기한이 취소되면 하위 기한도 함께 취소됩니다.
+현재 기한은 contextvars로 전파되어 플러그인이 남은 시간만큼 대기 시간을 줄이고, 취소 시 진행 중인 작업을 중단할 수 있습니다.
+"""
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """기한 초과 또는 취소"""
+    pass
+
+
+class Deadline:
+    """실행 기한
+    
+    expires_at이 None이면 시간 제한은 없고 취소만 전파됩니다.
+    cancel()을 호출하면 on_cancel()로 등록한 콜백(예: 비동기 작업 취소)이 한 번씩 호출됩니다.
+    """
+    
+    def __init__(self, timeout: Optional[float] = None, parent: 'Deadline' = None, name: str = None):
+        """기한 초기화
+        
+        Args:
+            timeout: 제한 시간(초) (None이면 상위 기한만 적용)
+            parent: 상위 기한
+            name: 기한 이름 (오류 메시지용)
+        """
+        expires_at = time.monotonic() + max(0.0, timeout) if timeout is not None else None
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        
+        self.name = name
+        self.timeout = timeout
+        self.expires_at = expires_at
+        self.parent = parent
+        self.reason: Optional[str] = None  # 취소 사유
+        self.cancelled_at: Optional[float] = None  # 취소 시각 (time.monotonic)
+        
+        self._cancelled = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self._detach_parent = parent.on_cancel(lambda: self.cancel(parent.reason)) if parent is not None else None
+    
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초) (제한이 없으면 None)"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._cancelled.is_set()
+    
+    @property
+    def expired(self) -> bool:
+        """취소되었거나 기한이 지났는지 여부"""
+        return self._cancelled.is_set() or (self.expires_at is not None and time.monotonic() >= self.expires_at)
+    
+    def describe(self) -> str:
+        """기한 초과 메시지"""
+        if self.reason:
+            return self.reason
+        if self.parent is not None and self.parent.expired:
+            return self.parent.describe()
+        if self.timeout is not None:
+            return f"기한 초과: {self.name or '작업'} ({self.timeout:.1f}초)"
+        return f"기한 초과: {self.name or '작업'}"
+    
+    def overdue(self) -> float:
+        """기한이 지나거나 취소된 뒤 흐른 시간(초) (아직 유효하면 0)"""
+        ends = [moment for moment in (self.expires_at, self.cancelled_at) if moment is not None]
+        if not ends:
+            return 0.0
+        return max(0.0, time.monotonic() - min(ends))
+    
+    def check(self) -> None:
+        """기한이 지났으면 예외 발생
+        
+        Raises:
+            DeadlineExceeded: 취소되었거나 기한이 지난 경우
+        """
+        if self.expired:
+            raise DeadlineExceeded(self.describe())
+    
+    def clamp(self, timeout: Optional[float], scale: float = 1.0) -> Optional[float]:
+        """대기 시간을 남은 시간 이내로 줄이기
+        
+        Args:
+            timeout: 대기 시간 (None이면 남은 시간)
+            scale: 초당 단위 수 (밀리초면 1000)
+        
+        Returns:
+            줄인 대기 시간 (둘 다 제한이 없으면 None)
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining * scale
+        return min(timeout, remaining * scale)
+    
+    def cancel(self, reason: str = None) -> None:
+        """기한 취소 (등록된 콜백 호출, 하위 기한에도 전파)
+        
+        Args:
+            reason: 취소 사유
+        """
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self.reason = reason or self.describe()
+            self.cancelled_at = time.monotonic()
+            self._cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+    
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """취소 시 호출할 콜백 등록 (이미 취소되었으면 즉시 호출)
+        
+        Args:
+            callback: 콜백 함수
+        
+        Returns:
+            등록 해제 함수
+        """
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        
+        callback()
+        return lambda: None
+    
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        """콜백 등록 해제"""
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+    
+    def detach(self) -> None:
+        """상위 기한과의 연결 해제 (완료된 하위 기한이 상위 기한에 콜백을 남기지 않도록)"""
+        if self._detach_parent is not None:
+            self._detach_parent()
+            self._detach_parent = None
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar('blueai_deadline', default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 기한"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """현재 컨텍스트의 기한 설정
+    
+    Args:
+        deadline: 기한 (None이면 기한 없음)
+    
+    Yields:
+        기한
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def clamp_timeout(timeout: Optional[float], scale: float = 1.0) -> Optional[float]:
+    """대기 시간을 현재 기한의 남은 시간 이내로 줄이기 (기한이 없으면 그대로)
+    
+    Args:
+        timeout: 대기 시간 (None이면 남은 시간)
+        scale: 초당 단위 수 (밀리초면 1000)
+    
+    Returns:
+        줄인 대기 시간
+    """
+    deadline = _current_deadline.get()
+    return timeout if deadline is None else deadline.clamp(timeout, scale)
+
+
+def wait_future(future: Future, timeout: float = None, deadline: Deadline = None) -> Any:
+    """기한 안에서 Future 결과 대기 (기한이 취소되면 즉시 중단)
+    
+    Args:
+        future: 대기할 Future
+        timeout: 최대 대기 시간(초)
+        deadline: 기한 (None이면 현재 컨텍스트의 기한)
+    
+    Returns:
+        Future 결과
+    
+    Raises:
+        DeadlineExceeded: 결과 전에 기한이 지났거나 취소된 경우
+        concurrent.futures.TimeoutError: timeout이 먼저 지난 경우
+    """
+    deadline = deadline or _current_deadline.get()
+    if deadline is None:
+        return future.result(timeout=timeout)
+    
+    done = threading.Event()
+    future.add_done_callback(lambda _: done.set())
+    unregister = deadline.on_cancel(done.set)
+    try:
+        done.wait(deadline.clamp(timeout))
+    finally:
+        unregister()
+    
+    if future.done():
+        return future.result()
+    if deadline.expired:
+        raise DeadlineExceeded(deadline.describe())
+    raise FutureTimeoutError()
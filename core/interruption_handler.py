@@ -519,8 +519,8 @@ class InterruptionHandler:
         
         # 이미지 템플릿 매칭
         recognition_plugins = self.plugin_manager.find_plugins(
-            PluginType.RECOGNITION, {'name': 'template_matching'}
-        )
+            PluginType.RECOGNITION, {'strategy': 'template'}
+        ) if pattern.image_templates else []
         
         if pattern.image_templates and recognition_plugins:
             plugin = recognition_plugins[0]
@@ -545,8 +545,8 @@ class InterruptionHandler:
         
         # OCR 기반 인식
         ocr_plugins = self.plugin_manager.find_plugins(
-            PluginType.RECOGNITION, {'name': 'ocr'}
-        )
+            PluginType.RECOGNITION, {'strategy': 'ocr'}
+        ) if pattern.ocr_patterns else []
         
         if pattern.ocr_patterns and ocr_plugins:
             plugin = ocr_plugins[0]
@@ -4,15 +4,24 @@
 이 모듈은 자동화 시스템의 플러그인 아키텍처를 구현합니다.
 다양한 자동화 엔진, 인식 시스템, 인터럽션 처리 등을 플러그인으로 관리합니다.
 """
+import bisect
 import importlib
 import inspect
+import json
 import logging
+import math
 import os
+import re
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+
+from . import tracing
 
 # 플러그인 타입 정의
 class PluginType(Enum):
@@ -23,20 +32,84 @@ class PluginType(Enum):
     WORKFLOW = auto()  # 작업 흐름 처리
     UI = auto()  # 사용자 인터페이스 관련
 
-@dataclass
+@dataclass(frozen=True)
 class PluginInfo:
-    """플러그인 정보 클래스"""
+    """플러그인 정보 클래스 (불변, 레지스트리에서 캐시됨)"""
     id: str  # 플러그인 고유 식별자
     name: str  # 플러그인 이름
     description: str  # 플러그인 설명
     version: str  # 플러그인 버전
     plugin_type: PluginType  # 플러그인 타입
     priority: int = 0  # 플러그인 우선순위 (높을수록 먼저 시도)
-    dependencies: List[str] = None  # 플러그인 의존성
+    dependencies: Tuple[str, ...] = None  # 플러그인 의존성
 
     def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
+        object.__setattr__(self, 'dependencies', tuple(self.dependencies or ()))
+
+
+@dataclass
+class PluginManifestEntry:
+    """플러그인 매니페스트 항목 (모듈을 가져오지 않고 플러그인을 식별하기 위한 정보)"""
+    id: str  # 플러그인 고유 식별자
+    name: str  # 플러그인 이름
+    plugin_type: PluginType  # 플러그인 타입
+    priority: int  # 플러그인 우선순위
+    module_name: str  # 모듈 이름 (importlib 경로)
+    class_name: str  # 플러그인 클래스 이름
+    module_path: str  # 모듈 소스 파일 경로
+    mtime: float  # 소스 파일 수정 시간
+    dependencies: List[str] = field(default_factory=list)  # 플러그인 의존성
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """사전으로 변환"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'plugin_type': self.plugin_type.name,
+            'priority': self.priority,
+            'module_name': self.module_name,
+            'class_name': self.class_name,
+            'module_path': self.module_path,
+            'mtime': self.mtime,
+            'dependencies': list(self.dependencies)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PluginManifestEntry':
+        """사전에서 생성"""
+        return cls(
+            id=data['id'],
+            name=data.get('name', data['id']),
+            plugin_type=PluginType[data['plugin_type']],
+            priority=data.get('priority', 0),
+            module_name=data['module_name'],
+            class_name=data['class_name'],
+            module_path=data['module_path'],
+            mtime=data['mtime'],
+            dependencies=data.get('dependencies', [])
+        )
+
+
+@dataclass
+class PluginInitReport:
+    """플러그인 초기화 결과"""
+    plugin_id: str  # 플러그인 ID
+    success: bool  # 초기화 성공 여부
+    elapsed: float = 0.0  # 초기화 소요 시간(초)
+    error: Optional[str] = None  # 실패 사유
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """사전으로 변환"""
+        result = {
+            'plugin_id': self.plugin_id,
+            'success': self.success,
+            'elapsed': self.elapsed
+        }
+        
+        if self.error:
+            result['error'] = self.error
+            
+        return result
 
 
 class Plugin(ABC):
@@ -65,16 +138,53 @@ class Plugin(ABC):
         """플러그인 정리"""
         pass
     
-    def match_criteria(self, criteria: Dict[str, Any]) -> bool:
+    def match_criteria(self, criteria: Dict[str, Any], info: PluginInfo = None) -> bool:
         """지정된 기준에 플러그인이 일치하는지 확인
         
         Args:
             criteria: 일치 기준
+            info: 캐시된 플러그인 정보 (없으면 새로 조회)
             
         Returns:
             일치 여부
         """
-        info = self.get_plugin_info()
+        return PluginIndex.match_info(info or self.get_plugin_info(), criteria)
+
+
+class PluginIndex:
+    """플러그인 레지스트리 색인
+    
+    캐시된 PluginInfo와 타입, 이름, 이름 토큰, 우선순위 버킷별 사전을 유지하여
+    플러그인 검색과 인식 전략 해석을 선형 탐색 없이 처리합니다.
+    """
+    
+    _TOKEN_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+    
+    def __init__(self):
+        """색인 초기화"""
+        self._infos: Dict[str, PluginInfo] = {}  # id -> info
+        self._keys: Dict[str, Tuple[int, int, str]] = {}  # id -> (-우선순위, 등록 순서, id) 정렬 키
+        self._by_type: Dict[PluginType, List[Tuple[int, int, str]]] = {
+            plugin_type: [] for plugin_type in PluginType
+        }  # 타입 -> 정렬 키 목록
+        self._by_name: Dict[str, List[Tuple[int, int, str]]] = {}  # 이름 -> 정렬 키 목록
+        self._by_token: Dict[Tuple[PluginType, str], List[Tuple[int, int, str]]] = {}  # (타입, 토큰) -> 정렬 키 목록
+        self._by_priority: Dict[PluginType, Dict[int, List[Tuple[int, int, str]]]] = {
+            plugin_type: {} for plugin_type in PluginType
+        }  # 타입 -> 우선순위 버킷 -> 정렬 키 목록
+        self._sequence = 0
+    
+    @classmethod
+    def tokenize(cls, text: str) -> Set[str]:
+        """식별자/이름을 검색 토큰으로 분리
+        
+        예: 'template_matching_recognition' -> {'template', 'matching', 'recognition'}
+        """
+        return {token for token in cls._TOKEN_PATTERN.split(text.lower()) if token}
+    
+    @staticmethod
+    def match_info(info: PluginInfo, criteria: Dict[str, Any]) -> bool:
+        """플러그인 정보가 기준에 일치하는지 확인"""
         for key, value in criteria.items():
             if key == 'id' and info.id != value:
                 return False
@@ -84,18 +194,358 @@ class Plugin(ABC):
                 return False
             elif key == 'min_priority' and info.priority < value:
                 return False
+            elif key == 'strategy' and str(value).lower() not in PluginIndex.tokenize(f"{info.id} {info.name}"):
+                return False
         return True
+    
+    def __contains__(self, plugin_id: str) -> bool:
+        return plugin_id in self._infos
+    
+    def add(self, info: PluginInfo) -> None:
+        """플러그인 정보 색인 (같은 ID가 있으면 교체)
+        
+        Args:
+            info: 플러그인 정보
+        """
+        if info.id in self._infos:
+            self.remove(info.id)
+        
+        self._sequence += 1
+        key = (-info.priority, self._sequence, info.id)
+        self._infos[info.id] = info
+        self._keys[info.id] = key
+        
+        bisect.insort(self._by_type[info.plugin_type], key)
+        bisect.insort(self._by_name.setdefault(info.name, []), key)
+        for token in self.tokenize(f"{info.id} {info.name}"):
+            bisect.insort(self._by_token.setdefault((info.plugin_type, token), []), key)
+        bisect.insort(self._by_priority[info.plugin_type].setdefault(info.priority, []), key)
+    
+    def remove(self, plugin_id: str) -> None:
+        """플러그인 정보 색인 제거
+        
+        Args:
+            plugin_id: 플러그인 ID
+        """
+        info = self._infos.pop(plugin_id, None)
+        if info is None:
+            return
+        
+        key = self._keys.pop(plugin_id)
+        self._by_type[info.plugin_type].remove(key)
+        self._discard(self._by_name, info.name, key)
+        for token in self.tokenize(f"{info.id} {info.name}"):
+            self._discard(self._by_token, (info.plugin_type, token), key)
+        self._discard(self._by_priority[info.plugin_type], info.priority, key)
+    
+    @staticmethod
+    def _discard(mapping: Dict[Any, List[Tuple[int, int, str]]], bucket: Any, key: Tuple[int, int, str]) -> None:
+        keys = mapping.get(bucket)
+        if keys and key in keys:
+            keys.remove(key)
+            if not keys:
+                del mapping[bucket]
+    
+    def get_info(self, plugin_id: str) -> Optional[PluginInfo]:
+        """캐시된 플러그인 정보"""
+        return self._infos.get(plugin_id)
+    
+    def ids_by_type(self, plugin_type: PluginType) -> List[str]:
+        """타입별 플러그인 ID 목록 (우선순위 내림차순)"""
+        return [key[2] for key in self._by_type.get(plugin_type, ())]
+    
+    def all_ids(self) -> List[str]:
+        """모든 플러그인 ID 목록 (타입별 우선순위 내림차순)"""
+        return [plugin_id for plugin_type in PluginType for plugin_id in self.ids_by_type(plugin_type)]
+    
+    def ids_by_strategy(self, strategy: str, plugin_type: PluginType = PluginType.RECOGNITION) -> List[str]:
+        """전략 별칭(예: 'selector', 'template', 'ocr', 'aria')에 해당하는 플러그인 ID 목록"""
+        return [key[2] for key in self._by_token.get((plugin_type, strategy.lower()), ())]
+    
+    def query(self, plugin_type: PluginType, criteria: Dict[str, Any]) -> List[str]:
+        """기준에 맞는 플러그인 ID 검색 (우선순위 내림차순)
+        
+        가장 선택적인 색인에서 후보를 고른 뒤 나머지 기준은 캐시된 정보로 확인합니다.
+        
+        Args:
+            plugin_type: 플러그인 타입
+            criteria: 일치 기준 (id, name, plugin_type, min_priority, strategy)
+            
+        Returns:
+            플러그인 ID 목록
+        """
+        if 'id' in criteria:
+            candidates = [criteria['id']] if criteria['id'] in self._infos else []
+        elif 'name' in criteria:
+            candidates = [key[2] for key in self._by_name.get(criteria['name'], ())]
+        elif 'strategy' in criteria:
+            candidates = self.ids_by_strategy(str(criteria['strategy']), plugin_type)
+        elif 'min_priority' in criteria:
+            buckets = self._by_priority.get(plugin_type, {})
+            candidates = [
+                key[2]
+                for priority in sorted(buckets, reverse=True) if priority >= criteria['min_priority']
+                for key in buckets[priority]
+            ]
+        else:
+            return self.ids_by_type(plugin_type)
+        
+        return [
+            plugin_id for plugin_id in candidates
+            if self._infos[plugin_id].plugin_type == plugin_type
+            and self.match_info(self._infos[plugin_id], criteria)
+        ]
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (지수 버킷, 메모리 사용량 고정)
+    
+    버킷 경계는 BASE * GROWTH^i 이므로 백분위수의 상대 오차는 GROWTH - 1 이내입니다.
+    """
+    
+    BASE = 0.000001  # 첫 버킷 상한(초, 1µs)
+    GROWTH = 1.1  # 버킷 증가율
+    
+    def __init__(self):
+        """히스토그램 초기화"""
+        self.buckets: Dict[int, int] = {}  # 버킷 인덱스 -> 개수
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+    
+    def record(self, elapsed: float, error: bool = False) -> None:
+        """측정값 기록
+        
+        Args:
+            elapsed: 소요 시간(초)
+            error: 오류 여부
+        """
+        if elapsed <= self.BASE:
+            index = 0
+        else:
+            index = math.ceil(math.log(elapsed / self.BASE, self.GROWTH))
+        
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+        if error:
+            self.errors += 1
+    
+    def percentile(self, q: float) -> float:
+        """백분위수 추정
+        
+        Args:
+            q: 백분위 (0.0 ~ 1.0)
+            
+        Returns:
+            추정 지연 시간(초)
+        """
+        if self.count == 0:
+            return 0.0
+        
+        rank = max(1, math.ceil(q * self.count))
+        cumulative = 0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if cumulative >= rank:
+                upper = self.BASE * (self.GROWTH ** index)
+                return min(max(upper, self.min), self.max)
+        
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """사전으로 변환"""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'p50': self.percentile(0.50),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99)
+        }
+
+
+class ActionProfiler:
+    """플러그인 액션 프로파일러
+    
+    플러그인 인스턴스의 execute_action을 감싸 (플러그인 ID, 액션 유형)별 지연 시간 히스토그램을 기록합니다.
+    예외가 발생하거나 결과의 success가 False이면 오류로 집계됩니다.
+    작업 흐름 추적 중이면 액션마다 추적 구간(action)도 기록합니다.
+    """
+    
+    def __init__(self, enabled: bool = True):
+        """프로파일러 초기화
+        
+        Args:
+            enabled: 기록 활성화 여부
+        """
+        self.enabled = enabled
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+    
+    def instrument(self, plugin: 'Plugin', plugin_id: str) -> None:
+        """플러그인 인스턴스의 execute_action 감싸기 (execute_action이 없는 플러그인은 건너뜀)
+        
+        Args:
+            plugin: 플러그인 인스턴스
+            plugin_id: 플러그인 ID
+        """
+        execute_action = getattr(plugin, 'execute_action', None)
+        if execute_action is None or getattr(execute_action, '_profiled', False):
+            return
+        
+        profiler = self
+        
+        def profiled_execute_action(action_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+            if tracing.is_tracing():
+                with tracing.span(f"{plugin_id}.{action_type}", 'action', plugin_id=plugin_id,
+                                  action=action_type, **tracing.scalar_attributes(params)) as span:
+                    result = timed_execute_action(action_type, params)
+                    if isinstance(result, dict) and not result.get('success', True):
+                        span.status = 'error'
+                        span.attributes['error'] = str(result.get('error'))
+                    return result
+            return timed_execute_action(action_type, params)
+        
+        def timed_execute_action(action_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+            if not profiler.enabled:
+                return execute_action(action_type, params)
+            
+            start_time = time.perf_counter()
+            error = True
+            try:
+                result = execute_action(action_type, params)
+                error = isinstance(result, dict) and not result.get('success', True)
+                return result
+            finally:
+                profiler.record(plugin_id, action_type, time.perf_counter() - start_time, error)
+        
+        profiled_execute_action._profiled = True
+        profiled_execute_action.__wrapped__ = execute_action
+        plugin.execute_action = profiled_execute_action
+        
+        # 일괄 실행은 'batch' 액션으로 기록 (기본 구현은 execute_action을 거치므로 액션별로도 기록됨)
+        execute_batch = getattr(plugin, 'execute_batch', None)
+        if execute_batch is None:
+            return
+        
+        def profiled_execute_batch(actions: List[Any], stop_on_error: bool = True) -> Dict[str, Any]:
+            if not profiler.enabled:
+                return execute_batch(actions, stop_on_error)
+            
+            start_time = time.perf_counter()
+            error = True
+            try:
+                result = execute_batch(actions, stop_on_error)
+                error = isinstance(result, dict) and not result.get('success', True)
+                return result
+            finally:
+                profiler.record(plugin_id, 'batch', time.perf_counter() - start_time, error)
+        
+        profiled_execute_batch.__wrapped__ = execute_batch
+        plugin.execute_batch = profiled_execute_batch
+    
+    def record(self, plugin_id: str, action_type: str, elapsed: float, error: bool = False) -> None:
+        """측정값 기록
+        
+        Args:
+            plugin_id: 플러그인 ID
+            action_type: 액션 유형
+            elapsed: 소요 시간(초)
+            error: 오류 여부
+        """
+        key = (plugin_id, action_type)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(elapsed, error)
+    
+    def get_stats(self, plugin_id: str = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """지연 시간 통계 가져오기
+        
+        Args:
+            plugin_id: 플러그인 ID (None이면 전체)
+            
+        Returns:
+            플러그인 ID -> 액션 유형 -> 통계 (count, errors, mean, min, max, p50, p95, p99; 초 단위)
+        """
+        stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for (pid, action_type), histogram in self._histograms.items():
+                if plugin_id is None or pid == plugin_id:
+                    stats.setdefault(pid, {})[action_type] = histogram.to_dict()
+        return stats
+    
+    def get_slowest(self, limit: int = 10, percentile: str = 'p99') -> List[Dict[str, Any]]:
+        """지정 백분위수 기준으로 가장 느린 액션 목록
+        
+        Args:
+            limit: 최대 개수
+            percentile: 정렬 기준 (p50, p95, p99, mean, max)
+            
+        Returns:
+            통계 목록 (plugin_id, action 포함)
+        """
+        rows = [
+            dict(stats, plugin_id=pid, action=action_type)
+            for pid, actions in self.get_stats().items()
+            for action_type, stats in actions.items()
+        ]
+        rows.sort(key=lambda row: row[percentile], reverse=True)
+        return rows[:limit]
+    
+    def reset(self) -> None:
+        """기록 초기화"""
+        with self._lock:
+            self._histograms.clear()
+    
+    def dump(self, file_path: str) -> bool:
+        """통계를 JSON 파일로 저장
+        
+        Args:
+            file_path: 저장할 파일 경로
+            
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            data = {
+                'generated_at': time.time(),
+                'unit': 'seconds',
+                'actions': self.get_stats()
+            }
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            return True
+        except Exception:
+            return False
 
 
 class PluginManager:
     """플러그인 관리자 클래스"""
     
-    def __init__(self, plugin_dirs: List[str] = None, logger=None):
+    MANIFEST_VERSION = 1
+    
+    def __init__(self, plugin_dirs: List[str] = None, logger=None, manifest_file: str = None,
+                 profiler: ActionProfiler = None):
         """플러그인 관리자 초기화
         
         Args:
             plugin_dirs: 플러그인 디렉토리 목록
             logger: 로거 객체
+            manifest_file: 지연 로딩용 플러그인 매니페스트 파일 경로
+            profiler: 액션 프로파일러 (None이면 기본 프로파일러 생성)
         """
         self.logger = logger or logging.getLogger(__name__)
         self.plugin_dirs = plugin_dirs or []
@@ -104,9 +554,29 @@ class PluginManager:
         }
         self.plugin_instances: Dict[str, Plugin] = {}  # id -> instance
         self.initialized_plugins: Set[str] = set()
+        self._init_lock = threading.Lock()
+        self._plugin_init_locks: Dict[str, threading.Lock] = {}  # id -> 초기화 잠금 (동시 워크플로우의 중복 초기화 방지)
+        
+        # 레지스트리 색인 (캐시된 플러그인 정보 및 검색 사전)
+        self.index = PluginIndex()
+        self._priority_keys: Dict[PluginType, List[int]] = {
+            plugin_type: [] for plugin_type in PluginType
+        }  # self.plugins와 같은 순서의 -우선순위 목록
+        
+        # 지연 로딩 (id -> 아직 가져오지 않은 플러그인의 매니페스트 항목)
+        self.manifest_file = manifest_file
+        self.lazy_plugins: Dict[str, PluginManifestEntry] = {}
+        self._lazy_lock = threading.RLock()
+        
+        # 액션 지연 시간 계측 (등록되는 모든 플러그인의 execute_action을 감쌈)
+        self.profiler = profiler or ActionProfiler()
     
-    def discover_plugins(self) -> None:
-        """플러그인 디렉토리에서 플러그인 발견"""
+    def _iter_plugin_modules(self):
+        """플러그인 디렉토리의 플러그인 모듈 순회
+        
+        Yields:
+            (모듈 이름, 모듈 파일 경로)
+        """
         for plugin_dir in self.plugin_dirs:
             if not os.path.exists(plugin_dir):
                 self.logger.warning(f"플러그인 디렉토리가 존재하지 않습니다: {plugin_dir}")
@@ -120,15 +590,232 @@ class PluginManager:
                         module_path = os.path.join(root, file)
                         relative_path = os.path.relpath(module_path, os.path.dirname(plugin_dir))
                         module_name = os.path.splitext(relative_path)[0].replace(os.path.sep, '.')
-                        
-                        try:
-                            module = importlib.import_module(module_name)
-                            for name, obj in inspect.getmembers(module):
-                                if (inspect.isclass(obj) and issubclass(obj, Plugin) and
-                                    obj is not Plugin and not inspect.isabstract(obj)):
-                                    self._register_plugin_class(obj)
-                        except Exception as e:
-                            self.logger.error(f"플러그인 로드 중 오류: {module_name} - {str(e)}")
+                        yield module_name, module_path
+    
+    @staticmethod
+    def _iter_plugin_classes(module) -> List[Type[Plugin]]:
+        """모듈에 포함된 구체 플러그인 클래스 목록"""
+        return [
+            obj for _, obj in inspect.getmembers(module)
+            if (inspect.isclass(obj) and issubclass(obj, Plugin) and
+                obj is not Plugin and not inspect.isabstract(obj))
+        ]
+    
+    def discover_plugins(self, lazy: bool = False) -> None:
+        """플러그인 디렉토리에서 플러그인 발견
+        
+        Args:
+            lazy: True이면 캐시된 매니페스트만 읽고, 모듈은 처음 요청될 때 가져옴
+        """
+        if lazy:
+            self._discover_plugins_lazy()
+            return
+        
+        for module_name, module_path in self._iter_plugin_modules():
+            try:
+                module = importlib.import_module(module_name)
+                for plugin_class in self._iter_plugin_classes(module):
+                    self._register_plugin_class(plugin_class)
+            except Exception as e:
+                self.logger.error(f"플러그인 로드 중 오류: {module_name} - {str(e)}")
+    
+    def _discover_plugins_lazy(self) -> None:
+        """매니페스트 기반 지연 플러그인 발견
+        
+        소스 파일의 수정 시간이 매니페스트와 다른 모듈만 다시 가져와 항목을 갱신합니다.
+        """
+        cached_modules = self._load_manifest()
+        modules: Dict[str, Dict[str, Any]] = {}
+        changed = False
+        
+        for module_name, module_path in self._iter_plugin_modules():
+            try:
+                mtime = os.path.getmtime(module_path)
+            except OSError as e:
+                self.logger.error(f"플러그인 파일 확인 중 오류: {module_path} - {str(e)}")
+                continue
+            
+            cached = cached_modules.get(module_path)
+            if cached and cached['mtime'] == mtime and cached['module_name'] == module_name:
+                modules[module_path] = cached
+                continue
+            
+            # 새 모듈이거나 소스가 변경됨: 가져와서 항목 재생성
+            entries = self._scan_plugin_module(module_name, module_path, mtime)
+            if entries is None:
+                continue
+            modules[module_path] = {
+                'module_name': module_name,
+                'mtime': mtime,
+                'plugins': entries
+            }
+            changed = True
+        
+        if changed or set(modules) != set(cached_modules):
+            self._save_manifest(modules)
+        
+        with self._lazy_lock:
+            for module in modules.values():
+                for entry in module['plugins']:
+                    if entry.id in self.plugin_instances or entry.id in self.lazy_plugins:
+                        self.logger.debug(f"이미 등록된 플러그인 ID, 매니페스트 항목 무시: {entry.id}")
+                        continue
+                    self.lazy_plugins[entry.id] = entry
+                    self.index.add(PluginInfo(
+                        id=entry.id,
+                        name=entry.name,
+                        description="",
+                        version="",
+                        plugin_type=entry.plugin_type,
+                        priority=entry.priority,
+                        dependencies=entry.dependencies
+                    ))
+                    self.logger.info(f"플러그인 발견 (지연 로딩): {entry.name} (ID: {entry.id}, 타입: {entry.plugin_type.name})")
+    
+    def _scan_plugin_module(self, module_name: str, module_path: str,
+                            mtime: float) -> Optional[List[PluginManifestEntry]]:
+        """모듈을 가져와 매니페스트 항목 생성
+        
+        Args:
+            module_name: 모듈 이름
+            module_path: 모듈 파일 경로
+            mtime: 소스 파일 수정 시간
+            
+        Returns:
+            매니페스트 항목 목록 또는 None (가져오기 실패)
+        """
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            self.logger.error(f"플러그인 로드 중 오류: {module_name} - {str(e)}")
+            return None
+        
+        entries = []
+        for plugin_class in self._iter_plugin_classes(module):
+            if plugin_class.__module__ != module.__name__:
+                continue
+            try:
+                info = plugin_class.get_plugin_info()
+            except Exception as e:
+                self.logger.error(f"플러그인 정보 조회 중 오류: {plugin_class.__name__} - {str(e)}")
+                continue
+            entries.append(PluginManifestEntry(
+                id=info.id,
+                name=info.name,
+                plugin_type=info.plugin_type,
+                priority=info.priority,
+                module_name=module_name,
+                class_name=plugin_class.__name__,
+                module_path=module_path,
+                mtime=mtime,
+                dependencies=list(info.dependencies)
+            ))
+        
+        self.logger.debug(f"플러그인 매니페스트 갱신: {module_name} ({len(entries)}개)")
+        return entries
+    
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """매니페스트 파일 로드
+        
+        Returns:
+            모듈 경로 -> {'module_name', 'mtime', 'plugins'} 사전
+        """
+        if not self.manifest_file or not os.path.exists(self.manifest_file):
+            return {}
+        
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('version') != self.MANIFEST_VERSION:
+                return {}
+            
+            return {
+                module_path: {
+                    'module_name': module['module_name'],
+                    'mtime': module['mtime'],
+                    'plugins': [PluginManifestEntry.from_dict(p) for p in module.get('plugins', [])]
+                }
+                for module_path, module in data.get('modules', {}).items()
+            }
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"플러그인 매니페스트 로드 실패, 재생성합니다: {str(e)}")
+            return {}
+    
+    def _save_manifest(self, modules: Dict[str, Dict[str, Any]]) -> None:
+        """매니페스트 파일 저장
+        
+        Args:
+            modules: 모듈 경로 -> {'module_name', 'mtime', 'plugins'} 사전
+        """
+        if not self.manifest_file:
+            return
+        
+        data = {
+            'version': self.MANIFEST_VERSION,
+            'modules': {
+                module_path: {
+                    'module_name': module['module_name'],
+                    'mtime': module['mtime'],
+                    'plugins': [entry.to_dict() for entry in module['plugins']]
+                }
+                for module_path, module in modules.items()
+            }
+        }
+        
+        try:
+            manifest_dir = os.path.dirname(os.path.abspath(self.manifest_file))
+            os.makedirs(manifest_dir, exist_ok=True)
+            temp_file = f"{self.manifest_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, self.manifest_file)
+            self.logger.debug(f"플러그인 매니페스트 저장: {self.manifest_file}")
+        except OSError as e:
+            self.logger.error(f"플러그인 매니페스트 저장 실패: {str(e)}")
+    
+    def _load_lazy_plugin(self, plugin_id: str) -> Optional[Plugin]:
+        """지연 로딩 플러그인 가져오기 및 등록
+        
+        Args:
+            plugin_id: 플러그인 ID
+            
+        Returns:
+            플러그인 인스턴스 또는 None
+        """
+        with self._lazy_lock:
+            # 다른 스레드가 먼저 로드한 경우
+            if plugin_id in self.plugin_instances:
+                return self.plugin_instances[plugin_id]
+            
+            entry = self.lazy_plugins.pop(plugin_id, None)
+            if entry is None:
+                return None
+            
+            try:
+                module = importlib.import_module(entry.module_name)
+                plugin_class = getattr(module, entry.class_name)
+            except Exception as e:
+                self.logger.error(f"플러그인 로드 중 오류: {entry.module_name} - {str(e)}")
+                self.index.remove(plugin_id)
+                return None
+            
+            self._register_plugin_class(plugin_class)
+            plugin = self.plugin_instances.get(plugin_id)
+            if plugin is None:
+                self.index.remove(plugin_id)
+            return plugin
+    
+    def _load_lazy_plugins_by_type(self, plugin_type: PluginType) -> None:
+        """유형이 일치하는 모든 지연 로딩 플러그인 가져오기
+        
+        Args:
+            plugin_type: 플러그인 타입
+        """
+        pending = [entry.id for entry in list(self.lazy_plugins.values())
+                   if entry.plugin_type == plugin_type]
+        for plugin_id in pending:
+            self._load_lazy_plugin(plugin_id)
     
     def _register_plugin_class(self, plugin_class: Type[Plugin]) -> None:
         """플러그인 클래스 등록
@@ -143,16 +830,7 @@ class PluginManager:
                 return
                 
             plugin_instance = plugin_class()
-            self.plugin_instances[info.id] = plugin_instance
-            self.plugins[info.plugin_type].append(plugin_instance)
-            
-            # 우선순위에 따라 정렬
-            self.plugins[info.plugin_type].sort(
-                key=lambda p: p.get_plugin_info().priority, 
-                reverse=True
-            )
-            
-            self.logger.info(f"플러그인 등록: {info.name} (ID: {info.id}, 타입: {info.plugin_type.name})")
+            self._add_plugin(plugin_instance, info)
         except Exception as e:
             self.logger.error(f"플러그인 등록 중 오류: {plugin_class.__name__} - {str(e)}")
     
@@ -166,18 +844,71 @@ class PluginManager:
         if info.id in self.plugin_instances:
             self.logger.warning(f"중복된 플러그인 ID: {info.id}")
             return
-            
+        
+        # 직접 등록된 인스턴스가 매니페스트 항목보다 우선
+        self.lazy_plugins.pop(info.id, None)
+        self._add_plugin(plugin, info)
+
+    def replace_plugin(self, plugin: Plugin) -> Optional[Plugin]:
+        """같은 ID로 등록된 플러그인을 새 인스턴스로 교체 (예: 프로세스 호스트로 감싸기)
+
+        기존 인스턴스가 초기화되어 있었다면 정리됩니다. 새 인스턴스는 초기화되지 않은 상태로
+        등록되므로 initialize_plugin으로 다시 초기화해야 합니다.
+
+        Args:
+            plugin: 새 플러그인 인스턴스
+
+        Returns:
+            교체된 기존 인스턴스 또는 None
+        """
+        info = plugin.get_plugin_info()
+        previous = self.plugin_instances.get(info.id)
+
+        if previous is not None:
+            self.cleanup_plugin(info.id)
+
+            old_info = self.index.get_info(info.id)
+            old_type = old_info.plugin_type if old_info else info.plugin_type
+            position = next(i for i, p in enumerate(self.plugins[old_type]) if p is previous)
+            del self.plugins[old_type][position]
+            del self._priority_keys[old_type][position]
+            del self.plugin_instances[info.id]
+            self.index.remove(info.id)
+
+        self.lazy_plugins.pop(info.id, None)
+        self._add_plugin(plugin, info)
+        return previous
+
+    def _add_plugin(self, plugin: Plugin, info: PluginInfo) -> None:
+        """플러그인 인스턴스를 레지스트리와 색인에 추가
+        
+        Args:
+            plugin: 플러그인 인스턴스
+            info: 플러그인 정보
+        """
+        self.profiler.instrument(plugin, info.id)
         self.plugin_instances[info.id] = plugin
-        self.plugins[info.plugin_type].append(plugin)
+        self.index.add(info)
         
-        # 우선순위에 따라 정렬
-        self.plugins[info.plugin_type].sort(
-            key=lambda p: p.get_plugin_info().priority, 
-            reverse=True
-        )
+        # 우선순위 순서를 유지하며 삽입 (동일 우선순위는 등록 순서)
+        keys = self._priority_keys[info.plugin_type]
+        position = bisect.bisect_right(keys, -info.priority)
+        keys.insert(position, -info.priority)
+        self.plugins[info.plugin_type].insert(position, plugin)
         
         self.logger.info(f"플러그인 등록: {info.name} (ID: {info.id}, 타입: {info.plugin_type.name})")
     
+    def get_plugin_info(self, plugin_id: str) -> Optional[PluginInfo]:
+        """캐시된 플러그인 정보 가져오기 (지연 로딩 플러그인도 가져오지 않고 조회)
+        
+        Args:
+            plugin_id: 플러그인 ID
+            
+        Returns:
+            플러그인 정보 또는 None
+        """
+        return self.index.get_info(plugin_id)
+    
     def get_plugin(self, plugin_id: str) -> Optional[Plugin]:
         """ID로 플러그인 가져오기
         
@@ -187,7 +918,10 @@ class PluginManager:
         Returns:
             플러그인 인스턴스 또는 None
         """
-        return self.plugin_instances.get(plugin_id)
+        plugin = self.plugin_instances.get(plugin_id)
+        if plugin is None and plugin_id in self.lazy_plugins:
+            plugin = self._load_lazy_plugin(plugin_id)
+        return plugin
     
     def get_plugins_by_type(self, plugin_type: PluginType) -> List[Plugin]:
         """유형별 모든 플러그인 가져오기
@@ -198,6 +932,8 @@ class PluginManager:
         Returns:
             플러그인 인스턴스 목록
         """
+        if self.lazy_plugins:
+            self._load_lazy_plugins_by_type(plugin_type)
         return self.plugins.get(plugin_type, [])
     
     def find_plugins(self, plugin_type: PluginType, criteria: Dict[str, Any]) -> List[Plugin]:
@@ -211,11 +947,32 @@ class PluginManager:
             플러그인 인스턴스 목록
         """
         result = []
-        for plugin in self.plugins.get(plugin_type, []):
-            if plugin.match_criteria(criteria):
+        for plugin_id in self.index.query(plugin_type, criteria):
+            plugin = self.get_plugin(plugin_id)
+            if plugin:
                 result.append(plugin)
         return result
     
+    def resolve_strategy(self, strategy: str,
+                         plugin_type: PluginType = PluginType.RECOGNITION) -> Optional[Plugin]:
+        """전략 별칭으로 플러그인 찾기
+        
+        플러그인 ID/이름 토큰 색인을 사용합니다.
+        예: 'template' -> template_matching_recognition, 'ocr' -> ocr_recognition
+        
+        Args:
+            strategy: 전략 별칭 ('selector', 'template', 'ocr', 'aria' 등)
+            plugin_type: 플러그인 타입
+            
+        Returns:
+            우선순위가 가장 높은 플러그인 인스턴스 또는 None
+        """
+        for plugin_id in self.index.ids_by_strategy(strategy, plugin_type):
+            plugin = self.get_plugin(plugin_id)
+            if plugin:
+                return plugin
+        return None
+    
     def initialize_plugin(self, plugin_id: str, config: Dict[str, Any] = None) -> bool:
         """플러그인 초기화
         
@@ -235,23 +992,175 @@ class PluginManager:
             return False
             
         # 의존성 확인 및 초기화
-        info = plugin.get_plugin_info()
+        info = self.get_plugin_info(plugin_id) or plugin.get_plugin_info()
         for dep_id in info.dependencies:
             if not self.initialize_plugin(dep_id, config):
                 self.logger.error(f"의존성 초기화 실패: {dep_id} (필요: {plugin_id})")
                 return False
-                
+        
+        return self._initialize_single(plugin_id, config).success
+    
+    def _initialize_single(self, plugin_id: str, config: Dict[str, Any] = None) -> PluginInitReport:
+        """의존성을 확인하지 않고 단일 플러그인 초기화
+        
+        Args:
+            plugin_id: 플러그인 ID
+            config: 플러그인 설정
+            
+        Returns:
+            초기화 결과
+        """
+        if plugin_id in self.initialized_plugins:
+            return PluginInitReport(plugin_id, True)
+        
+        with self._init_lock:
+            plugin_lock = self._plugin_init_locks.setdefault(plugin_id, threading.Lock())
+        
+        with plugin_lock:
+            # 다른 스레드가 먼저 초기화했는지 다시 확인
+            if plugin_id in self.initialized_plugins:
+                return PluginInitReport(plugin_id, True)
+            return self._run_initialize(plugin_id, config)
+    
+    def _run_initialize(self, plugin_id: str, config: Dict[str, Any] = None) -> PluginInitReport:
+        """플러그인 initialize() 호출 및 결과 기록
+        
+        Args:
+            plugin_id: 플러그인 ID
+            config: 플러그인 설정
+            
+        Returns:
+            초기화 결과
+        """
+        start_time = time.time()
+        plugin = self.get_plugin(plugin_id)
+        if not plugin:
+            self.logger.error(f"플러그인을 찾을 수 없음: {plugin_id}")
+            return PluginInitReport(plugin_id, False, time.time() - start_time, "플러그인을 찾을 수 없음")
+        
         try:
             success = plugin.initialize(config)
+            elapsed = time.time() - start_time
             if success:
-                self.initialized_plugins.add(plugin_id)
-                self.logger.info(f"플러그인 초기화 성공: {plugin_id}")
-            else:
-                self.logger.error(f"플러그인 초기화 실패: {plugin_id}")
-            return success
+                with self._init_lock:
+                    self.initialized_plugins.add(plugin_id)
+                self.logger.info(f"플러그인 초기화 성공: {plugin_id} ({elapsed:.2f}초)")
+                return PluginInitReport(plugin_id, True, elapsed)
+            
+            self.logger.error(f"플러그인 초기화 실패: {plugin_id}")
+            return PluginInitReport(plugin_id, False, elapsed, "initialize()가 False 반환")
         except Exception as e:
             self.logger.error(f"플러그인 초기화 중 오류: {plugin_id} - {str(e)}")
-            return False
+            return PluginInitReport(plugin_id, False, time.time() - start_time, str(e))
+    
+    def initialize_all(self, configs: Dict[str, Dict[str, Any]] = None, plugin_ids: List[str] = None,
+                       parallel: bool = True, max_workers: int = None) -> Dict[str, PluginInitReport]:
+        """여러 플러그인을 의존성 순서에 따라 초기화
+        
+        PluginInfo.dependencies로 DAG를 구성하고 순환 의존성을 검출한 뒤,
+        서로 독립적인 플러그인은 스레드 풀에서 동시에 초기화합니다.
+        
+        Args:
+            configs: 플러그인 ID -> 플러그인 설정
+            plugin_ids: 초기화할 플러그인 ID 목록 (None이면 이미 로드된 플러그인).
+                        지연 로딩 플러그인은 목록에 있거나 의존성으로 필요할 때만 가져옴
+            parallel: 독립적인 플러그인을 동시에 초기화할지 여부
+            max_workers: 스레드 풀 크기
+            
+        Returns:
+            플러그인 ID -> 초기화 결과
+        """
+        configs = configs or {}
+        reports: Dict[str, PluginInitReport] = {}
+        
+        # 대상 및 의존성 수집
+        graph: Dict[str, List[str]] = {}
+        pending = list(plugin_ids if plugin_ids is not None else self.plugin_instances)
+        while pending:
+            plugin_id = pending.pop()
+            if plugin_id in graph or plugin_id in reports:
+                continue
+            info = self.get_plugin_info(plugin_id)
+            if info is None:
+                reports[plugin_id] = PluginInitReport(plugin_id, False, error="플러그인을 찾을 수 없음")
+                continue
+            graph[plugin_id] = list(info.dependencies)
+            pending.extend(info.dependencies)
+        
+        # 위상 정렬 (Kahn) 및 순환 의존성 검출
+        dependents: Dict[str, List[str]] = {plugin_id: [] for plugin_id in graph}
+        remaining: Dict[str, int] = {}
+        for plugin_id, deps in graph.items():
+            remaining[plugin_id] = sum(1 for dep_id in deps if dep_id in graph)
+            for dep_id in deps:
+                if dep_id in graph:
+                    dependents[dep_id].append(plugin_id)
+        
+        order = [plugin_id for plugin_id, count in remaining.items() if count == 0]
+        counts = dict(remaining)
+        for plugin_id in order:
+            for child_id in dependents[plugin_id]:
+                counts[child_id] -= 1
+                if counts[child_id] == 0:
+                    order.append(child_id)
+        
+        for plugin_id in graph:
+            if counts[plugin_id] > 0:
+                reports[plugin_id] = PluginInitReport(plugin_id, False, error="순환 의존성")
+                self.logger.error(f"순환 의존성 감지: {plugin_id} -> {graph[plugin_id]}")
+        
+        def fail_dependents(plugin_id: str) -> None:
+            for child_id in dependents[plugin_id]:
+                if child_id not in reports:
+                    reports[child_id] = PluginInitReport(child_id, False, error=f"의존성 초기화 실패: {plugin_id}")
+                    fail_dependents(child_id)
+        
+        for plugin_id, deps in graph.items():
+            if plugin_id not in reports and any(dep_id in reports and not reports[dep_id].success for dep_id in deps):
+                reports[plugin_id] = PluginInitReport(plugin_id, False, error="의존성 초기화 실패")
+                fail_dependents(plugin_id)
+        
+        start_time = time.time()
+        
+        if not parallel:
+            for plugin_id in order:
+                if plugin_id in reports:
+                    continue
+                report = self._initialize_single(plugin_id, configs.get(plugin_id))
+                reports[plugin_id] = report
+                if not report.success:
+                    fail_dependents(plugin_id)
+        else:
+            ready = [plugin_id for plugin_id in order
+                     if remaining[plugin_id] == 0 and plugin_id not in reports]
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plugin-init") as executor:
+                running = {}
+                while ready or running:
+                    for plugin_id in ready:
+                        future = executor.submit(self._initialize_single, plugin_id, configs.get(plugin_id))
+                        running[future] = plugin_id
+                    ready = []
+                    
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        plugin_id = running.pop(future)
+                        report = future.result()
+                        reports[plugin_id] = report
+                        if not report.success:
+                            fail_dependents(plugin_id)
+                            continue
+                        for child_id in dependents[plugin_id]:
+                            remaining[child_id] -= 1
+                            if remaining[child_id] == 0 and child_id not in reports:
+                                ready.append(child_id)
+        
+        failed = [plugin_id for plugin_id, report in reports.items() if not report.success]
+        self.logger.info(f"플러그인 일괄 초기화 완료: {len(reports) - len(failed)}/{len(reports)} 성공 "
+                         f"({time.time() - start_time:.2f}초, 병렬: {parallel})")
+        for plugin_id in failed:
+            self.logger.warning(f"플러그인 초기화 실패: {plugin_id} - {reports[plugin_id].error}")
+        
+        return reports
     
     def cleanup_plugin(self, plugin_id: str) -> None:
         """플러그인 정리
@@ -0,0 +1,182 @@
+"""
+결과 싱크 모듈
+
+이 모듈은 반복 단계(foreach/while)의 반복별 결과를 작업 흐름 상태 대신 기록하는 싱크를 구현합니다.
+크롤링처럼 반복 결과가 많은 작업 흐름에서 결과가 상태와 저널에 쌓이지 않도록 메모리(최근 N개), JSONL, CSV로 내보냅니다.
+싱크는 여러 반복 스레드에서 동시에 기록할 수 있습니다.
+"""
+import csv
+import json
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class ResultSink:
+    """결과 싱크 기본 클래스"""
+    
+    def __init__(self, name: str = None):
+        """싱크 초기화
+        
+        Args:
+            name: 싱크 이름
+        """
+        self.name = name or self.__class__.__name__
+        self.count = 0  # 기록한 결과 수
+        self._lock = threading.Lock()
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """결과 하나 기록"""
+        self.write_batch([record])
+    
+    def write_batch(self, records: Iterable[Dict[str, Any]]) -> None:
+        """결과 여러 개 기록"""
+        records = list(records)
+        with self._lock:
+            self._write(records)
+            self.count += len(records)
+    
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        """결과 기록 (잠금 안에서 호출, 하위 클래스에서 구현)"""
+        raise NotImplementedError
+    
+    def flush(self) -> None:
+        """버퍼 내보내기"""
+        pass
+    
+    def close(self) -> None:
+        """싱크 닫기"""
+        self.flush()
+
+
+class MemorySink(ResultSink):
+    """메모리 싱크 (최근 max_records개만 보관)"""
+    
+    def __init__(self, name: str = None, max_records: Optional[int] = 1000):
+        """싱크 초기화
+        
+        Args:
+            name: 싱크 이름
+            max_records: 보관할 최대 결과 수 (None이면 제한 없음, 넘으면 오래된 결과부터 제거)
+        """
+        super().__init__(name)
+        self.records: deque = deque(maxlen=max_records)
+    
+    @property
+    def dropped(self) -> int:
+        """보관 한도를 넘어 제거된 결과 수"""
+        return self.count - len(self.records)
+    
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        self.records.extend(records)
+
+
+class JsonlSink(ResultSink):
+    """JSONL 파일 싱크 (한 줄에 결과 하나, 추가 모드)"""
+    
+    def __init__(self, path: str, name: str = None, buffer_size: int = 100):
+        """싱크 초기화
+        
+        Args:
+            path: 파일 경로
+            name: 싱크 이름
+            buffer_size: 파일에 쓰기 전에 모을 결과 수
+        """
+        super().__init__(name or os.path.basename(path))
+        self.path = path
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[str] = []
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        # 요소 핸들처럼 직렬화할 수 없는 값은 문자열로 기록
+        self._buffer.extend(json.dumps(record, ensure_ascii=False, default=str) for record in records)
+        if len(self._buffer) >= self.buffer_size:
+            self._flush_buffer()
+    
+    def _flush_buffer(self) -> None:
+        """버퍼를 파일에 쓰기 (잠금 안에서 호출)"""
+        if not self._buffer:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write("\n".join(self._buffer) + "\n")
+        self._buffer = []
+    
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_buffer()
+
+
+class CsvSink(ResultSink):
+    """CSV 파일 싱크 (열은 fields, 기존 파일의 머리글 또는 첫 결과의 키, 추가 모드)"""
+    
+    def __init__(self, path: str, fields: List[str] = None, name: str = None):
+        """싱크 초기화
+        
+        Args:
+            path: 파일 경로
+            fields: 열 이름 목록 (None이면 기존 파일의 머리글 또는 첫 결과의 키, 그 밖의 키는 무시)
+            name: 싱크 이름
+        """
+        super().__init__(name or os.path.basename(path))
+        self.path = path
+        self.fields = list(fields) if fields else None
+        self._file = None
+        self._writer = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        if self._writer is None:
+            write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            if not self.fields and not write_header:
+                # 기존 파일에 이어 쓸 때는 파일의 열 순서를 따름
+                with open(self.path, 'r', encoding='utf-8', newline='') as f:
+                    self.fields = next(csv.reader(f), None)
+            self.fields = self.fields or list(records[0])
+            self._file = open(self.path, 'a', encoding='utf-8', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fields, extrasaction='ignore')
+            if write_header:
+                self._writer.writeheader()
+        self._writer.writerows(records)
+    
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+
+def create_sink(config: Dict[str, Any], name: str = None) -> ResultSink:
+    """설정으로 싱크 생성
+    
+    Args:
+        config: 싱크 설정 ({'type': 'memory'|'jsonl'|'csv', 'path': ..., 'fields': [...], 'max_records': ...})
+        name: 싱크 이름
+    
+    Returns:
+        싱크
+    
+    Raises:
+        ValueError: 알 수 없는 싱크 유형 또는 파일 경로 누락
+    """
+    sink_type = config.get('type', 'memory')
+    if sink_type == 'memory':
+        return MemorySink(name=name, max_records=config.get('max_records', 1000))
+    
+    path = config.get('path')
+    if sink_type in ('jsonl', 'csv') and not path:
+        raise ValueError(f"싱크 파일 경로가 지정되지 않음: {sink_type}")
+    if sink_type == 'jsonl':
+        return JsonlSink(path, name=name, buffer_size=config.get('buffer_size', 100))
+    if sink_type == 'csv':
+        return CsvSink(path, fields=config.get('fields'), name=name)
+    raise ValueError(f"알 수 없는 싱크 유형: {sink_type}")
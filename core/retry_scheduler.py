@@ -0,0 +1,264 @@
+"""
+재시도 스케줄러 모듈
+
+이 모듈은 작업 단계 재시도를 스레드를 점유하지 않고 예약하는 스케줄러를 구현합니다.
+재시도 간격은 지수 백오프와 지터로 계산되며, 작업 흐름별 재시도 예산과 단계 유형별 재시도 비용(대기/실행 시간)을 관리합니다.
+대기 중인 재시도는 단일 타이머 스레드의 힙에 보관되고, 기한이 되면 콜백이 호출됩니다.
+"""
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class RetryStats:
+    """단계 유형별 재시도 통계"""
+    retries: int = 0  # 재시도 횟수
+    succeeded: int = 0  # 재시도 성공 횟수
+    budget_exhausted: int = 0  # 예산 소진으로 재시도하지 못한 횟수
+    wait_time: float = 0.0  # 백오프 대기 시간 합계(초)
+    run_time: float = 0.0  # 재시도 실행 시간 합계(초)
+
+
+class RetryScheduler:
+    """재시도 스케줄러
+    
+    call_later()로 예약한 콜백은 타이머 스레드에서 기한에 호출되며, 예약 결과는 Future로 반환됩니다.
+    콜백이 Future를 반환하면(예: 스레드 풀에 단계 실행 제출) 그 결과가 예약 Future로 전달되므로
+    호출자는 실행 중인 단계와 같은 방식으로 대기할 수 있습니다.
+    """
+    
+    def __init__(self, default_budget: Optional[int] = 20, seed: int = None, logger=None):
+        """스케줄러 초기화
+        
+        Args:
+            default_budget: 작업 흐름별 기본 재시도 예산 (None이면 제한 없음)
+            seed: 지터 난수 시드 (재현용)
+            logger: 로거 객체
+        """
+        self.default_budget = default_budget
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self._random = random.Random(seed)
+        self._heap: List[Tuple[float, int, Future, Callable, tuple]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+        
+        self._budgets: Dict[str, int] = {}  # 작업 흐름 ID -> 사용한 재시도 수
+        self._stats: Dict[str, RetryStats] = {}  # 단계 유형 -> 통계
+        self._stats_lock = threading.Lock()
+    
+    def compute_delay(self, attempt: int, delay: float, backoff: float = 2.0,
+                      max_delay: float = 30.0, jitter: float = 0.1) -> float:
+        """재시도 대기 시간 계산
+        
+        Args:
+            attempt: 재시도 차수 (1부터)
+            delay: 첫 재시도 대기 시간(초)
+            backoff: 지수 백오프 배수
+            max_delay: 최대 대기 시간(초)
+            jitter: 지터 비율 (0.1이면 ±10%)
+        
+        Returns:
+            대기 시간(초)
+        """
+        base = min(max_delay, delay * (backoff ** max(0, attempt - 1)))
+        if jitter > 0:
+            base *= 1.0 + self._random.uniform(-jitter, jitter)
+        return max(0.0, base)
+    
+    def acquire(self, workflow_id: str, budget: Optional[int], step_type: str = None) -> bool:
+        """작업 흐름 재시도 예산에서 1회 사용
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            budget: 작업 흐름 재시도 예산 (None이면 제한 없음)
+            step_type: 통계용 단계 유형
+        
+        Returns:
+            예산이 남아 있어 재시도할 수 있는지 여부
+        """
+        with self._stats_lock:
+            used = self._budgets.get(workflow_id, 0)
+            if budget is not None and used >= budget:
+                if step_type:
+                    self._stats.setdefault(step_type, RetryStats()).budget_exhausted += 1
+                return False
+            self._budgets[workflow_id] = used + 1
+            return True
+    
+    def release(self, workflow_id: str) -> None:
+        """작업 흐름 재시도 예산 정리
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+        """
+        with self._stats_lock:
+            self._budgets.pop(workflow_id, None)
+    
+    def get_used_budget(self, workflow_id: str) -> int:
+        """작업 흐름에서 사용한 재시도 수"""
+        with self._stats_lock:
+            return self._budgets.get(workflow_id, 0)
+    
+    def call_later(self, delay: float, callback: Callable, *args: Any) -> Future:
+        """지연 후 콜백 호출 예약
+        
+        Args:
+            delay: 지연 시간(초)
+            callback: 콜백 함수 (Future를 반환하면 그 결과가 전달됨)
+            *args: 콜백 인자
+        
+        Returns:
+            예약 Future (기한 전에는 RetryScheduler.cancel()로 취소 가능)
+        """
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("재시도 스케줄러가 종료됨")
+            heapq.heappush(self._heap, (time.monotonic() + max(0.0, delay), next(self._counter),
+                                        future, callback, args))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="retry-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+    
+    def sleep(self, delay: float, should_continue: Callable[[], bool] = None, poll_interval: float = 0.1) -> bool:
+        """현재 스레드에서 재시도 대기 (작업 흐름 취소/일시 중지 시 즉시 중단)
+        
+        Args:
+            delay: 대기 시간(초)
+            should_continue: 계속 대기할지 확인하는 함수
+            poll_interval: 중단 확인 주기(초)
+        
+        Returns:
+            대기를 끝까지 마쳤는지 여부
+        """
+        future = self.call_later(delay, lambda: None)
+        while True:
+            try:
+                future.result(timeout=poll_interval)
+                return True
+            except FutureTimeoutError:
+                if should_continue is not None and not should_continue():
+                    self.cancel(future)
+                    return False
+    
+    def cancel(self, future: Future) -> bool:
+        """아직 호출되지 않은 예약 취소
+        
+        Future.cancel()과 달리 대기 중인 wait()/as_completed()에도 즉시 취소를 알립니다.
+        
+        Args:
+            future: call_later()가 반환한 Future
+        
+        Returns:
+            취소 여부 (이미 콜백이 호출된 경우 False)
+        """
+        with self._condition:
+            if not future.cancel():
+                return False
+            self._heap = [entry for entry in self._heap if entry[2] is not future]
+            heapq.heapify(self._heap)
+        
+        future.set_running_or_notify_cancel()
+        return True
+    
+    def _run(self) -> None:
+        """타이머 스레드: 기한이 된 콜백 호출"""
+        while True:
+            with self._condition:
+                while not self._shutdown and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                if self._shutdown:
+                    return
+                _, _, future, callback, args = heapq.heappop(self._heap)
+            
+            if not future.set_running_or_notify_cancel():
+                continue
+            
+            try:
+                result = callback(*args)
+            except Exception as e:
+                self.logger.error(f"재시도 콜백 오류: {str(e)}")
+                future.set_exception(e)
+                continue
+            
+            if isinstance(result, Future):
+                result.add_done_callback(lambda inner, outer=future: self._chain(inner, outer))
+            else:
+                future.set_result(result)
+    
+    @staticmethod
+    def _chain(inner: Future, outer: Future) -> None:
+        """콜백이 반환한 Future 결과를 예약 Future로 전달"""
+        if inner.cancelled():
+            outer.set_exception(RuntimeError("재시도 실행이 취소됨"))
+        elif inner.exception() is not None:
+            outer.set_exception(inner.exception())
+        else:
+            outer.set_result(inner.result())
+    
+    def record(self, step_type: str, wait_time: float, run_time: float, succeeded: bool) -> None:
+        """재시도 비용 기록
+        
+        Args:
+            step_type: 단계 유형
+            wait_time: 백오프 대기 시간(초)
+            run_time: 재시도 실행 시간(초)
+            succeeded: 재시도 성공 여부
+        """
+        with self._stats_lock:
+            stats = self._stats.setdefault(step_type, RetryStats())
+            stats.retries += 1
+            stats.wait_time += wait_time
+            stats.run_time += run_time
+            if succeeded:
+                stats.succeeded += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """재시도 통계
+        
+        Returns:
+            대기 중인 예약 수(pending)와 단계 유형별 통계(step_types: retries, succeeded,
+            budget_exhausted, wait_time, run_time, total_time)
+        """
+        with self._stats_lock:
+            stats = {}
+            for step_type, step_stats in self._stats.items():
+                data = asdict(step_stats)
+                data['total_time'] = step_stats.wait_time + step_stats.run_time
+                stats[step_type] = data
+        with self._condition:
+            pending = len(self._heap)
+        return {'pending': pending, 'step_types': stats}
+    
+    def reset_stats(self) -> None:
+        """통계 초기화"""
+        with self._stats_lock:
+            self._stats.clear()
+    
+    def shutdown(self) -> None:
+        """타이머 스레드 종료 (대기 중인 예약은 취소)"""
+        with self._condition:
+            self._shutdown = True
+            pending = [entry[2] for entry in self._heap]
+            self._heap.clear()
+            self._condition.notify_all()
+        
+        for future in pending:
+            future.cancel()
+            future.set_running_or_notify_cancel()
+        
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
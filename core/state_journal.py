@@ -0,0 +1,148 @@
+"""
+작업 흐름 상태 저널 모듈
+
+이 모듈은 체크포인트를 상태 전체 복사 대신 변경 기록(delta)으로 관리하는 상태 저장소를 구현합니다.
+체크포인트는 저널 위치만 기억하고, 복원 시 그 이후의 변경을 역순으로 되돌립니다.
+따라서 체크포인트 생성/복원 비용은 상태 크기가 아니라 변경된 키 수에 비례합니다.
+가장 오래된 체크포인트보다 앞선 기록은 compact()로 버려 덮어쓴(또는 정리된) 값을 메모리에서 해제합니다.
+"""
+from typing import Any, Dict, List, Set, Tuple
+
+
+_MISSING = object()  # 체크포인트 시점에 키가 없었음을 나타내는 표식
+
+
+class JournaledState(dict):
+    """변경 저널을 가진 상태 사전
+    
+    일반 dict와 동일하게 사용할 수 있으며, mark() 이후의 최상위 키 변경을 기록합니다.
+    구간(mark 사이)마다 키별 최초 이전 값만 기록하므로 같은 키를 여러 번 바꿔도 저널은 커지지 않습니다.
+    중첩 값의 내부 변경은 기록하지 않습니다 (기존 얕은 복사 체크포인트와 동일한 의미).
+    """
+    
+    __slots__ = ('_journal', '_base', '_touched', '_recording')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._journal: List[Tuple[Any, Any]] = []  # (키, 이전 값 또는 _MISSING)
+        self._base = 0  # 버린 기록 수 (저널 위치 = _base + 목록 내 위치)
+        self._touched: Set[Any] = set()  # 현재 구간에서 이미 기록한 키
+        self._recording = False  # 첫 체크포인트 전에는 기록하지 않음
+    
+    def _record(self, key: Any) -> None:
+        """키 변경 전 이전 값 기록"""
+        if self._recording and key not in self._touched:
+            self._touched.add(key)
+            self._journal.append((key, dict.get(self, key, _MISSING)))
+    
+    def mark(self) -> int:
+        """현재 저널 위치 반환 (체크포인트 생성)
+        
+        Returns:
+            저널 위치
+        """
+        self._recording = True
+        self._touched = set()
+        return self._base + len(self._journal)
+    
+    def rollback(self, position: int) -> int:
+        """저널 위치까지 변경 되돌리기
+        
+        Args:
+            position: mark()로 얻은 저널 위치
+        
+        Returns:
+            되돌린 변경 수
+        """
+        index = position - self._base
+        if index < 0 or index > len(self._journal):
+            raise ValueError(f"잘못된 저널 위치: {position}")
+        
+        undone = len(self._journal) - index
+        for key, value in reversed(self._journal[index:]):
+            if value is _MISSING:
+                dict.pop(self, key, None)
+            else:
+                dict.__setitem__(self, key, value)
+        
+        del self._journal[index:]
+        self._touched = set()
+        return undone
+    
+    def compact(self, position: int) -> int:
+        """저널 위치 이전의 기록 버리기 (그 위치 이전으로는 더 이상 되돌릴 수 없음)
+        
+        Args:
+            position: 남은 체크포인트 중 가장 오래된 저널 위치
+        
+        Returns:
+            버린 기록 수
+        """
+        index = min(position - self._base, len(self._journal))
+        if index <= 0:
+            return 0
+        del self._journal[:index]
+        self._base += index
+        return index
+    
+    def reset_journal(self) -> int:
+        """저널 전체를 버리고 다음 mark()까지 기록 중지 (남은 체크포인트가 없을 때)
+        
+        Returns:
+            버린 기록 수
+        """
+        dropped = len(self._journal)
+        self._journal = []
+        self._base = 0
+        self._touched = set()
+        self._recording = False
+        return dropped
+    
+    @property
+    def journal_size(self) -> int:
+        """저널에 남아 있는 변경 수"""
+        return len(self._journal)
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._record(key)
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key: Any) -> None:
+        self._record(key)
+        super().__delitem__(key)
+    
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def __ior__(self, other: Any) -> 'JournaledState':
+        self.update(other)
+        return self
+    
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self._record(key)
+        return super().pop(key, *default)
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        if self:
+            self._record(next(reversed(self)))
+        return super().popitem()
+    
+    def clear(self) -> None:
+        for key in list(self):
+            self._record(key)
+        super().clear()
+    
+    def copy(self) -> Dict[str, Any]:
+        """일반 사전으로 얕은 복사"""
+        return dict(self)
+    
+    def __reduce__(self):
+        # 피클/deepcopy 시 저널 없이 일반 사전 내용만 전달
+        return (self.__class__, (dict(self),))
@@ -0,0 +1,101 @@
+"""
+단계 결과 캐시 모듈
+
+이 모듈은 멱등 단계(같은 URL 탐색, 변하지 않은 페이지의 요소 인식 등)의 결과를 재사용하기 위한 캐시를 구현합니다.
+항목은 TTL이 지나면 만료되고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거됩니다(LRU).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class StepResultCache:
+    """단계 결과 LRU/TTL 캐시"""
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        """캐시 초기화
+        
+        Args:
+            max_entries: 최대 항목 수
+            ttl: 기본 유효 시간(초)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()  # 키 -> (만료 시간, 출력)
+        self._lock = threading.Lock()
+        
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """캐시된 단계 출력 가져오기
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            단계 출력 사본 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+    
+    def put(self, key: Hashable, output: Dict[str, Any], ttl: float = None) -> None:
+        """단계 출력 저장
+        
+        Args:
+            key: 캐시 키
+            output: 단계 출력
+            ttl: 유효 시간(초) (None이면 기본값)
+        """
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires, dict(output))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def invalidate(self, step_type: str = None) -> None:
+        """캐시 항목 제거
+        
+        Args:
+            step_type: 제거할 단계 유형 (None이면 전체)
+        """
+        with self._lock:
+            if step_type is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == step_type]:
+                del self._entries[key]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계
+        
+        Returns:
+            항목 수, 적중/미스/제거/만료 횟수
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
@@ -0,0 +1,250 @@
+"""
+작업 흐름 추적 모듈
+
+이 모듈은 작업 흐름 실행을 중첩된 구간(span)으로 기록하는 추적 기능을 구현합니다.
+구간은 작업 흐름 > 단계 > 인식 전략 > 플러그인 액션 순으로 중첩되며, 현재 구간은 contextvars로 전파됩니다.
+추적 결과는 Chrome trace_event JSON(Perfetto/chrome://tracing에서 보기)과 구간별 JSONL 로그로 내보낼 수 있습니다.
+"""
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Span:
+    """추적 구간"""
+    name: str  # 구간 이름
+    category: str  # 분류 (workflow, step, recognition, action 등)
+    trace_id: str  # 추적 ID
+    span_id: str  # 구간 ID
+    parent_id: Optional[str] = None  # 상위 구간 ID
+    start_time: float = field(default_factory=time.time)  # 시작 시간 (epoch 초)
+    end_time: Optional[float] = None  # 종료 시간 (epoch 초)
+    thread_id: int = field(default_factory=threading.get_ident)  # 실행 스레드
+    thread_name: str = field(default_factory=lambda: threading.current_thread().name)  # 실행 스레드 이름
+    status: str = 'ok'  # ok 또는 error
+    attributes: Dict[str, Any] = field(default_factory=dict)  # 속성
+    
+    @property
+    def duration(self) -> float:
+        """구간 길이(초) (진행 중이면 현재까지)"""
+        return (self.end_time or time.time()) - self.start_time
+    
+    def set_attributes(self, **attributes: Any) -> None:
+        """속성 추가"""
+        self.attributes.update(attributes)
+
+
+class Trace:
+    """작업 흐름 실행 하나의 추적 (구간 모음)"""
+    
+    def __init__(self, name: str, trace_id: str = None):
+        """추적 초기화
+        
+        Args:
+            name: 추적 이름 (작업 흐름 ID 등)
+            trace_id: 추적 ID (None이면 생성)
+        """
+        self.name = name
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+    
+    def start_span(self, name: str, category: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        """구간 시작"""
+        span = Span(name=name, category=category, trace_id=self.trace_id, span_id=uuid.uuid4().hex[:16],
+                    parent_id=parent.span_id if parent else None, attributes=attributes)
+        with self._lock:
+            self.spans.append(span)
+        return span
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace_event 형식으로 변환
+        
+        Returns:
+            {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': self.name}}]
+        threads = {}
+        
+        with self._lock:
+            spans = list(self.spans)
+        
+        for span in spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            args = dict(span.attributes)
+            args.update({'span_id': span.span_id, 'parent_id': span.parent_id, 'status': span.status})
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': span.start_time * 1e6,
+                'dur': span.duration * 1e6,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args
+            })
+        
+        for thread_id, thread_name in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id,
+                           'args': {'name': thread_name}})
+        
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def export_chrome(self, path: str) -> None:
+        """Chrome trace_event JSON 파일로 저장
+        
+        Args:
+            path: 파일 경로
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+    
+    def export_jsonl(self, path: str) -> None:
+        """구간별 JSONL 파일로 저장 (한 줄에 구간 하나)
+        
+        Args:
+            path: 파일 경로
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock:
+            spans = list(self.spans)
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            for span in spans:
+                data = asdict(span)
+                data['duration'] = span.duration
+                f.write(json.dumps(data, ensure_ascii=False, default=str) + "\n")
+    
+    def summary(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """(분류, 이름)별 누적 시간이 가장 긴 구간 목록
+        
+        Args:
+            limit: 최대 개수
+        
+        Returns:
+            {'category', 'name', 'count', 'total_time', 'max_time'} 목록 (누적 시간 내림차순)
+        """
+        totals: Dict[tuple, Dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        
+        for span in spans:
+            entry = totals.setdefault((span.category, span.name), {
+                'category': span.category, 'name': span.name, 'count': 0, 'total_time': 0.0, 'max_time': 0.0
+            })
+            entry['count'] += 1
+            entry['total_time'] += span.duration
+            entry['max_time'] = max(entry['max_time'], span.duration)
+        
+        return sorted(totals.values(), key=lambda entry: entry['total_time'], reverse=True)[:limit]
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar('blueai_trace', default=None)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar('blueai_span', default=None)
+
+
+def is_tracing() -> bool:
+    """현재 컨텍스트에서 추적 중인지 확인"""
+    return _current_trace.get() is not None
+
+
+def current_span() -> Optional[Span]:
+    """현재 구간"""
+    return _current_span.get()
+
+
+@contextmanager
+def trace(name: str, category: str = 'workflow', /, **attributes: Any) -> Iterator[Trace]:
+    """새 추적을 시작하고 최상위 구간 열기
+    
+    Args:
+        name: 추적 및 최상위 구간 이름
+        category: 최상위 구간 분류
+        **attributes: 최상위 구간 속성
+    
+    Yields:
+        추적
+    """
+    active = Trace(name)
+    trace_token = _current_trace.set(active)
+    try:
+        with span(name, category, **attributes):
+            yield active
+    finally:
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, category: str = 'function', /, **attributes: Any) -> Iterator[Optional[Span]]:
+    """현재 구간 아래에 하위 구간 열기 (추적 중이 아니면 아무것도 하지 않음)
+    
+    구간 안에서 예외가 발생하면 status가 error가 되고 예외 메시지가 속성에 기록됩니다.
+    
+    Args:
+        name: 구간 이름
+        category: 구간 분류
+        **attributes: 구간 속성
+    
+    Yields:
+        구간 또는 None
+    """
+    active = _current_trace.get()
+    if active is None:
+        yield None
+        return
+    
+    current = active.start_span(name, category, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = 'error'
+        current.attributes['error'] = str(e)
+        raise
+    finally:
+        current.end_time = time.time()
+        _current_span.reset(token)
+
+
+def bind(fn: Callable) -> Callable:
+    """현재 추적 컨텍스트에서 실행되도록 함수 감싸기 (스레드 풀/타이머 제출용)
+    
+    Args:
+        fn: 함수
+    
+    Returns:
+        현재 컨텍스트를 복사해 실행하는 함수 (추적 중이 아니면 원래 함수)
+    """
+    if _current_trace.get() is None:
+        return fn
+    context = contextvars.copy_context()
+    # 같은 컨텍스트를 여러 스레드에서 동시에 실행할 수 없으므로 호출마다 복사
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+
+def scalar_attributes(params: Optional[Dict[str, Any]], max_length: int = 200) -> Dict[str, Any]:
+    """파라미터에서 구간 속성으로 기록할 스칼라 값만 추출
+    
+    Args:
+        params: 파라미터
+        max_length: 문자열 최대 길이
+    
+    Returns:
+        속성 사전
+    """
+    attributes = {}
+    for key, value in (params or {}).items():
+        if isinstance(value, str):
+            attributes[key] = value if len(value) <= max_length else value[:max_length] + '...'
+        elif isinstance(value, (bool, int, float)) or value is None:
+            attributes[key] = value
+    return attributes
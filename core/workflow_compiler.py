@@ -0,0 +1,659 @@
+"""
+작업 계획 컴파일러 모듈
+
+이 모듈은 작업 계획을 한 번 검증·변환하여 불변 실행 계획으로 만드는 컴파일러를 구현합니다.
+단계 핸들러를 미리 찾고, $a.b.c 변수 참조를 접근 경로 튜플로 미리 분석하며,
+변수 참조가 없는 하위 트리는 다시 분석하지 않고 읽기 전용 사본에서 복사만 합니다.
+컴파일된 계획은 내용 해시로 캐시되므로 같은 계획을 반복 실행하면 컴파일을 건너뜁니다.
+"""
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+
+class PlanCompileError(Exception):
+    """작업 계획 구조 오류"""
+    pass
+
+
+def _freeze(value: Any) -> Any:
+    """사전/목록을 읽기 전용 사본(MappingProxyType/튜플)으로 재귀 변환 (그 밖의 값은 공유)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """읽기 전용 사본을 새 사전/목록으로 복사 (실행마다 핸들러가 바꿔도 되는 사본)"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class VarRef:
+    """미리 분석된 변수 참조 ($a.b.c -> ('a', 'b', 'c'))"""
+    raw: str  # 원본 문자열
+    path: Tuple[str, ...]  # 상태 접근 경로
+    
+    @classmethod
+    def parse(cls, raw: str) -> 'VarRef':
+        return cls(raw, tuple(raw[1:].split('.')))
+
+
+class ParamTemplate:
+    """컴파일된 단계 파라미터
+    
+    _resolve_parameters와 같은 규칙으로 해결합니다.
+    - '$'로 시작하는 문자열 값은 상태 참조
+    - 사전은 재귀적으로 해결
+    - 목록은 사전 항목만 재귀적으로 해결 (문자열 항목은 그대로)
+    변수 참조가 없는 하위 사전/목록은 컴파일할 때 읽기 전용 사본으로 보관하고 해결할 때마다 새로 복사하므로,
+    핸들러가 파라미터를 바꿔도 같은 계획의 다른 실행(컴파일 캐시 공유)에 영향이 없습니다.
+    """
+    
+    __slots__ = ('_entries', 'references', 'is_static')
+    
+    _STATIC, _REF, _DICT, _LIST, _COPY = range(5)
+    
+    def __init__(self, params: Dict[str, Any]):
+        """파라미터 컴파일
+        
+        Args:
+            params: 원본 파라미터
+        """
+        entries = []
+        references: Set[str] = set()
+        
+        for key, value in params.items():
+            if isinstance(value, str) and value.startswith('$'):
+                ref = VarRef.parse(value)
+                references.add(ref.path[0])
+                entries.append((key, self._REF, ref))
+            elif isinstance(value, Mapping):
+                template = ParamTemplate(value)
+                references |= template.references
+                entries.append((key, self._COPY, _freeze(value)) if template.is_static else (key, self._DICT, template))
+            elif isinstance(value, (list, tuple)):
+                items = tuple(ParamTemplate(item) if isinstance(item, Mapping) else None for item in value)
+                dynamic = [item for item in items if item is not None and not item.is_static]
+                for item in dynamic:
+                    references |= item.references
+                if dynamic:
+                    entries.append((key, self._LIST, tuple(
+                        template if template is not None and not template.is_static else _freeze(raw)
+                        for template, raw in zip(items, value)
+                    )))
+                else:
+                    entries.append((key, self._COPY, _freeze(value)))
+            else:
+                entries.append((key, self._STATIC, value))
+        
+        self._entries = tuple(entries)
+        self.references = frozenset(references)  # 참조된 최상위 상태 키
+        self.is_static = not references
+    
+    def resolve(self, state: Mapping[str, Any], on_missing: Callable[[str], None] = None) -> Dict[str, Any]:
+        """상태를 적용하여 파라미터 생성 (사전/목록은 매번 새로 생성)
+        
+        Args:
+            state: 작업 흐름 상태
+            on_missing: 변수를 찾을 수 없을 때 호출 (원본 문자열 전달)
+        
+        Returns:
+            해결된 파라미터
+        """
+        resolved = {}
+        for key, kind, payload in self._entries:
+            if kind == self._STATIC:
+                resolved[key] = payload
+            elif kind == self._COPY:
+                resolved[key] = _thaw(payload)
+            elif kind == self._REF:
+                resolved[key] = self._lookup(state, payload, on_missing)
+            elif kind == self._DICT:
+                resolved[key] = payload.resolve(state, on_missing)
+            else:
+                resolved[key] = [
+                    item.resolve(state, on_missing) if isinstance(item, ParamTemplate) else _thaw(item)
+                    for item in payload
+                ]
+        return resolved
+    
+    @staticmethod
+    def _lookup(state: Mapping[str, Any], ref: VarRef, on_missing: Callable[[str], None]) -> Any:
+        """변수 참조 값 조회 (없으면 원본 문자열)"""
+        value = state
+        try:
+            for part in ref.path:
+                value = value[part]
+            return value
+        except (KeyError, TypeError):
+            if on_missing:
+                on_missing(ref.raw)
+            return ref.raw
+
+
+@dataclass(frozen=True)
+class RecoveryStrategy:
+    """컴파일된 복구 전략"""
+    type: str  # retry, alternative, rollback
+    max_retries: int = 3  # 재시도 횟수 (retry)
+    delay: float = 1.0  # 첫 재시도 간격(초) (retry)
+    backoff: float = 2.0  # 재시도 간격 증가 배수 (retry)
+    max_delay: float = 30.0  # 최대 재시도 간격(초) (retry)
+    jitter: float = 0.1  # 재시도 간격 지터 비율 (retry)
+    step: Optional['CompiledStep'] = None  # 대체 단계 (alternative)
+    checkpoint_id: Optional[str] = None  # 롤백할 체크포인트 (rollback)
+
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """컴파일된 작업 단계"""
+    id: str  # 단계 ID
+    type: str  # 단계 유형
+    handler: Callable  # 단계 핸들러
+    params: ParamTemplate  # 컴파일된 파라미터
+    checkpoint: bool = False  # 실행 전 체크포인트 생성 여부
+    recovery_strategies: Tuple[RecoveryStrategy, ...] = ()  # 복구 전략
+    timeout: Optional[float] = None  # 단계 실행 기한(초) (None이면 작업 흐름 설정의 step_timeout)
+    body: Tuple['CompiledStep', ...] = ()  # 반복 본문 단계 (foreach/while)
+    raw: Mapping[str, Any] = MappingProxyType({})  # 원본 단계 정의 (재귀적으로 읽기 전용인 사본, 목록은 튜플)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """원본 단계 정의 값 가져오기"""
+        return self.raw.get(key, default)
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """컴파일된 불변 실행 계획"""
+    plan_hash: str  # 계획 내용 해시 (캐시 키)
+    steps: Tuple[CompiledStep, ...]  # 단계 (목록 순서)
+    step_map: Mapping[str, CompiledStep]  # 단계 ID -> 단계
+    execution_mode: Optional[str] = None  # 계획에 지정된 실행 모드
+    graph: Optional['StepGraph'] = None  # 의존성 그래프 (DAG 모드용)
+    graph_error: Optional[str] = None  # 그래프 생성 오류 (순차 모드에서는 무시됨)
+    state_readers: Mapping[str, FrozenSet[str]] = MappingProxyType({})  # 상태 키 -> 참조하는 단계 ID (대체 단계 포함)
+
+
+class StepGraph:
+    """작업 단계 의존성 그래프 (DAG 실행 모드용)
+    
+    의존성은 다음에서 추출합니다.
+    - 명시적 depends_on (단계 ID 또는 목록)
+    - 파라미터의 element_from_step 참조
+    - 파라미터의 $상태 참조: 해당 키를 마지막으로 쓴 이전 단계 (반복 본문 단계의 참조 포함)
+    - 같은 상태 키/브라우저 탭을 쓰는 단계 사이의 순서 (쓰기-쓰기, 읽기-쓰기)
+      상태 키는 계획 안에서 $참조되는 키만 순서를 지킵니다 (참조되지 않는 키는 마지막에 끝난 단계의 값이 남음).
+    
+    출력 키를 알 수 없는 단계는 모든 상태 키를 쓰는 것으로 간주하여 앞뒤 단계와 직렬화됩니다.
+    """
+    
+    def __init__(self, steps: List[Dict[str, Any]], step_outputs: Dict[str, Optional[Set[str]]],
+                 page_access: Dict[str, str]):
+        """그래프 생성
+        
+        Args:
+            steps: 작업 단계 목록 (목록 순서가 기준 순서)
+            step_outputs: 단계 유형 -> 출력 상태 키 (None이면 알 수 없음)
+            page_access: 단계 유형 -> 브라우저 탭 접근 방식 ('read' 또는 'write')
+        """
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.order: List[str] = []
+        self.dependencies: Dict[str, Set[str]] = {}
+        self._build(steps, step_outputs, page_access)
+        self._check_acyclic()
+    
+    @classmethod
+    def collect_references(cls, params: Mapping[str, Any], state_keys: Set[str], step_ids: Set[str]) -> None:
+        """파라미터에서 상태 참조와 단계 참조 수집 (_resolve_parameters와 같은 규칙)
+        
+        Args:
+            params: 단계 파라미터
+            state_keys: 참조된 최상위 상태 키 (출력)
+            step_ids: element_from_step으로 참조된 단계 ID (출력)
+        """
+        for key, value in params.items():
+            if isinstance(value, str) and value.startswith('$'):
+                state_keys.add(value[1:].split('.')[0])
+            elif key == 'element_from_step' and isinstance(value, str):
+                step_ids.add(value)
+            elif isinstance(value, Mapping):
+                cls.collect_references(value, state_keys, step_ids)
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    if isinstance(item, Mapping):
+                        cls.collect_references(item, state_keys, step_ids)
+    
+    @classmethod
+    def collect_body_references(cls, step: Mapping[str, Any], state_keys: Set[str]) -> None:
+        """반복 본문 단계(steps)의 상태 참조 수집 (반복 변수 as/index_as 제외)
+        
+        Args:
+            step: 반복 단계 정의
+            state_keys: 참조된 최상위 상태 키 (출력)
+        """
+        body = step.get('steps')
+        if not isinstance(body, (list, tuple)):
+            return
+        
+        params = step.get('params') if isinstance(step.get('params'), Mapping) else {}
+        keys: Set[str] = set()
+        for body_step in body:
+            if isinstance(body_step, Mapping):
+                if isinstance(body_step.get('params'), Mapping):
+                    cls.collect_references(body_step['params'], keys, set())
+                cls.collect_body_references(body_step, keys)
+        state_keys |= keys - {params.get('as', 'item'), params.get('index_as', 'index')}
+    
+    def _build(self, steps: List[Dict[str, Any]], step_outputs: Dict[str, Optional[Set[str]]],
+               page_access: Dict[str, str]) -> None:
+        """의존성 계산"""
+        last_writer: Dict[str, str] = {}  # 자원 -> 마지막으로 쓴 단계
+        readers: Dict[str, Set[str]] = {}  # 자원 -> 마지막 쓰기 이후 읽은 단계
+        barrier: Optional[str] = None  # 출력 키를 알 수 없는 마지막 단계
+        since_barrier: Set[str] = set()  # barrier 이후 상태에 접근한 단계
+        
+        # 계획 전체에서 참조되는 상태 키
+        referenced: Set[str] = set()
+        for step in steps:
+            self.collect_references(step.get('params', {}), referenced, set())
+            self.collect_body_references(step, referenced)
+        
+        for step in steps:
+            step_id = step.get('id')
+            if not step_id:
+                continue
+            if step_id in self.steps:
+                raise PlanCompileError(f"중복된 단계 ID: {step_id}")
+            
+            params = step.get('params', {})
+            state_keys: Set[str] = set()
+            step_refs: Set[str] = set()
+            self.collect_references(params, state_keys, step_refs)
+            self.collect_body_references(step, state_keys)
+            
+            depends_on = step.get('depends_on', [])
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+            deps = set(depends_on) | step_refs
+            
+            outputs = step.get('outputs', step_outputs.get(step.get('type')))
+            reads = {f"state:{key}" for key in state_keys}
+            writes = {f"state:{key}" for key in outputs if key in referenced} if outputs is not None else set()
+            
+            access = page_access.get(step.get('type'))
+            if access:
+                page = f"page:{params.get('page') or 'default'}"
+                (writes if access == 'write' else reads).add(page)
+            
+            for resource in reads | writes:
+                writer = last_writer.get(resource)
+                if writer:
+                    deps.add(writer)
+                elif resource.startswith('state:') and barrier:
+                    deps.add(barrier)
+                if resource in writes:
+                    deps |= readers.get(resource, set())
+            
+            if outputs is None:
+                # 모든 상태 키를 쓸 수 있는 단계: 이전 상태 접근 단계 전체 이후에 실행
+                deps |= since_barrier
+                if barrier:
+                    deps.add(barrier)
+            
+            deps.discard(step_id)
+            self.steps[step_id] = step
+            self.order.append(step_id)
+            self.dependencies[step_id] = deps
+            
+            for resource in reads:
+                readers.setdefault(resource, set()).add(step_id)
+            for resource in writes:
+                last_writer[resource] = step_id
+                readers[resource] = set()
+            
+            if outputs is None:
+                barrier = step_id
+                since_barrier = set()
+                for resource in [r for r in last_writer if r.startswith('state:')]:
+                    del last_writer[resource]
+                for resource in [r for r in readers if r.startswith('state:')]:
+                    del readers[resource]
+            elif any(r.startswith('state:') for r in reads | writes):
+                since_barrier.add(step_id)
+        
+        for step_id, deps in self.dependencies.items():
+            unknown = deps - set(self.steps)
+            if unknown:
+                raise PlanCompileError(f"알 수 없는 의존 단계: {step_id} -> {', '.join(sorted(unknown))}")
+    
+    def _check_acyclic(self) -> None:
+        """순환 의존성 확인 (명시적 depends_on이 뒤 단계를 가리키는 경우)"""
+        remaining = {step_id: len(deps) for step_id, deps in self.dependencies.items()}
+        dependents: Dict[str, List[str]] = {step_id: [] for step_id in self.order}
+        for step_id, deps in self.dependencies.items():
+            for dep in deps:
+                dependents[dep].append(step_id)
+        
+        queue = [step_id for step_id, count in remaining.items() if count == 0]
+        visited = 0
+        while queue:
+            step_id = queue.pop()
+            visited += 1
+            for dependent in dependents[step_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+        
+        if visited != len(self.order):
+            cycle = sorted(step_id for step_id, count in remaining.items() if count > 0)
+            raise PlanCompileError(f"순환 의존성: {', '.join(cycle)}")
+    
+    def ready_steps(self, finished: Set[str], running: Set[str]) -> List[str]:
+        """실행 가능한 단계 목록 (기준 순서)
+        
+        Args:
+            finished: 완료된 단계
+            running: 실행 중인 단계
+        
+        Returns:
+            의존성이 모두 완료된 단계 ID 목록
+        """
+        return [
+            step_id for step_id in self.order
+            if step_id not in finished and step_id not in running
+            and self.dependencies[step_id] <= finished
+        ]
+    
+    def position(self, step_id: str) -> int:
+        """기준 순서상 위치"""
+        return self.order.index(step_id)
+
+
+class WorkflowCompiler:
+    """작업 계획 컴파일러
+    
+    계획의 실행 관련 내용(steps, execution_mode)의 해시로 컴파일 결과를 LRU 캐시에 보관합니다.
+    id, name, description 같은 메타데이터는 해시에 포함되지 않으므로 설명만 다른 계획도 캐시를 공유합니다.
+    단계 핸들러 등록이 바뀌면 invalidate()로 캐시를 비워야 합니다.
+    """
+    
+    HASHED_KEYS = ('steps', 'execution_mode')
+    RECOVERY_TYPES = ('retry', 'alternative', 'rollback')
+    
+    def __init__(self, step_handlers: Dict[str, Callable], step_outputs: Dict[str, Optional[Set[str]]],
+                 page_access: Dict[str, str], cache_size: int = 128):
+        """컴파일러 초기화
+        
+        Args:
+            step_handlers: 단계 유형 -> 핸들러 (작업 흐름 관리자와 공유)
+            step_outputs: 단계 유형 -> 출력 상태 키
+            page_access: 단계 유형 -> 브라우저 탭 접근 방식
+            cache_size: 캐시할 최대 계획 수
+        """
+        self._handlers = step_handlers
+        self._outputs = step_outputs
+        self._page_access = page_access
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, CompiledPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def plan_hash(cls, workflow_plan: Dict[str, Any]) -> str:
+        """계획 내용 해시
+        
+        Args:
+            workflow_plan: 작업 계획
+        
+        Returns:
+            SHA-256 해시 문자열
+        """
+        content = {key: workflow_plan.get(key) for key in cls.HASHED_KEYS}
+        encoded = json.dumps(content, sort_keys=True, ensure_ascii=False, default=repr).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def compile(self, workflow_plan: Dict[str, Any]) -> CompiledPlan:
+        """작업 계획 컴파일 (캐시 사용)
+        
+        Args:
+            workflow_plan: 작업 계획
+        
+        Returns:
+            컴파일된 계획
+        
+        Raises:
+            PlanCompileError: 계획 구조 오류 (모든 오류를 한 번에 보고)
+        """
+        plan_hash = self.plan_hash(workflow_plan)
+        
+        with self._lock:
+            compiled = self._cache.get(plan_hash)
+            if compiled is not None:
+                self._cache.move_to_end(plan_hash)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+        
+        # 호출자가 계획을 나중에 수정해도 컴파일 결과가 바뀌지 않도록 복사
+        steps = copy.deepcopy(workflow_plan.get('steps', []))
+        compiled = self._compile(steps, workflow_plan.get('execution_mode'), plan_hash)
+        
+        with self._lock:
+            self._cache[plan_hash] = compiled
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return compiled
+    
+    def _compile(self, steps: List[Dict[str, Any]], execution_mode: Optional[str], plan_hash: str) -> CompiledPlan:
+        """단계 목록 컴파일"""
+        if not isinstance(steps, list):
+            raise PlanCompileError("steps가 목록이 아님")
+        
+        errors: List[str] = []
+        compiled_steps: List[CompiledStep] = []
+        
+        for index, step in enumerate(steps):
+            compiled = self.compile_step(step, f"steps[{index}]", errors)
+            if compiled is None:
+                continue
+            if any(existing.id == compiled.id for existing in compiled_steps):
+                errors.append(f"steps[{index}]: 중복된 단계 ID: {compiled.id}")
+                continue
+            compiled_steps.append(compiled)
+        
+        step_map = {step.id: step for step in compiled_steps}
+        for step in compiled_steps:
+            referenced = set()
+            StepGraph.collect_references(step.raw.get('params', {}), set(), referenced)
+            depends_on = step.raw.get('depends_on', [])
+            referenced |= {depends_on} if isinstance(depends_on, str) else set(depends_on)
+            for step_id in sorted(referenced - set(step_map)):
+                errors.append(f"{step.id}: 알 수 없는 단계 참조: {step_id}")
+        
+        if errors:
+            raise PlanCompileError("; ".join(errors))
+        
+        graph, graph_error = None, None
+        try:
+            graph = StepGraph([dict(step.raw) for step in compiled_steps], self._outputs, self._page_access)
+        except PlanCompileError as e:
+            if execution_mode == 'dag':
+                raise
+            graph_error = str(e)
+        
+        # 상태 키별 참조 단계 (대체 단계와 반복 본문 단계의 참조는 원래 단계의 참조로 간주, 상태 정리용)
+        state_readers: Dict[str, Set[str]] = {}
+        for step in compiled_steps:
+            references = set(step.params.references)
+            StepGraph.collect_body_references(step.raw, references)
+            for strategy in step.recovery_strategies:
+                if strategy.step is not None:
+                    references |= strategy.step.params.references
+            for key in references:
+                state_readers.setdefault(key, set()).add(step.id)
+        
+        return CompiledPlan(
+            plan_hash=plan_hash,
+            steps=tuple(compiled_steps),
+            step_map=MappingProxyType(step_map),
+            execution_mode=execution_mode,
+            graph=graph,
+            graph_error=graph_error,
+            state_readers=MappingProxyType({key: frozenset(ids) for key, ids in state_readers.items()})
+        )
+    
+    def compile_step(self, step: Any, location: str, errors: List[str],
+                     default_id: str = None) -> Optional[CompiledStep]:
+        """단계 컴파일
+        
+        Args:
+            step: 단계 정의
+            location: 오류 메시지용 위치
+            errors: 오류 목록 (출력)
+            default_id: ID가 없을 때 사용할 ID (대체 단계용)
+        
+        Returns:
+            컴파일된 단계 (오류 시 None)
+        """
+        if not isinstance(step, dict):
+            errors.append(f"{location}: 단계가 사전이 아님")
+            return None
+        
+        step_id = step.get('id') or default_id
+        if not step_id or not isinstance(step_id, str):
+            errors.append(f"{location}: 단계 ID가 없음")
+            return None
+        
+        step_type = step.get('type')
+        handler = self._handlers.get(step_type) if step_type else None
+        if not step_type:
+            errors.append(f"{step_id}: 단계 유형이 지정되지 않음")
+        elif handler is None:
+            errors.append(f"{step_id}: 처리할 수 없는 단계 유형: {step_type}")
+        
+        params = step.get('params', {})
+        if not isinstance(params, dict):
+            errors.append(f"{step_id}: params가 사전이 아님")
+            params = {}
+        
+        timeout = step.get('timeout')
+        if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+            errors.append(f"{step_id}: 잘못된 단계 기한: {timeout}")
+            timeout = None
+        
+        strategies = []
+        for index, strategy in enumerate(step.get('recovery_strategies', [])):
+            compiled = self._compile_strategy(strategy, f"{step_id}.recovery_strategies[{index}]", step_id, errors)
+            if compiled is not None:
+                strategies.append(compiled)
+        
+        body = self._compile_body(step, step_id, params, errors) if 'steps' in step else ()
+        
+        if handler is None:
+            return None
+        
+        return CompiledStep(
+            id=step_id,
+            type=step_type,
+            handler=handler,
+            params=ParamTemplate(params),
+            checkpoint=bool(step.get('checkpoint', False)),
+            recovery_strategies=tuple(strategies),
+            timeout=float(timeout) if timeout is not None else None,
+            body=body,
+            raw=_freeze(dict(step, id=step_id))
+        )
+    
+    def _compile_body(self, step: Dict[str, Any], step_id: str, params: Dict[str, Any],
+                      errors: List[str]) -> Tuple[CompiledStep, ...]:
+        """반복 본문 단계 컴파일
+        
+        본문 단계 ID는 본문 안에서만 고유하면 되며, 본문 단계의 실패는 반복 단계의 on_error로 처리하므로
+        복구 전략과 체크포인트는 지원하지 않습니다. 병렬 반복 본문에는 페이지를 변경하는 단계를 둘 수 없습니다.
+        """
+        body_steps = step.get('steps')
+        if not isinstance(body_steps, list):
+            errors.append(f"{step_id}: 본문 단계(steps)가 목록이 아님")
+            return ()
+        
+        body: List[CompiledStep] = []
+        for index, body_step in enumerate(body_steps):
+            compiled = self.compile_step(body_step, f"{step_id}.steps[{index}]", errors, default_id=f"{step_id}_{index}")
+            if compiled is None:
+                continue
+            if compiled.recovery_strategies or compiled.checkpoint:
+                errors.append(f"{compiled.id}: 반복 본문 단계는 복구 전략과 체크포인트를 지원하지 않음 (반복 단계의 on_error 사용)")
+            if any(existing.id == compiled.id for existing in body):
+                errors.append(f"{step_id}.steps[{index}]: 중복된 단계 ID: {compiled.id}")
+                continue
+            body.append(compiled)
+        
+        max_parallel = params.get('max_parallel', 1)
+        if isinstance(max_parallel, int) and max_parallel > 1:
+            writers = [body_step.id for body_step in body if self._page_access.get(body_step.type) == 'write']
+            if writers:
+                errors.append(f"{step_id}: 병렬 반복 본문에서 페이지를 변경하는 단계: {', '.join(writers)}")
+        
+        return tuple(body)
+    
+    def _compile_strategy(self, strategy: Any, location: str, step_id: str,
+                          errors: List[str]) -> Optional[RecoveryStrategy]:
+        """복구 전략 컴파일"""
+        if not isinstance(strategy, dict) or strategy.get('type') not in self.RECOVERY_TYPES:
+            errors.append(f"{location}: 알 수 없는 복구 전략")
+            return None
+        
+        strategy_type = strategy['type']
+        if strategy_type == 'retry':
+            numbers = {name: strategy.get(name, default) for name, default in
+                       (('delay', 1.0), ('backoff', 2.0), ('max_delay', 30.0), ('jitter', 0.1))}
+            invalid = [name for name, value in numbers.items()
+                       if not isinstance(value, (int, float)) or value < 0]
+            if invalid:
+                errors.append(f"{location}: 잘못된 재시도 설정: {', '.join(invalid)}")
+                return None
+            return RecoveryStrategy(
+                type=strategy_type,
+                max_retries=strategy.get('max_retries', 3),
+                **numbers
+            )
+        
+        if strategy_type == 'alternative':
+            if not strategy.get('step'):
+                errors.append(f"{location}: 대체 단계가 지정되지 않음")
+                return None
+            alt_step = self.compile_step(strategy['step'], f"{location}.step", errors, default_id=f"{step_id}_alt")
+            return RecoveryStrategy(type=strategy_type, step=alt_step) if alt_step else None
+        
+        if not strategy.get('checkpoint_id'):
+            errors.append(f"{location}: 롤백할 체크포인트가 지정되지 않음")
+            return None
+        return RecoveryStrategy(type=strategy_type, checkpoint_id=strategy['checkpoint_id'])
+    
+    def invalidate(self) -> None:
+        """캐시 비우기 (단계 핸들러 등록 변경 시)"""
+        with self._lock:
+            self._cache.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                'cached_plans': len(self._cache),
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,361 @@
+"""
+작업 흐름 실행기 모듈
+
+이 모듈은 여러 작업 흐름을 동시에 실행하는 실행기를 구현합니다.
+각 작업 흐름은 Playwright 플러그인에서 격리된 페이지를 임대받아 실행되며,
+동시 실행 수 제한과 그룹 간 공정 스케줄링(라운드 로빈)을 제공합니다.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from .workflow_manager import WorkflowManager, WorkflowStatus
+
+
+@dataclass
+class WorkflowJob:
+    """실행 대기/진행 중인 작업 흐름"""
+    workflow_id: str  # 작업 흐름 ID
+    group: str  # 공정 스케줄링 그룹 (예: 사용자, 테넌트)
+    future: Future = field(default_factory=Future)  # 실행 결과
+    submitted_at: float = field(default_factory=time.time)  # 제출 시간
+    started_at: Optional[float] = None  # 시작 시간
+
+
+class WorkflowExecutor:
+    """동시 작업 흐름 실행기
+    
+    제출된 작업 흐름은 그룹별 대기열에 쌓이고, 실행 슬롯이 비면 그룹을 돌아가며 하나씩 시작합니다.
+    브라우저 단계를 포함한 작업 흐름은 시작 시 Playwright 플러그인에서 페이지를 임대하고 종료 시 반납합니다.
+    """
+    
+    def __init__(self, workflow_manager: WorkflowManager, max_concurrent: int = 4,
+                 max_per_group: int = None, use_page_leases: bool = True,
+                 lease_timeout: float = 60.0, auto_cleanup: bool = True, max_finished: int = 256, logger=None):
+        """실행기 초기화
+        
+        Args:
+            workflow_manager: 작업 흐름 관리자
+            max_concurrent: 최대 동시 실행 작업 흐름 수
+            max_per_group: 그룹별 최대 동시 실행 수 (None이면 제한 없음)
+            use_page_leases: 작업 흐름별 브라우저 페이지 임대 여부
+            lease_timeout: 페이지 임대 대기 시간(초)
+            auto_cleanup: 완료된 작업 흐름을 관리자에서 정리할지 여부 (결과는 future에 남음)
+            max_finished: 결과 future를 보관할 완료 작업 흐름 수 (가장 오래 조회되지 않은 것부터 제거)
+            logger: 로거 객체
+        """
+        self.workflow_manager = workflow_manager
+        self.plugin_manager = workflow_manager.plugin_manager
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_group = max_per_group
+        self.use_page_leases = use_page_leases
+        self.lease_timeout = lease_timeout
+        self.auto_cleanup = auto_cleanup
+        self.max_finished = max(0, max_finished)
+        
+        self._queues: "OrderedDict[str, Deque[WorkflowJob]]" = OrderedDict()  # 그룹 -> 대기열 (순서 = 라운드 로빈 순서)
+        self._running: Dict[str, WorkflowJob] = {}  # 작업 흐름 ID -> 실행 중인 작업
+        self._running_per_group: Dict[str, int] = {}
+        self._jobs: Dict[str, WorkflowJob] = {}  # 작업 흐름 ID -> 대기/실행 중인 작업
+        self._finished: "OrderedDict[str, Future]" = OrderedDict()  # 작업 흐름 ID -> 완료된 작업 결과 (LRU)
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="workflow")
+        
+        # 통계
+        self._completed = 0
+        self._failed = 0
+    
+    def submit(self, workflow_plan: Dict[str, Any], settings: Dict[str, Any] = None,
+               group: str = 'default') -> str:
+        """작업 흐름 제출
+        
+        Args:
+            workflow_plan: 작업 계획
+            settings: 실행 설정 (작업 흐름마다 복사되어 격리됨)
+            group: 공정 스케줄링 그룹
+        
+        Returns:
+            작업 흐름 ID
+        """
+        if self._shutdown:
+            raise RuntimeError("실행기가 종료됨")
+        
+        # 같은 계획을 동시에 여러 번 제출해도 상태가 섞이지 않도록 ID 중복 시 새 ID 부여
+        # (완료된 작업 흐름의 ID는 다시 사용할 수 있으며 이전 결과는 새 실행으로 대체됨)
+        workflow_id = workflow_plan.get('id') or str(uuid.uuid4())
+        if workflow_id in self.workflow_manager.active_workflows or workflow_id in self._jobs:
+            workflow_id = f"{workflow_id}-{uuid.uuid4().hex[:8]}"
+        plan = dict(workflow_plan, id=workflow_id)
+        
+        settings = dict(settings or {})
+        settings['workflow_plan'] = plan
+        self.workflow_manager.create_workflow(plan, settings)
+        
+        job = WorkflowJob(workflow_id=workflow_id, group=group)
+        with self._lock:
+            self._finished.pop(workflow_id, None)
+            self._jobs[workflow_id] = job
+            self._queues.setdefault(group, deque()).append(job)
+        
+        self.logger.info(f"작업 흐름 제출: {workflow_id} (그룹: {group})")
+        self._dispatch()
+        return workflow_id
+    
+    def get_future(self, workflow_id: str) -> Optional[Future]:
+        """작업 흐름 결과 future 가져오기
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+        
+        Returns:
+            결과 future 또는 None (알 수 없거나 보관 기간이 지난 작업 흐름)
+        """
+        with self._lock:
+            job = self._jobs.get(workflow_id)
+            if job is not None:
+                return job.future
+            future = self._finished.get(workflow_id)
+            if future is not None:
+                self._finished.move_to_end(workflow_id)
+            return future
+    
+    def wait(self, workflow_id: str, timeout: float = None) -> Dict[str, Any]:
+        """작업 흐름 완료 대기
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            timeout: 대기 시간(초)
+        
+        Returns:
+            작업 결과
+        """
+        future = self.get_future(workflow_id)
+        if future is None:
+            raise KeyError(workflow_id)
+        return future.result(timeout=timeout)
+    
+    def cancel(self, workflow_id: str) -> bool:
+        """대기 중인 작업 흐름 취소 (실행 중이면 작업 흐름 관리자에서 취소)
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+        
+        Returns:
+            성공 여부
+        """
+        with self._lock:
+            job = self._jobs.get(workflow_id)
+            if job is None:
+                return False
+            
+            queue = self._queues.get(job.group)
+            if queue and job in queue:
+                queue.remove(job)
+                job.future.cancel()
+                self._retire(job)
+                self.workflow_manager.cleanup_workflow(workflow_id)
+                return True
+        
+        return self.workflow_manager.cancel_workflow(workflow_id)
+    
+    def _dispatch(self) -> None:
+        """실행 슬롯이 비어 있으면 대기열에서 그룹을 돌아가며 작업 시작"""
+        with self._lock:
+            while len(self._running) < self.max_concurrent and not self._shutdown:
+                job = self._next_job()
+                if job is None:
+                    break
+                
+                job.started_at = time.time()
+                self._running[job.workflow_id] = job
+                self._running_per_group[job.group] = self._running_per_group.get(job.group, 0) + 1
+                self._pool.submit(self._run_job, job)
+    
+    def _next_job(self) -> Optional[WorkflowJob]:
+        """라운드 로빈으로 다음 작업 선택 (호출 시 _lock 보유)
+        
+        Returns:
+            다음 작업 또는 None
+        """
+        for _ in range(len(self._queues)):
+            if not self._queues:
+                break
+            group, queue = next(iter(self._queues.items()))
+            # 선택 여부와 관계없이 그룹을 맨 뒤로 보내 다음 그룹에 차례를 넘김
+            self._queues.move_to_end(group)
+            
+            if not queue:
+                del self._queues[group]
+                continue
+            
+            if self.max_per_group is not None and self._running_per_group.get(group, 0) >= self.max_per_group:
+                continue
+            
+            return queue.popleft()
+        
+        return None
+    
+    def _run_job(self, job: WorkflowJob) -> None:
+        """작업 흐름 실행 (실행기 스레드)
+        
+        페이지 반납과 작업 흐름 정리가 끝난 뒤에 결과를 future에 설정합니다.
+        
+        Args:
+            job: 실행할 작업
+        """
+        workflow_id = job.workflow_id
+        lease_id = None
+        plugin = None
+        result = None
+        error = None
+        started = job.future.set_running_or_notify_cancel()
+        
+        try:
+            if started:
+                context = self.workflow_manager.active_workflows[workflow_id]
+                
+                if self.use_page_leases and self._needs_browser(context.settings.get('workflow_plan', {})):
+                    plugin, lease_id = self._acquire_page(context.settings, workflow_id)
+                    context.page_lease = lease_id
+                
+                result = self.workflow_manager.execute_workflow(workflow_id)
+        
+        except Exception as e:
+            self.logger.error(f"작업 흐름 실행기 오류: {workflow_id} - {str(e)}")
+            error = e
+        finally:
+            # 페이지 반납이 실패해도 작업 흐름 정리와 슬롯 반환은 진행
+            if lease_id:
+                try:
+                    plugin.execute_action('release_page', {'lease_id': lease_id})
+                except Exception as e:
+                    self.logger.error(f"페이지 반납 실패: {workflow_id} - {str(e)}")
+            
+            if self.auto_cleanup:
+                try:
+                    self.workflow_manager.cleanup_workflow(workflow_id)
+                except Exception as e:
+                    self.logger.error(f"작업 흐름 정리 실패: {workflow_id} - {str(e)}")
+            
+            with self._lock:
+                if started:
+                    if error is None and result.get('status') == WorkflowStatus.COMPLETED.value:
+                        self._completed += 1
+                    else:
+                        self._failed += 1
+                self._running.pop(workflow_id, None)
+                self._running_per_group[job.group] -= 1
+                if self._running_per_group[job.group] == 0:
+                    del self._running_per_group[job.group]
+                self._retire(job)
+            
+            if started:
+                if error is None:
+                    job.future.set_result(result)
+                else:
+                    job.future.set_exception(error)
+            
+            self._dispatch()
+    
+    def _retire(self, job: WorkflowJob) -> None:
+        """끝난 작업을 작업 목록에서 빼고 결과 future를 완료 목록에 보관 (호출 시 _lock 보유)
+        
+        Args:
+            job: 끝난 작업
+        """
+        self._jobs.pop(job.workflow_id, None)
+        if self.max_finished == 0:
+            return
+        self._finished[job.workflow_id] = job.future
+        self._finished.move_to_end(job.workflow_id)
+        while len(self._finished) > self.max_finished:
+            self._finished.popitem(last=False)
+    
+    def _needs_browser(self, workflow_plan: Dict[str, Any]) -> bool:
+        """작업 계획에 브라우저 페이지를 사용하는 단계가 있는지 확인"""
+        page_types = self.workflow_manager.step_page_access
+        return any(step.get('type') in page_types for step in workflow_plan.get('steps', []))
+    
+    def _acquire_page(self, settings: Dict[str, Any], workflow_id: str):
+        """Playwright 플러그인에서 작업 흐름 전용 페이지 임대
+        
+        Args:
+            settings: 작업 설정 (browser_config 사용)
+            workflow_id: 작업 흐름 ID (임대 ID로 사용)
+        
+        Returns:
+            (플러그인, 임대 ID)
+        """
+        plugin = self.plugin_manager.get_plugin("playwright_automation")
+        if plugin is None:
+            raise RuntimeError("Playwright 플러그인을 찾을 수 없음")
+        
+        plugin_id = plugin.get_plugin_info().id
+        if plugin_id not in self.plugin_manager.initialized_plugins:
+            if not self.plugin_manager.initialize_plugin(plugin_id, settings.get('browser_config', {})):
+                raise RuntimeError("Playwright 플러그인 초기화 실패")
+        
+        result = plugin.execute_action('acquire_page', {'lease_id': workflow_id, 'timeout': self.lease_timeout})
+        if not result.get('success', False):
+            raise RuntimeError(f"페이지 임대 실패: {result.get('error')}")
+        
+        return plugin, result['lease_id']
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """실행기 통계
+        
+        Returns:
+            대기/실행/완료 수, 보관 중인 완료 결과 수 및 그룹별 현황
+        """
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'running': len(self._running),
+                'queued': sum(len(queue) for queue in self._queues.values()),
+                'completed': self._completed,
+                'failed': self._failed,
+                'finished_retained': len(self._finished),
+                'running_per_group': dict(self._running_per_group),
+                'queued_per_group': {group: len(queue) for group, queue in self._queues.items() if queue}
+            }
+    
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """실행기 종료
+        
+        Args:
+            wait: 실행 중인 작업 흐름 완료 대기 여부
+            cancel_pending: 대기 중인 작업 흐름 취소 여부 (False면 모두 실행 후 종료)
+        """
+        if cancel_pending:
+            with self._lock:
+                pending = [job for queue in self._queues.values() for job in queue]
+                self._queues.clear()
+                for job in pending:
+                    job.future.cancel()
+                    self._retire(job)
+            for job in pending:
+                self.workflow_manager.cleanup_workflow(job.workflow_id)
+        elif wait:
+            # 대기 중인 작업이 모두 시작·완료될 때까지 대기
+            while True:
+                with self._lock:
+                    futures = [job.future for job in self._jobs.values() if not job.future.done()]
+                if not futures:
+                    break
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception:
+                        pass
+        
+        self._shutdown = True
+        self._pool.shutdown(wait=wait)
+        self.logger.info("작업 흐름 실행기 종료")
@@ -0,0 +1,328 @@
+"""
+작업 흐름 저널 모듈
+
+이 모듈은 작업 흐름의 단계 결과, 상태 변경, 체크포인트를 디스크에 추가 전용(JSONL)으로 기록하는 저널을 구현합니다.
+프로세스가 비정상 종료(브라우저 충돌, 메모리 부족, 재배포)되어도 저널을 재생하여 마지막으로 완료된 단계 이후부터 재개할 수 있습니다.
+기록은 메모리 버퍼에 쌓이고 백그라운드 스레드가 주기적으로 직렬화하여 파일에 씁니다.
+fsync는 재개 지점이 되는 이벤트(체크포인트, 종료 상태)와 작업 흐름 종료 시에만 수행합니다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON으로 직렬화할 수 없는 값 변환 (페이지 핸들 등은 재개 시 복원할 수 없으므로 표시만 남김)"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, 'to_json'):
+        return obj.to_json()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return f"<bytes:{len(obj)}>"
+    return f"<{type(obj).__name__}>"
+
+
+def _snapshot(value: Any, depth: int = 2) -> Any:
+    """기록 시점의 값 사본 (사전/목록/집합은 depth 단계까지 얕게 복사, 그 밖의 값은 공유)
+    
+    단계 출력처럼 상태와 공유되는 값을 이후 핸들러가 변경해도 쓰기 스레드의 직렬화가 깨지지 않도록 합니다.
+    """
+    if depth <= 0:
+        return value
+    if isinstance(value, dict):
+        return {key: _snapshot(item, depth - 1) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item, depth - 1) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return value
+
+
+# 버퍼 제어 항목 (쓰기 스레드에서 기록 순서대로 처리)
+_RESET = object()  # 같은 ID의 이전 저널 삭제 (begin)
+_DISCARD = object()  # 완료된 저널 삭제 (complete)
+_SYNC = object()  # 파일 fsync (complete)
+
+
+class WorkflowJournal:
+    """작업 흐름 저널
+    
+    작업 흐름마다 <directory>/<workflow_id>.jsonl 파일에 이벤트를 한 줄씩 추가합니다.
+    각 이벤트는 {'seq', 'time', 'type', ...} 형태이며 유형은 created, state, step, checkpoint,
+    restore, prune, recovered, status, resumed 입니다.
+    """
+    
+    SYNC_EVENTS = frozenset({'checkpoint', 'status'})  # 기록 후 fsync할 이벤트 유형
+    
+    def __init__(self, directory: str, flush_interval: float = 0.5, fsync: bool = True,
+                 max_buffered: int = 1000, retain_completed: bool = False, logger=None):
+        """저널 초기화
+        
+        Args:
+            directory: 저널 파일 디렉토리
+            flush_interval: 백그라운드 쓰기 주기(초)
+            fsync: 체크포인트/종료 상태 이벤트와 작업 흐름 종료 시 fsync 수행 여부
+            max_buffered: 버퍼 이벤트 수가 이 값을 넘으면 주기를 기다리지 않고 쓰기
+            retain_completed: 완료된 작업 흐름의 저널 파일 보존 여부
+            logger: 로거 객체
+        """
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_buffered = max_buffered
+        self.retain_completed = retain_completed
+        self.logger = logger or logging.getLogger(__name__)
+        
+        os.makedirs(directory, exist_ok=True)
+        
+        self._buffer: List[Tuple[str, Any]] = []  # (작업 흐름 ID, 이벤트 또는 제어 항목)
+        self._sequence: Dict[str, int] = {}  # 작업 흐름 ID -> 마지막 이벤트 번호
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        
+        # 통계
+        self._events = 0
+        self._flushes = 0
+        self._fsyncs = 0
+        
+        self._thread = threading.Thread(target=self._flush_loop, name="workflow-journal", daemon=True)
+        self._thread.start()
+    
+    def _get_path(self, workflow_id: str) -> str:
+        """작업 흐름 저널 파일 경로"""
+        safe_id = "".join(c if c.isalnum() or c in '-_.' else '_' for c in workflow_id)
+        return os.path.join(self.directory, f"{safe_id}.jsonl")
+    
+    def record(self, workflow_id: str, event_type: str, /, **data: Any) -> None:
+        """이벤트 기록 (버퍼에 추가만 하고 즉시 반환)
+        
+        직렬화는 쓰기 스레드에서 수행되므로 값의 위쪽 두 단계(단계 출력 사전과 그 값의 목록/사전)는 기록 시점에 복사합니다.
+        더 깊은 값이 동시에 변경되어 직렬화에 실패하면 해당 이벤트만 건너뜁니다.
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            event_type: 이벤트 유형
+            **data: 이벤트 데이터
+        """
+        if self._closed:
+            return
+        
+        with self._lock:
+            seq = self._sequence.get(workflow_id, 0) + 1
+            self._sequence[workflow_id] = seq
+            event = {'seq': seq, 'time': time.time(), 'type': event_type}
+            event.update((key, _snapshot(value)) for key, value in data.items())
+            self._buffer.append((workflow_id, event))
+            self._events += 1
+            buffered = len(self._buffer)
+        
+        if buffered >= self.max_buffered or event_type in self.SYNC_EVENTS:
+            self._wakeup.set()
+    
+    def flush(self) -> None:
+        """버퍼의 이벤트를 즉시 파일에 쓰기 (호출 스레드에서 동기 실행)"""
+        # 버퍼 교체와 쓰기를 함께 직렬화하여 동시 flush 시에도 기록 순서 유지
+        with self._write_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            
+            if batch:
+                self._write_batch(batch)
+    
+    def _flush_loop(self) -> None:
+        """백그라운드 쓰기 루프"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"작업 흐름 저널 쓰기 오류: {str(e)}")
+    
+    def _write_batch(self, batch: List[Tuple[str, Any]]) -> None:
+        """이벤트 묶음을 직렬화해 작업 흐름별 파일에 추가 (호출 시 _write_lock 보유)
+        
+        파일마다 한 번 쓰며, 동기화 이벤트나 종료 요청이 있는 파일만 fsync합니다.
+        삭제 요청 앞의 같은 작업 흐름 이벤트는 쓰지 않고 버립니다.
+        
+        Args:
+            batch: (작업 흐름 ID, 이벤트 또는 제어 항목) 목록
+        """
+        lines: Dict[str, List[str]] = {}
+        sync: Set[str] = set()
+        for workflow_id, event in batch:
+            if event is _RESET or event is _DISCARD:
+                lines.pop(workflow_id, None)
+                sync.discard(workflow_id)
+                self._remove_file(workflow_id, previous=event is _RESET)
+            elif event is _SYNC:
+                sync.add(workflow_id)
+            else:
+                try:
+                    line = json.dumps(event, ensure_ascii=False, default=_json_default)
+                except Exception as e:
+                    # 동시 변경(RuntimeError 등)도 이 이벤트만 건너뛰고 같은 묶음의 다른 이벤트는 기록
+                    self.logger.error(f"저널 이벤트 직렬화 실패: {workflow_id} ({event.get('type')}) - {str(e)}")
+                    continue
+                lines.setdefault(workflow_id, []).append(line)
+                if event['type'] in self.SYNC_EVENTS:
+                    sync.add(workflow_id)
+        
+        for workflow_id in list(lines) + [workflow_id for workflow_id in sync if workflow_id not in lines]:
+            path = self._get_path(workflow_id)
+            if workflow_id not in lines and not os.path.exists(path):
+                continue
+            with open(path, 'a', encoding='utf-8') as f:
+                if workflow_id in lines:
+                    f.write("\n".join(lines[workflow_id]) + "\n")
+                if self.fsync and workflow_id in sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._fsyncs += 1
+        self._flushes += 1
+    
+    def _remove_file(self, workflow_id: str, previous: bool = False) -> None:
+        """작업 흐름 저널 파일 삭제 (호출 시 _write_lock 보유)
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            previous: 새 작업 흐름이 같은 ID의 이전 저널을 지우는 경우 (경고 기록)
+        """
+        path = self._get_path(workflow_id)
+        if os.path.exists(path):
+            if previous:
+                self.logger.warning(f"같은 ID의 이전 작업 흐름 저널 삭제: {workflow_id}")
+            os.remove(path)
+    
+    def load(self, workflow_id: str) -> List[Dict[str, Any]]:
+        """작업 흐름 이벤트 읽기
+        
+        비정상 종료로 마지막 줄이 잘린 경우 해당 줄은 무시합니다.
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+        
+        Returns:
+            이벤트 목록 (순서대로)
+        """
+        self.flush()
+        
+        path = self._get_path(workflow_id)
+        if not os.path.exists(path):
+            return []
+        
+        events = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self.logger.warning(f"손상된 저널 항목 무시: {workflow_id}:{line_no}")
+        
+        # 재개 후 이어서 기록할 때 이벤트 번호가 이어지도록 설정
+        if events:
+            with self._lock:
+                self._sequence[workflow_id] = max(self._sequence.get(workflow_id, 0), events[-1].get('seq', 0))
+        
+        return events
+    
+    def list_incomplete(self) -> List[str]:
+        """재개할 수 있는(완료되지 않은) 작업 흐름 ID 목록
+        
+        Returns:
+            작업 흐름 ID 목록
+        """
+        self.flush()
+        
+        incomplete = []
+        for file_name in sorted(os.listdir(self.directory)):
+            if not file_name.endswith('.jsonl'):
+                continue
+            
+            workflow_id = None
+            status = None
+            with open(os.path.join(self.directory, file_name), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if event.get('type') == 'created':
+                        workflow_id = event.get('workflow_id')
+                    elif event.get('type') == 'status':
+                        status = event.get('status')
+            
+            if workflow_id and status != 'completed':
+                incomplete.append(workflow_id)
+        
+        return incomplete
+    
+    def begin(self, workflow_id: str) -> None:
+        """새 작업 흐름 기록 시작 (같은 ID의 이전 저널은 쓰기 스레드에서 삭제)
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+        """
+        with self._lock:
+            self._sequence.pop(workflow_id, None)
+            self._buffer.append((workflow_id, _RESET))
+    
+    def complete(self, workflow_id: str, completed: bool) -> None:
+        """작업 흐름 종료 처리 (쓰기 스레드에서 완료된 저널은 설정에 따라 삭제하고, 남기는 저널은 fsync)
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            completed: 성공적으로 완료되었는지 여부
+        """
+        with self._lock:
+            self._sequence.pop(workflow_id, None)
+            self._buffer.append((workflow_id, _DISCARD if completed and not self.retain_completed else _SYNC))
+        self._wakeup.set()
+    
+    def remove(self, workflow_id: str) -> None:
+        """작업 흐름 저널 파일 삭제
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+        """
+        self.flush()
+        with self._write_lock:
+            self._remove_file(workflow_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """저널 통계
+        
+        Returns:
+            기록 이벤트 수, 쓰기/fsync 횟수, 버퍼 크기 (제어 항목 포함)
+        """
+        with self._lock:
+            return {
+                'events': self._events,
+                'flushes': self._flushes,
+                'fsyncs': self._fsyncs,
+                'buffered': len(self._buffer)
+            }
+    
+    def close(self) -> None:
+        """백그라운드 스레드 종료 및 남은 이벤트 쓰기"""
+        if self._closed:
+            return
+        
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout=max(1.0, self.flush_interval * 2))
+        self.flush()
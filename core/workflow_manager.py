@@ -4,15 +4,30 @@
 이 모듈은 자동화 작업의 흐름을 관리합니다.
 서버에서 받은 작업 계획을 실행하고, 작업 상태를 추적하며, 오류 발생 시 복구를 담당합니다.
 """
+import contextvars
+import functools
 import json
 import logging
+import os
+import threading
 import time
 import uuid
+from collections import ChainMap, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+from . import tracing
+from .blob_store import BlobRef, BlobStore, estimate_size
+from .deadline import Deadline, DeadlineExceeded, clamp_timeout, current_deadline, deadline_scope
 from .plugin_system import PluginManager, PluginType
+from .result_sink import MemorySink, ResultSink, create_sink
+from .retry_scheduler import RetryScheduler
+from .step_cache import StepResultCache
+from .state_journal import JournaledState
+from .workflow_compiler import CompiledPlan, CompiledStep, ParamTemplate, PlanCompileError, WorkflowCompiler
+from .workflow_journal import WorkflowJournal
 
 
 class StepStatus(Enum):
@@ -33,6 +48,246 @@ class WorkflowStatus(Enum):
     PAUSED = "paused"  # 일시 중지
 
 
+class WorkflowEventType(Enum):
+    """작업 흐름 이벤트 유형"""
+    WORKFLOW_CREATED = "workflow_created"  # 작업 흐름 생성
+    STATUS_CHANGED = "status_changed"  # 작업 흐름 상태 변경
+    STEP_STARTED = "step_started"  # 단계 시작
+    STEP_COMPLETED = "step_completed"  # 단계 완료
+    STEP_FAILED = "step_failed"  # 단계 실패
+    CHECKPOINT_CREATED = "checkpoint_created"  # 체크포인트 생성
+    CHECKPOINT_RESTORED = "checkpoint_restored"  # 체크포인트 복원
+    WORKFLOW_FINISHED = "workflow_finished"  # 작업 흐름 실행 종료 (결과 생성)
+    WORKFLOW_REMOVED = "workflow_removed"  # 작업 흐름 정리
+
+
+@dataclass
+class WorkflowEvent:
+    """작업 흐름 이벤트 (변경분만 포함)"""
+    type: WorkflowEventType  # 이벤트 유형
+    workflow_id: str  # 작업 흐름 ID
+    data: Dict[str, Any] = field(default_factory=dict)  # 이벤트 데이터
+    time: float = field(default_factory=time.time)  # 발생 시간
+    seq: int = 0  # 이벤트 버스 일련번호
+
+
+class WorkflowEventSubscription:
+    """작업 흐름 이벤트 구독 (크기가 제한된 스레드 안전 대기열)
+    
+    대기열이 가득 차면 overflow 정책에 따라 처리합니다.
+    - drop_oldest: 가장 오래된 이벤트를 버림 (GUI처럼 최신 상태만 중요한 구독자)
+    - drop_newest: 새 이벤트를 버림
+    - block: 발행자가 block_timeout 동안 기다린 후 버림 (서버 전달처럼 유실을 줄여야 하는 구독자)
+    """
+    
+    OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+    
+    def __init__(self, bus: 'WorkflowEventBus', maxsize: int = 1000, overflow: str = 'drop_oldest',
+                 workflow_id: str = None, event_types: Iterable[WorkflowEventType] = None,
+                 block_timeout: float = 1.0):
+        """구독 초기화
+        
+        Args:
+            bus: 이벤트 버스
+            maxsize: 최대 대기 이벤트 수
+            overflow: 대기열이 가득 찼을 때 정책 (drop_oldest, drop_newest, block)
+            workflow_id: 구독할 작업 흐름 ID (None이면 전체)
+            event_types: 구독할 이벤트 유형 (None이면 전체)
+            block_timeout: block 정책에서 발행자가 기다리는 최대 시간(초)
+        """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"알 수 없는 대기열 초과 정책: {overflow}")
+        
+        self.maxsize = max(1, maxsize)
+        self.overflow = overflow
+        self.workflow_id = workflow_id
+        self.event_types = frozenset(event_types) if event_types is not None else None
+        self.block_timeout = block_timeout
+        self.dropped = 0  # 버린 이벤트 수
+        
+        self._bus = bus
+        self._events: Deque[WorkflowEvent] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+    
+    @property
+    def closed(self) -> bool:
+        """구독 종료 여부"""
+        return self._closed
+    
+    @property
+    def pending(self) -> int:
+        """대기 중인 이벤트 수"""
+        with self._condition:
+            return len(self._events)
+    
+    def matches(self, event: WorkflowEvent) -> bool:
+        """이벤트가 구독 조건에 맞는지 확인"""
+        return ((self.workflow_id is None or event.workflow_id == self.workflow_id) and
+                (self.event_types is None or event.type in self.event_types))
+    
+    def put(self, event: WorkflowEvent) -> bool:
+        """이벤트 추가 (이벤트 버스에서 호출)
+        
+        Args:
+            event: 이벤트
+            
+        Returns:
+            대기열에 추가되었는지 여부
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            
+            if len(self._events) >= self.maxsize:
+                if self.overflow == 'drop_oldest':
+                    self._events.popleft()
+                    self.dropped += 1
+                elif self.overflow == 'block':
+                    self._condition.wait_for(lambda: self._closed or len(self._events) < self.maxsize,
+                                             self.block_timeout)
+                    if self._closed or len(self._events) >= self.maxsize:
+                        self.dropped += 1
+                        return False
+                else:
+                    self.dropped += 1
+                    return False
+            
+            self._events.append(event)
+            self._condition.notify_all()
+            return True
+    
+    def get(self, timeout: float = None) -> Optional[WorkflowEvent]:
+        """이벤트 하나 가져오기
+        
+        Args:
+            timeout: 최대 대기 시간(초) (None이면 이벤트가 올 때까지 대기)
+            
+        Returns:
+            이벤트 또는 None (시간 초과 또는 구독 종료)
+        """
+        events = self.drain(1, timeout)
+        return events[0] if events else None
+    
+    def drain(self, max_events: int = None, timeout: float = None) -> List[WorkflowEvent]:
+        """대기 중인 이벤트를 한꺼번에 가져오기 (없으면 첫 이벤트까지 대기)
+        
+        Args:
+            max_events: 최대 개수 (None이면 전체)
+            timeout: 첫 이벤트 최대 대기 시간(초) (0이면 대기하지 않음)
+            
+        Returns:
+            이벤트 목록 (발생 순서)
+        """
+        with self._condition:
+            if not self._events and not self._closed and timeout != 0:
+                self._condition.wait_for(lambda: self._events or self._closed, timeout)
+            
+            count = len(self._events) if max_events is None else min(max_events, len(self._events))
+            events = [self._events.popleft() for _ in range(count)]
+            if events:
+                # block 정책에서 기다리는 발행자 깨우기
+                self._condition.notify_all()
+            return events
+    
+    def close(self) -> None:
+        """구독 종료 (대기 중인 get/drain과 발행자 깨우기)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._bus.unsubscribe(self)
+
+
+class WorkflowEventBus:
+    """작업 흐름 이벤트 버스
+    
+    작업 흐름 실행 스레드에서 발행한 이벤트를 구독별 대기열로 전달합니다.
+    구독자(GUI, 서버 전달 등)는 작업 흐름 사전을 주기적으로 조회하지 않고 변경분 이벤트만 소비합니다.
+    """
+    
+    def __init__(self, logger=None):
+        """이벤트 버스 초기화
+        
+        Args:
+            logger: 로거 객체
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._subscriptions: List[WorkflowEventSubscription] = []
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._published = 0
+    
+    def subscribe(self, maxsize: int = 1000, overflow: str = 'drop_oldest', workflow_id: str = None,
+                  event_types: Iterable[WorkflowEventType] = None,
+                  block_timeout: float = 1.0) -> WorkflowEventSubscription:
+        """이벤트 구독
+        
+        Args:
+            maxsize: 최대 대기 이벤트 수
+            overflow: 대기열이 가득 찼을 때 정책 (drop_oldest, drop_newest, block)
+            workflow_id: 구독할 작업 흐름 ID (None이면 전체)
+            event_types: 구독할 이벤트 유형 (None이면 전체)
+            block_timeout: block 정책에서 발행자가 기다리는 최대 시간(초)
+            
+        Returns:
+            구독 (close()로 종료)
+        """
+        subscription = WorkflowEventSubscription(self, maxsize, overflow, workflow_id, event_types, block_timeout)
+        with self._lock:
+            # 발행 중 목록을 복사하지 않도록 새 목록으로 교체
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+    
+    def unsubscribe(self, subscription: WorkflowEventSubscription) -> None:
+        """구독 해제
+        
+        Args:
+            subscription: 구독
+        """
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+    
+    def publish(self, event_type: WorkflowEventType, workflow_id: str, /, **data: Any) -> None:
+        """이벤트 발행 (구독자가 없으면 이벤트를 만들지 않음)
+        
+        Args:
+            event_type: 이벤트 유형
+            workflow_id: 작업 흐름 ID
+            **data: 이벤트 데이터
+        """
+        subscriptions = self._subscriptions
+        if not subscriptions:
+            return
+        
+        with self._lock:
+            self._sequence += 1
+            self._published += 1
+            event = WorkflowEvent(type=event_type, workflow_id=workflow_id, data=data, seq=self._sequence)
+        
+        for subscription in subscriptions:
+            if subscription.matches(event) and not subscription.put(event) and not subscription.closed:
+                self.logger.debug(f"이벤트 대기열 초과로 버림: {event_type.value} ({workflow_id})")
+    
+    @property
+    def active(self) -> bool:
+        """구독자가 있는지 여부"""
+        return bool(self._subscriptions)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """이벤트 버스 통계
+        
+        Returns:
+            구독 수, 발행 이벤트 수, 구독별 대기/버림 수
+        """
+        subscriptions = self._subscriptions
+        return {
+            'subscriptions': len(subscriptions),
+            'published': self._published,
+            'pending': [s.pending for s in subscriptions],
+            'dropped': [s.dropped for s in subscriptions]
+        }
+
+
 @dataclass
 class StepResult:
     """작업 단계 결과"""
@@ -42,51 +297,194 @@ class StepResult:
     execution_time: float = 0.0  # 실행 시간(초)
 
 
+@dataclass
+class RetentionPolicy:
+    """작업 흐름 컨텍스트 보존 정책
+    
+    작업 설정의 같은 이름 키(max_execution_path, spill_threshold, prune_state, keep_state_keys)로 작업 흐름별로 변경할 수 있습니다.
+    """
+    max_execution_path: Optional[int] = None  # 실행 경로 최대 길이 (None이면 제한 없음, 오래된 항목부터 제거)
+    spill_threshold: Optional[int] = None  # 블롭으로 내보낼 단계 출력 값 크기(바이트) (None이면 메모리에 보관)
+    prune_state: bool = False  # 이후 단계가 참조하지 않는 단계 출력 상태 키 제거 여부
+    keep_state_keys: Tuple[str, ...] = ('automation_context',)  # 정리하지 않을 상태 키 (핸들러가 직접 읽는 키)
+    
+    def merged(self, settings: Dict[str, Any]) -> 'RetentionPolicy':
+        """작업 설정을 반영한 정책 (keep_state_keys는 기본값에 추가됨)
+        
+        Args:
+            settings: 작업 설정
+            
+        Returns:
+            보존 정책
+        """
+        return RetentionPolicy(
+            max_execution_path=settings.get('max_execution_path', self.max_execution_path),
+            spill_threshold=settings.get('spill_threshold', self.spill_threshold),
+            prune_state=settings.get('prune_state', self.prune_state),
+            keep_state_keys=tuple(dict.fromkeys(self.keep_state_keys + tuple(settings.get('keep_state_keys', ()))))
+        )
+
+
 @dataclass
 class WorkflowContext:
     """작업 흐름 컨텍스트"""
     workflow_id: str  # 작업 흐름 ID
-    state: Dict[str, Any] = field(default_factory=dict)  # 상태 저장소
+    state: Dict[str, Any] = field(default_factory=JournaledState)  # 상태 저장소 (변경 저널 포함)
     settings: Dict[str, Any] = field(default_factory=dict)  # 작업 설정
     results: Dict[str, StepResult] = field(default_factory=dict)  # 단계별 결과
-    checkpoints: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # 체크포인트
+    checkpoints: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # 체크포인트 (저널 위치)
     execution_path: List[str] = field(default_factory=list)  # 실행 경로
     start_time: float = field(default_factory=time.time)  # 시작 시간
     status: WorkflowStatus = WorkflowStatus.PENDING  # 작업 흐름 상태
+    page_lease: Optional[str] = None  # 임대한 브라우저 페이지 ID (WorkflowExecutor에서 설정)
+    plan: Optional[CompiledPlan] = None  # 컴파일된 실행 계획
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)  # 병렬 단계 실행용 잠금
+    journal: Optional[WorkflowJournal] = field(default=None, repr=False, compare=False)  # 디스크 저널 (재개용)
+    cache_hits: int = 0  # 단계 결과 캐시 적중 수
+    cache_misses: int = 0  # 단계 결과 캐시 미스 수
+    trace: Optional[tracing.Trace] = field(default=None, repr=False, compare=False)  # 실행 추적
+    deadline: Optional[Deadline] = field(default=None, repr=False, compare=False)  # 작업 흐름 실행 기한 (취소 전파)
+    event_bus: Optional[WorkflowEventBus] = field(default=None, repr=False, compare=False)  # 변경 이벤트 발행 대상
+    retention: RetentionPolicy = field(default_factory=RetentionPolicy)  # 보존 정책
+    path_offset: int = 0  # 실행 경로에서 잘려 나간 항목 수
+    output_keys: Set[str] = field(default_factory=set)  # 단계 출력으로 쓰인 상태 키 (상태 정리 대상)
+    pruned_keys: int = 0  # 정리된 상태 키 수
+    blob_store: Optional[BlobStore] = field(default=None, repr=False, compare=False)  # 큰 단계 출력 저장소
+    sinks: Dict[str, ResultSink] = field(default_factory=dict, repr=False, compare=False)  # 반복 단계 ID -> 기본 메모리 싱크
+    
+    def __post_init__(self):
+        if not isinstance(self.state, JournaledState):
+            self.state = JournaledState(self.state)
     
     def get_step_result(self, step_id: str) -> Optional[StepResult]:
         """단계 결과 가져오기"""
         return self.results.get(step_id)
     
+    def load_value(self, value: Any) -> Any:
+        """단계 출력 값 읽기 (블롭으로 내보낸 값은 블롭 저장소에서 읽음)"""
+        if isinstance(value, BlobRef) and self.blob_store is not None:
+            return self.blob_store.get(value)
+        return value
+    
     def set_step_result(self, step_id: str, result: StepResult) -> None:
         """단계 결과 설정"""
-        self.results[step_id] = result
-        self.execution_path.append(step_id)
+        with self.lock:
+            self.results[step_id] = result
+            self.execution_path.append(step_id)
+            self._trim_path()
+            if self.journal is not None:
+                # 상태 이벤트로 이미 기록된 출력 값은 키만 기록 (재생 시 상태에서 복원)
+                output = result.output or {}
+                state_keys = [key for key, value in output.items() if key in self.state and self.state[key] is value]
+                self.record_event('step', step_id=step_id, status=result.status.value,
+                                  output={key: value for key, value in output.items() if key not in state_keys},
+                                  state_keys=state_keys, error=result.error, execution_time=result.execution_time)
+            if self.event_bus is not None and self.event_bus.active:
+                event_type = (WorkflowEventType.STEP_FAILED if result.status == StepStatus.FAILED
+                              else WorkflowEventType.STEP_COMPLETED)
+                self.publish(event_type, step_id=step_id, status=result.status.value, error=result.error,
+                             step_time=result.execution_time,
+                             completed_steps=sum(1 for r in self.results.values() if r.status == StepStatus.COMPLETED),
+                             step_count=len(self.results))
+    
+    def _trim_path(self) -> None:
+        """실행 경로를 최대 길이로 줄이기
+        
+        잘린 구간까지 되돌려야 하는 체크포인트는 단계 결과를 정확히 되돌릴 수 없으므로 제거됩니다.
+        """
+        limit = self.retention.max_execution_path
+        excess = len(self.execution_path) - limit if limit else 0
+        if excess <= 0:
+            return
+        
+        del self.execution_path[:excess]
+        self.path_offset += excess
+        dropped = [cid for cid, cp in self.checkpoints.items() if cp['path_length'] < self.path_offset]
+        for checkpoint_id in dropped:
+            del self.checkpoints[checkpoint_id]
+        if dropped:
+            self._compact_journal()
+    
+    def _compact_journal(self) -> None:
+        """남은 체크포인트 중 가장 오래된 위치 이전의 상태 저널 기록 버리기
+        
+        남은 체크포인트가 없으면 저널 전체를 버려 덮어쓰거나 정리한 값이 저널에 남지 않도록 합니다.
+        """
+        oldest: Dict[int, Tuple[JournaledState, int]] = {}  # id(상태 저장소) -> (저장소, 가장 오래된 위치)
+        for checkpoint in self.checkpoints.values():
+            state, position = checkpoint['state'], checkpoint['journal_position']
+            if id(state) not in oldest or position < oldest[id(state)][1]:
+                oldest[id(state)] = (state, position)
+        
+        for state, position in oldest.values():
+            state.compact(position)
+        if id(self.state) not in oldest and isinstance(self.state, JournaledState):
+            self.state.reset_journal()
+    
+    def set_status(self, status: WorkflowStatus) -> None:
+        """작업 흐름 상태 변경 (변경된 경우 이벤트 발행)"""
+        if self.status == status:
+            return
+        self.status = status
+        self.publish(WorkflowEventType.STATUS_CHANGED, status=status.value)
     
     def create_checkpoint(self, checkpoint_id: str) -> None:
-        """체크포인트 생성"""
-        self.checkpoints[checkpoint_id] = {
-            'state': self.state.copy(),
-            'execution_path': self.execution_path.copy(),
-            'results': {k: v for k, v in self.results.items()},
-            'time': time.time()
-        }
+        """체크포인트 생성
+        
+        상태를 복사하지 않고 상태 저널 위치와 실행 경로 길이만 기록합니다.
+        """
+        with self.lock:
+            if not isinstance(self.state, JournaledState):
+                self.state = JournaledState(self.state)
+            
+            replaced = checkpoint_id in self.checkpoints
+            self.checkpoints[checkpoint_id] = {
+                'state': self.state,
+                'journal_position': self.state.mark(),
+                'path_length': self.path_offset + len(self.execution_path),
+                'time': time.time()
+            }
+            if replaced:
+                self._compact_journal()
+            self.record_event('checkpoint', checkpoint_id=checkpoint_id)
+            self.publish(WorkflowEventType.CHECKPOINT_CREATED, checkpoint_id=checkpoint_id)
     
     def restore_checkpoint(self, checkpoint_id: str) -> bool:
-        """체크포인트 복원"""
+        """체크포인트 복원
+        
+        체크포인트 이후의 상태 변경만 역순으로 되돌리며,
+        복원한 체크포인트 이후에 만들어진 체크포인트는 무효가 되어 제거됩니다.
+        """
         if checkpoint_id not in self.checkpoints:
             return False
         
-        checkpoint = self.checkpoints[checkpoint_id]
-        self.state = checkpoint['state'].copy()
-        
-        # 체크포인트 이후 단계 결과 제거
-        checkpoint_path = checkpoint['execution_path']
-        for step_id in self.execution_path[len(checkpoint_path):]:
-            if step_id in self.results:
-                del self.results[step_id]
-        
-        self.execution_path = checkpoint_path.copy()
+        with self.lock:
+            checkpoint = self.checkpoints[checkpoint_id]
+            position = checkpoint['journal_position']
+            path_length = checkpoint['path_length']
+            local_length = path_length - self.path_offset  # 잘린 구간의 체크포인트는 이미 제거됨
+            
+            # 상태 객체가 통째로 교체된 경우에도 체크포인트 시점의 저장소로 되돌림
+            self.state = checkpoint['state']
+            self.state.rollback(position)
+            
+            # 체크포인트 이후 단계 결과 제거
+            for step_id in self.execution_path[local_length:]:
+                if step_id in self.results:
+                    del self.results[step_id]
+            
+            del self.execution_path[local_length:]
+            
+            # 되돌린 구간에 속한 체크포인트 제거
+            for later_id in [cid for cid, cp in self.checkpoints.items()
+                             if cp['state'] is self.state and
+                             (cp['journal_position'] > position or cp['path_length'] > path_length)]:
+                del self.checkpoints[later_id]
+            
+            self.record_event('restore', checkpoint_id=checkpoint_id)
+            self.publish(WorkflowEventType.CHECKPOINT_RESTORED, checkpoint_id=checkpoint_id,
+                         completed_steps=sum(1 for r in self.results.values() if r.status == StepStatus.COMPLETED),
+                         step_count=len(self.results))
         return True
     
     def get_execution_time(self) -> float:
@@ -95,7 +493,29 @@ class WorkflowContext:
     
     def update_state(self, updates: Dict[str, Any]) -> None:
         """상태 업데이트"""
-        self.state.update(updates)
+        with self.lock:
+            self.state.update(updates)
+            self.output_keys.update(updates)
+            self.record_event('state', updates=updates)
+    
+    def prune_state(self, keys: List[str]) -> None:
+        """상태 키 제거 (상태 저널에 기록되어 체크포인트 롤백 시 되돌려짐)"""
+        with self.lock:
+            for key in keys:
+                self.state.pop(key, None)
+                self.output_keys.discard(key)
+            self.pruned_keys += len(keys)
+            self.record_event('prune', keys=keys)
+    
+    def record_event(self, event_type: str, /, **data: Any) -> None:
+        """디스크 저널에 이벤트 기록 (저널이 없으면 무시)"""
+        if self.journal is not None:
+            self.journal.record(self.workflow_id, event_type, **data)
+    
+    def publish(self, event_type: WorkflowEventType, /, **data: Any) -> None:
+        """이벤트 버스에 변경 이벤트 발행 (이벤트 버스가 없으면 무시)"""
+        if self.event_bus is not None:
+            self.event_bus.publish(event_type, self.workflow_id, elapsed=self.get_execution_time(), **data)
 
 
 class WorkflowError(Exception):
@@ -103,40 +523,148 @@ class WorkflowError(Exception):
     pass
 
 
+class PageBoundPlugin:
+    """임대 페이지/브라우저 탭에 바인딩된 자동화 플러그인 프록시
+    
+    execute_action/execute_batch 호출에 lease_id와 page_id를 추가하며 나머지 속성은 원래 플러그인으로 위임합니다.
+    """
+    
+    def __init__(self, plugin: Any, page_id: str = None, lease_id: str = None):
+        self._plugin = plugin
+        self._page_id = page_id
+        self._lease_id = lease_id
+    
+    def execute_action(self, action_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        return self._plugin.execute_action(action_type, self._bind_params(params))
+    
+    def execute_batch(self, actions: List[Any], stop_on_error: bool = True) -> Dict[str, Any]:
+        bound = [dict(spec, params=self._bind_params(spec.get('params'))) if isinstance(spec, dict)
+                 else (spec[0], self._bind_params(spec[1])) for spec in actions]
+        return self._plugin.execute_batch(bound, stop_on_error)
+    
+    def _bind_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        params = dict(params or {})
+        if self._page_id:
+            params.setdefault('page_id', self._page_id)
+        if self._lease_id:
+            params.setdefault('lease_id', self._lease_id)
+        return params
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._plugin, name)
+
+
 class WorkflowManager:
     """작업 흐름 관리자"""
     
-    def __init__(self, plugin_manager: PluginManager, logger=None):
+    def __init__(self, plugin_manager: PluginManager, logger=None, journal: Optional[WorkflowJournal] = None,
+                 retry_scheduler: Optional[RetryScheduler] = None, step_cache: Optional[StepResultCache] = None,
+                 tracing_enabled: bool = True, trace_dir: str = None,
+                 step_timeout: float = None, workflow_timeout: float = None, cancel_grace: float = 1.0,
+                 event_bus: Optional[WorkflowEventBus] = None, retention: Optional[RetentionPolicy] = None,
+                 blob_store: Optional[BlobStore] = None):
         """작업 흐름 관리자 초기화
         
         Args:
             plugin_manager: 플러그인 관리자
             logger: 로거 객체
+            journal: 작업 흐름 디스크 저널 (None이면 기록하지 않음)
+            retry_scheduler: 재시도 스케줄러 (None이면 새로 생성)
+            step_cache: 멱등 단계 결과 캐시 (None이면 새로 생성)
+            tracing_enabled: 작업 흐름 실행 추적 기본 활성화 여부 (설정의 trace로 작업 흐름별 변경)
+            trace_dir: 추적 내보내기 디렉토리 (None이면 메모리에만 보관)
+            step_timeout: 기본 단계 실행 기한(초) (None이면 제한 없음, 설정의 step_timeout으로 작업 흐름별 변경)
+            workflow_timeout: 기본 작업 흐름 실행 기한(초) (None이면 제한 없음, 설정의 workflow_timeout으로 변경)
+            cancel_grace: 기한 초과 후 단계가 끝나기까지 허용하는 시간(초) (넘기면 페이지 임대를 폐기)
+            event_bus: 작업 흐름 이벤트 버스 (None이면 새로 생성)
+            retention: 기본 컨텍스트 보존 정책 (None이면 제한 없음)
+            blob_store: 큰 단계 출력 블롭 저장소 (None이면 출력을 메모리에 보관)
         """
         self.plugin_manager = plugin_manager
         self.logger = logger or logging.getLogger(__name__)
+        self.journal = journal
+        self.retry_scheduler = retry_scheduler or RetryScheduler(logger=self.logger)
+        self.step_cache = step_cache or StepResultCache()
+        self.tracing_enabled = tracing_enabled
+        self.trace_dir = trace_dir
+        self.step_timeout = step_timeout
+        self.workflow_timeout = workflow_timeout
+        self.cancel_grace = cancel_grace
+        self.events = event_bus or WorkflowEventBus(logger=self.logger)
+        self.retention = retention or RetentionPolicy()
+        self.blob_store = blob_store
+        self.recognition_stats: Dict[str, Dict[str, Any]] = {}  # 인식 전략 -> 통계
+        self._recognition_lock = threading.Lock()
         self.active_workflows: Dict[str, WorkflowContext] = {}
         self.step_handlers: Dict[str, Callable] = {}
+        self.step_outputs: Dict[str, Optional[Set[str]]] = {}  # 단계 유형 -> 출력 상태 키
+        self.step_page_access: Dict[str, str] = {}  # 단계 유형 -> 브라우저 탭 접근 방식
+        self.step_cache_policies: Dict[str, Tuple[Callable, Optional[Callable], Optional[float]]] = {}  # 단계 유형 -> (캐시 키, 저장 조건, TTL)
+        self.step_receives_step: Set[str] = set()  # 컴파일된 단계를 step 인자로 받는 단계 유형 (반복 단계)
+        self.sinks: Dict[str, ResultSink] = {}  # 이름 -> 등록된 결과 싱크
+        self.compiler = WorkflowCompiler(self.step_handlers, self.step_outputs, self.step_page_access)
         self._register_default_step_handlers()
     
     def _register_default_step_handlers(self) -> None:
         """기본 단계 핸들러 등록"""
         # 기본 핸들러 등록 (향후 확장)
-        self.register_step_handler("web_navigation", self._handle_web_navigation)
-        self.register_step_handler("element_recognition", self._handle_element_recognition)
-        self.register_step_handler("interruption_handling", self._handle_interruption_handling)
-        self.register_step_handler("input_text", self._handle_input_text)
-        self.register_step_handler("key_press", self._handle_key_press)
-        self.register_step_handler("wait_for_load", self._handle_wait_for_load)
-    
-    def register_step_handler(self, step_type: str, handler: Callable) -> None:
+        # 인식은 같은 문서(로드 단위)에서 멱등이므로 결과 캐시 사용 (탐색은 페이지를 바꾸므로 캐시하지 않음)
+        self.register_step_handler("web_navigation", self._handle_web_navigation,
+                                   outputs=['current_url'], page_access='write')
+        self.register_step_handler("element_recognition", self._handle_element_recognition,
+                                   outputs=['element', 'strategy_used', 'confidence', 'recognition_time', 'ignored_errors'],
+                                   page_access='read', cache_key=self._page_cache_key,
+                                   cache_if=lambda output: not output.get('ignored_errors'))
+        self.register_step_handler("interruption_handling", self._handle_interruption_handling,
+                                   outputs=[], page_access='write')
+        self.register_step_handler("input_text", self._handle_input_text,
+                                   outputs=['text', 'selector', 'method'], page_access='write')
+        self.register_step_handler("key_press", self._handle_key_press,
+                                   outputs=['key', 'method', 'success'], page_access='write')
+        self.register_step_handler("wait_for_load", self._handle_wait_for_load,
+                                   outputs=['url'], page_access='write')
+        self.register_step_handler("set_blocking_profile", self._handle_set_blocking_profile,
+                                   outputs=['blocking_profile'], page_access='write')
+        # 반복 단계: 본문 단계 출력은 싱크로 보내고 반복 통계만 상태에 씀
+        self.register_step_handler("foreach", self._handle_foreach,
+                                   outputs=['iterations', 'failed_iterations', 'pages'], page_access='write',
+                                   receives_step=True)
+        self.register_step_handler("while", self._handle_while,
+                                   outputs=['iterations', 'failed_iterations'], page_access='write',
+                                   receives_step=True)
+    
+    def register_step_handler(self, step_type: str, handler: Callable, outputs: List[str] = None,
+                              page_access: str = None, cache_key: Callable = None,
+                              cache_if: Callable = None, cache_ttl: float = None, receives_step: bool = False) -> None:
         """단계 핸들러 등록
         
         Args:
             step_type: 단계 유형
             handler: 핸들러 함수
+            outputs: 핸들러가 상태에 쓰는 키 목록 (None이면 알 수 없음, DAG 모드에서 직렬화됨)
+            page_access: 브라우저 탭 접근 방식 ('read', 'write' 또는 None)
+            cache_key: 멱등 단계의 결과 캐시 키 함수 (context, params) -> 해시 가능한 값 또는 None(캐시 안 함).
+                       최종 키는 (단계 유형, 해결된 파라미터, 반환값)
+            cache_if: 출력을 캐시에 저장할지 판단하는 함수 (output) -> bool
+            cache_ttl: 캐시 유효 시간(초) (None이면 캐시 기본값)
+            receives_step: 핸들러가 컴파일된 단계를 step 키워드 인자로 받는지 여부 (본문 단계를 실행하는 반복 단계용)
         """
         self.step_handlers[step_type] = handler
+        self.step_outputs[step_type] = set(outputs) if outputs is not None else None
+        if page_access:
+            self.step_page_access[step_type] = page_access
+        else:
+            self.step_page_access.pop(step_type, None)
+        if cache_key:
+            self.step_cache_policies[step_type] = (cache_key, cache_if, cache_ttl)
+        else:
+            self.step_cache_policies.pop(step_type, None)
+        if receives_step:
+            self.step_receives_step.add(step_type)
+        else:
+            self.step_receives_step.discard(step_type)
+        self.step_cache.invalidate(step_type)
+        self.compiler.invalidate()
         self.logger.debug(f"단계 핸들러 등록: {step_type}")
     
     def create_workflow(self, workflow_plan: Dict[str, Any], settings: Dict[str, Any] = None) -> str:
@@ -148,15 +676,38 @@ class WorkflowManager:
             
         Returns:
             작업 흐름 ID
+            
+        Raises:
+            WorkflowError: 작업 계획 구조 오류
         """
         workflow_id = workflow_plan.get('id') or str(uuid.uuid4())
+        settings = settings or {}
+        
+        # 실행 계획 컴파일 (같은 내용의 계획은 캐시 사용)
+        try:
+            plan = self.compiler.compile(settings.get('workflow_plan') or workflow_plan)
+        except PlanCompileError as e:
+            raise WorkflowError(f"작업 계획 오류: {str(e)}") from e
         
         context = WorkflowContext(
             workflow_id=workflow_id,
-            settings=settings or {},
+            settings=settings,
+            plan=plan,
+            event_bus=self.events,
+            retention=self.retention.merged(settings),
+            blob_store=self.blob_store
         )
         
+        # 디스크 저널 기록 시작 (설정에서 journal=False로 끌 수 있음)
+        if self.journal is not None and settings.get('journal', True):
+            self.journal.begin(workflow_id)
+            context.journal = self.journal
+            context.record_event('created', workflow_id=workflow_id,
+                                 workflow_plan=settings.get('workflow_plan') or workflow_plan,
+                                 settings={k: v for k, v in settings.items() if k != 'workflow_plan'})
+        
         self.active_workflows[workflow_id] = context
+        context.publish(WorkflowEventType.WORKFLOW_CREATED, status=context.status.value, total_steps=len(plan.steps))
         self.logger.info(f"작업 흐름 생성: {workflow_id}")
         return workflow_id
     
@@ -172,25 +723,103 @@ class WorkflowManager:
         if workflow_id not in self.active_workflows:
             raise WorkflowError(f"작업 흐름을 찾을 수 없음: {workflow_id}")
         
-        context = self.active_workflows[workflow_id]
-        context.status = WorkflowStatus.RUNNING
+        return self._run_workflow(self.active_workflows[workflow_id], set())
+    
+    def _run_workflow(self, context: WorkflowContext, completed: Set[str]) -> Dict[str, Any]:
+        """작업 흐름 실행 (추적이 활성화되면 작업 흐름 구간 아래에 실행 기록)
         
-        workflow_plan = context.settings.get('workflow_plan', {})
-        steps = workflow_plan.get('steps', [])
+        Args:
+            context: 작업 흐름 컨텍스트
+            completed: 이미 완료되어 건너뛸 단계 ID (저널에서 재개한 경우)
+            
+        Returns:
+            작업 결과
+        """
+        if not context.settings.get('trace', self.tracing_enabled):
+            return self._run_workflow_steps(context, completed)
+        
+        with tracing.trace(context.workflow_id, 'workflow', workflow_id=context.workflow_id,
+                           steps=len(context.plan.steps), resumed=bool(completed)) as workflow_trace:
+            context.trace = workflow_trace
+            result = self._run_workflow_steps(context, completed)
+            root_span = tracing.current_span()
+            root_span.set_attributes(workflow_status=result.get('status'))
+            if result.get('error'):
+                root_span.status = 'error'
+                root_span.attributes['error'] = result['error']
+        
+        self._export_trace(context)
+        return result
+    
+    def _export_trace(self, context: WorkflowContext) -> None:
+        """작업 흐름 추적을 Chrome trace JSON과 구간 JSONL로 내보내기 (trace_dir 설정 시)
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+        """
+        if not self.trace_dir or context.trace is None:
+            return
+        
+        base_path = os.path.join(self.trace_dir, context.workflow_id)
+        try:
+            context.trace.export_chrome(f"{base_path}.trace.json")
+            context.trace.export_jsonl(f"{base_path}.spans.jsonl")
+            self.logger.info(f"작업 흐름 추적 저장: {base_path}.trace.json")
+        except Exception as e:
+            self.logger.warning(f"작업 흐름 추적 저장 실패: {context.workflow_id} - {str(e)}")
+    
+    def get_trace(self, workflow_id: str) -> Optional[tracing.Trace]:
+        """작업 흐름 실행 추적 가져오기
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            
+        Returns:
+            추적 또는 None
+        """
+        context = self.active_workflows.get(workflow_id)
+        return context.trace if context else None
+    
+    def _run_workflow_steps(self, context: WorkflowContext, completed: Set[str]) -> Dict[str, Any]:
+        """작업 흐름 단계 실행
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            completed: 이미 완료되어 건너뛸 단계 ID
+            
+        Returns:
+            작업 결과
+        """
+        workflow_id = context.workflow_id
+        context.set_status(WorkflowStatus.RUNNING)
+        context.record_event('status', status=context.status.value)
+        
+        # 작업 흐름 기한 (제한이 없어도 취소 전파용으로 생성)
+        context.deadline = Deadline(context.settings.get('workflow_timeout', self.workflow_timeout),
+                                    name=f"작업 흐름 {workflow_id}")
+        
+        plan = context.plan
+        execution_mode = plan.execution_mode or context.settings.get('execution_mode', 'sequential')
         
         try:
-            for step in steps:
+            if execution_mode == 'dag':
+                return self._execute_workflow_dag(context, plan, completed)
+            
+            finished = set(completed)  # 완료되었거나 복구된 단계 (상태 정리용)
+            for step in plan.steps:
                 if context.status != WorkflowStatus.RUNNING:
                     # 작업이 일시 중지되거나 중단된 경우
                     break
                 
-                step_id = step.get('id')
-                if not step_id:
-                    self.logger.warning("단계 ID가 없음, 건너뜀")
+                step_id = step.id
+                if step_id in completed:
                     continue
                 
+                if context.deadline.expired:
+                    raise WorkflowError(context.deadline.describe())
+                
                 # 체크포인트 생성
-                if step.get('checkpoint', False):
+                if step.checkpoint:
                     context.create_checkpoint(step_id)
                     self.logger.debug(f"체크포인트 생성: {step_id}")
                 
@@ -201,81 +830,278 @@ class WorkflowManager:
                 # 실패한 경우 오류 복구 시도
                 if result.status == StepStatus.FAILED:
                     if not self._try_recover(context, step):
-                        context.status = WorkflowStatus.FAILED
+                        context.set_status(WorkflowStatus.FAILED)
                         raise WorkflowError(f"단계 실행 실패: {step_id} - {result.error}")
+                    context.record_event('recovered', step_id=step_id)
+                
+                finished.add(step_id)
+                self._prune_state(context, finished)
             
             # 모든 단계 성공적으로 완료
-            context.status = WorkflowStatus.COMPLETED
+            context.set_status(WorkflowStatus.COMPLETED)
             self.logger.info(f"작업 흐름 완료: {workflow_id}")
             
-            return {
-                'workflow_id': workflow_id,
-                'status': context.status.value,
-                'execution_time': context.get_execution_time(),
-                'state': context.state,
-                'results': {k: {'status': v.status.value, 'output': v.output} 
-                           for k, v in context.results.items()}
-            }
+            return self._build_workflow_result(context)
             
         except Exception as e:
-            context.status = WorkflowStatus.FAILED
+            context.set_status(WorkflowStatus.FAILED)
             self.logger.error(f"작업 흐름 실행 중 오류: {workflow_id} - {str(e)}")
             
-            return {
-                'workflow_id': workflow_id,
-                'status': context.status.value,
-                'error': str(e),
-                'execution_time': context.get_execution_time(),
-                'state': context.state,
-                'results': {k: {'status': v.status.value, 'output': v.output} 
-                           for k, v in context.results.items()}
-            }
+            return self._build_workflow_result(context, error=str(e))
+    
+    def _build_workflow_result(self, context: WorkflowContext, error: str = None) -> Dict[str, Any]:
+        """작업 흐름 결과 사전 생성
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            error: 오류 메시지
+            
+        Returns:
+            작업 결과
+        """
+        result = {
+            'workflow_id': context.workflow_id,
+            'status': context.status.value,
+            'execution_time': context.get_execution_time(),
+            'state': context.state,
+            'results': {k: {'status': v.status.value,
+                            'output': {key: value.to_json() if isinstance(value, BlobRef) else value
+                                       for key, value in v.output.items()}}
+                       for k, v in context.results.items()},
+            'cache_hits': context.cache_hits,
+            'cache_misses': context.cache_misses
+        }
+        
+        if context.trace is not None:
+            result['trace_id'] = context.trace.trace_id
+        
+        if error is not None:
+            result['error'] = error
+        
+        context.publish(WorkflowEventType.WORKFLOW_FINISHED, status=context.status.value, error=error,
+                        execution_time=result['execution_time'], cache_hits=context.cache_hits,
+                        cache_misses=context.cache_misses)
+        
+        # 종료 상태는 저널 쓰기 스레드가 바로 기록하고 fsync
+        if context.journal is not None:
+            context.record_event('status', status=context.status.value, error=error)
+        
+        return result
     
-    def _execute_step(self, context: WorkflowContext, step: Dict[str, Any]) -> StepResult:
-        """단계 실행
+    def _execute_workflow_dag(self, context: WorkflowContext, plan: CompiledPlan,
+                              completed: Set[str] = None) -> Dict[str, Any]:
+        """의존성 그래프에 따라 독립적인 단계를 병렬 실행
+        
+        단계 실패 시 첫 복구 전략이 재시도이면 스레드를 점유하지 않고 재시도를 예약하며, 그동안 다른 단계는 계속 실행됩니다.
+        그 밖의 복구는 실행 중인 단계를 모두 마친 후 순차 모드와 같은 복구 전략을 적용합니다.
+        체크포인트 롤백으로 결과가 제거된 단계는 다시 실행됩니다.
         
         Args:
             context: 작업 흐름 컨텍스트
-            step: 단계 정보
+            plan: 컴파일된 실행 계획
+            completed: 이미 완료되어 건너뛸 단계 ID
+            
+        Returns:
+            작업 결과
+        """
+        graph = plan.graph
+        if graph is None:
+            raise WorkflowError(f"DAG 모드로 실행할 수 없는 계획: {plan.graph_error}")
+        max_workers = max(1, context.settings.get('max_parallel_steps', 4))
+        max_rollbacks = context.settings.get('max_rollbacks', 3)
+        
+        finished: Set[str] = set(completed or ())  # 완료되었거나 복구된 단계
+        recovered: Set[str] = set()  # 복구 전략으로 넘어간 실패 단계 (결과가 없을 수 있음)
+        running: Dict[Any, str] = {}  # future -> 단계 ID
+        parked: Set[Any] = set()  # 예약된 재시도 future
+        retry_attempts: Dict[str, int] = {}  # 단계 ID -> 예약한 재시도 횟수
+        rollbacks = 0
+        
+        self.logger.info(f"DAG 모드 실행: {context.workflow_id} (단계: {len(graph.order)}, 병렬: {max_workers})")
+        
+        def collect(futures) -> List[str]:
+            failed = []
+            for future in futures:
+                step_id = running.pop(future)
+                parked.discard(future)
+                if future.cancelled():
+                    continue
+                result = future.result()
+                context.set_step_result(step_id, result)
+                if result.status == StepStatus.FAILED:
+                    failed.append(step_id)
+                else:
+                    finished.add(step_id)
+            return failed
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow-step") as executor:
+            try:
+                while context.status == WorkflowStatus.RUNNING:
+                    if context.deadline is not None and context.deadline.expired:
+                        context.set_status(WorkflowStatus.FAILED)
+                        raise WorkflowError(context.deadline.describe())
+                    
+                    self._prune_state(context, finished)
+                    ready = graph.ready_steps(finished, set(running.values()))
+                    # 예약된 재시도는 실행 슬롯을 차지하지 않음
+                    for step_id in ready[:max_workers - (len(running) - len(parked))]:
+                        step = plan.step_map[step_id]
+                        if step.checkpoint:
+                            context.create_checkpoint(step_id)
+                            self.logger.debug(f"체크포인트 생성: {step_id}")
+                        running[executor.submit(tracing.bind(self._execute_step), context, step)] = step_id
+                    
+                    if not running:
+                        break
+                    
+                    # 재시도가 예약된 동안에도 일시 중지/취소를 확인하도록 주기적으로 깨어남
+                    done, _ = wait(list(running), timeout=0.5 if parked else None, return_when=FIRST_COMPLETED)
+                    failed = collect(done)
+                    
+                    # 첫 복구 전략이 재시도인 단계는 재시도 예약 (다른 단계 실행은 계속)
+                    for step_id in list(failed):
+                        future = self._park_retry(context, plan.step_map[step_id], retry_attempts, executor)
+                        if future is not None:
+                            running[future] = step_id
+                            parked.add(future)
+                            failed.remove(step_id)
+                    
+                    if not failed:
+                        continue
+                    
+                    # 아직 실행되지 않은 재시도 예약은 취소하여 동기 복구로 넘기고,
+                    # 실행 중인 단계를 마쳐 롤백이 진행 중인 단계와 겹치지 않게 함
+                    for future in list(parked):
+                        if self.retry_scheduler.cancel(future):
+                            step_id = running.pop(future)
+                            parked.discard(future)
+                            retry_attempts.pop(step_id, None)
+                            failed.append(step_id)
+                    failed += collect(list(running))
+                    
+                    for step_id in sorted(set(failed), key=graph.position):
+                        error = context.results[step_id].error if step_id in context.results else None
+                        step = plan.step_map[step_id]
+                        # 재시도 예약을 이미 사용한 경우 나머지 전략만 적용
+                        first_strategy = 1 if step_id in retry_attempts and self._leading_retry(step) else 0
+                        if not self._try_recover(context, step, first_strategy):
+                            context.set_status(WorkflowStatus.FAILED)
+                            raise WorkflowError(f"단계 실행 실패: {step_id} - {error}")
+                        finished.add(step_id)
+                        recovered.add(step_id)
+                        context.record_event('recovered', step_id=step_id)
+                    
+                    # 체크포인트 롤백으로 결과가 제거된 단계 재실행
+                    rolled_back = {step_id for step_id in finished - recovered if step_id not in context.results}
+                    if rolled_back:
+                        rollbacks += 1
+                        if rollbacks > max_rollbacks:
+                            context.set_status(WorkflowStatus.FAILED)
+                            raise WorkflowError(f"롤백 횟수 초과 ({max_rollbacks}회)")
+                        finished -= rolled_back
+                        for step_id in rolled_back:
+                            retry_attempts.pop(step_id, None)
+                        self.logger.info(f"롤백된 단계 재실행 예정: {sorted(rolled_back, key=graph.position)}")
+            finally:
+                # 일시 중지/취소/오류 시 아직 실행되지 않은 재시도는 취소하고 실행 중인 단계 결과 기록
+                for future in list(parked):
+                    self.retry_scheduler.cancel(future)
+                if running:
+                    wait(list(running))
+                    collect(list(running))
+        
+        if context.status == WorkflowStatus.RUNNING:
+            context.set_status(WorkflowStatus.COMPLETED)
+            self.logger.info(f"작업 흐름 완료: {context.workflow_id}")
+        
+        return self._build_workflow_result(context)
+    
+    def _execute_step(self, context: WorkflowContext, step: CompiledStep) -> StepResult:
+        """단계 실행 (추적 중이면 단계 구간 기록)
+        
+        단계는 작업 흐름 기한 아래의 단계 기한 안에서 실행되며, 플러그인은 현재 기한으로 대기 시간을 줄입니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계 (핸들러와 파라미터가 미리 해석됨)
             
         Returns:
             단계 실행 결과
         """
-        step_id = step.get('id', 'unknown')
-        step_type = step.get('type')
+        timeout = step.timeout if step.timeout is not None else context.settings.get('step_timeout', self.step_timeout)
+        step_deadline = Deadline(timeout, parent=context.deadline, name=f"단계 {step.id}")
         
-        if not step_type:
-            return StepResult(
-                status=StepStatus.FAILED,
-                error="단계 유형이 지정되지 않음"
-            )
+        context.publish(WorkflowEventType.STEP_STARTED, step_id=step.id, step_type=step.type)
+        with tracing.span(step.id, 'step', step_type=step.type) as step_span:
+            if step_span is not None and step_deadline.expires_at is not None:
+                step_span.set_attributes(deadline=step_deadline.remaining())
+            try:
+                with deadline_scope(step_deadline):
+                    result = self._run_step(context, step, step_deadline)
+            finally:
+                step_deadline.detach()
+            if step_span is not None:
+                step_span.set_attributes(step_status=result.status.value)
+                if result.status == StepStatus.FAILED:
+                    step_span.status = 'error'
+                    step_span.attributes['error'] = result.error
+            return result
+    
+    def _run_step(self, context: WorkflowContext, step: CompiledStep, deadline: Deadline) -> StepResult:
+        """단계 핸들러 실행 (결과 캐시 확인 및 상태 업데이트)
         
-        handler = self.step_handlers.get(step_type)
-        if not handler:
-            return StepResult(
-                status=StepStatus.FAILED,
-                error=f"처리할 수 없는 단계 유형: {step_type}"
-            )
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            deadline: 단계 기한
+            
+        Returns:
+            단계 실행 결과
+        """
+        step_id = step.id
         
         try:
-            self.logger.info(f"단계 실행: {step_id} ({step_type})")
+            self.logger.info(f"단계 실행: {step_id} ({step.type})")
             start_time = time.time()
             
-            # 단계 파라미터 (변수 대체 포함)
-            params = self._resolve_parameters(context, step.get('params', {}))
+            # 단계 파라미터 (미리 분석된 변수 참조 대체)
+            params = step.params.resolve(context.state, self._warn_missing_variable)
             
-            # 단계 실행
-            output = handler(context, params)
+            # 멱등 단계 결과 캐시 확인
+            cache_key = self._step_cache_key(context, step, params)
+            if cache_key is not None:
+                output = self.step_cache.get(cache_key)
+                with context.lock:
+                    if output is None:
+                        context.cache_misses += 1
+                    else:
+                        context.cache_hits += 1
+                current_span = tracing.current_span()
+                if current_span is not None:
+                    current_span.set_attributes(cache='miss' if output is None else 'hit')
+                if output is not None:
+                    self.logger.info(f"단계 결과 캐시 사용: {step_id}")
+                    context.update_state(output)
+                    return StepResult(status=StepStatus.COMPLETED, output=self._spill_output(context, output),
+                                      execution_time=time.time() - start_time)
+            
+            # 단계 실행 (기한이 있으면 기한 초과 시 중단)
+            output = self._call_handler(context, step, params, deadline)
             
             execution_time = time.time() - start_time
             
+            if cache_key is not None and isinstance(output, dict):
+                _, cache_if, cache_ttl = self.step_cache_policies[step.type]
+                if cache_if is None or cache_if(output):
+                    self.step_cache.put(cache_key, output, cache_ttl)
+            
             # 상태 업데이트 (단계 출력이 사전인 경우)
             if isinstance(output, dict):
                 context.update_state(output)
             
             return StepResult(
                 status=StepStatus.COMPLETED,
-                output=output if isinstance(output, dict) else {'result': output},
+                output=self._spill_output(context, output if isinstance(output, dict) else {'result': output}),
                 execution_time=execution_time
             )
             
@@ -286,20 +1112,165 @@ class WorkflowManager:
                 error=str(e)
             )
     
-    def _try_recover(self, context: WorkflowContext, step: Dict[str, Any]) -> bool:
+    def _spill_output(self, context: WorkflowContext, output: Dict[str, Any]) -> Dict[str, Any]:
+        """단계 출력의 큰 값을 블롭으로 내보내고 핸들로 대체 (retention.spill_threshold)
+        
+        상태에는 원래 값이 남으므로, 이후 단계가 참조하지 않는 값은 상태 정리(prune_state)로 메모리에서 해제됩니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            output: 단계 출력
+            
+        Returns:
+            단계 결과에 보관할 출력 (내보낸 값이 없으면 원래 출력)
+        """
+        threshold = context.retention.spill_threshold
+        if threshold is None or context.blob_store is None:
+            return output
+        
+        spilled = None
+        for key, value in output.items():
+            if isinstance(value, BlobRef) or estimate_size(value, threshold) <= threshold:
+                continue
+            ref = context.blob_store.put(context.workflow_id, value)
+            if ref is None:
+                continue
+            if spilled is None:
+                spilled = dict(output)
+            spilled[key] = ref
+            self.logger.debug(f"단계 출력 블롭 저장: {key} ({ref.size}바이트)")
+        
+        return output if spilled is None else spilled
+    
+    def _prune_state(self, context: WorkflowContext, finished: Set[str]) -> None:
+        """이후 단계가 참조하지 않는 단계 출력 상태 키 제거 (retention.prune_state)
+        
+        계획 분석으로 구한 참조 단계(대체 단계 포함)가 모두 끝난 출력 키만 제거하며, keep_state_keys는 유지합니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            finished: 완료되었거나 복구된 단계 ID
+        """
+        retention = context.retention
+        if not retention.prune_state or context.plan is None:
+            return
+        
+        readers = context.plan.state_readers
+        empty = frozenset()
+        with context.lock:
+            stale = [key for key in context.output_keys
+                     if key not in retention.keep_state_keys and readers.get(key, empty) <= finished]
+            if stale:
+                context.prune_state(sorted(stale))
+                self.logger.debug(f"상태 키 정리: {context.workflow_id} - {sorted(stale)}")
+    
+    def _call_handler(self, context: WorkflowContext, step: CompiledStep, params: Dict[str, Any],
+                      deadline: Deadline) -> Any:
+        """기한 안에서 단계 핸들러 호출
+        
+        핸들러는 호출 스레드에서 실행되며, 기한은 현재 컨텍스트로 전파되어 Playwright 액션과 인식 워커 대기가
+        남은 시간 안에 끝나거나 취소 시 중단됩니다. 기한이 지난 뒤에 끝난 단계는 출력과 관계없이 실패 처리합니다.
+        기한이 지나고 유예 시간(cancel_grace)이 넘도록 끝나지 않은 브라우저 단계는 페이지 상태를 알 수 없으므로
+        작업 흐름의 페이지 임대를 사용 중지로 표시해 반납 시 폐기되도록 합니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            params: 해결된 단계 파라미터
+            deadline: 단계 기한
+            
+        Returns:
+            핸들러 출력
+            
+        Raises:
+            DeadlineExceeded: 단계 또는 작업 흐름 기한 초과
+        """
+        deadline.check()
+        handler = self._bind_handler(step)
+        
+        try:
+            output = handler(context, params)
+        except Exception as e:
+            if not deadline.expired:
+                raise
+            self._check_overrun(context, step, deadline)
+            raise DeadlineExceeded(deadline.describe()) from e
+        
+        if deadline.expired:
+            self._check_overrun(context, step, deadline)
+            raise DeadlineExceeded(deadline.describe())
+        return output
+    
+    def _check_overrun(self, context: WorkflowContext, step: CompiledStep, deadline: Deadline) -> None:
+        """기한 후 유예 시간을 넘겨 끝난 브라우저 단계의 페이지 임대를 사용 중지로 표시
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            deadline: 단계 기한
+        """
+        overdue = deadline.overdue()
+        if overdue <= self.cancel_grace:
+            return
+        
+        self.logger.warning(f"기한 후 유예 시간 안에 끝나지 않은 단계 핸들러: {step.id} ({overdue:.1f}초 초과)")
+        if step.type not in self.step_page_access or not context.page_lease:
+            return
+        
+        plugin = self.plugin_manager.get_plugin("playwright_automation")
+        if plugin is None:
+            return
+        
+        # 만료된 기한 밖에서 요청 (기한 확인에 막히지 않도록)
+        with deadline_scope(None):
+            result = plugin.execute_action('invalidate_page', {'lease_id': context.page_lease})
+        if not result.get('success', False):
+            self.logger.warning(f"페이지 임대 사용 중지 표시 실패: {context.page_lease} - {result.get('error')}")
+    
+    def _bind_handler(self, step: CompiledStep) -> Callable:
+        """단계 핸들러 (반복 단계 핸들러에는 컴파일된 단계를 함께 전달)"""
+        if step.type in self.step_receives_step:
+            return functools.partial(step.handler, step=step)
+        return step.handler
+    
+    def _try_recover(self, context: WorkflowContext, step: CompiledStep, first_strategy: int = 0) -> bool:
         """오류 복구 시도
         
         Args:
             context: 작업 흐름 컨텍스트
-            step: 단계 정보
+            step: 컴파일된 단계
+            first_strategy: 적용을 시작할 복구 전략 위치 (DAG 모드에서 재시도를 이미 예약한 경우 1)
             
         Returns:
             복구 성공 여부
         """
-        step_id = step.get('id', 'unknown')
+        if context.deadline is not None and context.deadline.expired:
+            self.logger.warning(f"복구 생략: {step.id} - {context.deadline.describe()}")
+            return False
+        
+        with tracing.span(f"{step.id}.recover", 'recovery', step_type=step.type) as recovery_span:
+            recovered = self._apply_recovery(context, step, first_strategy)
+            if recovery_span is not None:
+                recovery_span.set_attributes(recovered=recovered)
+                if not recovered:
+                    recovery_span.status = 'error'
+            return recovered
+    
+    def _apply_recovery(self, context: WorkflowContext, step: CompiledStep, first_strategy: int) -> bool:
+        """복구 전략 적용
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            first_strategy: 적용을 시작할 복구 전략 위치
+            
+        Returns:
+            복구 성공 여부
+        """
+        step_id = step.id
         self.logger.info(f"오류 복구 시도: {step_id}")
         
-        recovery_strategies = step.get('recovery_strategies', [])
+        recovery_strategies = step.recovery_strategies
         if not recovery_strategies:
             # 기본 복구 전략: 체크포인트로 롤백
             last_checkpoint = None
@@ -315,18 +1286,22 @@ class WorkflowManager:
             return False
         
         # 복구 전략 시도
-        for strategy in recovery_strategies:
-            strategy_type = strategy.get('type')
+        for strategy in recovery_strategies[first_strategy:]:
+            strategy_type = strategy.type
             if strategy_type == 'retry':
-                # 재시도 전략
-                max_retries = strategy.get('max_retries', 3)
-                delay = strategy.get('delay', 1.0)
-                
-                for i in range(max_retries):
-                    self.logger.info(f"재시도 {i+1}/{max_retries}: {step_id}")
-                    time.sleep(delay)
+                # 재시도 전략 (지수 백오프 + 지터, 작업 흐름 재시도 예산 적용)
+                for attempt in range(1, strategy.max_retries + 1):
+                    delay = self._next_retry_delay(context, step, strategy, attempt)
+                    if delay is None:
+                        break
+                    
+                    self.logger.info(f"재시도 {attempt}/{strategy.max_retries}: {step_id} ({delay:.2f}초 후)")
+                    scheduled_at = time.time()
+                    # 취소/일시 중지되면 대기 중단
+                    if not self.retry_scheduler.sleep(delay, lambda: context.status == WorkflowStatus.RUNNING):
+                        return False
                     
-                    result = self._execute_step(context, step)
+                    result = self._execute_retry(context, step, scheduled_at)
                     context.set_step_result(step_id, result)
                     
                     if result.status == StepStatus.COMPLETED:
@@ -334,25 +1309,169 @@ class WorkflowManager:
             
             elif strategy_type == 'alternative':
                 # 대체 단계 실행
-                alt_step = strategy.get('step')
-                if alt_step:
-                    self.logger.info(f"대체 단계 실행: {alt_step.get('id', 'unknown')}")
-                    result = self._execute_step(context, alt_step)
-                    context.set_step_result(alt_step.get('id', f"{step_id}_alt"), result)
-                    return result.status == StepStatus.COMPLETED
+                alt_step = strategy.step
+                self.logger.info(f"대체 단계 실행: {alt_step.id}")
+                result = self._execute_step(context, alt_step)
+                context.set_step_result(alt_step.id, result)
+                return result.status == StepStatus.COMPLETED
+            
+            elif strategy_type == 'rollback':
+                # 특정 체크포인트로 롤백
+                checkpoint_id = strategy.checkpoint_id
+                if checkpoint_id in context.checkpoints:
+                    self.logger.info(f"체크포인트로 롤백: {checkpoint_id}")
+                    return context.restore_checkpoint(checkpoint_id)
+        
+        return False
+    
+    def _step_cache_key(self, context: WorkflowContext, step: CompiledStep, params: Dict[str, Any]) -> Optional[Tuple]:
+        """단계 결과 캐시 키 생성
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            params: 해결된 단계 파라미터
+            
+        Returns:
+            (단계 유형, 파라미터, 상태 키) 또는 None (캐시하지 않는 단계)
+        """
+        policy = self.step_cache_policies.get(step.type)
+        if policy is None or not context.settings.get('step_cache', True):
+            return None
+        
+        try:
+            state_key = policy[0](context, params)
+        except Exception as e:
+            self.logger.debug(f"캐시 키 생성 실패: {step.id} - {str(e)}")
+            return None
+        if state_key is None:
+            return None
+        
+        # 직렬화할 수 없는 값(요소 핸들 등)은 객체 ID로 구분
+        params_key = json.dumps(params, sort_keys=True, ensure_ascii=False,
+                                default=lambda obj: f"<{type(obj).__name__}:{id(obj)}>")
+        return (step.type, params_key, state_key)
+    
+    def _page_cache_key(self, context: WorkflowContext, params: Dict[str, Any]) -> Optional[Tuple]:
+        """브라우저 페이지 상태 기반 캐시 키 (임대/탭, URL, 문서 ID, DOM 변경 횟수, 뷰포트, 선택적으로 DOM 지문)
+        
+        문서 ID는 문서를 로드할 때마다 바뀌므로 다시 로드한 페이지에서 이전 문서의 요소 핸들을 재사용하지 않습니다.
+        같은 문서 안의 DOM 변경(SPA 다시 그리기, 닫힌 팝업)은 페이지의 DOM 변경 횟수로, 템플릿/OCR 좌표를 바꾸는
+        스크롤은 뷰포트 값으로 구분하므로 롤백 후 재시도에서도 바뀐 페이지에 이전 결과를 쓰지 않습니다.
+        변경 횟수는 모든 변경을 세므로 계속 바뀌는 페이지에서는 캐시가 적중하지 않습니다.
+        단계 파라미터 cache_dom_fingerprint는 DOM 해시를 키에 추가합니다 (문서 전체를 직렬화하므로 필요한 단계에만 사용).
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            params: 단계 파라미터
+            
+        Returns:
+            페이지 상태 키 또는 None (브라우저가 준비되지 않은 경우)
+        """
+        plugin = self.plugin_manager.get_plugin("playwright_automation")
+        if plugin is None or plugin.get_plugin_info().id not in self.plugin_manager.initialized_plugins:
+            return None
+        
+        include_dom = bool(params.get('cache_dom_fingerprint', False))
+        result = self._bind_page(plugin, context, params).execute_action('page_fingerprint', {'include_dom': include_dom})
+        if not result.get('success', False) or not result.get('document_id'):
+            return None
+        if include_dom and not result.get('fingerprint'):
+            return None
+        
+        return (context.page_lease, params.get('page'), result.get('url'), result['document_id'],
+                result.get('mutations'), tuple(result.get('viewport') or ()), result.get('fingerprint'))
+    
+    @staticmethod
+    def _leading_retry(step: CompiledStep) -> bool:
+        """첫 복구 전략이 재시도인지 확인"""
+        return bool(step.recovery_strategies) and step.recovery_strategies[0].type == 'retry'
+    
+    def _next_retry_delay(self, context: WorkflowContext, step: CompiledStep, strategy: Any,
+                          attempt: int) -> Optional[float]:
+        """재시도 대기 시간 계산 (재시도 횟수/예산 초과 시 None)
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            strategy: 재시도 복구 전략
+            attempt: 재시도 차수 (1부터)
+            
+        Returns:
+            대기 시간(초) 또는 None
+        """
+        if attempt > strategy.max_retries:
+            return None
+        
+        if context.deadline is not None and context.deadline.expired:
+            return None
+        
+        budget = context.settings.get('retry_budget', self.retry_scheduler.default_budget)
+        if not self.retry_scheduler.acquire(context.workflow_id, budget, step.type):
+            self.logger.warning(f"재시도 예산 소진: {context.workflow_id} ({budget}회) - {step.id}")
+            return None
+        
+        delay = self.retry_scheduler.compute_delay(attempt, strategy.delay, strategy.backoff,
+                                                   strategy.max_delay, strategy.jitter)
+        
+        # 대기 후 작업 흐름 기한이 남지 않으면 재시도하지 않음
+        remaining = context.deadline.remaining() if context.deadline is not None else None
+        if remaining is not None and delay >= remaining:
+            self.logger.warning(f"작업 흐름 기한 부족으로 재시도 생략: {step.id} (남은 시간 {remaining:.2f}초)")
+            return None
+        
+        return delay
+    
+    def _execute_retry(self, context: WorkflowContext, step: CompiledStep, scheduled_at: float) -> StepResult:
+        """단계 재시도 실행 및 재시도 비용 기록
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 단계
+            scheduled_at: 재시도를 예약한 시간
             
-            elif strategy_type == 'rollback':
-                # 특정 체크포인트로 롤백
-                checkpoint_id = strategy.get('checkpoint_id')
-                if checkpoint_id and checkpoint_id in context.checkpoints:
-                    self.logger.info(f"체크포인트로 롤백: {checkpoint_id}")
-                    return context.restore_checkpoint(checkpoint_id)
+        Returns:
+            단계 실행 결과
+        """
+        start_time = time.time()
+        with tracing.span(f"{step.id}.retry", 'retry', step_type=step.type, wait_time=start_time - scheduled_at):
+            result = self._execute_step(context, step)
+        self.retry_scheduler.record(step.type, start_time - scheduled_at, time.time() - start_time,
+                                    result.status == StepStatus.COMPLETED)
+        return result
+    
+    def _park_retry(self, context: WorkflowContext, step: CompiledStep, retry_attempts: Dict[str, int],
+                    executor: ThreadPoolExecutor) -> Optional[Any]:
+        """스레드를 점유하지 않고 단계 재시도 예약 (DAG 모드)
         
-        return False
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 실패한 단계
+            retry_attempts: 단계 ID -> 예약한 재시도 횟수
+            executor: 단계 실행 스레드 풀
+            
+        Returns:
+            재시도 결과 future 또는 None (첫 복구 전략이 재시도가 아니거나 횟수/예산 소진)
+        """
+        if context.status != WorkflowStatus.RUNNING or not self._leading_retry(step):
+            return None
+        
+        strategy = step.recovery_strategies[0]
+        attempt = retry_attempts.get(step.id, 0) + 1
+        delay = self._next_retry_delay(context, step, strategy, attempt)
+        if delay is None:
+            return None
+        
+        retry_attempts[step.id] = attempt
+        self.logger.info(f"재시도 예약 {attempt}/{strategy.max_retries}: {step.id} ({delay:.2f}초 후)")
+        return self.retry_scheduler.call_later(delay, executor.submit, tracing.bind(self._execute_retry),
+                                               context, step, time.time())
     
     def _resolve_parameters(self, context: WorkflowContext, params: Dict[str, Any]) -> Dict[str, Any]:
         """파라미터 해결 (변수 대체)
         
+        컴파일되지 않은 파라미터용이며, 계획의 단계는 CompiledStep.params를 사용합니다.
+        
         Args:
             context: 작업 흐름 컨텍스트
             params: 원본 파라미터
@@ -360,35 +1479,11 @@ class WorkflowManager:
         Returns:
             해결된 파라미터
         """
-        resolved = {}
-        
-        for key, value in params.items():
-            if isinstance(value, str) and value.startswith('$'):
-                # 변수 참조
-                var_path = value[1:].split('.')
-                var_value = context.state
-                
-                try:
-                    for path_part in var_path:
-                        var_value = var_value[path_part]
-                    resolved[key] = var_value
-                except (KeyError, TypeError):
-                    self.logger.warning(f"변수를 찾을 수 없음: {value}")
-                    resolved[key] = value
-            elif isinstance(value, dict):
-                # 중첩된 사전
-                resolved[key] = self._resolve_parameters(context, value)
-            elif isinstance(value, list):
-                # 목록
-                resolved[key] = [
-                    self._resolve_parameters(context, item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                # 기타 값
-                resolved[key] = value
-        
-        return resolved
+        return ParamTemplate(params).resolve(context.state, self._warn_missing_variable)
+    
+    def _warn_missing_variable(self, value: str) -> None:
+        """변수 참조를 찾을 수 없을 때 경고"""
+        self.logger.warning(f"변수를 찾을 수 없음: {value}")
     
     def pause_workflow(self, workflow_id: str) -> bool:
         """작업 흐름 일시 중지
@@ -404,7 +1499,7 @@ class WorkflowManager:
         
         context = self.active_workflows[workflow_id]
         if context.status == WorkflowStatus.RUNNING:
-            context.status = WorkflowStatus.PAUSED
+            context.set_status(WorkflowStatus.PAUSED)
             self.logger.info(f"작업 흐름 일시 중지: {workflow_id}")
             return True
         
@@ -424,7 +1519,7 @@ class WorkflowManager:
         
         context = self.active_workflows[workflow_id]
         if context.status == WorkflowStatus.PAUSED:
-            context.status = WorkflowStatus.RUNNING
+            context.set_status(WorkflowStatus.RUNNING)
             self.logger.info(f"작업 흐름 재개: {workflow_id}")
             return True
         
@@ -443,10 +1538,115 @@ class WorkflowManager:
             return False
         
         context = self.active_workflows[workflow_id]
-        context.status = WorkflowStatus.FAILED
+        context.set_status(WorkflowStatus.FAILED)
+        # 진행 중인 단계의 플러그인 작업도 중단
+        if context.deadline is not None:
+            context.deadline.cancel(f"작업 흐름 취소: {workflow_id}")
         self.logger.info(f"작업 흐름 취소: {workflow_id}")
         return True
     
+    def resume_workflow_from_journal(self, workflow_id: str) -> Dict[str, Any]:
+        """디스크 저널에서 작업 흐름 재개
+        
+        저널을 재생하여 상태, 단계 결과, 체크포인트를 복원한 뒤 완료되지 않은 단계부터 실행합니다.
+        직렬화할 수 없던 값(페이지 핸들 등)은 복원되지 않으므로 재개 후 필요한 단계는 다시 실행됩니다.
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            
+        Returns:
+            작업 결과
+            
+        Raises:
+            WorkflowError: 저널이 없거나 작업 흐름이 이미 실행 중인 경우
+        """
+        if self.journal is None:
+            raise WorkflowError("작업 흐름 저널이 설정되지 않음")
+        if workflow_id in self.active_workflows:
+            raise WorkflowError(f"이미 활성화된 작업 흐름: {workflow_id}")
+        
+        events = self.journal.load(workflow_id)
+        if not events or events[0].get('type') != 'created':
+            raise WorkflowError(f"작업 흐름 저널을 찾을 수 없음: {workflow_id}")
+        
+        created = events[0]
+        workflow_plan = created['workflow_plan']
+        settings = dict(created.get('settings') or {})
+        settings['workflow_plan'] = workflow_plan
+        
+        try:
+            plan = self.compiler.compile(workflow_plan)
+        except PlanCompileError as e:
+            raise WorkflowError(f"작업 계획 오류: {str(e)}") from e
+        
+        context = WorkflowContext(
+            workflow_id=workflow_id,
+            settings=settings,
+            plan=plan,
+            start_time=created.get('time', time.time()),
+            retention=self.retention.merged(settings),
+            blob_store=self.blob_store
+        )
+        completed, last_status = self._replay_journal(context, events[1:])
+        
+        context.journal = self.journal
+        context.event_bus = self.events
+        self.active_workflows[workflow_id] = context
+        context.publish(WorkflowEventType.WORKFLOW_CREATED, status=context.status.value, total_steps=len(plan.steps),
+                        completed_steps=len(completed))
+        
+        if last_status == WorkflowStatus.COMPLETED.value:
+            context.set_status(WorkflowStatus.COMPLETED)
+            self.logger.info(f"이미 완료된 작업 흐름: {workflow_id}")
+            return self._build_workflow_result(context)
+        
+        self.logger.info(f"저널에서 작업 흐름 재개: {workflow_id} (완료된 단계: {len(completed)}/{len(plan.steps)})")
+        context.record_event('resumed', completed_steps=sorted(completed))
+        return self._run_workflow(context, completed)
+    
+    def _replay_journal(self, context: WorkflowContext, events: List[Dict[str, Any]]) -> Tuple[Set[str], Optional[str]]:
+        """저널 이벤트를 컨텍스트에 재생
+        
+        Args:
+            context: 저널이 연결되지 않은 작업 흐름 컨텍스트
+            events: 생성 이벤트 이후의 이벤트 목록
+            
+        Returns:
+            (완료 또는 복구된 계획 단계 ID, 마지막 작업 흐름 상태)
+        """
+        recovered = set()
+        last_status = None
+        
+        for event in events:
+            event_type = event.get('type')
+            if event_type == 'state':
+                context.update_state(event['updates'])
+            elif event_type == 'prune':
+                context.prune_state(event['keys'])
+            elif event_type == 'step':
+                output = {key: context.state.get(key) for key in event.get('state_keys', [])}
+                output.update((key, BlobRef.from_json(value) or value) for key, value in (event.get('output') or {}).items())
+                context.set_step_result(event['step_id'], StepResult(
+                    status=StepStatus(event['status']),
+                    output=output,
+                    error=event.get('error'),
+                    execution_time=event.get('execution_time', 0.0)
+                ))
+            elif event_type == 'checkpoint':
+                context.create_checkpoint(event['checkpoint_id'])
+            elif event_type == 'restore':
+                context.restore_checkpoint(event['checkpoint_id'])
+            elif event_type == 'recovered':
+                recovered.add(event['step_id'])
+            elif event_type == 'status':
+                last_status = event.get('status')
+        
+        completed = {step_id for step_id, result in context.results.items()
+                     if result.status == StepStatus.COMPLETED}
+        # 복구된 실패 단계는 롤백으로 결과가 제거되지 않은 경우에만 완료로 간주
+        completed |= {step_id for step_id in recovered if step_id in context.results}
+        return completed & set(context.plan.step_map), last_status
+    
     def cleanup_workflow(self, workflow_id: str) -> None:
         """작업 흐름 정리
         
@@ -454,7 +1654,14 @@ class WorkflowManager:
             workflow_id: 작업 흐름 ID
         """
         if workflow_id in self.active_workflows:
-            del self.active_workflows[workflow_id]
+            context = self.active_workflows.pop(workflow_id)
+            self.retry_scheduler.release(workflow_id)
+            if context.journal is not None:
+                context.journal.complete(workflow_id, context.status == WorkflowStatus.COMPLETED)
+            # 저널로 재개할 수 있는 작업 흐름의 블롭은 유지
+            if self.blob_store is not None and (context.journal is None or context.status == WorkflowStatus.COMPLETED):
+                self.blob_store.remove_namespace(workflow_id)
+            context.publish(WorkflowEventType.WORKFLOW_REMOVED, status=context.status.value)
             self.logger.info(f"작업 흐름 정리: {workflow_id}")
     
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
@@ -474,14 +1681,49 @@ class WorkflowManager:
             'workflow_id': workflow_id,
             'status': context.status.value,
             'execution_time': context.get_execution_time(),
-            'execution_path': context.execution_path,
+            'execution_path': list(context.execution_path),
+            'trimmed_path': context.path_offset,
+            'pruned_keys': context.pruned_keys,
+            'total_steps': len(context.plan.steps) if context.plan else len(context.results),
             'step_count': len(context.results),
             'completed_steps': sum(1 for r in context.results.values() 
                                 if r.status == StepStatus.COMPLETED),
             'failed_steps': sum(1 for r in context.results.values() 
-                              if r.status == StepStatus.FAILED)
+                              if r.status == StepStatus.FAILED),
+            'cache_hits': context.cache_hits,
+            'cache_misses': context.cache_misses
         }
     
+    def _get_playwright_plugin(self, context: WorkflowContext, params: Dict[str, Any]) -> Optional[Any]:
+        """Playwright 플러그인 가져오기 (임대 페이지와 page 파라미터의 탭에 바인딩)
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            params: 단계 파라미터
+            
+        Returns:
+            플러그인 (또는 바인딩 프록시) 또는 None
+        """
+        return self._bind_page(self.plugin_manager.get_plugin("playwright_automation"), context, params)
+    
+    def _bind_page(self, plugin: Any, context: WorkflowContext, params: Dict[str, Any]) -> Any:
+        """작업 흐름의 임대 페이지와 단계의 page 파라미터에 따라 플러그인 바인딩
+        
+        Args:
+            plugin: 자동화 플러그인
+            context: 작업 흐름 컨텍스트
+            params: 단계 파라미터
+            
+        Returns:
+            바인딩 프록시 또는 원래 플러그인
+        """
+        page_id = params.get('page')
+        if page_id == 'default':
+            page_id = None
+        if plugin is None or not (page_id or context.page_lease):
+            return plugin
+        return PageBoundPlugin(plugin, page_id=page_id, lease_id=context.page_lease)
+    
     # 기본 단계 핸들러 (구현 예시)
     def _handle_web_navigation(self, context: WorkflowContext, params: Dict[str, Any]) -> Dict[str, Any]:
         """웹 탐색 단계 처리
@@ -502,20 +1744,12 @@ class WorkflowManager:
         plugin = self.plugin_manager.get_plugin("playwright_automation")
         
         if not plugin:
-            # 직접 모든 자동화 플러그인 확인 (디버깅용)
-            all_automation_plugins = self.plugin_manager.get_plugins_by_type(PluginType.AUTOMATION)
-            plugin_names = [p.get_plugin_info().name for p in all_automation_plugins]
-            self.logger.info(f"사용 가능한 자동화 플러그인: {plugin_names}")
-            
-            # 이름으로 다시 시도
-            for p in all_automation_plugins:
-                if "Playwright" in p.get_plugin_info().name:
-                    plugin = p
-                    self.logger.info(f"이름으로 플러그인 찾음: {p.get_plugin_info().name}")
-                    break
-            
+            # 이름 토큰 색인으로 다시 시도
+            plugin = self.plugin_manager.resolve_strategy('playwright', PluginType.AUTOMATION)
             if not plugin:
+                self.logger.info(f"사용 가능한 자동화 플러그인: {self.plugin_manager.index.ids_by_type(PluginType.AUTOMATION)}")
                 raise WorkflowError("Playwright 플러그인을 찾을 수 없음")
+            self.logger.info(f"이름으로 플러그인 찾음: {plugin.get_plugin_info().name}")
         
         # 플러그인 초기화
         plugin_id = plugin.get_plugin_info().id
@@ -529,9 +1763,13 @@ class WorkflowManager:
                 self.logger.error(f"플러그인 초기화 실패: {plugin_id} - {str(e)}")
                 raise WorkflowError(f"Playwright 플러그인 초기화 실패: {str(e)}")
         
-        # 작업 실행
+        # 작업 실행 (page 파라미터가 있으면 해당 탭에서 탐색, blocking_profile이 있으면 이 탐색부터 적용)
+        plugin = self._bind_page(plugin, context, params)
+        navigate_params = {'url': url}
+        if params.get('blocking_profile'):
+            navigate_params['blocking_profile'] = params['blocking_profile']
         try:
-            result = plugin.execute_action('navigate', {'url': url})
+            result = plugin.execute_action('navigate', navigate_params)
             
             if not result.get('success', False):
                 error_msg = result.get('error', '알 수 없는 오류')
@@ -546,9 +1784,14 @@ class WorkflowManager:
     def _handle_element_recognition(self, context: WorkflowContext, params: Dict[str, Any]) -> Dict[str, Any]:
         """요소 인식 단계 처리
         
+        strategies의 전략을 차례로 시도하며, race 파라미터(또는 설정의 recognition_race)가 참이면
+        전략을 동시에 실행하여 min_confidence 이상인 첫 결과를 사용합니다.
+        템플릿 매칭/OCR처럼 화면 프레임으로 인식하는 전략(captures_frames)에는 페이지 대신
+        임대 페이지와 page 파라미터의 탭에 바인딩된 Playwright 플러그인을 컨텍스트로 전달합니다.
+        
         Args:
             context: 작업 흐름 컨텍스트
-            params: 단계 파라미터
+            params: 단계 파라미터 (target, strategies, race, min_confidence)
             
         Returns:
             단계 결과
@@ -558,20 +1801,18 @@ class WorkflowManager:
             raise ValueError("인식 대상이 지정되지 않음")
         
         strategies = params.get('strategies', ['selector'])
-        mode = context.settings.get('mode', 'balanced')
-        
-        # 사용 가능한 인식 플러그인 모두 가져오기 (디버깅용)
-        all_recognition_plugins = self.plugin_manager.get_plugins_by_type(PluginType.RECOGNITION)
-        plugin_names = [p.get_plugin_info().name for p in all_recognition_plugins]
-        self.logger.info(f"사용 가능한 인식 플러그인: {plugin_names}")
         
         # 자동화 컨텍스트 가져오기 (Playwright 페이지 등)
         automation_context = context.state.get('automation_context')
+        frame_context = None
         
         # 웹 자동화 컨텍스트가 없으면 Playwright 플러그인에서 가져오기
         if not automation_context:
-            playwright_plugin = self.plugin_manager.get_plugin("playwright_automation")
+            playwright_plugin = self._get_playwright_plugin(context, params)
             if playwright_plugin and playwright_plugin.get_plugin_info().id in self.plugin_manager.initialized_plugins:
+                # 화면 프레임 기반 전략은 임대 페이지/탭에 바인딩된 플러그인으로 capture_frame 호출
+                frame_context = playwright_plugin
+                
                 # Playwright 페이지 가져오기 시도
                 try:
                     result = playwright_plugin.execute_action('get_page', {})
@@ -581,37 +1822,17 @@ class WorkflowManager:
                 except Exception as e:
                     self.logger.warning(f"자동화 컨텍스트 가져오기 실패: {str(e)}")
         
-        # 인식 시스템 플러그인 사용
-        result = None
+        # 인식 시스템 플러그인 준비
         errors = []
+        candidates = []
         
         for strategy_name in strategies:
-            # ID 기반으로 직접 플러그인 검색 시도
-            plugin = None
-            
-            # 전략 이름에 따라 플러그인 ID 매핑
-            strategy_to_id = {
-                'selector': 'selector_recognition',
-                'aria': 'aria_recognition',
-                'template': 'template_recognition',
-                'ocr': 'ocr_recognition'
-            }
-            
-            plugin_id = strategy_to_id.get(strategy_name)
-            if plugin_id:
-                plugin = self.plugin_manager.get_plugin(plugin_id)
-            
-            # ID로 찾지 못하면 이름 기반으로 검색
-            if not plugin:
-                for p in all_recognition_plugins:
-                    p_name = p.get_plugin_info().name.lower()
-                    if strategy_name.lower() in p_name:
-                        plugin = p
-                        self.logger.info(f"이름으로 플러그인 찾음: {p.get_plugin_info().name}")
-                        break
+            # 전략 별칭 색인으로 플러그인 검색 (예: 'template' -> template_matching_recognition)
+            plugin = self.plugin_manager.resolve_strategy(strategy_name)
             
             if not plugin:
-                self.logger.warning(f"인식 전략을 찾을 수 없음: {strategy_name}")
+                self.logger.warning(f"인식 전략을 찾을 수 없음: {strategy_name} "
+                                    f"(사용 가능: {self.plugin_manager.index.ids_by_type(PluginType.RECOGNITION)})")
                 continue
             
             # 플러그인 초기화
@@ -625,28 +1846,35 @@ class WorkflowManager:
                     errors.append(f"{strategy_name}: 초기화 실패 - {str(e)}")
                     continue
             
-            try:
-                self.logger.info(f"인식 시도: {strategy_name}")
-                result = plugin.execute_action('recognize', {
-                    'context': automation_context,
-                    'target': target,
-                    'timeout': context.settings.get('timeouts', {}).get('element', 10.0)
-                })
-                
-                if result.get('success', False):
-                    self.logger.info(f"인식 성공: {strategy_name}")
-                    return {
-                        'element': result.get('element'),
-                        'strategy_used': strategy_name,
-                        'confidence': result.get('confidence', 1.0)
-                    }
-                else:
-                    error_msg = result.get('error', '알 수 없는 오류')
-                    self.logger.warning(f"인식 실패 ({strategy_name}): {error_msg}")
-                    errors.append(f"{strategy_name}: {error_msg}")
-            except Exception as e:
-                self.logger.warning(f"인식 중 예외 발생 ({strategy_name}): {str(e)}")
-                errors.append(f"{strategy_name}: {str(e)}")
+            candidates.append((strategy_name, plugin))
+        
+        recognize_params = {
+            'context': automation_context,
+            'target': target,
+            'timeout': clamp_timeout(context.settings.get('timeouts', {}).get('element', 10.0))
+        }
+        min_confidence = params.get('min_confidence', context.settings.get('recognition_min_confidence', 0.0))
+        
+        # 경쟁 모드: 전략을 동시에 실행하고 기준 신뢰도를 넘은 첫 결과 사용
+        if len(candidates) > 1 and params.get('race', context.settings.get('recognition_race', False)):
+            winner = self._race_recognition(candidates, recognize_params, min_confidence, errors, frame_context)
+        else:
+            winner = None
+            for strategy_name, plugin in candidates:
+                result, elapsed = self._run_recognition_strategy(strategy_name, plugin, recognize_params, frame_context)
+                if self._accept_recognition(strategy_name, result, min_confidence, errors):
+                    winner = (strategy_name, result, elapsed)
+                    break
+        
+        if winner is not None:
+            strategy_name, result, elapsed = winner
+            self.logger.info(f"인식 성공: {strategy_name} ({elapsed:.3f}초)")
+            return {
+                'element': result.get('element'),
+                'strategy_used': strategy_name,
+                'confidence': result.get('confidence', 1.0),
+                'recognition_time': elapsed
+            }
         
         # 임시 해결책: 실패했지만 워크플로우 계속 진행 (테스트용)
         if context.settings.get('ignore_recognition_errors', True):
@@ -659,6 +1887,163 @@ class WorkflowManager:
         
         raise WorkflowError(f"모든 인식 전략 실패: {', '.join(errors)}")
     
+    def _run_recognition_strategy(self, strategy_name: str, plugin: Any, recognize_params: Dict[str, Any],
+                                  frame_context: Any = None) -> Tuple[Dict[str, Any], float]:
+        """인식 전략 하나 실행 (추적 중이면 인식 구간 기록)
+        
+        Args:
+            strategy_name: 전략 이름
+            plugin: 인식 플러그인
+            recognize_params: recognize 액션 파라미터
+            frame_context: 화면 프레임 기반 플러그인(captures_frames)에 페이지 대신 전달할 바인딩된 자동화 플러그인
+            
+        Returns:
+            (인식 결과, 소요 시간(초))
+        """
+        if frame_context is not None and getattr(plugin, 'captures_frames', False):
+            recognize_params = dict(recognize_params, context=frame_context)
+        
+        self.logger.info(f"인식 시도: {strategy_name}")
+        start_time = time.time()
+        try:
+            with tracing.span(f"recognition.{strategy_name}", 'recognition', strategy=strategy_name,
+                              plugin_id=plugin.get_plugin_info().id) as strategy_span:
+                result = plugin.execute_action('recognize', recognize_params)
+                if strategy_span is not None:
+                    strategy_span.set_attributes(success=result.get('success', False),
+                                                 confidence=result.get('confidence'))
+        except Exception as e:
+            self.logger.warning(f"인식 중 예외 발생 ({strategy_name}): {str(e)}")
+            result = {'success': False, 'error': str(e)}
+        
+        elapsed = time.time() - start_time
+        self._record_recognition(strategy_name, elapsed, result.get('success', False))
+        return result, elapsed
+    
+    @staticmethod
+    def _accept_recognition(strategy_name: str, result: Dict[str, Any], min_confidence: Any,
+                            errors: List[str]) -> bool:
+        """인식 결과가 성공이고 전략의 기준 신뢰도 이상인지 확인 (아니면 오류 목록에 추가)
+        
+        Args:
+            strategy_name: 전략 이름
+            result: 인식 결과
+            min_confidence: 기준 신뢰도 (숫자 또는 전략 이름 -> 숫자 사전)
+            errors: 오류 목록 (출력)
+            
+        Returns:
+            결과 채택 여부
+        """
+        if not result.get('success', False):
+            errors.append(f"{strategy_name}: {result.get('error', '알 수 없는 오류')}")
+            return False
+        
+        threshold = min_confidence.get(strategy_name, 0.0) if isinstance(min_confidence, dict) else min_confidence
+        confidence = result.get('confidence', 1.0)
+        if threshold and confidence < threshold:
+            errors.append(f"{strategy_name}: 신뢰도 부족 ({confidence:.2f} < {threshold:.2f})")
+            return False
+        
+        return True
+    
+    def _race_recognition(self, candidates: List[Tuple[str, Any]], recognize_params: Dict[str, Any],
+                          min_confidence: Any, errors: List[str],
+                          frame_context: Any = None) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        """인식 전략을 동시에 실행하여 첫 번째로 채택된 결과 반환
+        
+        전략마다 단계 기한 아래의 하위 기한을 두고, 승자가 정해지면 나머지 전략의 기한을 취소하여
+        Playwright 작업과 인식 워커 대기를 중단합니다. 최악의 인식 시간은 전략 제한 시간의 합이 아니라 가장 긴 제한 시간이 됩니다.
+        
+        Args:
+            candidates: (전략 이름, 인식 플러그인) 목록
+            recognize_params: recognize 액션 파라미터
+            min_confidence: 기준 신뢰도 (숫자 또는 전략 이름 -> 숫자 사전)
+            errors: 오류 목록 (출력)
+            frame_context: 화면 프레임 기반 플러그인에 전달할 바인딩된 자동화 플러그인
+            
+        Returns:
+            (전략 이름, 인식 결과, 소요 시간(초)) 또는 None (모든 전략 실패)
+        """
+        step_deadline = current_deadline()
+        strategy_deadlines = {name: Deadline(parent=step_deadline, name=f"인식 {name}") for name, _ in candidates}
+        
+        def run(strategy_name: str, plugin: Any) -> Tuple[Dict[str, Any], float]:
+            with deadline_scope(strategy_deadlines[strategy_name]):
+                return self._run_recognition_strategy(strategy_name, plugin, recognize_params, frame_context)
+        
+        self.logger.info(f"인식 전략 경쟁: {[name for name, _ in candidates]}")
+        pool = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="recognition-race")
+        pending = {pool.submit(contextvars.copy_context().run, run, name, plugin): name for name, plugin in candidates}
+        winner = None
+        
+        try:
+            while pending and winner is None:
+                timeout = step_deadline.remaining() if step_deadline is not None else None
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    errors.append(step_deadline.describe())
+                    break
+                
+                for future in done:
+                    strategy_name = pending.pop(future)
+                    result, elapsed = future.result()
+                    if winner is None and self._accept_recognition(strategy_name, result, min_confidence, errors):
+                        winner = (strategy_name, result, elapsed)
+        finally:
+            # 진 전략 취소 (실행 중인 플러그인 호출은 기한 취소로 중단되며 끝날 때까지 기다리지 않음)
+            for future, strategy_name in pending.items():
+                future.cancel()
+                strategy_deadlines[strategy_name].cancel(f"인식 경쟁 종료: {strategy_name}")
+            for deadline in strategy_deadlines.values():
+                deadline.detach()
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        if winner is not None:
+            self._record_recognition(winner[0], winner[2], True, won=True)
+            if pending:
+                self.logger.info(f"인식 경쟁 승리: {winner[0]} ({winner[2]:.3f}초), 취소된 전략: {sorted(pending.values())}")
+        return winner
+    
+    def _record_recognition(self, strategy_name: str, elapsed: float, success: bool, won: bool = False) -> None:
+        """인식 전략 통계 기록
+        
+        Args:
+            strategy_name: 전략 이름
+            elapsed: 소요 시간(초)
+            success: 성공 여부
+            won: 경쟁 모드 승리 기록 여부 (시도 기록과 별도로 호출)
+        """
+        with self._recognition_lock:
+            stats = self.recognition_stats.setdefault(strategy_name, {
+                'attempts': 0, 'successes': 0, 'total_time': 0.0, 'wins': 0, 'win_time': 0.0
+            })
+            if won:
+                stats['wins'] += 1
+                stats['win_time'] += elapsed
+            else:
+                stats['attempts'] += 1
+                stats['total_time'] += elapsed
+                if success:
+                    stats['successes'] += 1
+    
+    def get_recognition_stats(self) -> Dict[str, Dict[str, Any]]:
+        """인식 전략별 통계
+        
+        Returns:
+            전략 이름 -> {attempts, successes, wins, average_time, average_win_time}
+        """
+        with self._recognition_lock:
+            return {
+                name: {
+                    'attempts': stats['attempts'],
+                    'successes': stats['successes'],
+                    'wins': stats['wins'],
+                    'average_time': stats['total_time'] / stats['attempts'] if stats['attempts'] else 0.0,
+                    'average_win_time': stats['win_time'] / stats['wins'] if stats['wins'] else 0.0
+                }
+                for name, stats in self.recognition_stats.items()
+            }
+    
     def _handle_interruption_handling(self, context: WorkflowContext, params: Dict[str, Any]) -> Dict[str, Any]:
         """인터럽션 처리 단계
         
@@ -685,7 +2070,7 @@ class WorkflowManager:
         # 웹 컨텍스트 가져오기 시도
         automation_context = context.state.get('automation_context')
         if not automation_context:
-            playwright_plugin = self.plugin_manager.get_plugin("playwright_automation")
+            playwright_plugin = self._get_playwright_plugin(context, params)
             if playwright_plugin and playwright_plugin.get_plugin_info().id in self.plugin_manager.initialized_plugins:
                 try:
                     result = playwright_plugin.execute_action('get_page', {})
@@ -715,15 +2100,15 @@ class WorkflowManager:
                     try:
                         # Playwright 플러그인 통해 클릭 시도
                         if playwright_plugin:
-                            result = playwright_plugin.execute_action('find_element', {
-                                'selector': selector,
-                                'timeout': 1000
-                            })
+                            # 요소를 찾으면 바로 클릭 (한 번에 제출, 찾지 못하면 중단)
+                            result = playwright_plugin.execute_batch([
+                                ('find_element', {'selector': selector, 'timeout': 1000}),
+                                ('click', {'selector': selector})
+                            ])
                             
-                            if result.get('found', False):
-                                click_result = playwright_plugin.execute_action('click', {
-                                    'selector': selector
-                                })
+                            results = result.get('results') or [{}]
+                            if results[0].get('found', False):
+                                click_result = results[-1]
                                 if click_result.get('success', False):
                                     self.logger.info(f"쿠키 버튼 클릭: {selector}")
                                     handled.append({
@@ -750,7 +2135,7 @@ class WorkflowManager:
         if element_from_step:
             step_result = context.get_step_result(element_from_step)
             if step_result and step_result.status == StepStatus.COMPLETED:
-                element = step_result.output.get('element')
+                element = context.load_value(step_result.output.get('element'))
         
         # 요소 또는 선택자 확인
         selector = params.get('selector')
@@ -759,7 +2144,7 @@ class WorkflowManager:
             raise ValueError("요소 또는 선택자가 지정되지 않음")
         
         # Playwright 플러그인 가져오기
-        playwright_plugin = self.plugin_manager.get_plugin("playwright_automation")
+        playwright_plugin = self._get_playwright_plugin(context, params)
         if not playwright_plugin:
             raise WorkflowError("Playwright 플러그인을 찾을 수 없음")
         
@@ -870,10 +2255,10 @@ class WorkflowManager:
         if element_from_step:
             step_result = context.get_step_result(element_from_step)
             if step_result and step_result.status == StepStatus.COMPLETED:
-                element = step_result.output.get('element')
+                element = context.load_value(step_result.output.get('element'))
         
         # Playwright 플러그인 가져오기
-        playwright_plugin = self.plugin_manager.get_plugin("playwright_automation")
+        playwright_plugin = self._get_playwright_plugin(context, params)
         if not playwright_plugin:
             raise WorkflowError("Playwright 플러그인을 찾을 수 없음")
         
@@ -1009,6 +2394,339 @@ class WorkflowManager:
             self.logger.error(f"키 누르기 중 오류: {str(e)}")
             raise WorkflowError(f"키 누르기 중 오류: {str(e)}")
 
+    def _handle_foreach(self, context: WorkflowContext, params: Dict[str, Any],
+                        step: CompiledStep = None) -> Dict[str, Any]:
+        """목록의 각 항목에 대해 본문 단계를 실행하는 반복 단계 처리
+        
+        항목은 items(목록 또는 $참조) 또는 extract로 가져옵니다. extract는 Playwright extract_list 액션으로
+        페이지당 한 번의 DOM 조회로 행 목록을 추출하며, next_selector가 있으면 max_pages까지 다음 페이지로 이동합니다.
+        반복 결과(반복 변수와 본문 단계 출력)는 상태가 아니라 싱크에 기록됩니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            params: 단계 파라미터 (items 또는 extract, as, index_as, max_parallel, max_items, sink, collect, on_error)
+            step: 컴파일된 반복 단계
+            
+        Returns:
+            반복 횟수, 실패한 반복 횟수, 처리한 페이지 수
+        """
+        item_var = params.get('as', 'item')
+        index_var = params.get('index_as', 'index')
+        max_parallel = max(1, int(params.get('max_parallel', 1)))
+        max_items = params.get('max_items')
+        sink, owned = self._resolve_sink(context, step, params)
+        stats = {'iterations': 0, 'failed_iterations': 0, 'pages': 0}
+        
+        executor = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix=f"loop-{step.id}") \
+            if max_parallel > 1 else None
+        try:
+            for batch in self._foreach_batches(context, params):
+                stats['pages'] += 1
+                if max_items is not None:
+                    batch = batch[:max(0, max_items - stats['iterations'])]
+                scopes = [{item_var: item, index_var: stats['iterations'] + offset}
+                          for offset, item in enumerate(batch)]
+                if not self._run_iterations(context, step, params, scopes, sink, stats, executor):
+                    break
+                if max_items is not None and stats['iterations'] >= max_items:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if owned:
+                sink.close()
+            else:
+                sink.flush()
+        
+        self.logger.info(f"반복 완료: {step.id} (반복: {stats['iterations']}, 실패: {stats['failed_iterations']}, "
+                         f"페이지: {stats['pages']}, 싱크: {sink.name})")
+        return stats
+    
+    def _foreach_batches(self, context: WorkflowContext, params: Dict[str, Any]) -> Iterator[List[Any]]:
+        """반복 항목을 페이지 단위 묶음으로 가져오기
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            params: 반복 단계 파라미터
+            
+        Yields:
+            항목 목록
+        """
+        if 'items' in params:
+            items = params['items']
+            if isinstance(items, str):
+                raise WorkflowError(f"반복 항목을 찾을 수 없음: {items}")
+            if isinstance(items, dict):
+                items = [{'key': key, 'value': value} for key, value in items.items()]
+            yield list(items)
+            return
+        
+        extract = params.get('extract')
+        if not isinstance(extract, dict) or not extract.get('selector'):
+            raise WorkflowError("반복 항목(items 또는 extract.selector)이 지정되지 않음")
+        
+        plugin = self._get_playwright_plugin(context, params)
+        if not plugin:
+            raise WorkflowError("Playwright 플러그인을 찾을 수 없음")
+        if plugin.get_plugin_info().id not in self.plugin_manager.initialized_plugins:
+            self.plugin_manager.initialize_plugin(plugin.get_plugin_info().id)
+        
+        next_selector = extract.get('next_selector')
+        max_pages = max(1, extract.get('max_pages', 1 if not next_selector else 10))
+        for page_number in range(1, max_pages + 1):
+            result = plugin.execute_action('extract_list', {
+                'selector': extract['selector'],
+                'fields': extract.get('fields', {}),
+                'limit': extract.get('limit'),
+                'next_selector': next_selector
+            })
+            if not result.get('success', False):
+                raise WorkflowError(f"목록 추출 실패: {result.get('error', '알 수 없는 오류')}")
+            
+            yield result.get('items', [])
+            
+            if not next_selector or not result.get('has_next') or page_number == max_pages:
+                return
+            
+            # 다음 페이지로 이동 후 로드 대기
+            click = plugin.execute_action('click', {'selector': next_selector})
+            if not click.get('success', False):
+                self.logger.warning(f"다음 페이지 이동 실패: {click.get('error', '알 수 없는 오류')}")
+                return
+            plugin.execute_action('wait_for_load', {'state': extract.get('wait_until', 'load')})
+    
+    def _handle_while(self, context: WorkflowContext, params: Dict[str, Any],
+                      step: CompiledStep = None) -> Dict[str, Any]:
+        """조건이 참인 동안 본문 단계를 반복하는 반복 단계 처리
+        
+        condition은 반복마다 반복 범위, 상태 순으로 다시 조회하는 $참조이며(찾을 수 없으면 거짓),
+        본문 단계 출력은 다음 반복에도 유지되므로 본문 단계가 조건 값을 갱신할 수 있습니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            params: 단계 파라미터 (condition, max_iterations, index_as, sink, collect, on_error)
+            step: 컴파일된 반복 단계
+            
+        Returns:
+            반복 횟수, 실패한 반복 횟수
+        """
+        raw_condition = step.get('params', {}).get('condition', True)
+        condition = ParamTemplate({'value': raw_condition})
+        max_iterations = params.get('max_iterations', 100)
+        index_var = params.get('index_as', 'index')
+        sink, owned = self._resolve_sink(context, step, params)
+        stats = {'iterations': 0, 'failed_iterations': 0}
+        scope: Dict[str, Any] = {}  # 반복 사이에 유지되는 범위
+        
+        try:
+            while True:
+                missing = []
+                if not condition.resolve(ChainMap(scope, context.state), missing.append)['value'] or missing:
+                    break
+                if stats['iterations'] >= max_iterations:
+                    self.logger.warning(f"최대 반복 횟수 도달: {step.id} ({max_iterations}회)")
+                    break
+                scope[index_var] = stats['iterations']
+                if not self._run_iterations(context, step, params, [scope], sink, stats):
+                    break
+        finally:
+            if owned:
+                sink.close()
+            else:
+                sink.flush()
+        
+        self.logger.info(f"반복 완료: {step.id} (반복: {stats['iterations']}, 실패: {stats['failed_iterations']})")
+        return stats
+    
+    def _resolve_sink(self, context: WorkflowContext, step: CompiledStep,
+                      params: Dict[str, Any]) -> Tuple[ResultSink, bool]:
+        """반복 단계의 결과 싱크 결정
+        
+        sink가 문자열이면 등록된 싱크, 사전이면 싱크 설정으로 새로 만든 싱크(단계가 끝나면 닫음),
+        없으면 작업 흐름의 단계별 메모리 싱크(get_workflow_sink로 조회)를 사용합니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 반복 단계
+            params: 단계 파라미터
+            
+        Returns:
+            (싱크, 단계가 닫아야 하는지 여부)
+        """
+        sink = params.get('sink')
+        if sink is None:
+            with context.lock:
+                if step.id not in context.sinks:
+                    context.sinks[step.id] = MemorySink(name=step.id, max_records=params.get('max_records', 1000))
+                return context.sinks[step.id], False
+        
+        if isinstance(sink, str):
+            if sink not in self.sinks:
+                raise WorkflowError(f"등록되지 않은 싱크: {sink}")
+            return self.sinks[sink], False
+        
+        if isinstance(sink, dict):
+            try:
+                return create_sink(sink, name=step.id), True
+            except ValueError as e:
+                raise WorkflowError(f"싱크 생성 실패: {str(e)}")
+        
+        raise WorkflowError(f"잘못된 싱크 설정: {sink}")
+    
+    def _run_iterations(self, context: WorkflowContext, step: CompiledStep, params: Dict[str, Any],
+                        scopes: List[Dict[str, Any]], sink: ResultSink, stats: Dict[str, int],
+                        executor: ThreadPoolExecutor = None) -> bool:
+        """반복 묶음 실행 후 결과를 순서대로 싱크에 기록
+        
+        on_error가 fail(기본)이면 실패한 반복에서 단계를 실패 처리하고, skip이면 오류를 기록하고 계속하며,
+        stop이면 남은 반복을 취소하고 반복을 끝냅니다. 기한 초과는 항상 단계 실패입니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 반복 단계
+            params: 단계 파라미터
+            scopes: 반복별 범위 (반복 변수)
+            sink: 결과 싱크
+            stats: 반복 통계 (갱신됨)
+            executor: 병렬 반복용 스레드 풀 (None이면 순차 실행)
+            
+        Returns:
+            반복을 계속할지 여부
+            
+        Raises:
+            WorkflowError: on_error가 fail인 반복 실패
+            DeadlineExceeded: 단계 또는 작업 흐름 기한 초과
+        """
+        on_error = params.get('on_error', 'fail')
+        collect = params.get('collect')
+        index_var = params.get('index_as', 'index')
+        
+        def run(scope: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[BaseException]]:
+            try:
+                return self._run_iteration(context, step, scope, collect, scope.get(index_var)), None
+            except Exception as e:
+                return None, e
+        
+        if executor is None or len(scopes) <= 1:
+            outcomes = (run(scope) for scope in scopes)
+            futures = []
+        else:
+            # 기한과 추적 구간이 반복 스레드로 전파되도록 제출마다 현재 컨텍스트 복사
+            futures = [executor.submit(contextvars.copy_context().run, run, scope) for scope in scopes]
+            outcomes = (future.result() for future in futures)
+        
+        records = []
+        try:
+            for scope, (record, error) in zip(scopes, outcomes):
+                stats['iterations'] += 1
+                if error is None:
+                    records.append(record)
+                    continue
+                
+                stats['failed_iterations'] += 1
+                index = scope.get(index_var)
+                if isinstance(error, DeadlineExceeded):
+                    raise error
+                if on_error == 'skip':
+                    self.logger.warning(f"반복 실패 (건너뜀): {step.id}[{index}] - {str(error)}")
+                    records.append({index_var: index, 'error': str(error)})
+                    continue
+                if on_error == 'stop':
+                    self.logger.warning(f"반복 실패 (반복 종료): {step.id}[{index}] - {str(error)}")
+                    return False
+                raise WorkflowError(f"반복 실패: {step.id}[{index}] - {str(error)}")
+            return True
+        finally:
+            for future in futures:
+                future.cancel()
+            if records:
+                sink.write_batch(records)
+    
+    def _run_iteration(self, context: WorkflowContext, step: CompiledStep, scope: Dict[str, Any],
+                       collect: Optional[List[str]], index: Any) -> Dict[str, Any]:
+        """반복 한 회의 본문 단계 실행
+        
+        본문 단계 파라미터는 반복 범위(반복 변수와 앞선 본문 단계 출력)를 먼저, 작업 흐름 상태를 나중에 조회하며,
+        본문 단계 출력은 작업 흐름 상태가 아니라 반복 범위에만 반영됩니다.
+        기한이 지정되지 않은 본문 단계는 반복 단계의 기한 안에서 호출 스레드에서 바로 실행됩니다.
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            step: 컴파일된 반복 단계
+            scope: 반복 범위 (갱신됨)
+            collect: 싱크에 기록할 키 (None이면 반복 범위 전체)
+            index: 반복 순번 (추적 구간 속성)
+            
+        Returns:
+            싱크에 기록할 결과
+        """
+        view = ChainMap(scope, context.state)
+        with tracing.span(step.id, 'iteration', index=index):
+            for body_step in step.body:
+                params = body_step.params.resolve(view, self._warn_missing_variable)
+                if body_step.timeout is None:
+                    deadline = current_deadline()
+                    if deadline is not None:
+                        deadline.check()
+                    output = self._bind_handler(body_step)(context, params)
+                else:
+                    step_deadline = Deadline(body_step.timeout, parent=current_deadline(), name=f"단계 {body_step.id}")
+                    try:
+                        with deadline_scope(step_deadline):
+                            output = self._call_handler(context, body_step, params, step_deadline)
+                    finally:
+                        step_deadline.detach()
+                
+                if isinstance(output, dict):
+                    scope.update(output)
+                elif output is not None:
+                    scope[body_step.id] = output
+        
+        return {key: scope.get(key) for key in collect} if collect else dict(scope)
+    
+    def register_sink(self, name: str, sink: ResultSink) -> None:
+        """반복 단계가 이름으로 사용할 결과 싱크 등록
+        
+        Args:
+            name: 싱크 이름 (반복 단계의 sink 파라미터)
+            sink: 결과 싱크
+        """
+        self.sinks[name] = sink
+        self.logger.debug(f"결과 싱크 등록: {name}")
+    
+    def get_workflow_sink(self, workflow_id: str, step_id: str) -> Optional[ResultSink]:
+        """sink를 지정하지 않은 반복 단계의 메모리 싱크 가져오기
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            step_id: 반복 단계 ID
+            
+        Returns:
+            메모리 싱크 또는 None
+        """
+        context = self.active_workflows.get(workflow_id)
+        return context.sinks.get(step_id) if context is not None else None
+    
+    def _handle_set_blocking_profile(self, context: WorkflowContext, params: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 차단 프로필 변경 단계 처리 (이후 단계의 요청부터 적용)
+        
+        Args:
+            context: 작업 흐름 컨텍스트
+            params: 단계 파라미터 (profile: 프로필 이름, 'none'이면 차단 안 함, 없으면 도메인/기본 프로필)
+            
+        Returns:
+            단계 결과
+        """
+        playwright_plugin = self._get_playwright_plugin(context, params)
+        if not playwright_plugin:
+            raise WorkflowError("Playwright 플러그인을 찾을 수 없음")
+        
+        result = playwright_plugin.execute_action('set_blocking_profile', {'profile': params.get('profile')})
+        if not result.get('success', False):
+            raise WorkflowError(f"요청 차단 프로필 변경 실패: {result.get('error', '알 수 없는 오류')}")
+        
+        return {'blocking_profile': params.get('profile')}
+    
     def _handle_wait_for_load(self, context: WorkflowContext, params: Dict[str, Any]) -> Dict[str, Any]:
         """페이지 로드 대기 단계 처리
         
@@ -1019,28 +2737,30 @@ class WorkflowManager:
         Returns:
             단계 결과
         """
-        timeout = params.get('timeout', 30.0)
+        timeout = clamp_timeout(params.get('timeout', 30.0))
         
         # Playwright 플러그인 가져오기
-        playwright_plugin = self.plugin_manager.get_plugin("playwright_automation")
+        playwright_plugin = self._get_playwright_plugin(context, params)
         if not playwright_plugin:
             raise WorkflowError("Playwright 플러그인을 찾을 수 없음")
         
         if playwright_plugin.get_plugin_info().id not in self.plugin_manager.initialized_plugins:
             self.plugin_manager.initialize_plugin(playwright_plugin.get_plugin_info().id)
         
-        # 페이지 로드 대기 실행
-        result = playwright_plugin.execute_action('wait_for_load', {
-            'state': 'networkidle',  # 네트워크 활동이 끝날 때까지 대기
-            'timeout': timeout * 1000  # 밀리초로 변환
-        })
+        # 페이지 로드 대기 후 현재 URL 가져오기 (한 번에 제출)
+        result = playwright_plugin.execute_batch([
+            ('wait_for_load', {
+                'state': 'networkidle',  # 네트워크 활동이 끝날 때까지 대기
+                'timeout': timeout * 1000  # 밀리초로 변환
+            }),
+            ('get_url', {})
+        ])
         
-        if not result.get('success', False):
+        if not result.get('success', False) and result.get('failed_index') == 0:
             error_msg = result.get('error', '알 수 없는 오류')
             raise WorkflowError(f"페이지 로드 대기 실패: {error_msg}")
         
-        # 현재 URL 가져오기
-        url_result = playwright_plugin.execute_action('get_url', {})
+        url_result = result['results'][1] if len(result.get('results', [])) > 1 else {}
         current_url = url_result.get('url', '')
         
         return {'url': current_url}
@@ -0,0 +1,687 @@
+"""
+작업 흐름 스케줄러 모듈
+
+이 모듈은 같은 작업 계획을 주기적으로 실행하는 스케줄러를 구현합니다(환율 조회, 조달 공고 확인 등).
+일정은 cron 식 또는 고정 간격으로 실행 요청을 만들고, 요청은 우선순위 대기열을 거쳐 WorkflowExecutor로 실행됩니다.
+전체 동시 실행 수와 계획별 동시 실행 수를 제한하며, 같은 계획의 대기 중인 중복 요청은 하나로 병합합니다.
+일정과 대기열(실행 중이던 요청 포함)은 로컬 JSON 파일에 저장되어 재시작 후에도 이어서 실행됩니다.
+"""
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .workflow_compiler import WorkflowCompiler
+from .workflow_executor import WorkflowExecutor
+from .workflow_manager import WorkflowStatus
+
+
+class IntervalTrigger:
+    """고정 간격 트리거 (기준 시각부터 seconds 간격의 시각에 실행)"""
+    
+    def __init__(self, seconds: float, anchor: float = None):
+        """트리거 초기화
+        
+        Args:
+            seconds: 실행 간격(초)
+            anchor: 기준 시각 (epoch 초, None이면 현재 시각)
+        """
+        if seconds <= 0:
+            raise ValueError(f"잘못된 실행 간격: {seconds}")
+        self.seconds = float(seconds)
+        self.anchor = time.time() if anchor is None else anchor
+    
+    def next_fire(self, after: float) -> float:
+        """after 이후 다음 실행 시각 (놓친 실행은 건너뜀)"""
+        if after < self.anchor:
+            return self.anchor
+        return self.anchor + ((after - self.anchor) // self.seconds + 1) * self.seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': 'interval', 'seconds': self.seconds, 'anchor': self.anchor}
+    
+    def __repr__(self) -> str:
+        return f"IntervalTrigger({self.seconds}초)"
+
+
+class CronTrigger:
+    """cron 식 트리거 (분 시 일 월 요일, 로컬 시간)
+    
+    각 필드는 *, 값, 범위(a-b), 목록(a,b), 간격(*/n, a-b/n)을 지원하며 요일은 0(일요일)~6(7도 일요일)입니다.
+    일과 요일이 모두 지정되면 표준 cron과 같이 둘 중 하나만 맞아도 실행합니다.
+    """
+    
+    FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+    
+    def __init__(self, expression: str):
+        """트리거 초기화
+        
+        Args:
+            expression: cron 식 (예: '*/10 9-18 * * 1-5')
+        
+        Raises:
+            ValueError: 잘못된 cron 식
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 함: {expression}")
+        
+        self.expression = expression
+        minutes, hours, days, months, weekdays = (
+            self._parse_field(value, low, high, expression) for value, (low, high) in zip(fields, self.FIELD_RANGES)
+        )
+        self.minutes = minutes
+        self.hours = hours
+        self.days = days
+        self.months = months
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+    
+    @staticmethod
+    def _parse_field(value: str, low: int, high: int, expression: str) -> FrozenSet[int]:
+        """cron 필드 해석"""
+        values: Set[int] = set()
+        for part in value.split(','):
+            span, _, step_text = part.partition('/')
+            try:
+                step = int(step_text) if step_text else 1
+                if span == '*':
+                    start, end = low, high
+                elif '-' in span:
+                    start, end = (int(bound) for bound in span.split('-', 1))
+                else:
+                    start = int(span)
+                    end = high if step_text else start
+            except ValueError:
+                raise ValueError(f"잘못된 cron 필드: {part} ({expression})")
+            
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(f"cron 필드 범위 오류: {part} ({expression})")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+    
+    def _day_matches(self, moment: datetime) -> bool:
+        """일/요일 일치 여부"""
+        day_match = moment.day in self.days
+        weekday_match = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_match and weekday_match
+        return day_match or weekday_match
+    
+    def next_fire(self, after: float) -> float:
+        """after 이후 다음 실행 시각
+        
+        Raises:
+            ValueError: 5년 안에 실행 시각이 없는 경우 (예: 2월 30일)
+        """
+        moment = datetime.fromtimestamp(after).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        
+        raise ValueError(f"실행 시각이 없는 cron 식: {self.expression}")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': 'cron', 'expression': self.expression}
+    
+    def __repr__(self) -> str:
+        return f"CronTrigger('{self.expression}')"
+
+
+def trigger_from_dict(data: Optional[Dict[str, Any]]) -> Optional[Any]:
+    """저장된 트리거 복원
+    
+    Args:
+        data: to_dict() 결과 (None이면 수동 실행 전용)
+    
+    Returns:
+        트리거 또는 None
+    """
+    if not data:
+        return None
+    if data.get('type') == 'cron':
+        return CronTrigger(data['expression'])
+    if data.get('type') == 'interval':
+        return IntervalTrigger(data['seconds'], data.get('anchor'))
+    raise ValueError(f"알 수 없는 트리거 유형: {data.get('type')}")
+
+
+@dataclass
+class Schedule:
+    """작업 흐름 일정"""
+    name: str  # 일정 이름 (병합/동시 실행 제한 키)
+    workflow_plan: Dict[str, Any]  # 작업 계획
+    trigger: Optional[Any] = None  # 트리거 (None이면 run_now()로만 실행)
+    settings: Dict[str, Any] = field(default_factory=dict)  # 실행 설정
+    priority: int = 0  # 우선순위 (클수록 먼저 실행)
+    max_concurrent: int = 1  # 이 일정의 최대 동시 실행 수
+    group: str = 'default'  # 실행기 공정 스케줄링 그룹
+    coalesce: bool = True  # 대기 중인 요청이 있으면 새 요청을 병합할지 여부
+    enabled: bool = True  # 활성화 여부
+    next_run: Optional[float] = None  # 다음 실행 시각 (epoch 초)
+    last_run: Optional[float] = None  # 마지막 실행 시작 시각
+    last_status: Optional[str] = None  # 마지막 실행 결과 상태
+    runs: int = 0  # 실행 횟수
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['trigger'] = self.trigger.to_dict() if self.trigger is not None else None
+        return data
+
+
+@dataclass
+class ScheduledRun:
+    """실행 요청"""
+    run_id: str  # 요청 ID
+    key: str  # 병합/동시 실행 제한 키 (일정 이름 또는 계획 해시)
+    workflow_plan: Dict[str, Any]  # 작업 계획
+    settings: Dict[str, Any] = field(default_factory=dict)  # 실행 설정
+    priority: int = 0  # 우선순위 (클수록 먼저 실행)
+    max_concurrent: Optional[int] = None  # 같은 키의 최대 동시 실행 수 (None이면 제한 없음)
+    group: str = 'default'  # 실행기 공정 스케줄링 그룹
+    coalesce: bool = True  # 같은 키의 대기 중인 요청과 병합할지 여부
+    enqueued_at: float = field(default_factory=time.time)  # 요청 시각
+    coalesced: int = 0  # 병합된 중복 요청 수
+    workflow_id: Optional[str] = None  # 실행 중인 작업 흐름 ID
+    started_at: Optional[float] = None  # 실행 시작 시각
+
+
+class WorkflowScheduler:
+    """우선순위 작업 흐름 스케줄러
+    
+    대기 중인 요청은 (우선순위, 요청 순서) 힙에 보관되며, 실행 슬롯이 비면 우선순위가 가장 높은 요청 중
+    계획별 동시 실행 제한에 걸리지 않은 요청부터 WorkflowExecutor에 제출합니다.
+    스케줄러가 꺼져 있는 동안 놓친 실행은 재시작 시 한 번만 실행됩니다.
+    """
+    
+    def __init__(self, executor: WorkflowExecutor, state_file: str = None, max_concurrent: int = None,
+                 history_size: int = 100, logger=None):
+        """스케줄러 초기화
+        
+        Args:
+            executor: 작업 흐름 실행기
+            state_file: 일정/대기열 저장 파일 (None이면 저장하지 않음)
+            max_concurrent: 전체 최대 동시 실행 수 (None이면 실행기의 최대 동시 실행 수)
+            history_size: 보관할 완료 요청 기록 수
+            logger: 로거 객체
+        """
+        self.executor = executor
+        self.state_file = state_file
+        self.max_concurrent = max(1, max_concurrent or executor.max_concurrent)
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self._schedules: Dict[str, Schedule] = {}
+        self._pending: Dict[str, ScheduledRun] = {}  # 요청 ID -> 대기 중인 요청
+        self._pending_by_key: Dict[str, str] = {}  # 키 -> 병합 대상 대기 요청 ID
+        self._heap: List[Tuple[int, int, str]] = []  # (-우선순위, 순서, 요청 ID)
+        self._counter = itertools.count()
+        self._running: Dict[str, ScheduledRun] = {}  # 요청 ID -> 실행 중인 요청
+        self._running_per_key: Dict[str, int] = {}
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        
+        self._condition = threading.Condition()
+        self._save_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+        self._closed = False  # 종료 후에는 실행 중이던 요청이 대기 요청으로 남도록 저장하지 않음
+        
+        # 통계
+        self._stats = {'enqueued': 0, 'coalesced': 0, 'started': 0, 'completed': 0, 'failed': 0}
+        
+        if state_file:
+            self._load()
+    
+    # 일정 관리
+    def add_schedule(self, name: str, workflow_plan: Dict[str, Any], trigger: Any = None,
+                     settings: Dict[str, Any] = None, priority: int = 0, max_concurrent: int = 1,
+                     group: str = 'default', coalesce: bool = True) -> Schedule:
+        """일정 추가 (같은 이름의 일정은 교체)
+        
+        Args:
+            name: 일정 이름
+            workflow_plan: 작업 계획
+            trigger: IntervalTrigger/CronTrigger (None이면 run_now()로만 실행)
+            settings: 실행 설정
+            priority: 우선순위 (클수록 먼저 실행)
+            max_concurrent: 이 일정의 최대 동시 실행 수
+            group: 실행기 공정 스케줄링 그룹
+            coalesce: 대기 중인 요청이 있으면 새 요청을 병합할지 여부
+        
+        Returns:
+            일정
+        """
+        schedule = Schedule(name=name, workflow_plan=workflow_plan, trigger=trigger, settings=dict(settings or {}),
+                            priority=priority, max_concurrent=max(1, max_concurrent), group=group, coalesce=coalesce)
+        if trigger is not None:
+            schedule.next_run = trigger.next_fire(time.time())
+        
+        with self._condition:
+            self._schedules[name] = schedule
+            self._condition.notify_all()
+        
+        self.logger.info(f"작업 흐름 일정 추가: {name} ({trigger!r}, 우선순위: {priority})")
+        self._save()
+        return schedule
+    
+    def remove_schedule(self, name: str) -> bool:
+        """일정 제거 (이미 대기 중인 요청은 실행됨)
+        
+        Args:
+            name: 일정 이름
+        
+        Returns:
+            성공 여부
+        """
+        with self._condition:
+            removed = self._schedules.pop(name, None) is not None
+        if removed:
+            self.logger.info(f"작업 흐름 일정 제거: {name}")
+            self._save()
+        return removed
+    
+    def set_enabled(self, name: str, enabled: bool) -> bool:
+        """일정 활성화/비활성화
+        
+        Args:
+            name: 일정 이름
+            enabled: 활성화 여부
+        
+        Returns:
+            성공 여부
+        """
+        with self._condition:
+            schedule = self._schedules.get(name)
+            if schedule is None:
+                return False
+            schedule.enabled = enabled
+            if enabled and schedule.trigger is not None:
+                schedule.next_run = schedule.trigger.next_fire(time.time())
+            self._condition.notify_all()
+        self._save()
+        return True
+    
+    def list_schedules(self) -> List[Dict[str, Any]]:
+        """일정 목록
+        
+        Returns:
+            일정 사전 목록 (계획 제외)
+        """
+        with self._condition:
+            schedules = [schedule.to_dict() for schedule in self._schedules.values()]
+        for schedule in schedules:
+            schedule.pop('workflow_plan', None)
+        return schedules
+    
+    # 실행 요청
+    def run_now(self, name: str, priority: int = None) -> Optional[str]:
+        """일정을 즉시 실행 요청
+        
+        Args:
+            name: 일정 이름
+            priority: 우선순위 (None이면 일정의 우선순위)
+        
+        Returns:
+            요청 ID (병합된 경우 기존 요청 ID) 또는 None (일정 없음)
+        """
+        with self._condition:
+            schedule = self._schedules.get(name)
+            if schedule is None:
+                return None
+            run_id = self._enqueue_schedule(schedule, priority)
+        
+        self._save()
+        self._dispatch()
+        return run_id
+    
+    def enqueue(self, workflow_plan: Dict[str, Any], settings: Dict[str, Any] = None, priority: int = 0,
+                key: str = None, max_concurrent: int = None, group: str = 'default', coalesce: bool = True) -> str:
+        """일회성 실행 요청
+        
+        Args:
+            workflow_plan: 작업 계획
+            settings: 실행 설정
+            priority: 우선순위 (클수록 먼저 실행)
+            key: 병합/동시 실행 제한 키 (None이면 계획 내용 해시)
+            max_concurrent: 같은 키의 최대 동시 실행 수 (None이면 제한 없음)
+            group: 실행기 공정 스케줄링 그룹
+            coalesce: 같은 키의 대기 중인 요청과 병합할지 여부
+        
+        Returns:
+            요청 ID (병합된 경우 기존 요청 ID)
+        """
+        run = ScheduledRun(run_id=uuid.uuid4().hex, key=key or WorkflowCompiler.plan_hash(workflow_plan),
+                           workflow_plan=workflow_plan, settings=dict(settings or {}), priority=priority,
+                           max_concurrent=max_concurrent, group=group, coalesce=coalesce)
+        with self._condition:
+            run_id = self._push(run)
+        
+        self._save()
+        self._dispatch()
+        return run_id
+    
+    def cancel(self, run_id: str) -> bool:
+        """대기 중인 요청 취소 (실행 중인 요청은 실행기에서 취소)
+        
+        Args:
+            run_id: 요청 ID
+        
+        Returns:
+            성공 여부
+        """
+        with self._condition:
+            run = self._pending.pop(run_id, None)
+            running = self._running.get(run_id)
+            if run is not None and self._pending_by_key.get(run.key) == run_id:
+                del self._pending_by_key[run.key]
+        
+        if run is not None:
+            self._save()
+            return True
+        if running is not None and running.workflow_id:
+            return self.executor.cancel(running.workflow_id)
+        return False
+    
+    def _enqueue_schedule(self, schedule: Schedule, priority: int = None) -> str:
+        """일정의 실행 요청 추가 (호출 시 _condition 보유)"""
+        run = ScheduledRun(run_id=uuid.uuid4().hex, key=schedule.name, workflow_plan=schedule.workflow_plan,
+                           settings=dict(schedule.settings), priority=schedule.priority if priority is None else priority,
+                           max_concurrent=schedule.max_concurrent, group=schedule.group, coalesce=schedule.coalesce)
+        return self._push(run)
+    
+    def _push(self, run: ScheduledRun) -> str:
+        """대기열에 요청 추가 또는 같은 키의 대기 요청과 병합 (호출 시 _condition 보유)
+        
+        병합되면 기존 요청의 우선순위를 둘 중 높은 값으로 올리며, 설정은 기존 요청의 것을 유지합니다.
+        """
+        self._stats['enqueued'] += 1
+        existing_id = self._pending_by_key.get(run.key) if run.coalesce else None
+        existing = self._pending.get(existing_id) if existing_id else None
+        if existing is not None:
+            existing.coalesced += 1
+            self._stats['coalesced'] += 1
+            if run.priority > existing.priority:
+                existing.priority = run.priority
+                heapq.heappush(self._heap, (-existing.priority, next(self._counter), existing.run_id))
+            self.logger.debug(f"중복 실행 요청 병합: {run.key} -> {existing.run_id}")
+            return existing.run_id
+        
+        self._pending[run.run_id] = run
+        if run.coalesce:
+            self._pending_by_key[run.key] = run.run_id
+        heapq.heappush(self._heap, (-run.priority, next(self._counter), run.run_id))
+        self._condition.notify_all()
+        return run.run_id
+    
+    # 실행
+    def _pop_eligible(self) -> Optional[ScheduledRun]:
+        """동시 실행 제한에 걸리지 않은 가장 높은 우선순위 요청 꺼내기 (호출 시 _condition 보유)"""
+        deferred = []
+        selected = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            run = self._pending.get(entry[2])
+            if run is None or -entry[0] != run.priority:
+                continue  # 취소되었거나 우선순위가 올라가 다시 넣은 항목
+            if run.max_concurrent is not None and self._running_per_key.get(run.key, 0) >= run.max_concurrent:
+                deferred.append(entry)
+                continue
+            selected = run
+            break
+        
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+        
+        if selected is not None:
+            del self._pending[selected.run_id]
+            if self._pending_by_key.get(selected.key) == selected.run_id:
+                del self._pending_by_key[selected.key]
+        return selected
+    
+    def _dispatch(self) -> None:
+        """실행 슬롯이 비어 있으면 우선순위 순으로 요청을 실행기에 제출 (start() 전에는 대기열에만 보관)"""
+        while True:
+            with self._condition:
+                if self._shutdown or self._thread is None or len(self._running) >= self.max_concurrent:
+                    return
+                run = self._pop_eligible()
+                if run is None:
+                    return
+                run.started_at = time.time()
+                self._running[run.run_id] = run
+                self._running_per_key[run.key] = self._running_per_key.get(run.key, 0) + 1
+                self._stats['started'] += 1
+                schedule = self._schedules.get(run.key)
+                if schedule is not None:
+                    schedule.last_run = run.started_at
+                    schedule.runs += 1
+            
+            try:
+                run.workflow_id = self.executor.submit(run.workflow_plan, run.settings, group=run.group)
+            except Exception as e:
+                self.logger.error(f"예약 실행 제출 실패: {run.key} - {str(e)}")
+                self._finish(run, 'failed', str(e))
+                continue
+            
+            self.logger.info(f"예약 실행 시작: {run.key} -> {run.workflow_id} (우선순위: {run.priority})")
+            self.executor.get_future(run.workflow_id).add_done_callback(
+                lambda future, run=run: self._on_done(run, future))
+            self._save()
+    
+    def _on_done(self, run: ScheduledRun, future: Future) -> None:
+        """실행기 작업 완료 콜백"""
+        if future.cancelled():
+            self._finish(run, 'cancelled', None)
+        elif future.exception() is not None:
+            self._finish(run, 'failed', str(future.exception()))
+        else:
+            result = future.result()
+            self._finish(run, result.get('status'), result.get('error'))
+        self._dispatch()
+    
+    def _finish(self, run: ScheduledRun, status: Optional[str], error: Optional[str]) -> None:
+        """요청 종료 처리"""
+        with self._condition:
+            self._running.pop(run.run_id, None)
+            count = self._running_per_key.get(run.key, 0) - 1
+            if count > 0:
+                self._running_per_key[run.key] = count
+            else:
+                self._running_per_key.pop(run.key, None)
+            
+            if status == WorkflowStatus.COMPLETED.value:
+                self._stats['completed'] += 1
+            else:
+                self._stats['failed'] += 1
+            
+            schedule = self._schedules.get(run.key)
+            if schedule is not None:
+                schedule.last_status = status
+            
+            self._history.append({
+                'run_id': run.run_id, 'key': run.key, 'workflow_id': run.workflow_id, 'status': status,
+                'error': error, 'priority': run.priority, 'coalesced': run.coalesced,
+                'enqueued_at': run.enqueued_at, 'started_at': run.started_at, 'finished_at': time.time()
+            })
+            self._condition.notify_all()
+        
+        self._save()
+    
+    # 트리거 스레드
+    def start(self) -> None:
+        """트리거 스레드 시작 및 저장된 대기 요청 실행"""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._shutdown = False
+            self._thread = threading.Thread(target=self._run_triggers, name="workflow-scheduler", daemon=True)
+            self._thread.start()
+        self._dispatch()
+    
+    def _run_triggers(self) -> None:
+        """트리거 스레드: 실행 시각이 된 일정의 요청 추가"""
+        while True:
+            with self._condition:
+                if self._shutdown:
+                    return
+                
+                now = time.time()
+                fired = []
+                for schedule in self._schedules.values():
+                    if not schedule.enabled or schedule.trigger is None or schedule.next_run is None:
+                        continue
+                    if schedule.next_run <= now:
+                        self._enqueue_schedule(schedule)
+                        schedule.next_run = schedule.trigger.next_fire(now)
+                        fired.append(schedule.name)
+                
+                if not fired:
+                    next_runs = [schedule.next_run for schedule in self._schedules.values()
+                                 if schedule.enabled and schedule.next_run is not None]
+                    # 시계 변경에 대비해 최대 60초마다 다시 확인
+                    timeout = min(60.0, max(0.0, min(next_runs) - now)) if next_runs else 60.0
+                    self._condition.wait(timeout)
+                    continue
+            
+            self.logger.info(f"예약 실행 요청: {', '.join(fired)}")
+            self._save()
+            self._dispatch()
+    
+    def wait_idle(self, timeout: float = None) -> bool:
+        """대기 중이거나 실행 중인 요청이 없을 때까지 대기
+        
+        Args:
+            timeout: 최대 대기 시간(초)
+        
+        Returns:
+            유휴 상태가 되었는지 여부
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._running, timeout)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """스케줄러 통계
+        
+        Returns:
+            대기/실행 수, 키별 현황, 요청/병합/시작/완료/실패 횟수
+        """
+        with self._condition:
+            queued_per_key: Dict[str, int] = {}
+            for run in self._pending.values():
+                queued_per_key[run.key] = queued_per_key.get(run.key, 0) + 1
+            return dict(self._stats, **{
+                'max_concurrent': self.max_concurrent,
+                'schedules': len(self._schedules),
+                'queued': len(self._pending),
+                'running': len(self._running),
+                'queued_per_key': queued_per_key,
+                'running_per_key': dict(self._running_per_key)
+            })
+    
+    def get_history(self) -> List[Dict[str, Any]]:
+        """최근 완료된 요청 기록"""
+        with self._condition:
+            return list(self._history)
+    
+    # 저장/복원
+    def _save(self) -> None:
+        """일정과 대기열 저장 (실행 중인 요청은 재시작 시 다시 실행되도록 대기 요청으로 저장)"""
+        if not self.state_file or self._closed:
+            return
+        
+        with self._condition:
+            runs = sorted(list(self._running.values()) + list(self._pending.values()),
+                          key=lambda run: (-run.priority, run.enqueued_at))
+            data = {
+                'saved_at': time.time(),
+                'schedules': [schedule.to_dict() for schedule in self._schedules.values()],
+                'pending': [dict(asdict(run), workflow_id=None, started_at=None) for run in runs]
+            }
+        
+        # 저장 순서를 직렬화하고 임시 파일 교체로 쓰기 도중 종료되어도 이전 상태 유지
+        with self._save_lock:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+                temp_file = f"{self.state_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, default=str)
+                os.replace(temp_file, self.state_file)
+            except Exception as e:
+                self.logger.error(f"스케줄러 상태 저장 실패: {str(e)}")
+    
+    def _load(self) -> None:
+        """저장된 일정과 대기열 복원"""
+        if not os.path.exists(self.state_file):
+            return
+        
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.error(f"스케줄러 상태 로드 실패: {str(e)}")
+            return
+        
+        for item in data.get('schedules', []):
+            try:
+                item['trigger'] = trigger_from_dict(item.get('trigger'))
+                schedule = Schedule(**item)
+            except (TypeError, ValueError) as e:
+                self.logger.error(f"일정 복원 실패: {item.get('name')} - {str(e)}")
+                continue
+            self._schedules[schedule.name] = schedule
+        
+        for item in data.get('pending', []):
+            try:
+                run = ScheduledRun(**item)
+            except TypeError as e:
+                self.logger.error(f"실행 요청 복원 실패: {str(e)}")
+                continue
+            self._pending[run.run_id] = run
+            if run.coalesce:
+                self._pending_by_key.setdefault(run.key, run.run_id)
+            heapq.heappush(self._heap, (-run.priority, next(self._counter), run.run_id))
+        
+        self.logger.info(f"스케줄러 상태 복원: 일정 {len(self._schedules)}개, 대기 요청 {len(self._pending)}개")
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """스케줄러 종료 (대기 중인 요청은 저장되어 다음 시작 시 실행됨)
+        
+        wait=False면 실행 중인 요청도 대기 요청으로 저장되어 다음 시작 시 다시 실행됩니다.
+        
+        Args:
+            wait: 실행 중인 요청 완료 대기 여부
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        
+        if wait:
+            with self._condition:
+                self._condition.wait_for(lambda: not self._running)
+        
+        self._save()
+        self._closed = True
+        self.logger.info("작업 흐름 스케줄러 종료")
@@ -9,13 +9,20 @@ import json
 import logging
 import os
 import sys
+import time
 from typing import Dict, List, Any
 import os
 os.environ["PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"] = "python"
 
 # 코어 모듈 가져오기
 from core.plugin_system import PluginManager, PluginType
-from core.workflow_manager import WorkflowManager
+from core.workflow_manager import RetentionPolicy, WorkflowError, WorkflowEventSubscription, WorkflowManager
+from core.workflow_executor import WorkflowExecutor
+from core.workflow_scheduler import CronTrigger, IntervalTrigger, WorkflowScheduler
+from core.workflow_journal import WorkflowJournal
+from core.blob_store import BlobStore
+from core.retry_scheduler import RetryScheduler
+from core.step_cache import StepResultCache
 from core.interruption_handler import InterruptionHandler
 from core.settings_manager import SettingsManager, AutomationMode
 
@@ -52,6 +59,9 @@ class BlueAI:
         # 자동 명령 실행 여부
         self.auto_execute = True
         
+        # 플러그인 사전 초기화 결과 (플러그인 ID -> PluginInitReport)
+        self.plugin_init_reports = {}
+        
         # 설정 관리자
         self.settings_manager = SettingsManager(
             settings_dir=self.config.get('settings_dir', os.path.join(self.base_dir, 'settings'))
@@ -63,15 +73,75 @@ class BlueAI:
         # 플러그인 관리자
         self.plugin_manager = PluginManager(
             plugin_dirs=self.plugin_dirs,
+            logger=self.logger,
+            manifest_file=self.config.get('plugin_manifest', os.path.join(self.config_dir, 'plugin_manifest.json'))
+        )
+        
+        # 워크플로우 디스크 저널 (비정상 종료 후 재개용)
+        journal_config = self.config.get('workflow_journal', {})
+        self.workflow_journal = None
+        if journal_config.get('enabled', True):
+            self.workflow_journal = WorkflowJournal(
+                directory=journal_config.get('directory', os.path.join(self.base_dir, 'logs', 'journal')),
+                flush_interval=journal_config.get('flush_interval', 0.5),
+                fsync=journal_config.get('fsync', True),
+                retain_completed=journal_config.get('retain_completed', False),
+                logger=self.logger
+            )
+        
+        # 단계 재시도 스케줄러 (워크플로우별 재시도 예산)
+        self.retry_scheduler = RetryScheduler(
+            default_budget=self.config.get('workflow_retry_budget', 20),
             logger=self.logger
         )
         
-        # 워크플로우 관리자
+        # 워크플로우 관리자 (컨텍스트 보존 정책: 실행 경로 제한, 큰 출력 블롭 저장, 상태 정리)
+        retention_config = self.config.get('workflow_retention', {})
         self.workflow_manager = WorkflowManager(
             plugin_manager=self.plugin_manager,
+            logger=self.logger,
+            journal=self.workflow_journal,
+            retry_scheduler=self.retry_scheduler,
+            step_cache=StepResultCache(
+                max_entries=self.config.get('step_cache', {}).get('max_entries', 256),
+                ttl=self.config.get('step_cache', {}).get('ttl', 300.0)
+            ),
+            tracing_enabled=self.config.get('workflow_tracing', {}).get('enabled', True),
+            trace_dir=self.config.get('workflow_tracing', {}).get('directory', os.path.join(self.base_dir, 'logs', 'traces')),
+            step_timeout=self.config.get('workflow_deadlines', {}).get('step_timeout'),
+            workflow_timeout=self.config.get('workflow_deadlines', {}).get('workflow_timeout'),
+            cancel_grace=self.config.get('workflow_deadlines', {}).get('cancel_grace', 1.0),
+            retention=RetentionPolicy(
+                max_execution_path=retention_config.get('max_execution_path', 1000),
+                spill_threshold=retention_config.get('spill_threshold', 262144),
+                prune_state=retention_config.get('prune_state', False),
+                keep_state_keys=tuple(retention_config.get('keep_state_keys', ['automation_context']))
+            ),
+            blob_store=BlobStore(
+                directory=retention_config.get('blob_directory', os.path.join(self.base_dir, 'data', 'blobs')),
+                logger=self.logger
+            )
+        )
+        
+        # 동시 작업 흐름 실행기 (작업 흐름별 브라우저 페이지 임대)
+        self.workflow_executor = WorkflowExecutor(
+            workflow_manager=self.workflow_manager,
+            max_concurrent=self.config.get('max_concurrent_workflows', 4),
+            max_per_group=self.config.get('max_workflows_per_group'),
             logger=self.logger
         )
         
+        # 예약 실행 스케줄러 (우선순위 대기열, cron/간격 트리거, 대기열 로컬 저장)
+        scheduler_config = self.config.get('workflow_scheduler', {})
+        self.workflow_scheduler = None
+        if scheduler_config.get('enabled', True):
+            self.workflow_scheduler = WorkflowScheduler(
+                executor=self.workflow_executor,
+                state_file=scheduler_config.get('state_file', os.path.join(self.base_dir, 'data', 'scheduler_state.json')),
+                max_concurrent=scheduler_config.get('max_concurrent'),
+                logger=self.logger
+            )
+        
         # 인터럽션 처리자
         self.interruption_handler = InterruptionHandler(
             plugin_manager=self.plugin_manager,
@@ -117,6 +187,48 @@ class BlueAI:
         return {
             'settings_dir': os.path.join(self.base_dir, 'settings'),
             'plugin_dirs': [os.path.join(self.base_dir, 'plugins')],
+            'lazy_plugin_loading': True,
+            'preload_plugins': [],
+            'parallel_plugin_init': True,
+            'process_recognition_hosts': {},
+            'action_stats_file': os.path.join(self.base_dir, 'logs', 'action_stats.json'),
+            'max_concurrent_workflows': 4,
+            'max_workflows_per_group': None,
+            'workflow_retry_budget': 20,
+            'step_cache': {
+                'max_entries': 256,
+                'ttl': 300.0
+            },
+            'workflow_tracing': {
+                'enabled': True,
+                'directory': os.path.join(self.base_dir, 'logs', 'traces')
+            },
+            'workflow_deadlines': {
+                # 단계별 기한(초), None이면 제한 없음 (예: 120.0으로 켜면 모든 단계에 적용되므로
+                # 수동 입력/CAPTCHA 대기처럼 긴 단계는 단계의 timeout 또는 작업 흐름 설정의 step_timeout으로 늘림)
+                'step_timeout': None,
+                'workflow_timeout': None,  # 작업 흐름 전체 기한(초), None이면 제한 없음
+                'cancel_grace': 1.0  # 기한 초과 후 협조적 취소 유예(초)
+            },
+            'workflow_retention': {
+                'max_execution_path': 1000,  # 실행 경로 최대 길이
+                'spill_threshold': 262144,  # 블롭으로 저장할 단계 출력 값 크기(바이트)
+                'prune_state': False,  # 이후 단계가 참조하지 않는 상태 키 정리
+                'keep_state_keys': ['automation_context'],
+                'blob_directory': os.path.join(self.base_dir, 'data', 'blobs')
+            },
+            'workflow_scheduler': {
+                'enabled': True,
+                'state_file': os.path.join(self.base_dir, 'data', 'scheduler_state.json'),
+                'max_concurrent': None  # 예약 실행 최대 동시 실행 수, None이면 실행기와 같음
+            },
+            'workflow_journal': {
+                'enabled': True,
+                'directory': os.path.join(self.base_dir, 'logs', 'journal'),
+                'flush_interval': 0.5,
+                'fsync': True,
+                'retain_completed': False
+            },
             'default_mode': 'balanced',
             'logging': {
                 'level': 'INFO',
@@ -134,9 +246,13 @@ class BlueAI:
         except Exception as e:
             self.logger.error(f"설정 파일 저장 실패: {str(e)}")
     
-    def initialize(self) -> bool:
+    def initialize(self, start_scheduler: bool = False) -> bool:
         """시스템 초기화
         
+        Args:
+            start_scheduler: 초기화 후 예약 실행 스케줄러 시작 여부 (GUI/데몬 모드).
+                             저장된 대기 요청은 플러그인이 준비된 뒤에 실행됨
+        
         Returns:
             초기화 성공 여부
         """
@@ -145,8 +261,24 @@ class BlueAI:
         # 기본 플러그인 등록
         self._register_default_plugins()
         
-        # 플러그인 검색 및 로드
-        self.plugin_manager.discover_plugins()
+        # 플러그인 검색 및 로드 (지연 로딩 시 매니페스트만 읽고 모듈은 처음 사용할 때 가져옴)
+        self.plugin_manager.discover_plugins(lazy=self.config.get('lazy_plugin_loading', True))
+        
+        # 무거운 인식 플러그인을 워커 프로세스 호스트로 교체
+        self._install_process_hosts()
+        
+        # 미리 초기화할 플러그인 (독립적인 초기화는 병렬 실행)
+        preload_plugins = self.config.get('preload_plugins', [])
+        if preload_plugins:
+            self.plugin_init_reports = self.plugin_manager.initialize_all(
+                configs=self.config.get('plugin_configs', {}),
+                plugin_ids=preload_plugins,
+                parallel=self.config.get('parallel_plugin_init', True)
+            )
+        
+        # 예약 실행 시작 (단발성 명령 실행에서는 시작하지 않음)
+        if start_scheduler and self.workflow_scheduler:
+            self.workflow_scheduler.start()
         
         self.logger.info("BlueAI 시스템 초기화 완료")
         return True
@@ -162,6 +294,36 @@ class BlueAI:
         
         self.logger.info("기본 플러그인 등록 완료")
     
+    def _install_process_hosts(self) -> None:
+        """설정된 인식 플러그인을 프로세스 외부 호스트로 교체
+        
+        설정 예: {'process_recognition_hosts': {'ocr_recognition': {'workers': 2}}}
+        """
+        hosts = self.config.get('process_recognition_hosts', {})
+        if not hosts:
+            return
+        
+        from plugins.recognition.process_host import ProcessRecognitionHost
+        
+        automation_plugin = self.plugin_manager.get_plugin("playwright_automation")
+        
+        for plugin_id, options in hosts.items():
+            plugin = self.plugin_manager.get_plugin(plugin_id)
+            if plugin is None:
+                self.logger.warning(f"프로세스 호스트 대상 플러그인을 찾을 수 없음: {plugin_id}")
+                continue
+            if plugin.get_plugin_info().plugin_type != PluginType.RECOGNITION:
+                self.logger.warning(f"인식 플러그인이 아니므로 프로세스 호스트를 사용할 수 없음: {plugin_id}")
+                continue
+            
+            host = ProcessRecognitionHost(
+                type(plugin),
+                workers=(options or {}).get('workers', 2),
+                automation_plugin=automation_plugin
+            )
+            self.plugin_manager.replace_plugin(host)
+            self.logger.info(f"프로세스 인식 호스트 사용: {plugin_id}")
+    
     def execute_workflow(self, workflow_plan: Dict[str, Any], settings: Dict[str, Any] = None) -> Dict[str, Any]:
         """워크플로우 실행
         
@@ -183,8 +345,13 @@ class BlueAI:
         # 워크플로우 설정 저장
         settings['workflow_plan'] = workflow_plan
         
-        # 워크플로우 생성 및 실행
-        workflow_id = self.workflow_manager.create_workflow(workflow_plan, settings)
+        # 워크플로우 생성 (계획 컴파일 및 구조 검증) 및 실행
+        try:
+            workflow_id = self.workflow_manager.create_workflow(workflow_plan, settings)
+        except WorkflowError as e:
+            self.logger.error(f"워크플로우 생성 실패: {str(e)}")
+            return {'workflow_id': workflow_plan.get('id'), 'status': 'failed', 'error': str(e)}
+        
         result = self.workflow_manager.execute_workflow(workflow_id)
         
         # 워크플로우 정리
@@ -192,6 +359,60 @@ class BlueAI:
         
         return result
     
+    def submit_workflow(self, workflow_plan: Dict[str, Any], settings: Dict[str, Any] = None,
+                        group: str = 'default') -> str:
+        """워크플로우를 동시 실행기에 제출
+        
+        Args:
+            workflow_plan: 워크플로우 계획
+            settings: 실행 설정
+            group: 공정 스케줄링 그룹 (예: 사용자 ID)
+            
+        Returns:
+            워크플로우 ID (결과는 self.workflow_executor.wait(workflow_id)로 확인)
+        """
+        settings = dict(settings or {})
+        if 'mode' not in settings:
+            settings['mode'] = self.settings_manager.get_mode().value
+        
+        return self.workflow_executor.submit(workflow_plan, settings, group=group)
+    
+    def schedule_workflow(self, name: str, workflow_plan: Dict[str, Any], cron: str = None,
+                          interval: float = None, settings: Dict[str, Any] = None, priority: int = 0,
+                          max_concurrent: int = 1, group: str = 'default') -> bool:
+        """워크플로우 예약 실행 등록
+        
+        Args:
+            name: 일정 이름 (같은 이름의 일정은 교체)
+            workflow_plan: 워크플로우 계획
+            cron: cron 식 (예: '0 9 * * 1-5')
+            interval: 실행 간격(초) (cron과 함께 지정하면 cron 우선, 둘 다 없으면 run_now로만 실행)
+            settings: 실행 설정
+            priority: 우선순위 (클수록 먼저 실행)
+            max_concurrent: 이 일정의 최대 동시 실행 수
+            group: 공정 스케줄링 그룹
+            
+        Returns:
+            성공 여부
+        """
+        if not self.workflow_scheduler:
+            self.logger.error("워크플로우 스케줄러가 비활성화되어 있음")
+            return False
+        
+        settings = dict(settings or {})
+        if 'mode' not in settings:
+            settings['mode'] = self.settings_manager.get_mode().value
+        
+        try:
+            trigger = CronTrigger(cron) if cron else IntervalTrigger(interval) if interval else None
+        except ValueError as e:
+            self.logger.error(f"잘못된 예약 설정: {name} - {str(e)}")
+            return False
+        
+        self.workflow_scheduler.add_schedule(name, workflow_plan, trigger=trigger, settings=settings,
+                                             priority=priority, max_concurrent=max_concurrent, group=group)
+        return True
+    
     def execute_command(self, command: str) -> Dict[str, Any]:
         """자연어 명령 실행
         
@@ -292,13 +513,106 @@ class BlueAI:
         
         return self.execute_workflow(workflow_plan, settings)
     
+    def resume_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """비정상 종료된 워크플로우를 디스크 저널에서 재개
+        
+        Args:
+            workflow_id: 워크플로우 ID
+            
+        Returns:
+            실행 결과
+        """
+        try:
+            result = self.workflow_manager.resume_workflow_from_journal(workflow_id)
+        except WorkflowError as e:
+            self.logger.error(f"워크플로우 재개 실패: {str(e)}")
+            return {'workflow_id': workflow_id, 'status': 'failed', 'error': str(e)}
+        
+        self.workflow_manager.cleanup_workflow(workflow_id)
+        return result
+    
+    def get_resumable_workflows(self) -> List[str]:
+        """저널에 남아 있는 미완료 워크플로우 ID 목록
+        
+        Returns:
+            워크플로우 ID 목록
+        """
+        if self.workflow_journal is None:
+            return []
+        return self.workflow_journal.list_incomplete()
+    
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """단계 유형별 재시도 통계 가져오기
+        
+        Returns:
+            대기 중인 재시도 수와 단계 유형별 재시도 횟수/성공 수/대기·실행 시간
+        """
+        return self.retry_scheduler.get_stats()
+    
+    def subscribe_workflow_events(self, maxsize: int = 1000, overflow: str = 'drop_oldest',
+                                  workflow_id: str = None) -> WorkflowEventSubscription:
+        """작업 흐름 변경 이벤트 구독 (GUI/서버 전달용, 주기적 조회 대신 사용)
+        
+        Args:
+            maxsize: 최대 대기 이벤트 수
+            overflow: 대기열이 가득 찼을 때 정책 (drop_oldest, drop_newest, block)
+            workflow_id: 구독할 작업 흐름 ID (None이면 전체)
+            
+        Returns:
+            구독 (drain()으로 이벤트를 가져오고 close()로 종료)
+        """
+        return self.workflow_manager.events.subscribe(maxsize=maxsize, overflow=overflow, workflow_id=workflow_id)
+    
+    def get_action_stats(self, plugin_id: str = None) -> Dict[str, Any]:
+        """플러그인 액션별 지연 시간 통계 가져오기
+        
+        Args:
+            plugin_id: 플러그인 ID (None이면 전체)
+            
+        Returns:
+            플러그인 ID -> 액션 유형 -> 통계 (count, errors, mean, min, max, p50, p95, p99; 초 단위)
+        """
+        return self.plugin_manager.profiler.get_stats(plugin_id)
+    
+    def get_slowest_actions(self, limit: int = 10, percentile: str = 'p99') -> List[Dict[str, Any]]:
+        """꼬리 지연 시간이 가장 긴 액션 목록
+        
+        Args:
+            limit: 최대 개수
+            percentile: 정렬 기준 (p50, p95, p99, mean, max)
+            
+        Returns:
+            통계 목록
+        """
+        return self.plugin_manager.profiler.get_slowest(limit, percentile)
+    
     def cleanup(self) -> None:
         """시스템 정리"""
         self.logger.info("BlueAI 시스템 정리 시작")
         
+        # 예약 실행 중지 (대기/실행 중인 요청은 저장되어 다음 시작 시 다시 실행)
+        if self.workflow_scheduler:
+            self.workflow_scheduler.shutdown(wait=False)
+        
+        # 실행 중인 워크플로우 완료 대기 (대기 중인 워크플로우는 취소)
+        self.workflow_executor.shutdown(wait=True, cancel_pending=True)
+        self.retry_scheduler.shutdown()
+        
+        # 남은 저널 기록 쓰기
+        if self.workflow_journal:
+            self.workflow_journal.close()
+        
         # 모든 플러그인 정리
         self.plugin_manager.cleanup_all()
         
+        # 액션 지연 시간 통계 저장
+        stats_file = self.config.get('action_stats_file', os.path.join(self.base_dir, 'logs', 'action_stats.json'))
+        if stats_file:
+            if self.plugin_manager.profiler.dump(stats_file):
+                self.logger.info(f"액션 지연 시간 통계 저장: {stats_file}")
+            else:
+                self.logger.warning(f"액션 지연 시간 통계 저장 실패: {stats_file}")
+        
         self.logger.info("BlueAI 시스템 정리 완료")
 
 
@@ -307,6 +621,8 @@ def main():
     parser = argparse.ArgumentParser(description='BlueAI 자동화 시스템')
     parser.add_argument('--config', help='설정 파일 경로')
     parser.add_argument('--command', help='자연어 명령')
+    parser.add_argument('--resume', help='저널에서 재개할 워크플로우 ID')
+    parser.add_argument('--daemon', action='store_true', help='예약 실행 스케줄러를 시작하고 종료(Ctrl+C)까지 대기')
     
     args = parser.parse_args()
     
@@ -315,15 +631,28 @@ def main():
     
     try:
         # 시스템 초기화
-        if not blueai.initialize():
+        if not blueai.initialize(start_scheduler=args.daemon):
             print("시스템 초기화 실패")
             return 1
         
         # 명령 실행
-        if args.command:
+        if args.resume:
+            result = blueai.resume_workflow(args.resume)
+            print(f"실행 결과: {json.dumps(result, indent=2, default=str)}")
+        elif args.command:
             result = blueai.execute_command(args.command)
             print(f"실행 결과: {json.dumps(result, indent=2)}")
+        elif args.daemon:
+            print("예약 실행 스케줄러 실행 중 (종료: Ctrl+C)")
+            try:
+                while True:
+                    time.sleep(1.0)
+            except KeyboardInterrupt:
+                pass
         else:
+            resumable = blueai.get_resumable_workflows()
+            if resumable:
+                print(f"재개할 수 있는 워크플로우: {', '.join(resumable)} (--resume 옵션 사용)")
             print("명령이 지정되지 않았습니다. --command 옵션을 사용하세요.")
     finally:
         # 정리
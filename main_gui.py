@@ -86,6 +86,27 @@ class WorkerThread(QThread):
             self.finished.emit({"status": "failed", "error": str(e)})
 
 
+class WorkflowEventThread(QThread):
+    """작업 흐름 이벤트 수신 스레드 (이벤트 버스 구독을 Qt 시그널로 GUI 스레드에 전달)"""
+    events_received = pyqtSignal(list)
+    
+    def __init__(self, subscription):
+        super().__init__()
+        self.subscription = subscription
+    
+    def run(self):
+        """스레드 실행 (이벤트를 묶어서 전달)"""
+        while not self.subscription.closed:
+            events = self.subscription.drain(max_events=200, timeout=0.5)
+            if events:
+                self.events_received.emit(events)
+    
+    def stop(self):
+        """구독 종료 및 스레드 대기"""
+        self.subscription.close()
+        self.wait(2000)
+
+
 class LogHandler(logging.Handler):
     """로그 핸들러"""
     def __init__(self, callback):
@@ -106,7 +127,7 @@ class BlueAIGUI(QMainWindow):
         self.blueai = None
         self.worker = None
         self.current_workflow_id = None
-        self.status_timer = None
+        self.event_thread = None
         
         # 설정
         self.settings = QSettings("BlueAI", "Automation")
@@ -641,11 +662,12 @@ class BlueAIGUI(QMainWindow):
             self.blueai.auto_execute = False
             
             # 초기화 호출
-            success = self.blueai.initialize()
+            success = self.blueai.initialize(start_scheduler=True)
             
             if success:
                 self.statusBar().showMessage("BlueAI 초기화 완료")
                 self.log("BlueAI 초기화 완료", logging.INFO)
+                self.start_workflow_events()
             else:
                 self.statusBar().showMessage("BlueAI 초기화 실패")
                 self.log("BlueAI 초기화 실패", logging.ERROR)
@@ -764,7 +786,7 @@ class BlueAIGUI(QMainWindow):
             # 시작 전 BlueAI 초기화 확인
             if not hasattr(self.blueai, 'plugin_manager') or not self.blueai.plugin_manager.initialized_plugins:
                 self.log("BlueAI 초기화 시작", logging.INFO)
-                success = self.blueai.initialize()
+                success = self.blueai.initialize(start_scheduler=True)
                 if not success:
                     self.log("BlueAI 초기화 실패", logging.ERROR)
                     self.result_text.setPlainText("초기화 실패: BlueAI 시스템을 초기화할 수 없습니다")
@@ -966,12 +988,6 @@ class BlueAIGUI(QMainWindow):
         self.worker.progress.connect(self.on_workflow_progress)
         self.current_workflow_id = workflow['id']
         self.worker.start()
-        
-        # 상태 모니터링 타이머 시작
-        if self.status_timer is None:
-            self.status_timer = QTimer(self)
-            self.status_timer.timeout.connect(self.update_workflow_status)
-            self.status_timer.start(2000)  # 2초마다 업데이트
     
     def on_workflow_finished(self, result):
         """워크플로우 실행 완료 핸들러
@@ -1190,48 +1206,97 @@ class BlueAIGUI(QMainWindow):
                 self.log(f"워크플로우 로드 중 오류: {str(e)}", logging.ERROR)
                 QMessageBox.critical(self, "로드 오류", f"워크플로우 로드 중 오류가 발생했습니다: {str(e)}")
     
-    def update_workflow_status(self):
-        """워크플로우 상태 업데이트"""
+    def start_workflow_events(self):
+        """작업 흐름 이벤트 구독 시작 (모니터링 표는 주기적 조회 대신 변경 이벤트로 갱신)"""
+        if self.event_thread is not None or not hasattr(self.blueai, 'subscribe_workflow_events'):
+            return
+        
+        # GUI는 최신 상태만 중요하므로 대기열이 가득 차면 오래된 이벤트부터 버림
+        subscription = self.blueai.subscribe_workflow_events(maxsize=1000, overflow='drop_oldest')
+        self.event_thread = WorkflowEventThread(subscription)
+        self.event_thread.events_received.connect(self.on_workflow_events)
+        self.event_thread.start()
         self.refresh_workflows()
     
+    def on_workflow_events(self, events):
+        """작업 흐름 이벤트 처리 (GUI 스레드, 해당 행만 갱신)
+        
+        Args:
+            events: 작업 흐름 이벤트 목록
+        """
+        for event in events:
+            event_type = event.type.value
+            data = event.data
+            
+            if event_type == 'workflow_removed':
+                row = self._find_workflow_row(event.workflow_id)
+                if row is not None:
+                    self.workflow_table.removeRow(row)
+                continue
+            
+            row = self._find_workflow_row(event.workflow_id)
+            if row is None:
+                row = self._add_workflow_row(event.workflow_id, data.get('total_steps', 0))
+            
+            if 'status' in data and event_type in ('workflow_created', 'status_changed', 'workflow_finished'):
+                self.workflow_table.item(row, 1).setText(data['status'])
+            
+            if 'completed_steps' in data:
+                steps_item = self.workflow_table.item(row, 2)
+                total_steps = steps_item.data(Qt.UserRole) or data.get('step_count', 0)
+                steps_item.setText(f"{data['completed_steps']}/{total_steps}")
+            
+            elapsed = data.get('execution_time', data.get('elapsed'))
+            if elapsed is not None:
+                self.workflow_table.item(row, 3).setText(f"{elapsed:.1f}초")
+    
+    def _find_workflow_row(self, workflow_id):
+        """작업 흐름 ID의 표 행 번호 (없으면 None)"""
+        for row in range(self.workflow_table.rowCount()):
+            item = self.workflow_table.item(row, 0)
+            if item is not None and item.text() == workflow_id:
+                return row
+        return None
+    
+    def _add_workflow_row(self, workflow_id, total_steps):
+        """작업 흐름 표에 행 추가
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            total_steps: 전체 단계 수
+            
+        Returns:
+            추가한 행 번호
+        """
+        row = self.workflow_table.rowCount()
+        self.workflow_table.insertRow(row)
+        self.workflow_table.setItem(row, 0, QTableWidgetItem(workflow_id))
+        self.workflow_table.setItem(row, 1, QTableWidgetItem("pending"))
+        steps_item = QTableWidgetItem(f"0/{total_steps}")
+        steps_item.setData(Qt.UserRole, total_steps)
+        self.workflow_table.setItem(row, 2, steps_item)
+        self.workflow_table.setItem(row, 3, QTableWidgetItem("0.0초"))
+        return row
+    
     def refresh_workflows(self):
-        """워크플로우 목록 새로고침"""
+        """워크플로우 목록 새로고침 (현재 상태 스냅샷으로 표 전체를 다시 구성, 이후 변경은 이벤트로 갱신)"""
         if not self.blueai or not hasattr(self.blueai, 'workflow_manager'):
             return
         
         # 테이블 초기화
         self.workflow_table.setRowCount(0)
         
-        # 활성 워크플로우 가져오기
-        active_workflows = self.blueai.workflow_manager.active_workflows
-        
-        if not active_workflows:
-            return
-        
-        # 테이블에 추가
-        for i, (workflow_id, context) in enumerate(active_workflows.items()):
-            self.workflow_table.insertRow(i)
-            
-            # ID
-            id_item = QTableWidgetItem(workflow_id)
-            self.workflow_table.setItem(i, 0, id_item)
-            
-            # 상태
-            status = context.status.value
-            status_item = QTableWidgetItem(status)
-            self.workflow_table.setItem(i, 1, status_item)
-            
-            # 완료 단계
-            completed_steps = sum(1 for r in context.results.values() 
-                               if r.status == self.blueai.workflow_manager.StepStatus.COMPLETED)
-            total_steps = len(context.results)
-            steps_item = QTableWidgetItem(f"{completed_steps}/{total_steps}")
-            self.workflow_table.setItem(i, 2, steps_item)
+        workflow_manager = self.blueai.workflow_manager
+        for workflow_id in list(workflow_manager.active_workflows):
+            status = workflow_manager.get_workflow_status(workflow_id)
+            if not status:
+                continue
             
-            # 실행 시간
-            execution_time = context.get_execution_time()
-            time_item = QTableWidgetItem(f"{execution_time:.1f}초")
-            self.workflow_table.setItem(i, 3, time_item)
+            row = self._add_workflow_row(workflow_id, status.get('total_steps', status.get('step_count', 0)))
+            self.workflow_table.item(row, 1).setText(status.get('status', 'unknown'))
+            self.workflow_table.item(row, 2).setText(
+                f"{status.get('completed_steps', 0)}/{status.get('total_steps', status.get('step_count', 0))}")
+            self.workflow_table.item(row, 3).setText(f"{status.get('execution_time', 0):.1f}초")
     
     def show_workflow_info(self):
         """선택된 워크플로우 정보 표시"""
@@ -1258,6 +1323,7 @@ class BlueAIGUI(QMainWindow):
         info_text += f"전체 단계: {status.get('step_count', 0)}\n"
         info_text += f"완료 단계: {status.get('completed_steps', 0)}\n"
         info_text += f"실패 단계: {status.get('failed_steps', 0)}\n"
+        info_text += f"캐시 적중/미스: {status.get('cache_hits', 0)}/{status.get('cache_misses', 0)}\n"
         
         QMessageBox.information(self, f"워크플로우 정보: {workflow_id}", info_text)
     
@@ -1279,8 +1345,7 @@ class BlueAIGUI(QMainWindow):
             self.statusBar().showMessage(f"워크플로우가 취소되었습니다: {workflow_id}")
             self.log(f"워크플로우가 취소되었습니다: {workflow_id}", logging.INFO)
             
-            # 테이블 새로고침
-            self.refresh_workflows()
+            # 테이블은 상태 변경 이벤트로 갱신됨
         else:
             QMessageBox.warning(self, "취소 오류", f"워크플로우를 취소할 수 없습니다: {workflow_id}")
     
@@ -1657,9 +1722,9 @@ class BlueAIGUI(QMainWindow):
             except Exception as e:
                 self.log(f"BlueAI 정리 중 오류: {str(e)}", logging.ERROR)
         
-        # 타이머 중지
-        if self.status_timer:
-            self.status_timer.stop()
+        # 이벤트 수신 스레드 중지
+        if self.event_thread:
+            self.event_thread.stop()
         
         # 이벤트 수락
         event.accept()
@@ -81,6 +81,66 @@ class AutomationPlugin(Plugin):
         # 각 플러그인에서 구현해야 함
         raise NotImplementedError
     
+    def execute_batch(self, actions: List[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+                      stop_on_error: bool = True) -> Dict[str, Any]:
+        """여러 액션을 순서대로 실행
+        
+        기본 구현은 execute_action을 차례로 호출합니다. 액션 제출 비용이 큰 플러그인은 한 번에 제출하도록 재정의합니다.
+        
+        Args:
+            actions: 액션 명세 목록 ({'action': 유형, 'params': 파라미터} 또는 (유형, 파라미터))
+            stop_on_error: 첫 실패에서 중단 여부
+            
+        Returns:
+            일괄 실행 결과 (results: 실행된 액션별 결과, 실패가 있으면 첫 실패의 오류)
+        """
+        results = []
+        for action_type, params in self._normalize_batch(actions):
+            result = self.execute_action(action_type, params)
+            results.append(result)
+            if stop_on_error and not result.get('success', False):
+                break
+        return self._batch_result(results)
+    
+    @staticmethod
+    def _normalize_batch(actions: List[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """액션 명세 목록을 (유형, 파라미터) 목록으로 변환
+        
+        Args:
+            actions: 액션 명세 목록
+            
+        Returns:
+            (액션 유형, 파라미터) 목록
+            
+        Raises:
+            ValueError: 액션 유형이 없는 명세
+        """
+        normalized = []
+        for spec in actions:
+            if isinstance(spec, dict):
+                action_type, params = spec.get('action'), spec.get('params')
+            else:
+                action_type, params = spec
+            if not action_type:
+                raise ValueError(f"액션 유형이 지정되지 않음: {spec}")
+            normalized.append((action_type, dict(params or {})))
+        return normalized
+    
+    def _batch_result(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """액션별 결과를 일괄 실행 결과로 묶기
+        
+        Args:
+            results: 실행된 액션별 결과
+            
+        Returns:
+            일괄 실행 결과
+        """
+        for index, result in enumerate(results):
+            if not result.get('success', False):
+                return self._create_result(False, result.get('error', '액션 실패'), results=results,
+                                           failed_index=index)
+        return self._create_result(True, results=results)
+    
     def _check_initialized(self) -> None:
         """초기화 상태 확인"""
         if not self._initialized:
@@ -0,0 +1,262 @@
+"""
+브라우저 페이지 풀 모듈
+
+이 모듈은 Playwright 플러그인이 작업 흐름에 임대하는 격리된 컨텍스트/페이지 풀을 구현합니다.
+시작 시 미리 만든 페이지를 임대하고, 반납된 페이지는 초기화(저장소 정리, about:blank 이동) 후 다시 사용합니다.
+임대 전 상태 확인에 실패하거나 사용 횟수/메모리 증가량 한도를 넘은 페이지는 닫고 새로 만듭니다.
+모든 메서드는 플러그인의 이벤트 루프 스레드에서 호출되어야 합니다.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# JS 힙 사용량 (Chromium에서만 제공, 그 밖의 브라우저는 null)
+HEAP_USAGE_SCRIPT = "() => (performance.memory ? performance.memory.usedJSHeapSize : null)"
+
+# 현재 출처의 웹 저장소 정리
+CLEAR_STORAGE_SCRIPT = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+
+@dataclass
+class PooledPage:
+    """풀의 페이지 (임대 단위)"""
+    context: Any  # 격리 컨텍스트 (격리 모드가 아니면 None)
+    page: Any  # 기본 페이지
+    pages: Dict[str, Any] = field(default_factory=dict)  # 임대 중 만든 이름 있는 탭
+    uses: int = 0  # 임대 횟수
+    created_at: float = field(default_factory=time.time)  # 생성 시각
+    baseline_heap: Optional[int] = None  # 생성 직후 JS 힙 사용량(바이트)
+    lease_id: Optional[str] = None  # 현재 임대 ID
+    unusable: bool = False  # 반납 시 폐기할지 여부 (취소에 응답하지 않은 단계가 상태를 알 수 없게 만든 페이지)
+
+
+class PagePool:
+    """격리된 컨텍스트/페이지 풀"""
+    
+    def __init__(self, factory: Callable[[], Awaitable[Tuple[Any, Any]]], max_leases: int = 4,
+                 warm_size: int = 0, max_uses: int = 50, max_heap_growth_mb: float = None,
+                 reset_storage: bool = True, health_timeout: float = 5.0, logger=None):
+        """풀 초기화
+        
+        Args:
+            factory: (컨텍스트, 페이지)를 만드는 코루틴 함수
+            max_leases: 최대 동시 임대 수
+            warm_size: 미리 만들어 둘 페이지 수 (max_leases 이하)
+            max_uses: 페이지를 다시 만들기 전 최대 임대 횟수 (None이면 제한 없음)
+            max_heap_growth_mb: 생성 직후보다 JS 힙이 이만큼 늘면 다시 만듦 (None이면 확인하지 않음)
+            reset_storage: 반납 시 쿠키/권한/웹 저장소 정리 여부 (격리 컨텍스트에서만)
+            health_timeout: 상태 확인 제한 시간(초)
+            logger: 로거 객체
+        """
+        self.factory = factory
+        self.max_leases = max(1, max_leases)
+        self.warm_size = min(max(0, warm_size), self.max_leases)
+        self.max_uses = max_uses
+        self.max_heap_growth_mb = max_heap_growth_mb
+        self.reset_storage = reset_storage
+        self.health_timeout = health_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self._idle: List[PooledPage] = []
+        self._leased: Dict[str, PooledPage] = {}
+        self._slots = asyncio.BoundedSemaphore(self.max_leases)
+        
+        # 통계
+        self._stats = {'created': 0, 'reused': 0, 'recycled': 0, 'unhealthy': 0, 'reset_failures': 0}
+    
+    async def start(self) -> None:
+        """미리 만들어 둘 페이지 생성"""
+        while len(self._idle) < self.warm_size:
+            self._idle.append(await self._create())
+        if self.warm_size:
+            self.logger.info(f"페이지 풀 준비: {self.warm_size}개")
+    
+    def get(self, lease_id: Optional[str]) -> Optional[PooledPage]:
+        """임대 중인 페이지 가져오기"""
+        return self._leased.get(lease_id) if lease_id else None
+    
+    @property
+    def leased(self) -> Dict[str, PooledPage]:
+        """임대 중인 페이지 (임대 ID -> 페이지)"""
+        return self._leased
+    
+    async def acquire(self, lease_id: str, timeout: float = 60.0) -> Optional[PooledPage]:
+        """페이지 임대 (빈 자리가 날 때까지 대기)
+        
+        Args:
+            lease_id: 임대 ID (작업 흐름 ID)
+            timeout: 최대 대기 시간(초)
+        
+        Returns:
+            임대한 페이지 또는 None (대기 시간 초과)
+        """
+        if lease_id in self._leased:
+            return self._leased[lease_id]
+        
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        
+        try:
+            entry = None
+            while self._idle and entry is None:
+                candidate = self._idle.pop()
+                if await self._is_healthy(candidate):
+                    entry = candidate
+                    self._stats['reused'] += 1
+                else:
+                    self._stats['unhealthy'] += 1
+                    self.logger.warning("상태 확인에 실패한 풀 페이지 폐기")
+                    await self._discard(candidate)
+            
+            if entry is None:
+                entry = await self._create()
+        except Exception:
+            self._slots.release()
+            raise
+        
+        entry.uses += 1
+        entry.lease_id = lease_id
+        self._leased[lease_id] = entry
+        return entry
+    
+    async def release(self, lease_id: str) -> bool:
+        """페이지 반납 (초기화 후 풀에 반환하거나 한도를 넘었으면 폐기)
+        
+        Args:
+            lease_id: 임대 ID
+        
+        Returns:
+            임대 중이었는지 여부
+        """
+        entry = self._leased.pop(lease_id, None)
+        if entry is None:
+            return False
+        
+        try:
+            entry.lease_id = None
+            reason = await self._recycle_reason(entry)
+            if reason is None and await self._reset(entry):
+                self._idle.append(entry)
+                return True
+            
+            if reason is not None:
+                self._stats['recycled'] += 1
+                self.logger.info(f"풀 페이지 재생성: {reason}")
+            await self._discard(entry)
+            
+            # 미리 만들어 둘 수만큼 다시 채움
+            if len(self._idle) + len(self._leased) < self.warm_size:
+                self._idle.append(await self._create())
+            return True
+        finally:
+            self._slots.release()
+    
+    def mark_unusable(self, lease_id: str) -> bool:
+        """임대 중인 페이지를 반납 시 초기화하지 않고 폐기하도록 표시
+        
+        Args:
+            lease_id: 임대 ID
+        
+        Returns:
+            임대 중이었는지 여부
+        """
+        entry = self._leased.get(lease_id)
+        if entry is None:
+            return False
+        entry.unusable = True
+        return True
+    
+    async def close(self) -> None:
+        """모든 페이지 닫기"""
+        entries = self._idle + list(self._leased.values())
+        self._idle = []
+        self._leased = {}
+        for entry in entries:
+            await self._discard(entry)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계
+        
+        Returns:
+            대기/임대 중인 페이지 수, 생성/재사용/재생성/상태 확인 실패/초기화 실패 횟수
+        """
+        return dict(self._stats, idle=len(self._idle), leased=len(self._leased), max_leases=self.max_leases)
+    
+    async def _create(self) -> PooledPage:
+        """새 페이지 생성"""
+        context, page = await self.factory()
+        entry = PooledPage(context=context, page=page)
+        if self.max_heap_growth_mb is not None:
+            entry.baseline_heap = await self._heap_usage(entry)
+        self._stats['created'] += 1
+        return entry
+    
+    async def _discard(self, entry: PooledPage) -> None:
+        """페이지(격리 컨텍스트면 컨텍스트 전체) 닫기"""
+        try:
+            if entry.context is not None:
+                await entry.context.close()
+            else:
+                for page in (entry.page, *entry.pages.values()):
+                    if not page.is_closed():
+                        await page.close()
+        except Exception as e:
+            self.logger.warning(f"풀 페이지 닫기 중 오류: {str(e)}")
+    
+    async def _is_healthy(self, entry: PooledPage) -> bool:
+        """페이지가 열려 있고 스크립트에 응답하는지 확인"""
+        try:
+            if entry.page.is_closed():
+                return False
+            return await asyncio.wait_for(entry.page.evaluate("() => 1"), self.health_timeout) == 1
+        except Exception:
+            return False
+    
+    async def _heap_usage(self, entry: PooledPage) -> Optional[int]:
+        """페이지 JS 힙 사용량(바이트) (알 수 없으면 None)"""
+        try:
+            return await asyncio.wait_for(entry.page.evaluate(HEAP_USAGE_SCRIPT), self.health_timeout)
+        except Exception:
+            return None
+    
+    async def _recycle_reason(self, entry: PooledPage) -> Optional[str]:
+        """페이지를 다시 만들어야 하는 이유 (재사용 가능하면 None)"""
+        if entry.unusable:
+            return "사용 중지 표시됨"
+        if entry.page.is_closed():
+            return "페이지 닫힘"
+        if self.max_uses is not None and entry.uses >= self.max_uses:
+            return f"사용 횟수 {entry.uses}회"
+        if self.max_heap_growth_mb is not None and entry.baseline_heap is not None:
+            heap = await self._heap_usage(entry)
+            if heap is not None and (heap - entry.baseline_heap) / (1024 * 1024) > self.max_heap_growth_mb:
+                return f"JS 힙 증가 {(heap - entry.baseline_heap) / (1024 * 1024):.1f}MB"
+        return None
+    
+    async def _reset(self, entry: PooledPage) -> bool:
+        """다음 임대를 위해 페이지 초기화 (이름 있는 탭 닫기, 저장소 정리, about:blank 이동)
+        
+        Returns:
+            성공 여부 (실패하면 폐기)
+        """
+        try:
+            for page in entry.pages.values():
+                if not page.is_closed():
+                    await page.close()
+            entry.pages = {}
+            
+            if self.reset_storage and entry.context is not None:
+                await entry.page.evaluate(CLEAR_STORAGE_SCRIPT)
+                await entry.context.clear_cookies()
+                await entry.context.clear_permissions()
+            
+            await entry.page.goto('about:blank')
+            return True
+        except Exception as e:
+            self._stats['reset_failures'] += 1
+            self.logger.warning(f"풀 페이지 초기화 실패: {str(e)}")
+            return False
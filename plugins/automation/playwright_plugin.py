@@ -3,15 +3,28 @@ Playwright 자동화 플러그인
 
 이 모듈은 Playwright를 사용한 웹 자동화 플러그인을 구현합니다.
 웹 페이지 탐색, 요소 조작, 스크린샷 등의 작업을 수행합니다.
+모든 Playwright 호출은 플러그인 전용 이벤트 루프 스레드에서 실행되며, 여러 스레드(GUI 작업 스레드, 작업 흐름 실행기)가
+submit_action으로 동시에 액션을 제출할 수 있습니다. execute_action은 결과를 기다리는 동기 래퍼입니다.
+연속된 액션은 submit_batch/execute_batch로 한 번에 제출해 액션마다의 스레드 간 왕복을 줄일 수 있습니다.
+capture_frame은 파일을 거치지 않고 스크린샷을 메모리에서 NumPy 배열로 디코딩해 인식 플러그인에 전달합니다.
+요청 차단(request_blocking)을 켜면 컨텍스트 라우트로 요청을 가로채 프로필에 따라 이미지/글꼴/추적 스크립트 등을 차단합니다.
 """
 import asyncio
+import base64
+import contextvars
 import logging
 import os
+import threading
 import time
+import uuid
+from concurrent.futures import CancelledError, Future
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from core.deadline import Deadline, DeadlineExceeded, current_deadline, wait_future
 from core.plugin_system import PluginInfo, PluginType
 from plugins.automation.base import ActionResult, AutomationPlugin
+from plugins.automation.page_pool import PagePool
+from plugins.automation.request_filter import RequestFilter
 
 # Playwright 가져오기 (런타임에 설치)
 try:
@@ -20,10 +33,126 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# NumPy/OpenCV 가져오기 (capture_frame 프레임 디코딩용, 선택 사항)
+try:
+    import cv2
+    import numpy as np
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+# 액션 대상 페이지 (이벤트 루프 작업마다 독립적으로 설정되어 동시에 실행되는 액션끼리 섞이지 않음)
+_target_page: contextvars.ContextVar = contextvars.ContextVar('playwright_target_page', default=None)
+
+
+def _decode_frame(data: bytes, scale: float = 1.0) -> Any:
+    """인코딩된 이미지를 BGR 배열로 디코딩
+    
+    Args:
+        data: 인코딩된 이미지 바이트 (JPEG/PNG)
+        scale: 축소 비율 (1/2, 1/4, 1/8이면 디코딩 단계에서 축소)
+        
+    Returns:
+        BGR 이미지 배열 또는 None (디코딩 실패)
+    """
+    flag = {0.5: cv2.IMREAD_REDUCED_COLOR_2, 0.25: cv2.IMREAD_REDUCED_COLOR_4,
+            0.125: cv2.IMREAD_REDUCED_COLOR_8}.get(scale, cv2.IMREAD_COLOR)
+    frame = cv2.imdecode(np.frombuffer(data, np.uint8), flag)
+    if frame is not None and flag == cv2.IMREAD_COLOR and scale < 1:
+        frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return frame
+
 
 class PlaywrightPlugin(AutomationPlugin):
     """Playwright 자동화 플러그인"""
     
+    # 봇 감지 회피 브라우저 인자
+    BROWSER_ARGS = [
+        '--disable-dev-shm-usage',  # 리소스 제한 방지
+        '--disable-blink-features=AutomationControlled',  # 자동화 감지 비활성화
+        '--disable-extensions',  # 확장 비활성화
+        '--no-sandbox',  # 샌드박스 비활성화
+        '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36', # 일반적인 UA
+    ]
+    
+    # 페이지 지문 스크립트 (문서 로드마다 새로 만드는 문서 ID, DOM 변경 횟수, 스크롤 위치/뷰포트 크기,
+    # 요청 시 DOM 직렬화에 대한 32비트 FNV-1a 해시 + 길이)
+    PAGE_FINGERPRINT_SCRIPT = """([selector, includeDom]) => {
+        // window 객체는 문서를 새로 로드할 때마다 바뀌므로 같은 DOM으로 다시 로드해도 ID가 달라짐
+        if (!window.__blueaiDocumentId) {
+            window.__blueaiDocumentId = performance.timeOrigin.toString(36) + ':' + Math.random().toString(36).slice(2);
+        }
+        // 첫 호출 때 DOM 변경 감시를 설치하고 이후 변경 횟수를 셈 (DOM 직렬화 없이 같은 문서 안의 변경 감지)
+        if (window.__blueaiMutations === undefined) {
+            window.__blueaiMutations = 0;
+            new MutationObserver((records) => { window.__blueaiMutations += records.length; })
+                .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+        }
+        const result = {
+            document: window.__blueaiDocumentId,
+            mutations: window.__blueaiMutations,
+            viewport: [window.scrollX, window.scrollY, window.innerWidth, window.innerHeight],
+            dom: null
+        };
+        if (!includeDom) return result;
+        const root = selector ? document.querySelector(selector) : document.documentElement;
+        if (!root) return result;
+        const text = root.outerHTML;
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < text.length; i++) {
+            hash ^= text.charCodeAt(i);
+            hash = Math.imul(hash, 0x01000193);
+        }
+        result.dom = (hash >>> 0).toString(16) + ':' + text.length;
+        return result;
+    }"""
+    
+    # 행 목록 일괄 추출 스크립트 (행마다 필드별 하위 선택자의 텍스트/속성/프로퍼티를 한 번의 DOM 조회로 수집)
+    EXTRACT_LIST_SCRIPT = """([selector, fields, limit, nextSelector]) => {
+        const rows = Array.from(document.querySelectorAll(selector));
+        const pick = (row, spec) => {
+            const target = spec.selector ? row.querySelector(spec.selector) : row;
+            if (!target) return null;
+            if (spec.prop) return target[spec.prop] ?? null;
+            if (spec.attr && spec.attr !== 'text') return target.getAttribute(spec.attr);
+            return (target.textContent || '').trim();
+        };
+        const items = rows.slice(0, limit || rows.length).map((row) => {
+            const item = {};
+            for (const [name, spec] of Object.entries(fields)) item[name] = pick(row, spec);
+            return item;
+        });
+        let hasNext = false;
+        if (nextSelector) {
+            const next = document.querySelector(nextSelector);
+            hasNext = !!next && !next.disabled && next.getAttribute('aria-disabled') !== 'true';
+        }
+        return {items, total: rows.length, hasNext};
+    }"""
+    
+    # 페이지 액션 디스패치 표 (액션 유형 -> 코루틴 메서드 이름)
+    ACTIONS = {
+        'navigate': '_navigate',
+        'get_url': '_get_url',
+        'type': '_type',
+        'find_element': '_find_element',
+        'click': '_click',
+        'press': '_press',
+        'keyboard_press': '_keyboard_press',
+        'fill': '_fill',
+        'select': '_select',
+        'get_text': '_get_text',
+        'get_attribute': '_get_attribute',
+        'evaluate': '_evaluate',
+        'get_page': '_get_page',
+        'screenshot': '_screenshot',
+        'wait_for_load': '_wait_for_load',
+        'page_fingerprint': '_page_fingerprint',
+        'extract_list': '_extract_list',
+        'set_blocking_profile': '_set_blocking_profile',
+        'capture_frame': '_capture_frame'
+    }
+    
     @classmethod
     def get_plugin_info(cls) -> PluginInfo:
         """플러그인 정보 반환"""
@@ -47,14 +176,31 @@ class PlaywrightPlugin(AutomationPlugin):
         self._browser = None
         self._context = None
         self._page = None
+        self._pages: Dict[str, Any] = {}  # 이름 있는 추가 탭 (page_id -> 페이지)
+        
+        # 페이지 임대 (워크플로우별 격리된 컨텍스트/페이지 풀)
+        self._pool: Optional[PagePool] = None
+        self._lease_browser = None  # 격리 컨텍스트용 비영구 브라우저
+        self._max_leases = 4
+        self._isolated_leases = True
+        self._pool_size = 0  # 미리 만들어 둘 임대 페이지 수
+        self._page_max_uses = 50  # 임대 페이지를 다시 만들기 전 최대 사용 횟수
+        self._page_max_heap_growth_mb = None  # 임대 페이지를 다시 만드는 JS 힙 증가량(MB)
+        self._reset_page_storage = True  # 반납 시 쿠키/저장소 정리 여부
+        
+        # 요청 차단 (None이면 라우트를 설치하지 않음)
+        self._request_filter: Optional[RequestFilter] = None
         
         # 설정
         self._default_timeout = 30000  # ms
         self._browser_type = "chromium"  # chromium, firefox, webkit
         self._headless = False
         
-        # 비동기 루프
-        self._loop = None
+        # 전용 이벤트 루프 스레드 (모든 Playwright 호출은 이 스레드에서 실행)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._page_locks: Dict[int, asyncio.Lock] = {}  # id(페이지) -> 같은 페이지 액션 직렬화 잠금
+        self._cdp_sessions: Dict[int, Any] = {}  # id(페이지) -> 프레임 캡처용 CDP 세션 (Chromium, 실패하면 None)
     
     def initialize(self, config: Dict[str, Any] = None) -> bool:
         """플러그인 초기화
@@ -75,22 +221,70 @@ class PlaywrightPlugin(AutomationPlugin):
         self._default_timeout = self._config.get('timeout', 30000)
         self._browser_type = self._config.get('browser_type', 'chromium')
         self._headless = self._config.get('headless', False)
-        
-        # 비동기 루프 생성
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-        
-        # Playwright 초기화
+        self._max_leases = self._config.get('max_leases', 4)
+        self._isolated_leases = self._config.get('isolated_leases', True)
+        self._pool_size = self._config.get('page_pool_size', 0)
+        self._page_max_uses = self._config.get('page_max_uses', 50)
+        self._page_max_heap_growth_mb = self._config.get('page_max_heap_growth_mb')
+        self._reset_page_storage = self._config.get('reset_page_storage', True)
+        
+        # 요청 차단 프로필 (라우트는 요청마다 비용이 있으므로 설정된 경우에만 사용)
+        self._request_filter = None
+        if self._config.get('request_blocking', False) or self._config.get('blocking_profiles') \
+                or self._config.get('default_blocking_profile'):
+            try:
+                self._request_filter = RequestFilter(self._config.get('blocking_profiles'),
+                                                     self._config.get('default_blocking_profile'), self.logger)
+            except ValueError as e:
+                self.logger.error(f"요청 차단 설정 오류: {str(e)}")
+                return False
+        
+        # 이벤트 루프 스레드 시작 후 루프에서 Playwright 초기화
+        self._start_loop()
         try:
-            # asyncio.run() 대신 직접 호출하여 루프 재사용
-            future = asyncio.ensure_future(self._initialize_playwright(), loop=self._loop)
-            result = self._loop.run_until_complete(future)
-            
-            self.logger.info(f"Playwright 초기화 완료 (브라우저: {self._browser_type})")
-            return result
+            result = asyncio.run_coroutine_threadsafe(self._initialize_playwright(), self._loop).result()
         except Exception as e:
             self.logger.error(f"Playwright 초기화 실패: {str(e)}")
+            result = False
+        
+        if not result:
+            self._stop_loop()
             return False
+        
+        self.logger.info(f"Playwright 초기화 완료 (브라우저: {self._browser_type})")
+        return True
+    
+    def _start_loop(self) -> None:
+        """전용 이벤트 루프 스레드 시작"""
+        if self._loop is not None:
+            return
+        
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, args=(self._loop,),
+                                             name="playwright-loop", daemon=True)
+        self._loop_thread.start()
+    
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """이벤트 루프 스레드 본문 (중지될 때까지 실행 후 루프 닫기)"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    
+    def _stop_loop(self) -> None:
+        """이벤트 루프 중지 및 스레드 종료 대기"""
+        loop, thread = self._loop, self._loop_thread
+        self._loop = None
+        self._loop_thread = None
+        if loop is None:
+            return
+        
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=10.0)
     
     async def _initialize_playwright(self) -> bool:
         """Playwright 비동기 초기화"""
@@ -111,22 +305,10 @@ class PlaywrightPlugin(AutomationPlugin):
             self._playwright = await async_playwright().start()
             
             # 브라우저 유형 선택
-            if self._browser_type == 'firefox':
-                browser_module = self._playwright.firefox
-            elif self._browser_type == 'webkit':
-                browser_module = self._playwright.webkit
-            else:
-                # 기본값은 chromium
-                browser_module = self._playwright.chromium
+            browser_module = self._get_browser_module()
             
             # 봇 감지 회피 설정 추가
-            browser_args = [
-                '--disable-dev-shm-usage',  # 리소스 제한 방지
-                '--disable-blink-features=AutomationControlled',  # 자동화 감지 비활성화
-                '--disable-extensions',  # 확장 비활성화
-                '--no-sandbox',  # 샌드박스 비활성화
-                '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36', # 일반적인 UA
-            ]
+            browser_args = list(self.BROWSER_ARGS)
             
             # Microsoft Edge를 사용할 경우 (chromium 기반)
             if self._config.get('use_edge', False):
@@ -184,6 +366,20 @@ class PlaywrightPlugin(AutomationPlugin):
             
             # 페이지 타임아웃 설정
             self._page.set_default_timeout(self._default_timeout)
+            await self._install_request_filter(self._context)
+            
+            # 작업 흐름 임대용 페이지 풀 (설정된 수만큼 미리 생성)
+            if self._pool is None:
+                self._pool = PagePool(
+                    self._open_lease,
+                    max_leases=self._max_leases,
+                    warm_size=self._pool_size,
+                    max_uses=self._page_max_uses,
+                    max_heap_growth_mb=self._page_max_heap_growth_mb,
+                    reset_storage=self._reset_page_storage,
+                    logger=self.logger
+                )
+                await self._pool.start()
             
             return True
         except Exception as e:
@@ -194,21 +390,33 @@ class PlaywrightPlugin(AutomationPlugin):
             return False
 
     
+    def _get_browser_module(self) -> Any:
+        """설정된 브라우저 유형의 Playwright 브라우저 모듈"""
+        if self._browser_type == 'firefox':
+            return self._playwright.firefox
+        elif self._browser_type == 'webkit':
+            return self._playwright.webkit
+        # 기본값은 chromium
+        return self._playwright.chromium
+    
     def cleanup(self) -> None:
         """플러그인 정리"""
         if self._loop and self._playwright:
             try:
-                future = asyncio.ensure_future(self._cleanup_playwright(), loop=self._loop)
-                self._loop.run_until_complete(future)
-                self._loop.close()
+                asyncio.run_coroutine_threadsafe(self._cleanup_playwright(), self._loop).result(timeout=30.0)
             except Exception as e:
                 self.logger.error(f"Playwright 정리 중 오류: {str(e)}")
+        self._stop_loop()
         
         self._playwright = None
         self._browser = None
         self._context = None
         self._page = None
-        self._loop = None
+        self._pages = {}
+        self._pool = None
+        self._lease_browser = None
+        self._page_locks = {}
+        self._cdp_sessions = {}
         
         super().cleanup()
     
@@ -218,6 +426,14 @@ class PlaywrightPlugin(AutomationPlugin):
             if self._page and not self._page.is_closed():
                 await self._page.close()
                 self._page = None
+            
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+            
+            if self._lease_browser and self._lease_browser.is_connected():
+                await self._lease_browser.close()
+                self._lease_browser = None
                 
             if self._context and self._context != self._browser:  # context가 browser와 같지 않은 경우에만
                 await self._context.close()
@@ -236,7 +452,10 @@ class PlaywrightPlugin(AutomationPlugin):
             self.logger.error(f"Playwright 리소스 정리 중 오류: {str(e)}")
     
     def execute_action(self, action_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """액션 실행
+        """액션 실행 (submit_action 결과를 기다리는 동기 래퍼)
+        
+        params에 page_id가 있으면 해당 이름의 탭에서 실행합니다 (없으면 새 탭 생성).
+        현재 단계 기한이 지나거나 취소되면 실행 중인 액션을 취소하고 실패 결과를 반환합니다.
         
         Args:
             action_type: 액션 유형
@@ -245,85 +464,377 @@ class PlaywrightPlugin(AutomationPlugin):
         Returns:
             액션 결과
         """
-        self._check_initialized()
+        if self._loop_thread is threading.current_thread():
+            raise RuntimeError("이벤트 루프 스레드에서는 execute_action을 호출할 수 없음")
         
-        params = params or {}
-        result = None
+        return self._wait_result(self.submit_action(action_type, params))
+    
+    def execute_batch(self, actions: List[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+                      stop_on_error: bool = True) -> Dict[str, Any]:
+        """여러 액션을 한 번에 제출해 순서대로 실행 (submit_batch 결과를 기다리는 동기 래퍼)
         
-        # 비동기 루프에서 액션 실행
+        Args:
+            actions: 액션 명세 목록 ({'action': 유형, 'params': 파라미터} 또는 (유형, 파라미터))
+            stop_on_error: 첫 실패에서 중단 여부
+            
+        Returns:
+            일괄 실행 결과 (results: 실행된 액션별 결과, 실패가 있으면 첫 실패의 오류)
+        """
+        if self._loop_thread is threading.current_thread():
+            raise RuntimeError("이벤트 루프 스레드에서는 execute_batch를 호출할 수 없음")
+        
+        return self._wait_result(self.submit_batch(actions, stop_on_error))
+    
+    def _wait_result(self, future: Future) -> Dict[str, Any]:
+        """제출한 액션 결과 대기 (기한이 지나거나 취소되면 액션을 취소하고 실패 결과 반환)"""
         try:
-            if action_type == 'navigate':
-                future = asyncio.ensure_future(self._navigate(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-
-            elif action_type == 'get_url':
-                future = asyncio.ensure_future(self._get_url(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-
-            elif action_type == 'type':
-                future = asyncio.ensure_future(self._type(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
+            return wait_future(future)
+        except (DeadlineExceeded, CancelledError) as e:
+            future.cancel()
+            deadline = current_deadline()
+            return self._create_result(False, deadline.describe() if deadline is not None else str(e) or "액션 취소됨")
+    
+    def submit_action(self, action_type: str, params: Dict[str, Any] = None) -> Future:
+        """액션을 이벤트 루프 스레드에 제출 (결과를 기다리지 않음)
+        
+        여러 스레드에서 동시에 제출할 수 있으며, 서로 다른 페이지(임대/탭)의 액션은 루프에서 함께 진행됩니다.
+        같은 페이지의 액션은 제출 순서대로 실행됩니다. 제출한 컨텍스트의 기한이 적용되며,
+        기한이 취소되면 실행 중인 액션도 취소됩니다.
+        
+        Args:
+            action_type: 액션 유형
+            params: 액션 파라미터
             
-            elif action_type == 'find_element':
-                future = asyncio.ensure_future(self._find_element(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
+        Returns:
+            액션 결과 사전의 Future
             
-            elif action_type == 'click':
-                future = asyncio.ensure_future(self._click(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-
-            elif action_type == 'press':
-                future = asyncio.ensure_future(self._press(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-
-            elif action_type == 'keyboard_press':
-                future = asyncio.ensure_future(self._keyboard_press(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-
-            elif action_type == 'get_url':
-                future = asyncio.ensure_future(self._get_url(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-            
-            elif action_type == 'fill':
-                future = asyncio.ensure_future(self._fill(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-            
-            elif action_type == 'select':
-                future = asyncio.ensure_future(self._select(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-            
-            elif action_type == 'get_text':
-                future = asyncio.ensure_future(self._get_text(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-            
-            elif action_type == 'get_attribute':
-                future = asyncio.ensure_future(self._get_attribute(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-            
-            elif action_type == 'evaluate':
-                future = asyncio.ensure_future(self._evaluate(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
-                        
-            elif action_type == 'get_page':
-                # 현재 페이지 반환
-                return self._create_result(True, page=self._page)
-
-            elif action_type == 'screenshot':
-                future = asyncio.ensure_future(self._screenshot(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
+        Raises:
+            RuntimeError: 초기화되지 않은 경우
+        """
+        deadline = current_deadline()
+        return self._submit(self._dispatch(action_type, self._clamp_params(action_type, params or {}, deadline),
+                                           deadline), deadline)
+    
+    def submit_batch(self, actions: List[Union[Dict[str, Any], Tuple[str, Dict[str, Any]]]],
+                     stop_on_error: bool = True) -> Future:
+        """여러 액션을 한 번에 이벤트 루프 스레드에 제출 (결과를 기다리지 않음)
+        
+        액션마다 스레드 간 왕복 없이 루프 안에서 차례로 실행됩니다. 각 액션은 submit_action과 같이
+        대상 페이지 잠금을 잡으므로, 같은 페이지에 제출된 다른 액션이 일괄 액션 사이에 실행될 수 있습니다.
+        
+        Args:
+            actions: 액션 명세 목록 ({'action': 유형, 'params': 파라미터} 또는 (유형, 파라미터))
+            stop_on_error: 첫 실패에서 중단 여부
             
-            elif action_type == 'wait_for_load':
-                future = asyncio.ensure_future(self._wait_for_load(params), loop=self._loop)
-                result = self._loop.run_until_complete(future)
+        Returns:
+            일괄 실행 결과 사전의 Future
             
-            else:
-                result = self._create_result(False, f"Unsupported action: {action_type}")
+        Raises:
+            RuntimeError: 초기화되지 않은 경우
+            ValueError: 액션 유형이 없는 명세
+        """
+        deadline = current_deadline()
+        batch = [(action_type, self._clamp_params(action_type, params, deadline))
+                 for action_type, params in self._normalize_batch(actions)]
+        return self._submit(self._dispatch_batch(batch, stop_on_error, deadline), deadline)
+    
+    def _clamp_params(self, action_type: str, params: Dict[str, Any], deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """단계 기한이 있으면 액션 대기 시간(밀리초)을 남은 시간 이내로 줄임"""
+        if deadline is not None and deadline.expires_at is not None and action_type in self.ACTIONS:
+            return dict(params, timeout=deadline.clamp(params.get('timeout', self._default_timeout), 1000.0))
+        return params
+    
+    def _submit(self, coro: Any, deadline: Optional[Deadline]) -> Future:
+        """코루틴을 이벤트 루프에 제출하고 기한 취소를 연결
+        
+        Args:
+            coro: 실행할 코루틴
+            deadline: 제출한 컨텍스트의 기한
+            
+        Returns:
+            코루틴 결과의 Future
+            
+        Raises:
+            RuntimeError: 초기화되지 않았거나 루프가 실행 중이 아닌 경우
+        """
+        try:
+            self._check_initialized()
+            loop = self._loop
+            if loop is None:
+                raise RuntimeError("Playwright 이벤트 루프가 실행 중이 아님")
+        except RuntimeError:
+            coro.close()
+            raise
+        
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        if deadline is not None:
+            unregister = deadline.on_cancel(future.cancel)
+            future.add_done_callback(lambda _: unregister())
+        return future
+    
+    def acquire_page(self, workflow_id: str, timeout: float = 60.0) -> Dict[str, Any]:
+        """작업 흐름 전용 페이지 임대 (풀에서 초기화된 페이지를 가져옴)
+        
+        임대한 페이지에서 액션을 실행하려면 params에 lease_id로 workflow_id를 넘깁니다.
+        
+        Args:
+            workflow_id: 작업 흐름 ID (임대 ID로 사용)
+            timeout: 빈 임대를 기다릴 최대 시간(초)
+            
+        Returns:
+            액션 결과 (lease_id 포함)
+        """
+        return self.execute_action('acquire_page', {'lease_id': workflow_id, 'timeout': timeout})
+    
+    def release_page(self, workflow_id: str) -> Dict[str, Any]:
+        """임대 페이지 반납
+        
+        Args:
+            workflow_id: 작업 흐름 ID
+            
+        Returns:
+            액션 결과
+        """
+        return self.execute_action('release_page', {'lease_id': workflow_id})
+    
+    async def _dispatch(self, action_type: str, params: Dict[str, Any], deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """이벤트 루프에서 액션 실행 (대상 페이지 선택, 기한 적용, 예외를 실패 결과로 변환)
+        
+        Args:
+            action_type: 액션 유형
+            params: 액션 파라미터
+            deadline: 제출한 컨텍스트의 기한
+            
+        Returns:
+            액션 결과
+        """
+        page_id = params.get('page_id')
+        lease_id = params.get('lease_id')
         
+        try:
+            if deadline is not None:
+                deadline.check()
+            
+            if action_type == 'acquire_page':
+                return await self._acquire_lease(params)
+            if action_type == 'release_page':
+                return await self._release_lease(lease_id or params.get('workflow_id'))
+            if action_type == 'invalidate_page':
+                return self._invalidate_lease(lease_id)
+            if action_type == 'close_page':
+                return await self._close_named_page(lease_id, page_id)
+            if action_type == 'page_pool_stats':
+                return self._create_result(True, **self._pool.get_stats())
+            if action_type == 'request_filter_stats':
+                if self._request_filter is None:
+                    return self._create_result(False, "요청 차단이 설정되지 않음")
+                return self._create_result(True, **self._request_filter.get_stats(params.get('reset', False)))
+            
+            method = self.ACTIONS.get(action_type)
+            if method is None:
+                return self._create_result(False, f"Unsupported action: {action_type}")
+            
+            try:
+                page = await self._get_target_page(lease_id, page_id)
+            except Exception as e:
+                self.logger.error(f"페이지 준비 중 오류 ({lease_id or 'default'}/{page_id or 'default'}): {str(e)}")
+                return self._create_result(False, str(e))
+            
+            # 대상 페이지는 이 작업(task)의 컨텍스트에만 설정되어 동시에 실행되는 다른 액션과 섞이지 않음
+            _target_page.set(page)
+            lock = self._page_locks.setdefault(id(page), asyncio.Lock())
+            async with lock:
+                coro = getattr(self, method)(params)
+                if deadline is not None and deadline.expires_at is not None:
+                    return await asyncio.wait_for(coro, deadline.remaining())
+                return await coro
+        
+        except (asyncio.TimeoutError, DeadlineExceeded) as e:
+            if deadline is not None and deadline.expired:
+                return self._create_result(False, deadline.describe())
+            return self._create_result(False, str(e))
         except Exception as e:
-            result = self._create_result(False, str(e))
             self.logger.error(f"액션 실행 중 오류 ({action_type}): {str(e)}")
+            return self._create_result(False, str(e))
+    
+    async def _dispatch_batch(self, batch: List[Tuple[str, Dict[str, Any]]], stop_on_error: bool,
+                              deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """이벤트 루프에서 액션 목록을 차례로 실행
         
-        return result
+        Args:
+            batch: (액션 유형, 파라미터) 목록
+            stop_on_error: 첫 실패에서 중단 여부
+            deadline: 제출한 컨텍스트의 기한
+            
+        Returns:
+            일괄 실행 결과
+        """
+        results = []
+        for action_type, params in batch:
+            result = await self._dispatch(action_type, params, deadline)
+            results.append(result)
+            if stop_on_error and not result.get('success', False):
+                break
+        return self._batch_result(results)
+    
+    @property
+    def _active_page(self) -> Any:
+        """현재 액션의 대상 페이지 (루프 작업 밖에서는 기본 페이지)"""
+        return _target_page.get() or self._page
+    
+    async def _acquire_lease(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """워크플로우 전용 페이지 임대 (페이지 풀에서 가져오며 동시 임대 수는 max_leases로 제한)
+        
+        Args:
+            params: lease_id 또는 workflow_id (선택), timeout (임대 대기 시간, 초)
+            
+        Returns:
+            액션 결과 (lease_id 포함)
+        """
+        lease_id = params.get('lease_id') or params.get('workflow_id') or str(uuid.uuid4())
+        
+        # 빈 임대를 기다리는 동안에도 루프는 다른 액션을 계속 실행
+        try:
+            lease = await self._pool.acquire(lease_id, params.get('timeout', 60.0))
+        except Exception as e:
+            self.logger.error(f"페이지 임대 실패: {str(e)}")
+            return self._create_result(False, str(e))
+        
+        if lease is None:
+            return self._create_result(False, f"페이지 임대 대기 시간 초과 (최대 {self._max_leases}개)")
+        
+        self.logger.info(f"페이지 임대: {lease_id} (사용 중: {len(self._pool.leased)}/{self._max_leases}, "
+                         f"사용 횟수: {lease.uses})")
+        return self._create_result(True, lease_id=lease_id)
+    
+    async def _open_lease(self) -> Tuple[Any, Any]:
+        """임대용 컨텍스트와 페이지 생성 (페이지 풀 생성 함수)
+        
+        Returns:
+            (컨텍스트, 페이지) (컨텍스트는 격리 모드가 아니면 None)
+        """
+        context = None
+        if self._isolated_leases:
+            # 쿠키/저장소가 섞이지 않도록 비영구 브라우저의 새 컨텍스트 사용
+            if not self._lease_browser or not self._lease_browser.is_connected():
+                self._lease_browser = await self._get_browser_module().launch(
+                    headless=self._headless,
+                    args=list(self.BROWSER_ARGS),
+                    ignore_default_args=['--enable-automation']
+                )
+            context = await self._lease_browser.new_context()
+            await self._install_request_filter(context)
+            page = await context.new_page()
+        else:
+            page = await self._context.new_page()
+        
+        page.set_default_timeout(self._default_timeout)
+        return context, page
+    
+    async def _release_lease(self, lease_id: str) -> Dict[str, Any]:
+        """임대 페이지 반납 (초기화 후 풀에 반환하거나 한도를 넘었으면 새로 만듦)
+        
+        Args:
+            lease_id: 임대 ID
+            
+        Returns:
+            액션 결과
+        """
+        lease = self._pool.get(lease_id) if self._pool else None
+        if lease is None:
+            return self._create_result(False, f"임대를 찾을 수 없음: {lease_id}")
+        
+        for page in (lease.page, *lease.pages.values()):
+            self._page_locks.pop(id(page), None)
+            self._cdp_sessions.pop(id(page), None)
+            if self._request_filter is not None:
+                self._request_filter.clear_page(page)
+        
+        try:
+            await self._pool.release(lease_id)
+            return self._create_result(True, lease_id=lease_id)
+        except Exception as e:
+            self.logger.warning(f"임대 페이지 정리 중 오류: {lease_id} - {str(e)}")
+            return self._create_result(False, str(e))
+        finally:
+            self.logger.info(f"페이지 반납: {lease_id}")
+    
+    def _invalidate_lease(self, lease_id: str) -> Dict[str, Any]:
+        """임대 페이지를 반납 시 폐기하도록 표시 (페이지 잠금을 기다리지 않음)
+        
+        Args:
+            lease_id: 임대 ID
+            
+        Returns:
+            액션 결과
+        """
+        if self._pool is None or not self._pool.mark_unusable(lease_id):
+            return self._create_result(False, f"임대를 찾을 수 없음: {lease_id}")
+        
+        self.logger.warning(f"임대 페이지 사용 중지 표시 (반납 시 폐기): {lease_id}")
+        return self._create_result(True, lease_id=lease_id)
+    
+    async def _get_target_page(self, lease_id: Optional[str], page_id: Optional[str]) -> Any:
+        """액션 대상 페이지 가져오기 (이름 있는 탭은 없거나 닫혔으면 새로 생성)
+        
+        Args:
+            lease_id: 임대 ID (None이면 기본 컨텍스트)
+            page_id: 탭 이름 (None 또는 'default'면 기본 페이지)
+            
+        Returns:
+            Playwright 페이지
+        """
+        if not lease_id and (not page_id or page_id == 'default'):
+            return self._page
+        
+        if lease_id:
+            lease = self._pool.get(lease_id) if self._pool else None
+            if lease is None:
+                raise RuntimeError(f"임대를 찾을 수 없음: {lease_id}")
+            if not page_id or page_id == 'default':
+                return lease.page
+            pages, context = lease.pages, lease.context or self._context
+        else:
+            pages, context = self._pages, self._context
+        
+        page = pages.get(page_id)
+        if page is None or page.is_closed():
+            page = await context.new_page()
+            page.set_default_timeout(self._default_timeout)
+            pages[page_id] = page
+            self.logger.info(f"새 탭 생성: {page_id}")
+        return page
+    
+    async def _close_named_page(self, lease_id: Optional[str], page_id: str) -> Dict[str, Any]:
+        """이름 있는 탭 닫기
+        
+        Args:
+            lease_id: 임대 ID (None이면 기본 컨텍스트)
+            page_id: 탭 이름
+            
+        Returns:
+            액션 결과
+        """
+        lease = self._pool.get(lease_id) if self._pool else None
+        pages = lease.pages if lease is not None else self._pages
+        page = pages.pop(page_id, None) if page_id else None
+        if page is None:
+            return self._create_result(False, f"탭을 찾을 수 없음: {page_id}")
+        
+        self._page_locks.pop(id(page), None)
+        self._cdp_sessions.pop(id(page), None)
+        if self._request_filter is not None:
+            self._request_filter.clear_page(page)
+        try:
+            if not page.is_closed():
+                await page.close()
+            return self._create_result(True, page_id=page_id)
+        except Exception as e:
+            return self._create_result(False, str(e))
+    
+    async def _get_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """현재 페이지 객체 반환 (인식 플러그인 컨텍스트용)"""
+        return self._create_result(True, page=self._active_page)
     
     async def _navigate(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """웹 페이지 탐색
@@ -341,18 +852,85 @@ class PlaywrightPlugin(AutomationPlugin):
         timeout = params.get('timeout', self._default_timeout)
         wait_until = params.get('wait_until', 'load')  # load, domcontentloaded, networkidle
         
+        # 이 탐색부터 적용할 차단 프로필
+        if params.get('blocking_profile'):
+            result = await self._set_blocking_profile({'profile': params['blocking_profile']})
+            if not result['success']:
+                return result
+        
         try:
-            response = await self._page.goto(url, timeout=timeout, wait_until=wait_until)
+            response = await self._active_page.goto(url, timeout=timeout, wait_until=wait_until)
             
             return self._create_result(
                 True,
-                url=self._page.url,
+                url=self._active_page.url,
                 status=response.status if response else None,
-                title=await self._page.title()
+                title=await self._active_page.title()
             )
         except Exception as e:
             return self._create_result(False, str(e))
     
+    async def _install_request_filter(self, context: Any) -> None:
+        """컨텍스트에 요청 차단 라우트와 응답 크기 기록 설치 (요청 차단이 설정된 경우)
+        
+        Args:
+            context: 브라우저 컨텍스트
+        """
+        if self._request_filter is None:
+            return
+        await context.route('**/*', self._route_request)
+        context.on('response', self._record_response)
+    
+    async def _route_request(self, route: Any) -> None:
+        """가로챈 요청을 프로필에 따라 차단하거나 계속 진행"""
+        request = route.request
+        try:
+            page = request.frame.page
+            page_url = page.url
+        except Exception:
+            # 서비스 워커 요청 등 페이지가 없는 요청
+            page, page_url = None, request.url
+        
+        try:
+            if self._request_filter.check(page, page_url, request.url, request.resource_type):
+                await route.abort('blockedbyclient')
+            else:
+                await route.continue_()
+        except Exception as e:
+            # 페이지가 닫히는 중에는 라우트 처리가 실패할 수 있음
+            self.logger.debug(f"요청 라우트 처리 실패: {request.url} - {str(e)}")
+    
+    def _record_response(self, response: Any) -> None:
+        """허용된 요청의 응답 크기(Content-Length) 기록"""
+        try:
+            size = int(response.headers.get('content-length', 0))
+        except (TypeError, ValueError):
+            return
+        self._request_filter.record_response(size)
+    
+    async def _set_blocking_profile(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """대상 페이지의 요청 차단 프로필 변경
+        
+        Args:
+            params: profile (프로필 이름, 'none'이면 차단 안 함, 없으면 도메인/기본 프로필로 되돌림)
+            
+        Returns:
+            변경 결과
+        """
+        if self._request_filter is None:
+            return self._create_result(False, "요청 차단이 설정되지 않음 (request_blocking)")
+        
+        profile = params.get('profile')
+        try:
+            if profile is None:
+                self._request_filter.clear_page(self._active_page)
+            else:
+                self._request_filter.set_page_profile(self._active_page, profile)
+        except ValueError as e:
+            return self._create_result(False, str(e))
+        
+        return self._create_result(True, profile=profile)
+    
     async def _find_element(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """요소 찾기
         
@@ -370,7 +948,7 @@ class PlaywrightPlugin(AutomationPlugin):
         
         try:
             # 요소 찾기 시도
-            locator = self._page.locator(selector)
+            locator = self._active_page.locator(selector)
             
             # 요소가 존재하는지 확인
             is_visible = await locator.is_visible(timeout=timeout)
@@ -383,7 +961,7 @@ class PlaywrightPlugin(AutomationPlugin):
             element_handle = await locator.first.element_handle()
             
             # 요소 정보 수집
-            tag_name = await self._page.evaluate("e => e.tagName.toLowerCase()", element_handle)
+            tag_name = await self._active_page.evaluate("e => e.tagName.toLowerCase()", element_handle)
             
             return self._create_result(
                 True,
@@ -419,14 +997,14 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 선택자로 요소 클릭
-                await self._page.click(selector, timeout=timeout)
+                await self._active_page.click(selector, timeout=timeout)
             elif position:
                 # 위치 클릭
                 x, y = position
-                await self._page.mouse.click(x, y)
+                await self._active_page.mouse.click(x, y)
             elif element and element.get('selector'):
                 # 요소 정보로 클릭
-                await self._page.click(element['selector'], timeout=timeout)
+                await self._active_page.click(element['selector'], timeout=timeout)
             
             return self._create_result(True)
         except Exception as e:
@@ -453,10 +1031,10 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 선택자로 요소 채우기
-                await self._page.fill(selector, text, timeout=timeout)
+                await self._active_page.fill(selector, text, timeout=timeout)
             elif element and element.get('selector'):
                 # 요소 정보로 채우기
-                await self._page.fill(element['selector'], text, timeout=timeout)
+                await self._active_page.fill(element['selector'], text, timeout=timeout)
             
             return self._create_result(True)
         except Exception as e:
@@ -486,10 +1064,10 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 선택자로 요소 선택
-                values = await self._page.select_option(selector, value, timeout=timeout)
+                values = await self._active_page.select_option(selector, value, timeout=timeout)
             elif element and element.get('selector'):
                 # 요소 정보로 선택
-                values = await self._page.select_option(element['selector'], value, timeout=timeout)
+                values = await self._active_page.select_option(element['selector'], value, timeout=timeout)
             
             return self._create_result(True, selected_values=values)
         except Exception as e:
@@ -515,10 +1093,10 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 선택자로 요소 텍스트 가져오기
-                text = await self._page.text_content(selector, timeout=timeout)
+                text = await self._active_page.text_content(selector, timeout=timeout)
             elif element and element.get('selector'):
                 # 요소 정보로 텍스트 가져오기
-                text = await self._page.text_content(element['selector'], timeout=timeout)
+                text = await self._active_page.text_content(element['selector'], timeout=timeout)
             
             return self._create_result(True, text=text)
         except Exception as e:
@@ -548,10 +1126,10 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 선택자로 요소 속성 가져오기
-                value = await self._page.get_attribute(selector, attribute, timeout=timeout)
+                value = await self._active_page.get_attribute(selector, attribute, timeout=timeout)
             elif element and element.get('selector'):
                 # 요소 정보로 속성 가져오기
-                value = await self._page.get_attribute(element['selector'], attribute, timeout=timeout)
+                value = await self._active_page.get_attribute(element['selector'], attribute, timeout=timeout)
             
             return self._create_result(True, attribute=attribute, value=value)
         except Exception as e:
@@ -571,7 +1149,7 @@ class PlaywrightPlugin(AutomationPlugin):
             return self._create_result(False, "스크립트가 지정되지 않음")
         
         try:
-            result = await self._page.evaluate(script)
+            result = await self._active_page.evaluate(script)
             return self._create_result(True, result=result)
         except Exception as e:
             return self._create_result(False, str(e))
@@ -592,7 +1170,7 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 특정 요소 스크린샷
-                locator = self._page.locator(selector)
+                locator = self._active_page.locator(selector)
                 if path:
                     await locator.screenshot(path=path)
                 else:
@@ -601,15 +1179,109 @@ class PlaywrightPlugin(AutomationPlugin):
             else:
                 # 전체 페이지 스크린샷
                 if path:
-                    await self._page.screenshot(path=path, full_page=full_page)
+                    await self._active_page.screenshot(path=path, full_page=full_page)
                 else:
-                    screenshot_bytes = await self._page.screenshot(full_page=full_page)
+                    screenshot_bytes = await self._active_page.screenshot(full_page=full_page)
                     return self._create_result(True, screenshot=screenshot_bytes)
             
             return self._create_result(True, path=path)
         except Exception as e:
             return self._create_result(False, str(e))
     
+    async def _capture_frame(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """화면 프레임 캡처 (파일 없이 메모리에서 BGR 배열로 디코딩)
+        
+        Chromium에서는 CDP로 캡처해 영역 자르기와 축소를 브라우저에서 처리하며, 그 밖의 브라우저는
+        Playwright 스크린샷을 디코딩한 뒤 축소합니다.
+        
+        Args:
+            params: clip (뷰포트 기준 {'x', 'y', 'width', 'height'}, CSS 픽셀), scale (축소 비율, 0 초과 1 이하),
+                    format ('jpeg' 또는 'png'), quality (JPEG 품질), decode (False면 인코딩된 이미지 반환)
+            
+        Returns:
+            캡처 결과 (frame: BGR 배열, width, height 또는 decode=False면 image: 인코딩된 이미지 바이트)
+        """
+        image_format = params.get('format', 'jpeg')
+        if image_format not in ('jpeg', 'png'):
+            return self._create_result(False, f"지원하지 않는 이미지 형식: {image_format}")
+        
+        scale = float(params.get('scale', 1.0))
+        if not 0 < scale <= 1:
+            return self._create_result(False, f"축소 비율은 0보다 크고 1 이하여야 함: {scale}")
+        
+        decode = params.get('decode', True)
+        if decode and not OPENCV_AVAILABLE:
+            return self._create_result(False, "OpenCV/NumPy를 찾을 수 없어 프레임을 디코딩할 수 없음 (decode=False 사용)")
+        
+        try:
+            data, scaled = await self._grab_frame(self._active_page, image_format, params.get('quality', 80),
+                                                  params.get('clip'), scale)
+        except Exception as e:
+            return self._create_result(False, f"프레임 캡처 실패: {str(e)}")
+        
+        if not decode:
+            return self._create_result(True, image=data, format=image_format, scaled=scaled)
+        
+        # 디코딩은 루프 밖 스레드에서 실행해 다른 페이지 액션을 막지 않음
+        frame = await asyncio.get_running_loop().run_in_executor(None, _decode_frame, data, 1.0 if scaled else scale)
+        if frame is None:
+            return self._create_result(False, "프레임 디코딩 실패")
+        
+        return self._create_result(True, frame=frame, width=frame.shape[1], height=frame.shape[0])
+    
+    async def _grab_frame(self, page: Any, image_format: str, quality: int, clip: Optional[Dict[str, float]],
+                          scale: float) -> Tuple[bytes, bool]:
+        """인코딩된 화면 이미지 가져오기
+        
+        Args:
+            page: 대상 페이지
+            image_format: 이미지 형식
+            quality: JPEG 품질
+            clip: 뷰포트 기준 영역 (None이면 뷰포트 전체)
+            scale: 축소 비율
+            
+        Returns:
+            (이미지 바이트, 브라우저에서 축소했는지 여부)
+        """
+        session = await self._cdp_session(page) if self._browser_type == 'chromium' else None
+        if session is None:
+            options = {'type': image_format}
+            if image_format == 'jpeg':
+                options['quality'] = quality
+            if clip:
+                options['clip'] = clip
+            return await page.screenshot(**options), False
+        
+        args = {'format': image_format, 'optimizeForSpeed': True}
+        if image_format == 'jpeg':
+            args['quality'] = quality
+        if clip or scale < 1:
+            # CDP 영역은 문서 기준이므로 현재 스크롤 위치를 더함
+            metrics = await session.send('Page.getLayoutMetrics')
+            viewport = metrics.get('cssVisualViewport') or metrics['visualViewport']
+            region = clip or {'x': 0, 'y': 0, 'width': viewport['clientWidth'], 'height': viewport['clientHeight']}
+            args['clip'] = {
+                'x': region['x'] + viewport['pageX'],
+                'y': region['y'] + viewport['pageY'],
+                'width': region['width'],
+                'height': region['height'],
+                'scale': scale
+            }
+        
+        result = await session.send('Page.captureScreenshot', args)
+        return base64.b64decode(result['data']), True
+    
+    async def _cdp_session(self, page: Any) -> Any:
+        """페이지의 CDP 세션 (페이지별로 한 번 생성, 만들 수 없으면 None)"""
+        key = id(page)
+        if key not in self._cdp_sessions:
+            try:
+                self._cdp_sessions[key] = await page.context.new_cdp_session(page)
+            except Exception as e:
+                self.logger.debug(f"CDP 세션을 만들 수 없어 스크린샷으로 캡처: {str(e)}")
+                self._cdp_sessions[key] = None
+        return self._cdp_sessions[key]
+    
     async def _wait_for_load(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """페이지 로드 대기
         
@@ -623,11 +1295,68 @@ class PlaywrightPlugin(AutomationPlugin):
         timeout = params.get('timeout', self._default_timeout)
         
         try:
-            await self._page.wait_for_load_state(state, timeout=timeout)
+            await self._active_page.wait_for_load_state(state, timeout=timeout)
             return self._create_result(True, state=state)
         except Exception as e:
             return self._create_result(False, str(e))
         
+    async def _page_fingerprint(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """현재 페이지 지문 계산 (단계 결과 캐시 키용)
+        
+        문서 ID는 문서를 로드할 때마다 새로 만들어지므로 같은 DOM으로 다시 로드한 페이지와 구분됩니다.
+        같은 문서 안의 변경(SPA 다시 그리기, 닫힌 팝업)은 MutationObserver로 센 DOM 변경 횟수로,
+        화면 좌표가 바뀌는 스크롤/창 크기 변경은 뷰포트 값으로 구분합니다.
+        DOM 해시는 문서 전체(또는 범위 요소)를 직렬화하므로 include_dom을 지정한 경우에만 계산합니다.
+        
+        Args:
+            params: 지문 파라미터 (include_dom: DOM 해시 포함 여부, selector: DOM 해시 범위 요소, 기본은 문서 전체)
+            
+        Returns:
+            URL, 문서 ID(document_id), DOM 변경 횟수(mutations), 뷰포트(viewport: [스크롤 x, 스크롤 y, 너비, 높이]),
+            DOM 해시(fingerprint, include_dom이 아니면 None)
+        """
+        try:
+            result = await self._active_page.evaluate(
+                self.PAGE_FINGERPRINT_SCRIPT, [params.get('selector'), bool(params.get('include_dom', False))])
+            return self._create_result(True, url=self._active_page.url, document_id=result['document'],
+                                       mutations=result['mutations'], viewport=result['viewport'],
+                                       fingerprint=result['dom'])
+        except Exception as e:
+            return self._create_result(False, str(e))
+    
+    async def _extract_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """행 목록 일괄 추출 (요소마다 왕복하지 않고 페이지당 한 번의 DOM 조회)
+        
+        필드는 {'이름': {'selector': 하위 선택자, 'attr': 속성 또는 'text', 'prop': 프로퍼티}} 형식이며,
+        문자열이면 '하위 선택자@속성' 약식입니다 ('a@href', '.price', '@data-id'). 필드가 없으면 행 텍스트만 추출합니다.
+        
+        Args:
+            params: 추출 파라미터 (selector, fields, limit, next_selector)
+            
+        Returns:
+            항목 목록(items), 항목 수(count), 전체 행 수(total), 다음 페이지 존재 여부(has_next)
+        """
+        selector = params.get('selector')
+        if not selector:
+            return self._create_result(False, "선택자가 지정되지 않음")
+        
+        fields = {}
+        for name, spec in (params.get('fields') or {'text': {}}).items():
+            if isinstance(spec, str):
+                sub_selector, _, attr = spec.partition('@')
+                spec = {'selector': sub_selector or None, 'attr': attr or 'text'}
+            fields[name] = spec
+        
+        try:
+            extracted = await self._active_page.evaluate(
+                self.EXTRACT_LIST_SCRIPT, [selector, fields, params.get('limit'), params.get('next_selector')]
+            )
+            items = extracted['items']
+            return self._create_result(True, items=items, count=len(items), total=extracted['total'],
+                                       has_next=extracted['hasNext'])
+        except Exception as e:
+            return self._create_result(False, str(e))
+    
     async def _press(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """요소에 키 누르기 (수정된 버전)
         
@@ -648,7 +1377,7 @@ class PlaywrightPlugin(AutomationPlugin):
         try:
             if selector:
                 # 선택자 존재 확인
-                locator = self._page.locator(selector)
+                locator = self._active_page.locator(selector)
                 is_visible = await locator.is_visible(timeout=timeout)
                 
                 if not is_visible:
@@ -656,13 +1385,13 @@ class PlaywrightPlugin(AutomationPlugin):
                 
                 # 요소 포커스 확보 후 키 누르기
                 await locator.focus()
-                await self._page.wait_for_timeout(100)  # 약간의 지연으로 안정성 확보
+                await self._active_page.wait_for_timeout(100)  # 약간의 지연으로 안정성 확보
                 
                 # 특정 요소에 키 누르기
-                await self._page.press(selector, key, timeout=timeout)
+                await self._active_page.press(selector, key, timeout=timeout)
             else:
                 # 전역 키보드에 키 누르기
-                await self._page.keyboard.press(key)
+                await self._active_page.keyboard.press(key)
             
             return self._create_result(True, key=key)
         except Exception as e:
@@ -692,17 +1421,17 @@ class PlaywrightPlugin(AutomationPlugin):
                 
                 # 수정자 키 누르기
                 for modifier in modifiers:
-                    await self._page.keyboard.down(modifier.strip())
+                    await self._active_page.keyboard.down(modifier.strip())
                 
                 # 최종 키 누르고 떼기
-                await self._page.keyboard.press(final_key.strip())
+                await self._active_page.keyboard.press(final_key.strip())
                 
                 # 수정자 키 떼기 (역순)
                 for modifier in reversed(modifiers):
-                    await self._page.keyboard.up(modifier.strip())
+                    await self._active_page.keyboard.up(modifier.strip())
             else:
                 # 단일 키 누르기
-                await self._page.keyboard.press(key)
+                await self._active_page.keyboard.press(key)
             
             return self._create_result(True, key=key)
         except Exception as e:
@@ -735,7 +1464,7 @@ class PlaywrightPlugin(AutomationPlugin):
                 return self._create_result(False, "유효한 선택자를 찾을 수 없음")
             
             # 요소 존재 확인
-            locator = self._page.locator(use_selector)
+            locator = self._active_page.locator(use_selector)
             is_visible = await locator.is_visible(timeout=timeout)
             
             if not is_visible:
@@ -743,37 +1472,37 @@ class PlaywrightPlugin(AutomationPlugin):
             
             # 요소 태그 확인 및 최적의 입력 방법 선택
             element_handle = await locator.element_handle()
-            tag_name = await self._page.evaluate("e => e.tagName.toLowerCase()", element_handle)
+            tag_name = await self._active_page.evaluate("e => e.tagName.toLowerCase()", element_handle)
             
             if clear_first:
                 # 기존 내용 지우기
                 await locator.focus()
-                await self._page.wait_for_timeout(50)
+                await self._active_page.wait_for_timeout(50)
                 
                 if tag_name in ['input', 'textarea']:
                     # 전체 선택 후 삭제
-                    await self._page.keyboard.press('Control+a')
-                    await self._page.wait_for_timeout(50)
-                    await self._page.keyboard.press('Backspace')
-                    await self._page.wait_for_timeout(50)
+                    await self._active_page.keyboard.press('Control+a')
+                    await self._active_page.wait_for_timeout(50)
+                    await self._active_page.keyboard.press('Backspace')
+                    await self._active_page.wait_for_timeout(50)
             
             # 텍스트 입력
             if text:
                 # 일반적인 fill 메서드 사용
-                await self._page.fill(use_selector, text, timeout=timeout)
+                await self._active_page.fill(use_selector, text, timeout=timeout)
                 
                 # 입력 확인
-                input_value = await self._page.evaluate(f"document.querySelector('{use_selector}').value")
+                input_value = await self._active_page.evaluate(f"document.querySelector('{use_selector}').value")
                 if input_value != text:
                     # fill 메서드가 실패한 경우 대체 방법 시도
                     self.logger.warning(f"Fill 메서드 실패, type 메서드로 재시도: {use_selector}")
                     await locator.focus()
-                    await self._page.wait_for_timeout(50)
-                    await self._page.keyboard.press('Control+a')
-                    await self._page.wait_for_timeout(50)
-                    await self._page.keyboard.press('Backspace')
-                    await self._page.wait_for_timeout(50)
-                    await self._page.type(use_selector, text, timeout=timeout)
+                    await self._active_page.wait_for_timeout(50)
+                    await self._active_page.keyboard.press('Control+a')
+                    await self._active_page.wait_for_timeout(50)
+                    await self._active_page.keyboard.press('Backspace')
+                    await self._active_page.wait_for_timeout(50)
+                    await self._active_page.type(use_selector, text, timeout=timeout)
             
             return self._create_result(True, text=text, selector=use_selector)
         except Exception as e:
@@ -790,7 +1519,7 @@ class PlaywrightPlugin(AutomationPlugin):
             결과
         """
         try:
-            url = self._page.url
+            url = self._active_page.url
             return self._create_result(True, url=url)
         except Exception as e:
             return self._create_result(False, str(e))
@@ -815,7 +1544,7 @@ class PlaywrightPlugin(AutomationPlugin):
         
         try:
             # 요소 존재 확인
-            locator = self._page.locator(selector)
+            locator = self._active_page.locator(selector)
             is_visible = await locator.is_visible(timeout=timeout)
             
             if not is_visible:
@@ -824,7 +1553,7 @@ class PlaywrightPlugin(AutomationPlugin):
             # 기존 텍스트 지우기 - 여기를 수정
             # 작은따옴표 이스케이프 처리
             escaped_selector = selector.replace("'", "\\'")
-            await self._page.evaluate(f"""
+            await self._active_page.evaluate(f"""
                 (() => {{
                     const el = document.querySelector('{escaped_selector}');
                     if(el) {{
@@ -837,10 +1566,10 @@ class PlaywrightPlugin(AutomationPlugin):
             
             # 포커스 설정
             await locator.focus()
-            await self._page.wait_for_timeout(100)
+            await self._active_page.wait_for_timeout(100)
             
             # 텍스트 입력
-            await self._page.type(selector, text, delay=delay)
+            await self._active_page.type(selector, text, delay=delay)
             
             return self._create_result(True, text=text, selector=selector)
         except Exception as e:
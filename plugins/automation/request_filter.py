@@ -0,0 +1,217 @@
+"""
+요청 차단 프로필 모듈
+
+이 모듈은 Playwright 플러그인이 라우트로 가로챈 요청을 차단할지 판단하는 프로필과 필터를 구현합니다.
+프로필은 차단할 리소스 유형(image, font, media 등)과 URL 패턴(글롭 또는 're:' 접두사 정규식)으로 이루어지며,
+URL 패턴은 프로필마다 정규식 하나로 컴파일됩니다. 페이지마다 지정한 프로필이 없으면
+페이지 도메인에 연결된 프로필, 그다음 기본 프로필을 사용합니다.
+모든 메서드는 플러그인의 이벤트 루프 스레드에서 호출되어야 합니다.
+"""
+import fnmatch
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern, Set
+from urllib.parse import urlsplit
+
+# 기본 제공 프로필 (설정의 blocking_profiles로 덮어쓰거나 추가)
+BUILTIN_PROFILES = {
+    # 이미지/글꼴/동영상과 흔한 추적 스크립트 차단
+    'lite': {
+        'resource_types': ['image', 'media', 'font'],
+        'url_patterns': [
+            '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*',
+            '*facebook.net/*', '*connect.facebook.*', '*hotjar.com/*', '*scorecardresearch.com/*'
+        ]
+    },
+    # 텍스트 추출용: 스타일시트까지 차단
+    'text_only': {
+        'resource_types': ['image', 'media', 'font', 'stylesheet', 'texttrack', 'manifest'],
+        'url_patterns': [
+            '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*',
+            '*facebook.net/*', '*connect.facebook.*', '*hotjar.com/*', '*scorecardresearch.com/*'
+        ]
+    }
+}
+
+
+@dataclass
+class BlockingProfile:
+    """요청 차단 프로필"""
+    name: str  # 프로필 이름
+    resource_types: Set[str] = field(default_factory=set)  # 차단할 리소스 유형
+    url_patterns: List[str] = field(default_factory=list)  # 차단할 URL 패턴 (글롭 또는 're:' 정규식)
+    allow_patterns: List[str] = field(default_factory=list)  # 차단하지 않을 URL 패턴 (차단 패턴보다 우선)
+    domains: List[str] = field(default_factory=list)  # 이 프로필을 자동 적용할 페이지 도메인 (하위 도메인 포함)
+    
+    def __post_init__(self):
+        self.resource_types = set(self.resource_types)
+        self._block_re = self._compile(self.url_patterns)
+        self._allow_re = self._compile(self.allow_patterns)
+    
+    @staticmethod
+    def _compile(patterns: List[str]) -> Optional[Pattern]:
+        """URL 패턴 목록을 정규식 하나로 컴파일 (패턴이 없으면 None)"""
+        parts = [pattern[3:] if pattern.startswith('re:') else fnmatch.translate(pattern) for pattern in patterns]
+        return re.compile('|'.join(f"(?:{part})" for part in parts)) if parts else None
+    
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> 'BlockingProfile':
+        """사전에서 프로필 생성
+        
+        Args:
+            name: 프로필 이름
+            data: 프로필 설정 (resource_types, url_patterns, allow_patterns, domains)
+        
+        Returns:
+            프로필
+        """
+        return cls(
+            name=name,
+            resource_types=set(data.get('resource_types', [])),
+            url_patterns=list(data.get('url_patterns', [])),
+            allow_patterns=list(data.get('allow_patterns', [])),
+            domains=[domain.lower().lstrip('.') for domain in data.get('domains', [])]
+        )
+    
+    def match(self, url: str, resource_type: str) -> Optional[str]:
+        """요청을 차단할 이유 (차단하지 않으면 None)
+        
+        Args:
+            url: 요청 URL
+            resource_type: 리소스 유형
+        
+        Returns:
+            차단 이유 ('type' 또는 'pattern') 또는 None
+        """
+        if self._allow_re is not None and self._allow_re.match(url):
+            return None
+        if resource_type in self.resource_types:
+            return 'type'
+        if self._block_re is not None and self._block_re.match(url):
+            return 'pattern'
+        return None
+
+
+class RequestFilter:
+    """프로필 기반 요청 필터 (페이지별 프로필 선택과 차단 통계)"""
+    
+    def __init__(self, profiles: Dict[str, Dict[str, Any]] = None, default_profile: str = None, logger=None):
+        """필터 초기화
+        
+        Args:
+            profiles: 프로필 이름 -> 프로필 설정 (기본 제공 프로필에 추가/덮어씀)
+            default_profile: 페이지에 지정된 프로필도 도메인 프로필도 없을 때 사용할 프로필
+            logger: 로거 객체
+        
+        Raises:
+            ValueError: 알 수 없는 기본 프로필
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.profiles: Dict[str, BlockingProfile] = {
+            name: BlockingProfile.from_dict(name, data)
+            for name, data in dict(BUILTIN_PROFILES, **(profiles or {})).items()
+        }
+        if default_profile is not None and default_profile not in self.profiles:
+            raise ValueError(f"알 수 없는 차단 프로필: {default_profile}")
+        self.default_profile = default_profile
+        
+        self._page_profiles: Dict[int, Optional[str]] = {}  # id(페이지) -> 지정된 프로필 (None이면 차단 안 함)
+        self._domain_cache: Dict[str, Optional[str]] = {}  # 호스트 -> 도메인 프로필
+        self._stats = self._empty_stats()
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {'allowed': 0, 'blocked': 0, 'allowed_bytes': 0, 'blocked_by_type': {}, 'blocked_by_profile': {}}
+    
+    def set_page_profile(self, page: Any, profile: Optional[str]) -> None:
+        """페이지에 프로필 지정
+        
+        Args:
+            page: 페이지
+            profile: 프로필 이름 ('none'이면 차단하지 않음)
+        
+        Raises:
+            ValueError: 알 수 없는 프로필
+        """
+        if profile not in (None, 'none') and profile not in self.profiles:
+            raise ValueError(f"알 수 없는 차단 프로필: {profile}")
+        self._page_profiles[id(page)] = None if profile == 'none' else profile
+    
+    def clear_page(self, page: Any) -> None:
+        """페이지 지정 프로필 제거 (도메인/기본 프로필로 돌아감)"""
+        self._page_profiles.pop(id(page), None)
+    
+    def profile_for(self, page: Any, page_url: str) -> Optional[BlockingProfile]:
+        """페이지에 적용할 프로필
+        
+        Args:
+            page: 요청을 보낸 페이지 (알 수 없으면 None)
+            page_url: 페이지 URL
+        
+        Returns:
+            프로필 또는 None (차단하지 않음)
+        """
+        key = id(page) if page is not None else None
+        if key in self._page_profiles:
+            name = self._page_profiles[key]
+        else:
+            name = self._domain_profile(page_url) or self.default_profile
+        return self.profiles.get(name) if name else None
+    
+    def _domain_profile(self, url: str) -> Optional[str]:
+        """URL 호스트에 연결된 프로필 이름 (호스트별 캐시)"""
+        host = (urlsplit(url).hostname or '').lower()
+        if host not in self._domain_cache:
+            self._domain_cache[host] = next(
+                (profile.name for profile in self.profiles.values()
+                 for domain in profile.domains if host == domain or host.endswith('.' + domain)),
+                None
+            )
+        return self._domain_cache[host]
+    
+    def check(self, page: Any, page_url: str, url: str, resource_type: str) -> bool:
+        """요청 차단 여부 판단 및 통계 기록
+        
+        문서 요청(페이지 탐색)은 차단하지 않습니다.
+        
+        Args:
+            page: 요청을 보낸 페이지
+            page_url: 페이지 URL
+            url: 요청 URL
+            resource_type: 리소스 유형
+        
+        Returns:
+            차단 여부
+        """
+        profile = self.profile_for(page, page_url) if resource_type != 'document' else None
+        reason = profile.match(url, resource_type) if profile is not None else None
+        if reason is None:
+            self._stats['allowed'] += 1
+            return False
+        
+        self._stats['blocked'] += 1
+        by_type = self._stats['blocked_by_type']
+        by_type[resource_type] = by_type.get(resource_type, 0) + 1
+        by_profile = self._stats['blocked_by_profile']
+        by_profile[profile.name] = by_profile.get(profile.name, 0) + 1
+        return True
+    
+    def record_response(self, size: int) -> None:
+        """허용된 요청의 응답 크기(바이트) 기록"""
+        self._stats['allowed_bytes'] += size
+    
+    def get_stats(self, reset: bool = False) -> Dict[str, Any]:
+        """차단 통계
+        
+        Args:
+            reset: 통계 초기화 여부
+        
+        Returns:
+            허용/차단 요청 수, 허용된 응답 바이트, 리소스 유형/프로필별 차단 수
+        """
+        stats = dict(self._stats, blocked_by_type=dict(self._stats['blocked_by_type']),
+                     blocked_by_profile=dict(self._stats['blocked_by_profile']))
+        if reset:
+            self._stats = self._empty_stats()
+        return stats
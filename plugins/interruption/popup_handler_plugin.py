@@ -511,26 +511,34 @@ class InterruptionHandlerPlugin(Plugin):
         """
         for selector in pattern.selectors:
             try:
-                # 요소 찾기
-                find_result = self._automation_plugin.execute_action('find_element', {
-                    'selector': selector,
-                    'timeout': 1000  # 1초 타임아웃 (빠른 검색)
-                })
-                
-                if not find_result.get('success', False) or not find_result.get('found', False):
-                    continue
-                
-                # 요소 발견, 액션 실행
+                actions = []
                 for action_data in pattern.actions:
-                    action_type = action_data.get('action', 'click')
                     action_params = action_data.copy()
-                    action_params.pop('action', None)
+                    action_type = action_params.pop('action', 'click')
                     
                     # 선택자 추가
                     action_params['selector'] = selector
-                    
-                    # 액션 실행
-                    action_result = self._automation_plugin.execute_action(action_type, action_params)
+                    actions.append((action_type, action_params))
+                
+                # 요소 찾기와 첫 액션을 한 번에 제출 (찾지 못하면 중단)
+                batch_result = self._automation_plugin.execute_batch([
+                    ('find_element', {
+                        'selector': selector,
+                        'timeout': 1000  # 1초 타임아웃 (빠른 검색)
+                    }),
+                    *actions[:1]
+                ])
+                results = batch_result.get('results') or [{}]
+                
+                if not results[0].get('success', False) or not results[0].get('found', False):
+                    continue
+                
+                # 요소 발견, 첫 액션이 실패하면 나머지 액션을 차례로 실행
+                for index, (action_type, action_params) in enumerate(actions):
+                    if index == 0:
+                        action_result = results[1]
+                    else:
+                        action_result = self._automation_plugin.execute_action(action_type, action_params)
                     
                     if action_result.get('success', False):
                         self.logger.info(f"인터럽션 처리 성공: {pattern.id} - {selector} ({action_type})")
@@ -83,6 +83,9 @@ class RecognitionResult:
 class RecognitionPlugin(Plugin):
     """인식 시스템 플러그인 기본 클래스"""
     
+    # 화면 프레임으로 인식하는지 여부 (참이면 작업 흐름 관리자가 페이지 대신 페이지에 바인딩된 자동화 플러그인을 컨텍스트로 전달)
+    captures_frames = False
+    
     def __init__(self):
         """플러그인 초기화"""
         self._initialized = False
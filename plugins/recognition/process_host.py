@@ -0,0 +1,364 @@
+"""
+프로세스 외부 인식 플러그인 호스트
+
+이 모듈은 인식 시스템 플러그인(OCR, 템플릿 매칭 등)을 별도 워커 프로세스 풀에서 실행하는
+호스트 플러그인을 구현합니다. 각 워커는 모델을 한 번만 로드하며, 스크린샷은 피클링 대신
+multiprocessing.shared_memory를 통해 워커에 전달됩니다.
+호스트는 감싼 플러그인과 같은 ID와 execute_action('recognize', ...) 계약을 제공하므로
+작업 흐름 관리자는 변경 없이 사용할 수 있습니다.
+"""
+import importlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from core.deadline import DeadlineExceeded, clamp_timeout, wait_future
+from core.plugin_system import PluginInfo
+from plugins.recognition.base import RecognitionMethod, RecognitionPlugin, RecognitionResult, RecognitionTarget
+
+# NumPy/OpenCV 가져오기 (디코딩된 프레임 전달용, 선택 사항)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+
+# 워커 프로세스 전역 상태 (프로세스당 한 번 로드)
+_worker_plugin = None
+_worker_error = None
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """워커에서 공유 메모리 연결 (세그먼트 해제는 호스트가 담당)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.13 미만: 워커는 호스트의 리소스 추적기를 공유하므로 그대로 연결
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker_initialize(module_name: str, class_name: str, config: Optional[Dict[str, Any]]) -> None:
+    """워커 프로세스 초기화 (플러그인 및 모델 로드)"""
+    global _worker_plugin, _worker_error
+
+    try:
+        module = importlib.import_module(module_name)
+        plugin = getattr(module, class_name)()
+        if plugin.initialize(config):
+            _worker_plugin = plugin
+        else:
+            _worker_error = f"플러그인 초기화 실패: {class_name}"
+    except Exception as e:
+        _worker_error = f"플러그인 로드 실패: {class_name} - {str(e)}"
+
+
+def _worker_ping() -> Dict[str, Any]:
+    """워커 상태 확인"""
+    return {'pid': os.getpid(), 'ready': _worker_plugin is not None, 'error': _worker_error}
+
+
+def _worker_recognize(frame: Dict[str, Any], target: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+    """워커에서 인식 수행
+
+    Args:
+        frame: 프레임 설명 (공유 메모리 이름/크기/형태 또는 이미지 경로)
+        target: 인식 대상
+        timeout: 인식 제한 시간
+
+    Returns:
+        인식 결과 사전
+    """
+    if _worker_plugin is None:
+        return {'success': False, 'error': _worker_error or "워커 플러그인이 초기화되지 않음"}
+
+    if 'path' in frame:
+        return _worker_plugin.execute_action('recognize', {
+            'context': frame['path'], 'target': target, 'timeout': timeout
+        })
+
+    shm = _attach_shared_memory(frame['name'])
+    try:
+        if 'shape' in frame:
+            # 디코딩된 프레임: 공유 버퍼 위에 복사 없이 배열 생성
+            context = np.ndarray(tuple(frame['shape']), dtype=np.dtype(frame['dtype']), buffer=shm.buf)
+        else:
+            # 인코딩된 이미지: 가능하면 워커에서 디코딩
+            data = bytes(shm.buf[:frame['size']])
+            if OPENCV_AVAILABLE:
+                context = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+            else:
+                context = data
+
+        result = _worker_plugin.execute_action('recognize', {
+            'context': context, 'target': target, 'timeout': timeout
+        })
+        del context
+        return result
+    finally:
+        shm.close()
+
+
+class ProcessRecognitionHost(RecognitionPlugin):
+    """프로세스 외부 인식 플러그인 호스트
+
+    감싼 인식 플러그인을 워커 프로세스 풀에서 실행합니다.
+    """
+
+    captures_frames = True  # 감싼 플러그인과 관계없이 항상 프레임을 캡처해 워커로 전달
+
+    def __init__(self, plugin_class: Type[RecognitionPlugin], workers: int = 2,
+                 automation_plugin: Any = None):
+        """호스트 초기화
+
+        Args:
+            plugin_class: 워커에서 실행할 인식 플러그인 클래스
+            workers: 워커 프로세스 수
+            automation_plugin: 컨텍스트가 없을 때 스크린샷 캡처에 사용할 자동화 플러그인 (기본 페이지)
+        """
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+
+        self._plugin_class = plugin_class
+        self._plugin_info = plugin_class.get_plugin_info()
+        self._workers = max(1, workers)
+        self._automation_plugin = automation_plugin
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._default_timeout = 30.0  # 인식 기본 제한 시간(초)
+
+    def get_plugin_info(self) -> PluginInfo:
+        """플러그인 정보 반환 (감싼 플러그인과 동일)"""
+        return self._plugin_info
+
+    def set_automation_plugin(self, plugin: Any) -> None:
+        """컨텍스트가 없을 때 스크린샷 캡처에 사용할 자동화 플러그인 설정
+
+        Args:
+            plugin: 자동화 플러그인
+        """
+        self._automation_plugin = plugin
+
+    def initialize(self, config: Dict[str, Any] = None) -> bool:
+        """워커 프로세스 풀 시작 및 모델 로드
+
+        Args:
+            config: 감싼 플러그인 설정
+
+        Returns:
+            초기화 성공 여부
+        """
+        super().initialize(config)
+        self._default_timeout = self._config.get('default_timeout', 30.0)
+
+        try:
+            # Playwright 등 스레드가 있는 부모 프로세스에서 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_worker_initialize,
+                initargs=(self._plugin_class.__module__, self._plugin_class.__name__, config)
+            )
+
+            # 모든 워커를 미리 시작하여 모델 로드 완료 확인
+            futures = [self._executor.submit(_worker_ping) for _ in range(self._workers)]
+            for future in futures:
+                status = future.result()
+                if not status['ready']:
+                    raise RuntimeError(status['error'] or "워커 초기화 실패")
+
+            self.logger.info(f"프로세스 인식 호스트 초기화 완료: {self._plugin_info.id} (워커: {self._workers})")
+            return True
+        except Exception as e:
+            self.logger.error(f"프로세스 인식 호스트 초기화 실패: {self._plugin_info.id} - {str(e)}")
+            self.cleanup()
+            return False
+
+    def cleanup(self) -> None:
+        """워커 프로세스 풀 종료"""
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        super().cleanup()
+
+    def recognize(self, context: Any, target: Union[Dict[str, Any], RecognitionTarget],
+                timeout: float = None) -> RecognitionResult:
+        """대상 인식 (워커 프로세스에서 실행)
+
+        Args:
+            context: 인식 컨텍스트 (페이지에 바인딩된 자동화 플러그인, 이미지 배열/바이트/경로, None이면 기본 페이지)
+            target: 인식 대상
+            timeout: 인식 제한 시간
+
+        Returns:
+            인식 결과
+        """
+        target_data = target.to_dict() if isinstance(target, RecognitionTarget) else target
+        result = self._recognize_remote(context, target_data, timeout)
+        return self._result_from_dict(result, target)
+
+    def execute_action(self, action_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """액션 실행 (recognize는 워커 결과 사전을 그대로 반환)
+
+        Args:
+            action_type: 액션 유형
+            params: 액션 파라미터
+
+        Returns:
+            액션 결과
+        """
+        if not self._initialized:
+            return {'success': False, 'error': "Plugin not initialized"}
+
+        params = params or {}
+
+        if action_type == 'recognize':
+            target_data = params.get('target')
+            if not target_data:
+                return {'success': False, 'error': "Recognition target not specified"}
+            if isinstance(target_data, RecognitionTarget):
+                target_data = target_data.to_dict()
+            return self._recognize_remote(params.get('context'), target_data, params.get('timeout'))
+
+        return {'success': False, 'error': f"Unsupported action: {action_type}"}
+
+    def _recognize_remote(self, context: Any, target: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        """프레임을 공유 메모리에 올리고 워커에서 인식 수행
+
+        Args:
+            context: 인식 컨텍스트
+            target: 인식 대상 사전
+            timeout: 인식 제한 시간
+
+        Returns:
+            인식 결과 사전
+        """
+        self._check_initialized()
+
+        frame = self._capture_frame(context)
+        if frame is None:
+            return {'success': False, 'error': "스크린샷 캡처 실패"}
+
+        shm = None
+        try:
+            if isinstance(frame, str):
+                descriptor = {'path': frame}
+            else:
+                shm, descriptor = self._share_frame(frame)
+
+            # 워커 제한 시간은 단계 기한의 남은 시간 이내로 줄이고, 기한이 취소되면 대기를 바로 중단
+            timeout = clamp_timeout(timeout)
+            future = self._executor.submit(_worker_recognize, descriptor, target, timeout)
+            wait_time = (timeout if timeout is not None else self._default_timeout) + 5.0
+            try:
+                return wait_future(future, wait_time)
+            except FutureTimeoutError:
+                future.cancel()
+                return {'success': False, 'error': f"워커 인식 시간 초과 ({wait_time:.1f}초)"}
+            except DeadlineExceeded as e:
+                future.cancel()
+                return {'success': False, 'error': str(e)}
+        except Exception as e:
+            self.logger.error(f"워커 인식 중 오류: {self._plugin_info.id} - {str(e)}")
+            return {'success': False, 'error': str(e)}
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def _share_frame(self, frame: Any) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+        """프레임을 공유 메모리에 복사
+
+        Args:
+            frame: 이미지 배열 또는 인코딩된 이미지 바이트
+
+        Returns:
+            (공유 메모리, 프레임 설명)
+        """
+        if NUMPY_AVAILABLE and isinstance(frame, np.ndarray):
+            frame = np.ascontiguousarray(frame)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, frame.nbytes))
+            np.ndarray(frame.shape, dtype=frame.dtype, buffer=shm.buf)[...] = frame
+            return shm, {'name': shm.name, 'size': frame.nbytes,
+                         'shape': list(frame.shape), 'dtype': frame.dtype.str}
+
+        data = bytes(frame)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+        shm.buf[:len(data)] = data
+        return shm, {'name': shm.name, 'size': len(data)}
+
+    def _capture_frame(self, context: Any) -> Any:
+        """인식 컨텍스트에서 프레임 가져오기
+
+        Args:
+            context: 인식 컨텍스트
+
+        Returns:
+            이미지 배열, 인코딩된 이미지 바이트, 이미지 경로 또는 None
+        """
+        if NUMPY_AVAILABLE and isinstance(context, np.ndarray):
+            return context
+
+        if isinstance(context, (bytes, bytearray)):
+            return context
+
+        if isinstance(context, str):
+            return context if os.path.exists(context) else None
+
+        # 자동화 플러그인을 통한 스크린샷 (컨텍스트가 없으면 설정된 플러그인의 기본 페이지)
+        # 페이지 객체는 어느 임대 페이지/탭인지 알 수 없으므로 다른 탭을 캡처하지 않도록 거부
+        if hasattr(context, 'execute_action'):
+            engine = context
+        elif context is None:
+            engine = self._automation_plugin
+        else:
+            self.logger.error(f"지원되지 않는 컨텍스트 유형: {type(context)} "
+                              f"(페이지 대신 페이지에 바인딩된 자동화 플러그인 사용)")
+            return None
+        if engine is None:
+            self.logger.error("스크린샷을 캡처할 자동화 플러그인이 없음")
+            return None
+
+        # 디코딩된 프레임을 우선 사용하고, capture_frame을 지원하지 않는 엔진은 인코딩된 스크린샷 사용
+        result = engine.execute_action('capture_frame', {})
+        if result.get('success', False) and result.get('frame') is not None:
+            return result['frame']
+
+        result = engine.execute_action('screenshot', {})
+        if not result.get('success', False):
+            self.logger.error(f"스크린샷 캡처 실패: {result.get('error')}")
+            return None
+
+        return result.get('screenshot')
+
+    @staticmethod
+    def _result_from_dict(data: Dict[str, Any], target: Any) -> RecognitionResult:
+        """결과 사전을 RecognitionResult로 변환"""
+        location = data.get('location')
+        method = data.get('method')
+
+        if isinstance(target, dict):
+            target = RecognitionTarget(
+                type=target.get('type', 'unknown'),
+                description=target.get('description', ''),
+                context=target.get('context', ''),
+                attributes=target.get('attributes', {})
+            )
+
+        return RecognitionResult(
+            success=data.get('success', False),
+            confidence=data.get('confidence', 0.0),
+            method=RecognitionMethod(method) if method else None,
+            target=target,
+            element=data.get('element'),
+            location=(location['x'], location['y'], location['width'], location['height']) if location else None,
+            error=data.get('error')
+        )
@@ -28,6 +28,8 @@ except ImportError:
 class TemplateMatchingPlugin(RecognitionPlugin):
     """템플릿 매칭 인식 플러그인"""
     
+    captures_frames = True
+    
     @classmethod
     def get_plugin_info(cls) -> PluginInfo:
         """플러그인 정보 반환"""
@@ -128,8 +130,8 @@ class TemplateMatchingPlugin(RecognitionPlugin):
         """
         self._check_initialized()
         
-        # 컨텍스트 확인
-        if not context:
+        # 컨텍스트 확인 (이미지 배열은 진리값 판정 불가)
+        if context is None or (isinstance(context, (str, bytes)) and not context):
             return RecognitionResult(
                 success=False,
                 error="인식 컨텍스트가 제공되지 않음"
@@ -287,19 +289,31 @@ class TemplateMatchingPlugin(RecognitionPlugin):
             OpenCV 이미지 또는 None
         """
         try:
+            # 이미 디코딩된 이미지 배열인 경우 (프로세스 호스트의 공유 메모리 프레임 등)
+            if OPENCV_AVAILABLE and isinstance(context, np.ndarray):
+                return context
+            
+            # 자동화 플러그인인 경우 메모리에서 디코딩한 프레임 사용 (임시 파일 없음)
+            if hasattr(context, 'execute_action'):
+                frame_result = context.execute_action('capture_frame', {})
+                if frame_result.get('success', False) and frame_result.get('frame') is not None:
+                    return frame_result['frame']
+                
+                # capture_frame을 지원하지 않는 엔진은 임시 파일 스크린샷 사용
+                temp_file = os.path.join(self._temp_dir, f"screenshot_{uuid.uuid4()}.png")
+                screenshot_result = context.execute_action('screenshot', {'path': temp_file})
+                if not screenshot_result.get('success', False):
+                    self.logger.error(f"스크린샷 캡처 실패: {screenshot_result.get('error')}")
+                    return None
+                screenshot = cv2.imread(temp_file, cv2.IMREAD_COLOR)
+                os.remove(temp_file)
+                return screenshot
+            
             # Playwright 페이지인 경우
             if hasattr(context, 'screenshot'):
                 # 비동기 호출 없이 임시 파일 사용
                 temp_file = os.path.join(self._temp_dir, f"screenshot_{uuid.uuid4()}.png")
                 
-                # Playwright 플러그인을 통한 스크린샷
-                if hasattr(context, 'execute_action'):
-                    screenshot_result = context.execute_action('screenshot', {'path': temp_file})
-                    if screenshot_result.get('success', False):
-                        screenshot = cv2.imread(temp_file, cv2.IMREAD_COLOR)
-                        os.remove(temp_file)
-                        return screenshot
-                
                 # 다른 방법 시도
                 with open(temp_file, 'wb') as f:
                     # 이 부분은 실제 구현에서 비동기 처리가 필요할 수 있음
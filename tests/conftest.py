@@ -0,0 +1,28 @@
+"""
+테스트 공통 설정
+
+저장소 루트를 모듈 경로에 추가하고, 여러 테스트 모듈이 함께 쓰는 플러그인 도우미를 제공합니다.
+"""
+import os
+import sys
+import textwrap
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    """임시 플러그인 디렉토리 생성 함수 (모듈 캐시와 겹치지 않도록 디렉토리 이름은 매번 다름)
+
+    반환된 함수는 {파일 이름: 소스} 사전을 받아 *_plugin.py 파일을 쓰고 디렉토리 경로를 반환합니다.
+    """
+    def create(modules):
+        directory = tmp_path / f"plugins_{uuid.uuid4().hex[:8]}"
+        directory.mkdir()
+        for file_name, source in modules.items():
+            (directory / file_name).write_text(textwrap.dedent(source), encoding='utf-8')
+        return str(directory)
+    return create
@@ -0,0 +1,83 @@
+"""
+액션 일괄 실행 테스트 (user-023)
+"""
+import pytest
+
+from core.plugin_system import ActionProfiler, PluginInfo, PluginType
+from core.workflow_manager import PageBoundPlugin
+from plugins.automation.base import AutomationPlugin
+
+
+class RecordingPlugin(AutomationPlugin):
+    """실행한 액션을 기록하는 자동화 플러그인 ('fail' 액션은 실패)"""
+    
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='recording', name='recording', description='', version='1.0',
+                          plugin_type=PluginType.AUTOMATION)
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+    
+    def initialize(self, config=None):
+        return super().initialize(config)
+    
+    def cleanup(self):
+        super().cleanup()
+    
+    def execute_action(self, action_type, params=None):
+        self.calls.append((action_type, params))
+        if action_type == 'fail':
+            return self._create_result(False, f"{action_type} 실패")
+        return self._create_result(True, action=action_type)
+
+
+def test_batch_runs_actions_in_order():
+    plugin = RecordingPlugin()
+    
+    result = plugin.execute_batch([('find_element', {'selector': '#a'}), {'action': 'click', 'params': None}])
+    
+    assert result['success']
+    assert [item['action'] for item in result['results']] == ['find_element', 'click']
+    assert plugin.calls == [('find_element', {'selector': '#a'}), ('click', {})]
+
+
+def test_batch_stops_at_first_failure_unless_asked_to_continue():
+    plugin = RecordingPlugin()
+    
+    stopped = plugin.execute_batch([('fail', {}), ('click', {})])
+    continued = plugin.execute_batch([('click', {}), ('fail', {}), ('click', {})], stop_on_error=False)
+    
+    assert not stopped['success'] and stopped['error'] == "fail 실패"
+    assert (stopped['failed_index'], len(stopped['results'])) == (0, 1)
+    assert continued['failed_index'] == 1 and len(continued['results']) == 3
+
+
+def test_batch_rejects_specs_without_action():
+    with pytest.raises(ValueError):
+        RecordingPlugin().execute_batch([{'params': {}}])
+
+
+def test_page_bound_plugin_binds_lease_into_batch():
+    plugin = RecordingPlugin()
+    bound = PageBoundPlugin(plugin, page_id='tab', lease_id='wf-1')
+    
+    bound.execute_batch([('click', {'selector': '#a'}), {'action': 'get_url', 'params': {'page_id': 'other'}}])
+    
+    assert plugin.calls == [
+        ('click', {'selector': '#a', 'page_id': 'tab', 'lease_id': 'wf-1'}),
+        ('get_url', {'page_id': 'other', 'lease_id': 'wf-1'})
+    ]
+
+
+def test_profiler_records_batch_and_actions():
+    profiler = ActionProfiler()
+    plugin = RecordingPlugin()
+    profiler.instrument(plugin, 'recording')
+    
+    plugin.execute_batch([('click', {}), ('fail', {})])
+    
+    stats = profiler.get_stats('recording')['recording']
+    assert stats['batch']['count'] == 1 and stats['batch']['errors'] == 1
+    assert stats['click']['count'] == 1 and stats['fail']['errors'] == 1
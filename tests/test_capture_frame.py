@@ -0,0 +1,203 @@
+"""
+메모리 프레임 캡처 테스트 (user-025)
+
+브라우저 없이 가짜 페이지/CDP 세션과 가짜 플러그인으로 캡처 경로를 확인합니다. 디코딩 테스트는 OpenCV가 있을 때만 실행합니다.
+"""
+import asyncio
+import base64
+
+import pytest
+
+from core.plugin_system import Plugin, PluginInfo, PluginManager, PluginType
+from core.workflow_manager import PageBoundPlugin, WorkflowManager
+from plugins.automation.playwright_plugin import PlaywrightPlugin
+from plugins.recognition.process_host import ProcessRecognitionHost
+from test_process_host import EchoRecognition
+
+
+class FakeSession:
+    """CDP 세션 (요청 기록)"""
+    
+    def __init__(self, image):
+        self.image = image
+        self.sent = []
+    
+    async def send(self, method, args=None):
+        self.sent.append((method, args))
+        if method == 'Page.getLayoutMetrics':
+            return {'cssVisualViewport': {'clientWidth': 800, 'clientHeight': 600, 'pageX': 0, 'pageY': 120}}
+        return {'data': base64.b64encode(self.image).decode('ascii')}
+
+
+class FakeContext:
+    def __init__(self, session):
+        self.session = session
+    
+    async def new_cdp_session(self, page):
+        if self.session is None:
+            raise RuntimeError("CDP 미지원")
+        return self.session
+
+
+class FakePage:
+    def __init__(self, image, session=None):
+        self.image = image
+        self.context = FakeContext(session)
+        self.screenshots = []
+    
+    async def screenshot(self, **options):
+        self.screenshots.append(options)
+        return self.image
+
+
+def capture(plugin, **params):
+    return asyncio.run(plugin._capture_frame(params))
+
+
+def make_plugin(page, browser_type='chromium'):
+    plugin = PlaywrightPlugin()
+    plugin._page = page
+    plugin._browser_type = browser_type
+    return plugin
+
+
+def test_invalid_parameters_are_rejected():
+    plugin = make_plugin(FakePage(b'img'))
+    
+    assert "지원하지 않는 이미지 형식" in capture(plugin, format='gif')['error']
+    assert "축소 비율" in capture(plugin, scale=0)['error']
+
+
+def test_chromium_capture_clips_and_scales_in_browser():
+    session = FakeSession(b'jpeg-bytes')
+    plugin = make_plugin(FakePage(b'unused', session))
+    
+    result = capture(plugin, decode=False, scale=0.5, clip={'x': 10, 'y': 20, 'width': 100, 'height': 50})
+    
+    assert result['success'] and result['image'] == b'jpeg-bytes' and result['scaled']
+    method, args = session.sent[-1]
+    assert method == 'Page.captureScreenshot'
+    assert args['clip'] == {'x': 10, 'y': 140, 'width': 100, 'height': 50, 'scale': 0.5}
+    assert args['format'] == 'jpeg' and args['quality'] == 80
+
+
+def test_capture_falls_back_to_screenshot_without_cdp():
+    page = FakePage(b'png-bytes')
+    plugin = make_plugin(page)
+    
+    result = capture(plugin, decode=False, format='png', clip={'x': 0, 'y': 0, 'width': 5, 'height': 5})
+    firefox = capture(make_plugin(FakePage(b'ff'), browser_type='firefox'), decode=False)
+    
+    assert result['image'] == b'png-bytes' and not result['scaled']
+    assert page.screenshots == [{'type': 'png', 'clip': {'x': 0, 'y': 0, 'width': 5, 'height': 5}}]
+    assert firefox['image'] == b'ff'
+
+
+def test_capture_decodes_frame_when_opencv_is_available():
+    cv2 = pytest.importorskip('cv2')
+    np = pytest.importorskip('numpy')
+    ok, encoded = cv2.imencode('.png', np.zeros((40, 60, 3), dtype=np.uint8))
+    plugin = make_plugin(FakePage(encoded.tobytes()))
+    
+    result = capture(plugin, format='png', scale=0.5)
+    
+    assert result['success'] and (result['width'], result['height']) == (30, 20)
+
+
+class FrameEngine:
+    """capture_frame 지원 여부를 지정한 자동화 플러그인"""
+    
+    def __init__(self, frame=None):
+        self.frame = frame
+        self.actions = []
+    
+    def execute_action(self, action_type, params=None):
+        self.actions.append(action_type)
+        if action_type == 'capture_frame':
+            return {'success': self.frame is not None, 'frame': self.frame}
+        return {'success': True, 'screenshot': b'encoded'}
+
+
+def test_recognition_host_prefers_decoded_frames():
+    host = ProcessRecognitionHost(EchoRecognition, workers=1)
+    engine = FrameEngine(frame=b'decoded')
+    fallback = FrameEngine()
+    
+    assert host._capture_frame(engine) == b'decoded' and engine.actions == ['capture_frame']
+    assert host._capture_frame(fallback) == b'encoded' and fallback.actions == ['capture_frame', 'screenshot']
+
+
+class FakeAutomation(Plugin):
+    """get_page와 capture_frame 요청을 기록하는 Playwright 플러그인"""
+    
+    def __init__(self):
+        self.page = object()
+        self.calls = []
+    
+    def get_plugin_info(self):
+        return PluginInfo(id='playwright_automation', name='Playwright', description='', version='1.0',
+                          plugin_type=PluginType.AUTOMATION)
+    
+    def initialize(self, config=None):
+        return True
+    
+    def cleanup(self):
+        pass
+    
+    def execute_action(self, action_type, params=None):
+        self.calls.append((action_type, params))
+        if action_type == 'get_page':
+            return {'success': True, 'page': self.page}
+        return {'success': True, 'frame': f"frame:{params.get('page_id')}"}
+
+
+class ContextRecognition(Plugin):
+    """받은 인식 컨텍스트를 기록하는 인식 플러그인"""
+    
+    def __init__(self, plugin_id, captures_frames):
+        self.plugin_id = plugin_id
+        self.captures_frames = captures_frames
+        self.contexts = []
+    
+    def get_plugin_info(self):
+        return PluginInfo(id=self.plugin_id, name=self.plugin_id, description='', version='1.0',
+                          plugin_type=PluginType.RECOGNITION)
+    
+    def initialize(self, config=None):
+        return True
+    
+    def cleanup(self):
+        pass
+    
+    def execute_action(self, action_type, params=None):
+        context = params['context']
+        self.contexts.append(context)
+        if self.captures_frames:
+            return {'success': True, 'element': {'frame': context.execute_action('capture_frame', {})['frame']}}
+        return {'success': False, 'error': '요소 없음'}
+
+
+@pytest.mark.parametrize('race', [False, True])
+def test_element_recognition_captures_frames_from_the_step_page(race):
+    automation = FakeAutomation()
+    selector = ContextRecognition('selector_recognition', captures_frames=False)
+    template = ContextRecognition('template_recognition', captures_frames=True)
+    plugin_manager = PluginManager()
+    for plugin in (automation, selector, template):
+        plugin_manager.register_plugin(plugin)
+    assert plugin_manager.initialize_plugin('playwright_automation')
+    manager = WorkflowManager(plugin_manager)
+    
+    plan = {'steps': [{'id': 'find', 'type': 'element_recognition',
+                       'params': {'target': 'button', 'page': 'tab2', 'strategies': ['selector', 'template'],
+                                  'race': race}}]}
+    workflow_id = manager.create_workflow(plan, {'workflow_plan': plan, 'ignore_recognition_errors': False})
+    result = manager.execute_workflow(workflow_id)
+    step = manager.active_workflows[workflow_id].get_step_result('find')
+    
+    assert result['status'] == 'completed'
+    assert step.output['element'] == {'frame': 'frame:tab2'}
+    # 선택자 전략은 페이지를, 화면 프레임 전략은 단계의 탭에 바인딩된 플러그인을 받음
+    assert selector.contexts == [automation.page]
+    assert isinstance(template.contexts[0], PageBoundPlugin)
+    assert ('get_page', {'page_id': 'tab2'}) in automation.calls
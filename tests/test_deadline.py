@@ -0,0 +1,130 @@
+"""
+기한 테스트 (상위 기한 전파, 취소 콜백, 기한 안의 단계 핸들러 호출)
+"""
+import threading
+import time
+
+import pytest
+
+from core.deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope
+from core.plugin_system import PluginInfo, PluginManager, PluginType
+from core.workflow_manager import WorkflowManager
+from plugins.automation.base import AutomationPlugin
+
+
+class FakePlaywright(AutomationPlugin):
+    """액션 호출을 기록하는 Playwright 대역"""
+    
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='playwright_automation', name='Playwright', description='', version='1.0',
+                          plugin_type=PluginType.AUTOMATION)
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+    
+    def initialize(self, config=None):
+        self._initialized = True
+        return True
+    
+    def cleanup(self):
+        pass
+    
+    def execute_action(self, action_type, params=None):
+        self.calls.append((action_type, dict(params or {}), current_deadline()))
+        return {'success': True}
+
+
+def test_child_deadline_is_capped_and_cancelled_by_parent():
+    parent = Deadline(10.0, name='작업 흐름')
+    child = Deadline(60.0, parent=parent, name='단계')
+    assert child.expires_at == parent.expires_at
+    
+    cancelled = []
+    child.on_cancel(lambda: cancelled.append('child'))
+    parent.cancel("사용자 취소")
+    
+    assert child.cancelled and cancelled == ['child']
+    assert child.describe() == "사용자 취소"
+    with pytest.raises(DeadlineExceeded):
+        child.check()
+
+
+def test_overdue_counts_from_expiry_or_cancel():
+    assert Deadline(10.0).overdue() == 0.0
+    assert Deadline(-1.0).overdue() > 0.0
+    
+    deadline = Deadline()
+    deadline.cancel()
+    time.sleep(0.01)
+    assert deadline.overdue() >= 0.01
+
+
+# user-014: 단계 핸들러는 호출 스레드에서 실행되고, 유예 시간을 넘긴 브라우저 단계는 페이지 임대를 폐기
+@pytest.fixture
+def manager():
+    plugin_manager = PluginManager()
+    plugin = FakePlaywright()
+    plugin_manager.register_plugin(plugin)
+    plugin_manager.initialize_plugin('playwright_automation')
+    workflow_manager = WorkflowManager(plugin_manager, step_timeout=0.05, cancel_grace=0.05)
+    workflow_manager.plugin = plugin
+    return workflow_manager
+
+
+def run_step(workflow_manager, handler, page_lease='wf-lease'):
+    workflow_manager.register_step_handler('probe', handler, outputs=['value'], page_access='write')
+    plan = {'steps': [{'id': 'probe', 'type': 'probe', 'params': {}}]}
+    workflow_id = workflow_manager.create_workflow(plan, {'workflow_plan': plan})
+    workflow_manager.active_workflows[workflow_id].page_lease = page_lease
+    return workflow_manager.execute_workflow(workflow_id)
+
+
+def invalidations(workflow_manager):
+    return [(params, deadline) for action, params, deadline in workflow_manager.plugin.calls
+            if action == 'invalidate_page']
+
+
+def test_handler_runs_on_calling_thread_with_step_deadline(manager):
+    seen = {}
+    
+    def handler(context, params):
+        seen['thread'] = threading.current_thread()
+        seen['deadline'] = current_deadline()
+        return {'value': 1}
+    
+    result = run_step(manager, handler)
+    assert result['status'] == 'completed'
+    assert seen['thread'] is threading.current_thread()
+    assert seen['deadline'].expires_at is not None
+    assert invalidations(manager) == []
+
+
+def test_handler_finishing_within_grace_fails_without_invalidating_page(manager):
+    result = run_step(manager, lambda context, params: time.sleep(0.07) or {'value': 1})
+    assert result['status'] == 'failed'
+    assert invalidations(manager) == []
+
+
+def test_handler_ignoring_cancellation_invalidates_page_lease(manager):
+    result = run_step(manager, lambda context, params: time.sleep(0.2) or {'value': 1})
+    assert result['status'] == 'failed'
+    # 만료된 단계 기한 밖에서 요청
+    assert invalidations(manager) == [({'lease_id': 'wf-lease'}, None)]
+
+
+def test_error_after_deadline_is_reported_as_deadline_exceeded(manager):
+    def handler(context, params):
+        time.sleep(0.07)
+        raise RuntimeError("page closed")
+    
+    manager.register_step_handler('probe', handler, outputs=['value'], page_access='write')
+    plan = {'steps': [{'id': 'probe', 'type': 'probe', 'params': {}}]}
+    workflow_id = manager.create_workflow(plan, {'workflow_plan': plan})
+    context = manager.active_workflows[workflow_id]
+    step = manager.compiler.compile(plan).steps[0]
+    deadline = Deadline(0.01, name='단계 probe')
+    with deadline_scope(deadline):
+        with pytest.raises(DeadlineExceeded):
+            manager._call_handler(context, step, {}, deadline)
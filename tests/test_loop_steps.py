@@ -0,0 +1,123 @@
+"""
+반복 단계와 결과 싱크 테스트 (user-018)
+"""
+import csv
+import json
+import threading
+
+import pytest
+
+from core.plugin_system import PluginManager
+from core.result_sink import CsvSink, JsonlSink, MemorySink, create_sink
+from core.workflow_manager import WorkflowManager
+
+
+@pytest.fixture
+def manager():
+    workflow_manager = WorkflowManager(PluginManager())
+    workflow_manager.threads = set()
+    
+    def seed(context, params):
+        return {'rows': [{'n': n} for n in range(5)], 'remaining': 3}
+    
+    def double(context, params):
+        workflow_manager.threads.add(threading.current_thread().name)
+        if params['value'] == params.get('fail_on'):
+            raise ValueError(f"실패 {params['value']}")
+        return {'doubled': params['value'] * 2}
+    
+    def countdown(context, params):
+        return {'remaining': params['remaining'] - 1}
+    
+    workflow_manager.register_step_handler('seed', seed, outputs=['rows', 'remaining'])
+    workflow_manager.register_step_handler('double', double, outputs=['doubled'])
+    workflow_manager.register_step_handler('countdown', countdown, outputs=['remaining'])
+    return workflow_manager
+
+
+def run(workflow_manager, loop):
+    plan = {'steps': [{'id': 'seed', 'type': 'seed'}, loop]}
+    workflow_id = workflow_manager.create_workflow(plan, {'workflow_plan': plan})
+    result = workflow_manager.execute_workflow(workflow_id)
+    context = workflow_manager.active_workflows[workflow_id]
+    return result, context, workflow_manager.get_workflow_sink(workflow_id, loop['id'])
+
+
+def foreach(fail_on=None, **params):
+    body = {'id': 'double', 'type': 'double', 'params': {'value': '$row.n', 'fail_on': fail_on}}
+    return {'id': 'loop', 'type': 'foreach', 'params': dict({'items': '$rows', 'as': 'row'}, **params), 'steps': [body]}
+
+
+def test_foreach_writes_iterations_to_sink_not_state(manager):
+    result, context, sink = run(manager, foreach(collect=['index', 'doubled']))
+    
+    assert result['status'] == 'completed'
+    assert list(sink.records) == [{'index': n, 'doubled': n * 2} for n in range(5)]
+    assert context.get_step_result('loop').output == {'iterations': 5, 'failed_iterations': 0, 'pages': 1}
+    assert 'doubled' not in context.state and 'row' not in context.state
+
+
+def test_foreach_parallel_keeps_item_order(manager):
+    result, _, sink = run(manager, foreach(collect=['doubled'], max_parallel=3, max_items=4))
+    
+    assert result['status'] == 'completed'
+    assert [record['doubled'] for record in sink.records] == [0, 2, 4, 6]
+    assert any(name.startswith('loop-loop') for name in manager.threads)
+
+
+def test_foreach_on_error_policies(manager):
+    _, context, sink = run(manager, foreach(collect=['doubled'], on_error='skip', fail_on=2))
+    assert context.get_step_result('loop').output['failed_iterations'] == 1
+    assert [record.get('error') for record in sink.records][2] == "실패 2"
+    
+    _, context, sink = run(manager, foreach(collect=['doubled'], on_error='stop', fail_on=2))
+    assert [record['doubled'] for record in sink.records] == [0, 2]
+    assert context.get_step_result('loop').status.value == 'completed'
+    
+    result, _, _ = run(manager, foreach(fail_on=2))
+    assert result['status'] == 'failed'
+
+
+def test_while_repeats_until_condition_is_false(manager):
+    loop = {'id': 'loop', 'type': 'while', 'params': {'condition': '$remaining', 'max_iterations': 10},
+            'steps': [{'id': 'tick', 'type': 'countdown', 'params': {'remaining': '$remaining'}}]}
+    
+    result, context, sink = run(manager, loop)
+    
+    assert result['status'] == 'completed'
+    assert context.get_step_result('loop').output == {'iterations': 3, 'failed_iterations': 0}
+    assert [record['remaining'] for record in sink.records] == [2, 1, 0]
+    assert context.state['remaining'] == 3
+
+
+def test_named_sink_is_used_and_left_open(manager, tmp_path):
+    sink = JsonlSink(str(tmp_path / 'rows.jsonl'), buffer_size=100)
+    manager.register_sink('rows', sink)
+    
+    run(manager, foreach(collect=['doubled'], sink='rows'))
+    sink.write({'doubled': 'after'})
+    sink.close()
+    
+    lines = (tmp_path / 'rows.jsonl').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['doubled'] for line in lines] == [0, 2, 4, 6, 8, 'after']
+
+
+def test_memory_sink_keeps_latest_records():
+    sink = MemorySink(max_records=2)
+    sink.write_batch([{'n': n} for n in range(5)])
+    
+    assert list(sink.records) == [{'n': 3}, {'n': 4}] and sink.dropped == 3
+
+
+def test_csv_sink_writes_header_once(tmp_path):
+    path = str(tmp_path / 'out' / 'rows.csv')
+    for batch in ([{'a': 1, 'b': 2}], [{'a': 3, 'b': 4, 'extra': 5}]):
+        sink = create_sink({'type': 'csv', 'path': path})
+        sink.write_batch(batch)
+        sink.close()
+    
+    with open(path, encoding='utf-8', newline='') as f:
+        assert list(csv.reader(f)) == [['a', 'b'], ['1', '2'], ['3', '4']]
+    assert isinstance(create_sink({}), MemorySink)
+    with pytest.raises(ValueError):
+        create_sink({'type': 'jsonl'})
@@ -0,0 +1,160 @@
+"""
+브라우저 페이지 풀 테스트 (임대/반납, 재사용, 재생성, 사용 중지 표시)
+"""
+import asyncio
+
+from plugins.automation.page_pool import PagePool
+
+
+class FakePage:
+    """evaluate/goto/close를 기록하는 페이지"""
+    
+    def __init__(self, heap=1024 * 1024):
+        self.heap = heap
+        self.closed = False
+        self.visited = []
+        self.healthy = True
+    
+    def is_closed(self):
+        return self.closed
+    
+    async def evaluate(self, script, arg=None):
+        if 'usedJSHeapSize' in script:
+            return self.heap
+        if script == "() => 1":
+            return 1 if self.healthy else 0
+        return None
+    
+    async def goto(self, url):
+        self.visited.append(url)
+    
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """격리 컨텍스트"""
+    
+    def __init__(self, page):
+        self.page = page
+        self.closed = False
+        self.cleared = 0
+    
+    async def clear_cookies(self):
+        self.cleared += 1
+    
+    async def clear_permissions(self):
+        pass
+    
+    async def close(self):
+        self.closed = True
+        self.page.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+    
+    async def factory():
+        page = FakePage()
+        context = FakeContext(page)
+        created.append(context)
+        return context, page
+    
+    return PagePool(factory, **kwargs), created
+
+
+# user-014: 사용 중지로 표시된 페이지는 반납 시 초기화하지 않고 폐기
+def test_unusable_page_is_discarded_on_release():
+    async def scenario():
+        pool, created = make_pool(max_leases=1)
+        entry = await pool.acquire('wf-1')
+        assert pool.mark_unusable('wf-1')
+        assert not pool.mark_unusable('unknown')
+        
+        await pool.release('wf-1')
+        assert created[0].closed
+        assert entry.page.visited == []
+        
+        replacement = await pool.acquire('wf-2')
+        assert replacement is not entry and not replacement.unusable
+        return pool.get_stats()
+    
+    stats = asyncio.run(scenario())
+    assert (stats['created'], stats['recycled'], stats['reused']) == (2, 1, 0)
+
+
+# user-022: 임대/반납, 재사용, 재생성, 상태 확인
+def test_released_page_is_reset_and_reused():
+    async def scenario():
+        pool, created = make_pool(warm_size=1)
+        await pool.start()
+        entry = await pool.acquire('wf-1')
+        assert await pool.acquire('wf-1') is entry
+        
+        assert await pool.release('wf-1')
+        assert not await pool.release('wf-1')
+        assert entry.page.visited == ['about:blank'] and created[0].cleared == 1
+        
+        assert await pool.acquire('wf-2') is entry
+        return pool.get_stats(), entry
+    
+    stats, entry = asyncio.run(scenario())
+    assert (stats['created'], stats['reused'], stats['leased'], stats['idle']) == (1, 2, 1, 0)
+    assert entry.uses == 2 and entry.lease_id == 'wf-2'
+
+
+def test_page_is_recycled_after_max_uses_and_pool_refilled():
+    async def scenario():
+        pool, created = make_pool(warm_size=1, max_uses=1)
+        await pool.start()
+        first = await pool.acquire('wf-1')
+        await pool.release('wf-1')
+        second = await pool.acquire('wf-2')
+        return pool.get_stats(), created, first, second
+    
+    stats, created, first, second = asyncio.run(scenario())
+    assert created[0].closed and second is not first
+    assert (stats['created'], stats['recycled'], stats['reused']) == (2, 1, 2)
+
+
+def test_page_is_recycled_after_heap_growth():
+    async def scenario():
+        pool, created = make_pool(max_heap_growth_mb=1)
+        entry = await pool.acquire('wf-1')
+        entry.page.heap += 2 * 1024 * 1024
+        await pool.release('wf-1')
+        return pool.get_stats(), created
+    
+    stats, created = asyncio.run(scenario())
+    assert created[0].closed and stats['recycled'] == 1 and stats['idle'] == 0
+
+
+def test_unhealthy_idle_page_is_replaced():
+    async def scenario():
+        pool, created = make_pool(warm_size=1)
+        await pool.start()
+        created[0].page.healthy = False
+        entry = await pool.acquire('wf-1')
+        return pool.get_stats(), created, entry
+    
+    stats, created, entry = asyncio.run(scenario())
+    assert created[0].closed and entry.page is created[1].page
+    assert (stats['unhealthy'], stats['created'], stats['reused']) == (1, 2, 0)
+
+
+def test_acquire_waits_for_free_slot():
+    async def scenario():
+        pool, _ = make_pool(max_leases=1)
+        await pool.acquire('wf-1')
+        assert await pool.acquire('wf-2', timeout=0.01) is None
+        
+        waiter = asyncio.ensure_future(pool.acquire('wf-2', timeout=1))
+        await asyncio.sleep(0)
+        await pool.release('wf-1')
+        entry = await waiter
+        await pool.close()
+        return pool.get_stats(), entry
+    
+    stats, entry = asyncio.run(scenario())
+    assert entry.lease_id == 'wf-2' and entry.page.closed
+    assert (stats['leased'], stats['idle']) == (0, 0)
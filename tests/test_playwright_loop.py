@@ -0,0 +1,132 @@
+"""
+Playwright 플러그인 이벤트 루프 스레드 테스트 (user-021)
+
+브라우저 없이 가짜 페이지로 루프 스레드, 페이지별 직렬화, 기한 취소를 확인합니다.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.deadline import Deadline, deadline_scope
+from plugins.automation.page_pool import PagePool
+from plugins.automation.playwright_plugin import PlaywrightPlugin
+
+
+class FakePage:
+    """'sleep:초' 스크립트를 비동기로 기다리며 실행 구간을 기록하는 페이지"""
+    
+    def __init__(self, name, intervals):
+        self.name = name
+        self.url = f"https://example.com/{name}"
+        self.intervals = intervals
+        self.closed = False
+    
+    def is_closed(self):
+        return self.closed
+    
+    def set_default_timeout(self, timeout):
+        pass
+    
+    async def evaluate(self, script, arg=None):
+        if script.startswith('sleep:'):
+            start = time.monotonic()
+            await asyncio.sleep(float(script[6:]))
+            self.intervals.append((self.name, start, time.monotonic(), threading.current_thread().name))
+        return self.name
+    
+    async def goto(self, url):
+        self.url = url
+    
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def plugin():
+    intervals = []
+    plugin = PlaywrightPlugin()
+    
+    created = []
+    
+    async def factory():
+        created.append(FakePage(f"lease-{len(created)}", intervals))
+        return None, created[-1]
+    
+    plugin._initialized = True
+    plugin._page = FakePage('default', intervals)
+    plugin._pool = PagePool(factory, max_leases=2)
+    plugin.intervals = intervals
+    plugin._start_loop()
+    yield plugin
+    plugin._stop_loop()
+
+
+def run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def overlaps(intervals):
+    return any(a[1] < b[2] and b[1] < a[2] for i, a in enumerate(intervals) for b in intervals[i + 1:])
+
+
+def test_actions_run_on_loop_thread(plugin):
+    result = plugin.execute_action('evaluate', {'script': 'sleep:0'})
+    
+    assert result == {'success': True, 'result': 'default'}
+    assert plugin.intervals[0][3] == 'playwright-loop'
+
+
+def test_same_page_actions_are_serialized(plugin):
+    run_threads([lambda: plugin.execute_action('evaluate', {'script': 'sleep:0.05'})] * 3)
+    
+    assert len(plugin.intervals) == 3 and not overlaps(plugin.intervals)
+
+
+def test_leased_pages_run_concurrently(plugin):
+    for lease_id in ('wf-1', 'wf-2'):
+        assert plugin.acquire_page(lease_id)['success']
+    
+    def sleep_on(lease_id):
+        return lambda: plugin.execute_action('evaluate', {'script': 'sleep:0.1', 'lease_id': lease_id})
+    
+    run_threads([sleep_on('wf-1'), sleep_on('wf-2')])
+    
+    assert len({name for name, *_ in plugin.intervals}) == 2 and overlaps(plugin.intervals)
+    assert plugin.release_page('wf-1')['success']
+    assert not plugin.release_page('wf-1')['success']
+
+
+def test_deadline_cancels_running_action(plugin):
+    start = time.monotonic()
+    with deadline_scope(Deadline(0.05, name='단계 probe')):
+        result = plugin.execute_action('evaluate', {'script': 'sleep:5'})
+    
+    assert not result['success'] and '단계 probe' in result['error']
+    assert time.monotonic() - start < 1.0
+    assert plugin.execute_action('get_url')['url'] == 'https://example.com/default'
+
+
+def test_batch_is_submitted_once(plugin):
+    result = plugin.execute_batch([('get_url', {}), ('evaluate', {'script': 'sleep:0'}), ('unknown', {})])
+    
+    assert [item['success'] for item in result['results']] == [True, True, False]
+    assert result['failed_index'] == 2 and "Unsupported action" in result['error']
+
+
+def test_calls_from_loop_thread_are_rejected(plugin):
+    async def call_from_loop():
+        return plugin.execute_action('get_url')
+    
+    with pytest.raises(RuntimeError, match="이벤트 루프 스레드"):
+        asyncio.run_coroutine_threadsafe(call_from_loop(), plugin._loop).result(timeout=1)
+
+
+def test_uninitialized_plugin_rejects_submission():
+    with pytest.raises(RuntimeError):
+        PlaywrightPlugin().submit_action('get_url')
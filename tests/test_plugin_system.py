@@ -0,0 +1,300 @@
+"""
+플러그인 관리자 테스트 (지연 발견, 레지스트리 색인, 의존성 순서 초기화, 액션 프로파일러)
+"""
+import json
+import os
+import sys
+
+import pytest
+
+from core.plugin_system import (ActionProfiler, LatencyHistogram, Plugin, PluginIndex, PluginInfo, PluginManager,
+                                PluginType)
+
+# 의존 관계가 있는 플러그인 모듈 (base <- child), 가져오면 모듈 변수에 기록
+DEPENDENT_PLUGINS = '''
+from core.plugin_system import Plugin, PluginInfo, PluginType
+
+INITIALIZED = []
+
+
+class BasePlugin(Plugin):
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='base', name='Base', description='', version='1.0',
+                          plugin_type=PluginType.AUTOMATION)
+    
+    def initialize(self, config=None):
+        INITIALIZED.append('base')
+        return True
+    
+    def cleanup(self):
+        pass
+
+
+class ChildPlugin(Plugin):
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='child', name='Child', description='', version='1.0',
+                          plugin_type=PluginType.RECOGNITION, dependencies=['base'])
+    
+    def initialize(self, config=None):
+        INITIALIZED.append('child')
+        return True
+    
+    def cleanup(self):
+        pass
+'''
+
+
+def make_plugin(plugin_id, dependencies=(), fail=False, log=None):
+    """의존성과 초기화 결과를 지정한 플러그인 인스턴스 생성"""
+    class TestPlugin(Plugin):
+        @classmethod
+        def get_plugin_info(cls):
+            return PluginInfo(id=plugin_id, name=plugin_id, description='', version='1.0',
+                              plugin_type=PluginType.WORKFLOW, dependencies=list(dependencies))
+        
+        def initialize(self, config=None):
+            if log is not None:
+                log.append(plugin_id)
+            return not fail
+        
+        def cleanup(self):
+            pass
+    
+    return TestPlugin()
+
+
+def lazy_manager(plugin_dir, tmp_path):
+    """매니페스트를 만든 뒤 새 관리자로 지연 발견 (모듈은 아직 가져오지 않은 상태)"""
+    directory = plugin_dir({'dependent_plugin.py': DEPENDENT_PLUGINS})
+    manifest = str(tmp_path / 'manifest.json')
+    PluginManager(plugin_dirs=[directory], manifest_file=manifest).discover_plugins(lazy=True)
+    
+    module_name = f"{directory.rsplit('/', 1)[-1]}.dependent_plugin"
+    sys.modules.pop(module_name, None)
+    manager = PluginManager(plugin_dirs=[directory], manifest_file=manifest)
+    manager.discover_plugins(lazy=True)
+    return manager, module_name
+
+
+# user-003: 의존성 순서 병렬 초기화
+def test_initialize_all_orders_dependencies():
+    log = []
+    manager = PluginManager()
+    for plugin in (make_plugin('c', ['b'], log=log), make_plugin('b', ['a'], log=log), make_plugin('a', log=log)):
+        manager.register_plugin(plugin)
+    
+    reports = manager.initialize_all()
+    
+    assert all(report.success for report in reports.values())
+    assert log == ['a', 'b', 'c']
+
+
+def test_initialize_all_reports_cycles_and_failed_dependencies():
+    manager = PluginManager()
+    for plugin in (make_plugin('x', ['y']), make_plugin('y', ['x']),
+                   make_plugin('broken', fail=True), make_plugin('user', ['broken'])):
+        manager.register_plugin(plugin)
+    
+    reports = manager.initialize_all(parallel=False)
+    
+    assert reports['x'].error == "순환 의존성" and reports['y'].error == "순환 의존성"
+    assert not reports['broken'].success
+    assert not reports['user'].success and 'broken' in reports['user'].error
+    assert manager.initialized_plugins == set()
+
+
+def test_initialize_all_does_not_import_lazy_plugins_by_default(plugin_dir, tmp_path):
+    manager, module_name = lazy_manager(plugin_dir, tmp_path)
+    manager.register_plugin(make_plugin('loaded'))
+    
+    reports = manager.initialize_all()
+    
+    assert set(reports) == {'loaded'}
+    assert module_name not in sys.modules
+    assert set(manager.lazy_plugins) == {'base', 'child'}
+
+
+def test_initialize_all_loads_requested_lazy_plugin_and_dependencies(plugin_dir, tmp_path):
+    manager, module_name = lazy_manager(plugin_dir, tmp_path)
+    
+    reports = manager.initialize_all(plugin_ids=['child'])
+    
+    assert reports['base'].success and reports['child'].success
+    assert sys.modules[module_name].INITIALIZED == ['base', 'child']
+
+
+# user-001: 매니페스트 기반 지연 발견
+def test_lazy_discovery_indexes_without_importing(plugin_dir, tmp_path):
+    manager, module_name = lazy_manager(plugin_dir, tmp_path)
+    
+    assert module_name not in sys.modules
+    assert manager.plugin_instances == {}
+    assert manager.get_plugin_info('child').dependencies == ('base',)
+    
+    plugin = manager.get_plugin('child')
+    
+    assert module_name in sys.modules
+    assert type(plugin).__name__ == 'ChildPlugin'
+    assert set(manager.lazy_plugins) == {'base'}
+
+
+def test_lazy_discovery_loads_plugins_by_type(plugin_dir, tmp_path):
+    manager, _ = lazy_manager(plugin_dir, tmp_path)
+    
+    plugins = manager.get_plugins_by_type(PluginType.AUTOMATION)
+    
+    assert [type(plugin).__name__ for plugin in plugins] == ['BasePlugin']
+    assert set(manager.lazy_plugins) == {'child'}
+
+
+def test_lazy_discovery_rescans_changed_modules(plugin_dir, tmp_path):
+    directory = plugin_dir({'dependent_plugin.py': DEPENDENT_PLUGINS})
+    manifest = str(tmp_path / 'manifest.json')
+    PluginManager(plugin_dirs=[directory], manifest_file=manifest).discover_plugins(lazy=True)
+    
+    module_path = os.path.join(directory, 'dependent_plugin.py')
+    with open(module_path, 'w', encoding='utf-8') as f:
+        f.write(DEPENDENT_PLUGINS.replace("id='child'", "id='renamed'"))
+    stat = os.stat(module_path)
+    os.utime(module_path, (stat.st_atime, stat.st_mtime + 10))
+    sys.modules.pop(f"{os.path.basename(directory)}.dependent_plugin", None)
+    
+    manager = PluginManager(plugin_dirs=[directory], manifest_file=manifest)
+    manager.discover_plugins(lazy=True)
+    
+    assert set(manager.lazy_plugins) == {'base', 'renamed'}
+    with open(manifest, encoding='utf-8') as f:
+        entries = json.load(f)['modules'][module_path]['plugins']
+    assert sorted(entry['id'] for entry in entries) == ['base', 'renamed']
+
+
+def test_registered_instance_takes_precedence_over_manifest(plugin_dir, tmp_path):
+    manager, module_name = lazy_manager(plugin_dir, tmp_path)
+    plugin = make_plugin('base')
+    
+    manager.register_plugin(plugin)
+    
+    assert manager.get_plugin('base') is plugin
+    assert 'base' not in manager.lazy_plugins and module_name not in sys.modules
+
+
+# user-002: 레지스트리 색인
+def make_info(plugin_id, name=None, priority=0, plugin_type=PluginType.RECOGNITION):
+    return PluginInfo(id=plugin_id, name=name or plugin_id, description='', version='1.0',
+                      plugin_type=plugin_type, priority=priority)
+
+
+def test_index_orders_by_priority_then_registration():
+    index = PluginIndex()
+    for info in (make_info('low_ocr', priority=1), make_info('high_ocr', priority=5),
+                 make_info('second_low', priority=1), make_info('runner', plugin_type=PluginType.WORKFLOW)):
+        index.add(info)
+    
+    assert index.ids_by_type(PluginType.RECOGNITION) == ['high_ocr', 'low_ocr', 'second_low']
+    assert sorted(index.all_ids()) == ['high_ocr', 'low_ocr', 'runner', 'second_low']
+    assert index.ids_by_strategy('ocr') == ['high_ocr', 'low_ocr']
+    
+    index.add(make_info('low_ocr', priority=9))
+    assert index.ids_by_type(PluginType.RECOGNITION) == ['low_ocr', 'high_ocr', 'second_low']
+
+
+def test_index_query_uses_criteria():
+    index = PluginIndex()
+    for info in (make_info('template_matching_recognition', 'Template Matching', priority=3),
+                 make_info('ocr_recognition', 'OCR', priority=1),
+                 make_info('selector_recognition', 'Selector', priority=5)):
+        index.add(info)
+    
+    assert index.query(PluginType.RECOGNITION, {'strategy': 'template'}) == ['template_matching_recognition']
+    assert index.query(PluginType.RECOGNITION, {'min_priority': 3}) == [
+        'selector_recognition', 'template_matching_recognition'
+    ]
+    assert index.query(PluginType.RECOGNITION, {'name': 'OCR', 'min_priority': 2}) == []
+    assert index.query(PluginType.WORKFLOW, {'id': 'ocr_recognition'}) == []
+    
+    index.remove('selector_recognition')
+    assert 'selector_recognition' not in index
+    assert index.query(PluginType.RECOGNITION, {'min_priority': 3}) == ['template_matching_recognition']
+
+
+def test_manager_resolves_strategy_in_registration_order_for_equal_priority():
+    manager = PluginManager()
+    low, high = make_plugin('ocr_basic'), make_plugin('ocr_fast')
+    manager.register_plugin(low)
+    manager.register_plugin(high)
+    
+    assert manager.resolve_strategy('ocr', PluginType.WORKFLOW) is low
+    assert manager.find_plugins(PluginType.WORKFLOW, {'name': 'ocr_fast'}) == [high]
+    assert manager.get_plugins_by_type(PluginType.WORKFLOW) == [low, high]
+
+
+# user-005: 액션 프로파일러
+class ActionPlugin(Plugin):
+    """execute_action 결과를 액션 유형으로 정하는 플러그인"""
+    
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='actions', name='actions', description='', version='1.0',
+                          plugin_type=PluginType.AUTOMATION)
+    
+    def initialize(self, config=None):
+        return True
+    
+    def cleanup(self):
+        pass
+    
+    def execute_action(self, action_type, params=None):
+        if action_type == 'raise':
+            raise RuntimeError("실패")
+        return {'success': action_type != 'fail'}
+
+
+def test_profiler_records_actions_and_errors():
+    manager = PluginManager()
+    plugin = ActionPlugin()
+    manager.register_plugin(plugin)
+    manager.profiler.instrument(plugin, 'actions')  # 이미 감싼 플러그인은 다시 감싸지 않음
+    
+    plugin.execute_action('ok')
+    plugin.execute_action('ok')
+    plugin.execute_action('fail')
+    with pytest.raises(RuntimeError):
+        plugin.execute_action('raise')
+    
+    stats = manager.profiler.get_stats('actions')['actions']
+    assert (stats['ok']['count'], stats['ok']['errors']) == (2, 0)
+    assert stats['fail']['errors'] == 1 and stats['raise']['errors'] == 1
+    assert {row['action'] for row in manager.profiler.get_slowest(limit=3)} == {'ok', 'fail', 'raise'}
+
+
+def test_profiler_can_be_disabled_and_dumped(tmp_path):
+    profiler = ActionProfiler(enabled=False)
+    plugin = ActionPlugin()
+    profiler.instrument(plugin, 'actions')
+    
+    plugin.execute_action('ok')
+    assert profiler.get_stats() == {}
+    
+    profiler.enabled = True
+    plugin.execute_action('ok')
+    path = tmp_path / 'profile' / 'actions.json'
+    assert profiler.dump(str(path))
+    assert json.loads(path.read_text(encoding='utf-8'))['actions']['actions']['ok']['count'] == 1
+    
+    profiler.reset()
+    assert profiler.get_stats() == {}
+
+
+def test_latency_histogram_percentiles_are_within_bucket_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    
+    stats = histogram.to_dict()
+    
+    assert stats['count'] == 100 and stats['min'] == 0.001 and stats['max'] == 0.1
+    assert 0.050 <= stats['p50'] <= 0.050 * LatencyHistogram.GROWTH
+    assert 0.099 <= stats['p99'] <= 0.1
+    assert LatencyHistogram().percentile(0.5) == 0.0
@@ -0,0 +1,97 @@
+"""
+프로세스 외부 인식 플러그인 호스트 테스트 (user-004)
+
+워커는 spawn으로 시작되므로 워커에서 가져올 수 있도록 인식 플러그인을 이 모듈 최상위에 정의합니다.
+"""
+import os
+
+from core.plugin_system import PluginInfo, PluginManager, PluginType
+from plugins.recognition.base import RecognitionMethod, RecognitionPlugin, RecognitionResult
+from plugins.recognition.process_host import ProcessRecognitionHost
+
+
+class EchoRecognition(RecognitionPlugin):
+    """프레임 크기와 워커 프로세스 ID를 돌려주는 인식 플러그인"""
+    
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='echo_recognition', name='Echo', description='', version='1.0',
+                          plugin_type=PluginType.RECOGNITION)
+    
+    def initialize(self, config=None):
+        return super().initialize(config) and not (config or {}).get('fail')
+    
+    def cleanup(self):
+        super().cleanup()
+    
+    def recognize(self, context, target, timeout=None):
+        return RecognitionResult(success=True, confidence=len(context) / 100, method=RecognitionMethod.OCR,
+                                 target=target, location=(os.getpid(), len(context), 1, 1))
+
+
+def test_host_runs_recognition_in_worker_processes():
+    manager = PluginManager()
+    manager.register_plugin(EchoRecognition())
+    previous = manager.replace_plugin(ProcessRecognitionHost(EchoRecognition, workers=1))
+    
+    assert isinstance(previous, EchoRecognition)
+    assert manager.initialize_plugin('echo_recognition')
+    host = manager.get_plugin('echo_recognition')
+    try:
+        result = host.execute_action('recognize', {'context': b'x' * 42, 'target': {'type': 'text'}})
+        typed = host.recognize(b'abc', {'type': 'text'})
+    finally:
+        manager.cleanup_all()
+    
+    assert result['success'] and result['confidence'] == 0.42
+    worker_pid = result['location']['x']
+    assert worker_pid != os.getpid()
+    assert typed.success and typed.location[:2] == (worker_pid, 3)
+
+
+def test_host_reports_invalid_requests():
+    host = ProcessRecognitionHost(EchoRecognition, workers=1)
+    assert host.execute_action('recognize', {'target': {'type': 'text'}})['error'] == "Plugin not initialized"
+    
+    assert host.initialize()
+    try:
+        assert host.execute_action('recognize', {'context': b'x'})['error'] == "Recognition target not specified"
+        assert "Unsupported action" in host.execute_action('train', {})['error']
+    finally:
+        host.cleanup()
+
+
+def test_host_initialization_fails_when_worker_plugin_fails():
+    host = ProcessRecognitionHost(EchoRecognition, workers=1)
+    
+    assert not host.initialize({'fail': True})
+    assert host._executor is None
+
+
+class ScreenshotEngine:
+    """스크린샷 요청을 기록하는 자동화 플러그인"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+    
+    def execute_action(self, action_type, params=None):
+        self.calls.append((action_type, params))
+        return {'success': True, 'screenshot': self.name.encode()}
+
+
+class BarePage:
+    def screenshot(self, **options):
+        return b'page'
+
+
+def test_host_captures_through_the_bound_engine_only():
+    default = ScreenshotEngine('default')
+    bound = ScreenshotEngine('lease')
+    host = ProcessRecognitionHost(EchoRecognition, workers=1, automation_plugin=default)
+    
+    assert host._capture_frame(bound) == b'lease'
+    assert host._capture_frame(None) == b'default'
+    # 어느 임대 페이지인지 알 수 없는 페이지 객체는 기본 페이지로 대신 캡처하지 않음
+    assert host._capture_frame(BarePage()) is None
+    assert len(default.calls) == 2
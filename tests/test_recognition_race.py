@@ -0,0 +1,101 @@
+"""
+인식 전략 경쟁 테스트 (user-015)
+"""
+import threading
+
+from core.deadline import current_deadline
+from core.plugin_system import Plugin, PluginInfo, PluginManager, PluginType
+from core.workflow_manager import WorkflowManager
+
+
+class FakeRecognition(Plugin):
+    """지정한 결과를 돌려주는 인식 플러그인 (wait이면 기한이 취소될 때까지 대기)"""
+    
+    def __init__(self, plugin_id, result=None, wait=False):
+        self.plugin_id = plugin_id
+        self.result = result or {'success': True, 'confidence': 0.9, 'element': {'id': plugin_id}}
+        self.wait = wait
+        self.calls = 0
+        self.cancelled = threading.Event()
+    
+    def get_plugin_info(self):
+        return PluginInfo(id=self.plugin_id, name=self.plugin_id, description='', version='1.0',
+                          plugin_type=PluginType.RECOGNITION)
+    
+    def initialize(self, config=None):
+        return True
+    
+    def cleanup(self):
+        pass
+    
+    def execute_action(self, action_type, params=None):
+        self.calls += 1
+        if self.wait:
+            current_deadline().on_cancel(self.cancelled.set)
+            if self.cancelled.wait(5):
+                return {'success': False, 'error': '취소됨'}
+        return dict(self.result)
+
+
+def make_manager(*plugins):
+    plugin_manager = PluginManager()
+    for plugin in plugins:
+        plugin_manager.register_plugin(plugin)
+    return WorkflowManager(plugin_manager)
+
+
+def recognize(workflow_manager, **params):
+    plan = {'steps': [{'id': 'find', 'type': 'element_recognition', 'params': dict({'target': 'button'}, **params)}]}
+    workflow_id = workflow_manager.create_workflow(plan, {'workflow_plan': plan, 'ignore_recognition_errors': False})
+    result = workflow_manager.execute_workflow(workflow_id)
+    step = workflow_manager.active_workflows[workflow_id].get_step_result('find')
+    return result, step
+
+
+def test_sequential_strategies_stop_at_first_accepted_result():
+    low = FakeRecognition('selector_recognition', {'success': True, 'confidence': 0.3})
+    good = FakeRecognition('ocr_recognition')
+    unused = FakeRecognition('template_recognition')
+    manager = make_manager(low, good, unused)
+    
+    result, step = recognize(manager, strategies=['selector', 'ocr', 'template'], min_confidence=0.5)
+    
+    assert result['status'] == 'completed'
+    assert step.output['strategy_used'] == 'ocr'
+    assert (low.calls, good.calls, unused.calls) == (1, 1, 0)
+
+
+def test_race_returns_first_result_and_cancels_losers():
+    slow = FakeRecognition('slow_recognition', wait=True)
+    fast = FakeRecognition('fast_recognition')
+    manager = make_manager(slow, fast)
+    
+    result, step = recognize(manager, strategies=['slow', 'fast'], race=True)
+    
+    assert result['status'] == 'completed'
+    assert step.output['strategy_used'] == 'fast'
+    assert slow.cancelled.wait(1)
+    stats = manager.get_recognition_stats()
+    assert stats['fast']['wins'] == 1
+    assert stats.get('slow', {}).get('wins', 0) == 0
+
+
+def test_race_applies_per_strategy_confidence():
+    selector = FakeRecognition('selector_recognition', {'success': True, 'confidence': 0.6})
+    ocr = FakeRecognition('ocr_recognition', {'success': True, 'confidence': 0.7})
+    manager = make_manager(selector, ocr)
+    
+    result, step = recognize(manager, strategies=['selector', 'ocr'], race=True,
+                             min_confidence={'selector': 0.9, 'ocr': 0.5})
+    
+    assert step.output['strategy_used'] == 'ocr'
+
+
+def test_all_strategies_failing_fails_step():
+    manager = make_manager(FakeRecognition('selector_recognition', {'success': False, 'error': '없음'}),
+                           FakeRecognition('ocr_recognition', {'success': False, 'error': '없음'}))
+    
+    result, step = recognize(manager, strategies=['selector', 'ocr'], race=True)
+    
+    assert result['status'] == 'failed'
+    assert "모든 인식 전략 실패" in step.error
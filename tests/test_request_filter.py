@@ -0,0 +1,78 @@
+"""
+요청 차단 프로필 테스트 (user-024)
+"""
+import pytest
+
+from plugins.automation.request_filter import BlockingProfile, RequestFilter
+
+
+class Page:
+    pass
+
+
+def test_profile_matches_types_patterns_and_allow_list():
+    profile = BlockingProfile.from_dict('ads', {
+        'resource_types': ['image'],
+        'url_patterns': ['*ads.example.com/*', r're:https://cdn\.example\.com/track\d+\.js'],
+        'allow_patterns': ['*example.com/logo.png']
+    })
+    
+    assert profile.match('https://example.com/a.png', 'image') == 'type'
+    assert profile.match('https://ads.example.com/x.js', 'script') == 'pattern'
+    assert profile.match('https://cdn.example.com/track12.js', 'script') == 'pattern'
+    assert profile.match('https://cdn.example.com/app.js', 'script') is None
+    assert profile.match('https://example.com/logo.png', 'image') is None
+
+
+def test_documents_are_never_blocked():
+    request_filter = RequestFilter(default_profile='text_only')
+    
+    assert not request_filter.check(None, 'https://a.com', 'https://doubleclick.net/x', 'document')
+    assert request_filter.check(None, 'https://a.com', 'https://a.com/style.css', 'stylesheet')
+
+
+def test_page_profile_overrides_domain_and_default():
+    request_filter = RequestFilter(
+        profiles={'shop': {'resource_types': ['font'], 'domains': ['.Shop.com']}},
+        default_profile='lite'
+    )
+    page = Page()
+    
+    assert request_filter.profile_for(None, 'https://m.shop.com/item').name == 'shop'
+    assert request_filter.profile_for(None, 'https://notshop.com/').name == 'lite'
+    
+    request_filter.set_page_profile(page, 'none')
+    assert request_filter.profile_for(page, 'https://m.shop.com/item') is None
+    assert not request_filter.check(page, 'https://m.shop.com/item', 'https://m.shop.com/a.woff', 'font')
+    
+    request_filter.clear_page(page)
+    assert request_filter.check(page, 'https://m.shop.com/item', 'https://m.shop.com/a.woff', 'font')
+
+
+def test_no_profile_allows_everything():
+    request_filter = RequestFilter()
+    
+    assert request_filter.profile_for(None, 'https://a.com') is None
+    assert not request_filter.check(None, 'https://a.com', 'https://a.com/a.png', 'image')
+
+
+def test_unknown_profiles_raise():
+    with pytest.raises(ValueError):
+        RequestFilter(default_profile='missing')
+    with pytest.raises(ValueError):
+        RequestFilter().set_page_profile(Page(), 'missing')
+
+
+def test_stats_count_blocked_and_allowed_requests():
+    request_filter = RequestFilter(default_profile='lite')
+    request_filter.check(None, 'https://a.com', 'https://a.com/a.png', 'image')
+    request_filter.check(None, 'https://a.com', 'https://www.google-analytics.com/ga.js', 'script')
+    request_filter.check(None, 'https://a.com', 'https://a.com/app.js', 'script')
+    request_filter.record_response(2048)
+    
+    stats = request_filter.get_stats(reset=True)
+    
+    assert (stats['allowed'], stats['blocked'], stats['allowed_bytes']) == (1, 2, 2048)
+    assert stats['blocked_by_type'] == {'image': 1, 'script': 1}
+    assert stats['blocked_by_profile'] == {'lite': 2}
+    assert request_filter.get_stats()['blocked'] == 0
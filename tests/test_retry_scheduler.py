@@ -0,0 +1,96 @@
+"""
+재시도 스케줄러 테스트 (user-011)
+"""
+from concurrent.futures import CancelledError, Future
+
+import pytest
+
+from core.retry_scheduler import RetryScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RetryScheduler(seed=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_compute_delay_backs_off_and_caps(scheduler):
+    delays = [scheduler.compute_delay(attempt, 1.0, backoff=2.0, max_delay=5.0, jitter=0) for attempt in (1, 2, 3, 4)]
+    
+    assert delays == [1.0, 2.0, 4.0, 5.0]
+    for _ in range(50):
+        assert 1.8 <= scheduler.compute_delay(2, 1.0, jitter=0.1) <= 2.2
+
+
+def test_budget_is_shared_per_workflow(scheduler):
+    assert [scheduler.acquire('wf', 2, 'click') for _ in range(3)] == [True, True, False]
+    assert scheduler.acquire('other', 2, 'click')
+    assert scheduler.get_used_budget('wf') == 2
+    assert scheduler.get_stats()['step_types']['click']['budget_exhausted'] == 1
+    
+    scheduler.release('wf')
+    assert scheduler.get_used_budget('wf') == 0 and scheduler.acquire('wf', 2)
+
+
+def test_unlimited_budget(scheduler):
+    assert all(scheduler.acquire('wf', None) for _ in range(100))
+
+
+def test_call_later_runs_in_deadline_order(scheduler):
+    calls = []
+    later = scheduler.call_later(0.05, calls.append, 'later')
+    sooner = scheduler.call_later(0.01, calls.append, 'sooner')
+    
+    later.result(timeout=1)
+    sooner.result(timeout=1)
+    
+    assert calls == ['sooner', 'later']
+
+
+def test_call_later_chains_returned_future(scheduler):
+    inner = Future()
+    outer = scheduler.call_later(0, lambda: inner)
+    
+    inner.set_result('done')
+    
+    assert outer.result(timeout=1) == 'done'
+
+
+def test_cancel_removes_pending_call(scheduler):
+    calls = []
+    future = scheduler.call_later(10, calls.append, 'never')
+    
+    assert scheduler.cancel(future)
+    assert scheduler.get_stats()['pending'] == 0
+    with pytest.raises(CancelledError):
+        future.result(timeout=0)
+    assert calls == []
+
+
+def test_sleep_stops_when_workflow_is_cancelled(scheduler):
+    assert scheduler.sleep(0.01)
+    assert not scheduler.sleep(10, should_continue=lambda: False, poll_interval=0.01)
+    assert scheduler.get_stats()['pending'] == 0
+
+
+def test_record_accumulates_cost(scheduler):
+    scheduler.record('click', 0.5, 0.25, True)
+    scheduler.record('click', 1.0, 0.25, False)
+    
+    stats = scheduler.get_stats()['step_types']['click']
+    
+    assert (stats['retries'], stats['succeeded'], stats['total_time']) == (2, 1, 2.0)
+    scheduler.reset_stats()
+    assert scheduler.get_stats()['step_types'] == {}
+
+
+def test_shutdown_cancels_pending_calls():
+    scheduler = RetryScheduler()
+    future = scheduler.call_later(10, lambda: None)
+    
+    scheduler.shutdown()
+    
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        scheduler.call_later(0, lambda: None)
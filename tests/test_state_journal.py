@@ -0,0 +1,168 @@
+"""
+상태 저널 테스트 (체크포인트 롤백, 저널 압축, 실행 경로 제한과 상태 정리)
+"""
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from core.state_journal import JournaledState
+from core.workflow_manager import RetentionPolicy, StepResult, StepStatus, WorkflowContext
+
+
+class Blob:
+    """약한 참조로 해제 여부를 확인할 값"""
+
+
+# user-009: 체크포인트 롤백
+def test_rollback_restores_values_and_missing_keys():
+    state = JournaledState(a=1, b=2)
+    state['ignored'] = 0  # 첫 체크포인트 전 변경은 기록하지 않음
+    assert state.journal_size == 0
+    
+    position = state.mark()
+    state['a'] = 10
+    state['a'] = 11  # 같은 구간의 반복 변경은 한 번만 기록
+    del state['b']
+    state.update(c=3)
+    state.setdefault('d', 4)
+    assert state.journal_size == 4
+    
+    assert state.rollback(position) == 4
+    assert dict(state) == {'a': 1, 'b': 2, 'ignored': 0}
+    assert state.journal_size == 0
+
+
+def test_nested_checkpoints_roll_back_independently():
+    state = JournaledState(step=0)
+    first = state.mark()
+    state['step'] = 1
+    second = state.mark()
+    state['step'] = 2
+    state.pop('step')
+    
+    state.rollback(second)
+    assert state['step'] == 1
+    state.rollback(first)
+    assert state['step'] == 0
+    
+    with pytest.raises(ValueError):
+        state.rollback(first + 5)
+
+
+def test_copy_and_pickle_drop_journal():
+    state = JournaledState(a=1)
+    state.mark()
+    state['a'] = 2
+    restored = pickle.loads(pickle.dumps(state))
+    assert type(state.copy()) is dict
+    assert isinstance(restored, JournaledState) and dict(restored) == {'a': 2} and restored.journal_size == 0
+
+
+# user-009/user-017: 저널 압축
+def test_compact_drops_entries_before_oldest_position():
+    state = JournaledState(a=0)
+    first = state.mark()
+    state['a'] = 1
+    second = state.mark()
+    state['a'] = 2
+    
+    assert state.compact(second) == 1
+    assert state.journal_size == 1
+    with pytest.raises(ValueError):
+        state.rollback(first)
+    
+    # 압축 후에도 이후 위치는 그대로 유효
+    third = state.mark()
+    state['a'] = 3
+    state.rollback(third)
+    assert state['a'] == 2
+    state.rollback(second)
+    assert state['a'] == 1
+
+
+def test_reset_journal_stops_recording_until_next_mark():
+    state = JournaledState(a=0)
+    state.mark()
+    state['a'] = 1
+    assert state.reset_journal() == 1
+    state['a'] = 2
+    assert state.journal_size == 0
+    
+    position = state.mark()
+    assert position == 0
+    state['a'] = 3
+    state.rollback(position)
+    assert state['a'] == 2
+
+
+def make_context(max_execution_path=1000):
+    return WorkflowContext(workflow_id='wf', retention=RetentionPolicy(max_execution_path=max_execution_path))
+
+
+def complete(context, step_id, **output):
+    context.update_state(output)
+    context.set_step_result(step_id, StepResult(status=StepStatus.COMPLETED, output=output))
+
+
+def test_restore_checkpoint_rolls_back_state_results_and_later_checkpoints():
+    context = make_context()
+    complete(context, 'a', value=1)
+    context.create_checkpoint('cp1')
+    complete(context, 'b', value=2)
+    context.create_checkpoint('cp2')
+    complete(context, 'c', value=3, extra=True)
+    
+    assert context.restore_checkpoint('cp1')
+    assert dict(context.state) == {'value': 1}
+    assert context.execution_path == ['a'] and list(context.results) == ['a']
+    assert list(context.checkpoints) == ['cp1']
+    assert not context.restore_checkpoint('cp2')
+
+
+def test_trimmed_checkpoints_compact_journal():
+    context = make_context(max_execution_path=2)
+    context.create_checkpoint('cp1')
+    complete(context, 'a', value=1)
+    context.create_checkpoint('cp2')
+    complete(context, 'b', value=2)
+    assert context.state.journal_size == 2
+    
+    # cp1이 잘린 구간으로 밀려나면 cp2 이전 기록은 버림
+    complete(context, 'c', value=3)
+    assert list(context.checkpoints) == ['cp2']
+    assert context.state.journal_size == 1
+    
+    assert context.restore_checkpoint('cp2')
+    assert context.state['value'] == 1
+
+
+def test_pruned_values_are_released_when_no_checkpoint_remains():
+    context = make_context(max_execution_path=1)
+    blob = Blob()
+    ref = weakref.ref(blob)
+    
+    context.create_checkpoint('cp')
+    complete(context, 'fetch', page=blob)
+    del blob
+    context.prune_state(['page'])
+    assert ref() is not None  # 체크포인트 롤백용으로 저널에 남음
+    
+    complete(context, 'parse', count=1)
+    assert context.checkpoints == {}
+    assert context.state.journal_size == 0
+    context.results.clear()
+    gc.collect()
+    assert ref() is None
+
+
+def test_replacing_checkpoint_compacts_journal():
+    context = make_context()
+    context.create_checkpoint('retry')
+    complete(context, 'a', value=1)
+    context.create_checkpoint('retry')
+    assert context.state.journal_size == 0
+    complete(context, 'b', value=2)
+    assert context.restore_checkpoint('retry')
+    assert context.state['value'] == 1
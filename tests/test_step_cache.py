@@ -0,0 +1,155 @@
+"""
+단계 결과 캐시 테스트 (LRU/TTL 캐시, 페이지 상태 캐시 키)
+"""
+import pytest
+
+from core.plugin_system import PluginInfo, PluginManager, PluginType
+from core.step_cache import StepResultCache
+from core.workflow_manager import WorkflowManager
+from plugins.automation.base import AutomationPlugin
+
+
+class FakePlaywright(AutomationPlugin):
+    """문서 ID, DOM 변경 횟수, 뷰포트, DOM 지문을 돌려주는 Playwright 대역 (reload()로 같은 DOM 다시 로드)"""
+    
+    @classmethod
+    def get_plugin_info(cls):
+        return PluginInfo(id='playwright_automation', name='Playwright', description='', version='1.0',
+                          plugin_type=PluginType.AUTOMATION)
+    
+    def __init__(self):
+        super().__init__()
+        self.url = 'https://example.com/'
+        self.loads = 1
+        self.mutations = 0
+        self.scroll_y = 0
+        self.fingerprint_calls = []
+    
+    def initialize(self, config=None):
+        self._initialized = True
+        return True
+    
+    def cleanup(self):
+        pass
+    
+    def reload(self):
+        self.loads += 1
+    
+    def execute_action(self, action_type, params=None):
+        if action_type == 'page_fingerprint':
+            self.fingerprint_calls.append(dict(params))
+            return {'success': True, 'url': self.url, 'document_id': f"doc-{self.loads}",
+                    'mutations': self.mutations, 'viewport': [0, self.scroll_y, 1280, 720],
+                    'fingerprint': 'dom-hash' if params.get('include_dom') else None}
+        return {'success': True}
+
+
+@pytest.fixture
+def manager():
+    plugin_manager = PluginManager()
+    plugin = FakePlaywright()
+    plugin_manager.register_plugin(plugin)
+    plugin_manager.initialize_plugin('playwright_automation')
+    
+    workflow_manager = WorkflowManager(plugin_manager)
+    workflow_manager.probe_calls = 0
+    
+    def handle_probe(context, params):
+        workflow_manager.probe_calls += 1
+        return {'value': workflow_manager.probe_calls}
+    
+    workflow_manager.register_step_handler('probe', handle_probe, outputs=['value'], page_access='read',
+                                           cache_key=workflow_manager._page_cache_key)
+    workflow_manager.plugin = plugin
+    return workflow_manager
+
+
+def run(workflow_manager, params=None):
+    plan = {'steps': [{'id': 'probe', 'type': 'probe', 'params': dict(params or {'target': '#search'})}]}
+    workflow_id = workflow_manager.create_workflow(plan, {'workflow_plan': plan})
+    result = workflow_manager.execute_workflow(workflow_id)
+    assert result['status'] == 'completed'
+    workflow_manager.cleanup_workflow(workflow_id)
+
+
+# user-012: LRU/TTL 캐시
+def test_cache_evicts_least_recently_used():
+    cache = StepResultCache(max_entries=2)
+    cache.put(('a', '{}', 1), {'value': 1})
+    cache.put(('b', '{}', 1), {'value': 2})
+    assert cache.get(('a', '{}', 1)) == {'value': 1}
+    cache.put(('c', '{}', 1), {'value': 3})
+    
+    assert cache.get(('b', '{}', 1)) is None
+    assert cache.get(('a', '{}', 1)) == {'value': 1}
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_cache_expires_entries_and_returns_copies():
+    cache = StepResultCache(ttl=60.0)
+    cache.put(('a', '{}', 1), {'value': 1}, ttl=-1.0)
+    assert cache.get(('a', '{}', 1)) is None
+    assert cache.get_stats()['expirations'] == 1
+    
+    cache.put(('b', '{}', 1), {'value': 1})
+    cache.get(('b', '{}', 1))['value'] = 2
+    assert cache.get(('b', '{}', 1)) == {'value': 1}
+
+
+def test_cache_invalidates_by_step_type():
+    cache = StepResultCache()
+    cache.put(('a', '{}', 1), {'value': 1})
+    cache.put(('b', '{}', 1), {'value': 2})
+    cache.invalidate('a')
+    assert cache.get(('a', '{}', 1)) is None
+    assert cache.get(('b', '{}', 1)) == {'value': 2}
+    cache.invalidate()
+    assert cache.get_stats()['entries'] == 0
+
+
+# user-012: 페이지 상태 캐시 키
+def test_navigation_is_not_cached(manager):
+    assert 'web_navigation' not in manager.step_cache_policies
+    assert 'element_recognition' in manager.step_cache_policies
+
+
+def test_same_document_reuses_result_across_workflows(manager):
+    run(manager)
+    run(manager)
+    assert manager.probe_calls == 1
+    # DOM 지문은 요청하지 않음
+    assert manager.plugin.fingerprint_calls == [{'include_dom': False}] * 2
+
+
+def test_reload_to_identical_dom_misses_cache(manager):
+    run(manager)
+    manager.plugin.reload()
+    run(manager)
+    assert manager.probe_calls == 2
+
+
+def test_changes_within_the_same_document_miss_cache(manager):
+    run(manager)
+    manager.plugin.mutations += 3
+    run(manager)
+    manager.plugin.scroll_y = 400
+    run(manager)
+    run(manager)
+    assert manager.probe_calls == 3
+
+
+def test_dom_fingerprint_is_opt_in_per_step(manager):
+    run(manager, {'target': '#search', 'cache_dom_fingerprint': True})
+    run(manager, {'target': '#search', 'cache_dom_fingerprint': True})
+    assert manager.probe_calls == 1
+    assert manager.plugin.fingerprint_calls == [{'include_dom': True}] * 2
+
+
+def test_step_cache_setting_disables_cache(manager):
+    plan = {'steps': [{'id': 'probe', 'type': 'probe', 'params': {'target': '#search'}}]}
+    for _ in range(2):
+        workflow_id = manager.create_workflow(plan, {'workflow_plan': plan, 'step_cache': False})
+        manager.execute_workflow(workflow_id)
+        manager.cleanup_workflow(workflow_id)
+    assert manager.probe_calls == 2
+    assert manager.plugin.fingerprint_calls == []
@@ -0,0 +1,108 @@
+"""
+작업 단계 의존성 그래프 테스트 (user-006)
+"""
+import pytest
+
+from core.workflow_compiler import PlanCompileError, StepGraph
+
+STEP_OUTPUTS = {'fetch': {'data'}, 'extract': {'items'}, 'notify': set(), 'navigate': set(), 'read_page': set(),
+                'custom': None}
+PAGE_ACCESS = {'navigate': 'write', 'read_page': 'read'}
+
+
+def build(*steps):
+    return StepGraph(list(steps), STEP_OUTPUTS, PAGE_ACCESS)
+
+
+def test_independent_steps_are_ready_together():
+    graph = build({'id': 'a', 'type': 'notify'}, {'id': 'b', 'type': 'notify'})
+    
+    assert graph.dependencies == {'a': set(), 'b': set()}
+    assert graph.ready_steps(set(), set()) == ['a', 'b']
+
+
+def test_state_reference_depends_on_last_writer():
+    graph = build(
+        {'id': 'first', 'type': 'fetch'},
+        {'id': 'second', 'type': 'fetch'},
+        {'id': 'use', 'type': 'notify', 'params': {'body': {'text': '$data.title'}}}
+    )
+    
+    assert graph.dependencies['second'] == {'first'}
+    assert graph.dependencies['use'] == {'second'}
+    assert graph.ready_steps({'first'}, {'second'}) == []
+    assert graph.ready_steps({'first', 'second'}, set()) == ['use']
+
+
+def test_writer_waits_for_earlier_readers():
+    graph = build(
+        {'id': 'fetch1', 'type': 'fetch'},
+        {'id': 'reader', 'type': 'notify', 'params': {'value': '$data'}},
+        {'id': 'fetch2', 'type': 'fetch'}
+    )
+    
+    assert graph.dependencies['fetch2'] == {'fetch1', 'reader'}
+
+
+def test_unreferenced_outputs_do_not_serialize_steps():
+    graph = build({'id': 'a', 'type': 'extract'}, {'id': 'b', 'type': 'extract'})
+    
+    assert graph.dependencies['b'] == set()
+
+
+def test_explicit_dependencies_and_element_references():
+    graph = build(
+        {'id': 'find', 'type': 'notify'},
+        {'id': 'other', 'type': 'notify'},
+        {'id': 'click', 'type': 'notify', 'depends_on': 'other', 'params': {'element_from_step': 'find'}}
+    )
+    
+    assert graph.dependencies['click'] == {'find', 'other'}
+
+
+def test_loop_body_references_exclude_loop_variables():
+    graph = build(
+        {'id': 'fetch', 'type': 'fetch'},
+        {'id': 'loop', 'type': 'notify', 'params': {'items': [], 'as': 'row'},
+         'steps': [{'id': 'inner', 'type': 'notify', 'params': {'a': '$row.name', 'b': '$data'}}]}
+    )
+    
+    assert graph.dependencies['loop'] == {'fetch'}
+
+
+def test_unknown_outputs_act_as_barrier():
+    graph = build(
+        {'id': 'fetch', 'type': 'fetch'},
+        {'id': 'reader', 'type': 'notify', 'params': {'value': '$data'}},
+        {'id': 'opaque', 'type': 'custom'},
+        {'id': 'after', 'type': 'notify', 'params': {'value': '$data'}},
+        {'id': 'unrelated', 'type': 'notify'}
+    )
+    
+    assert graph.dependencies['opaque'] == {'fetch', 'reader'}
+    assert graph.dependencies['after'] == {'opaque'}
+    assert graph.dependencies['unrelated'] == set()
+
+
+def test_page_access_orders_steps_per_page():
+    graph = build(
+        {'id': 'go', 'type': 'navigate'},
+        {'id': 'read1', 'type': 'read_page'},
+        {'id': 'read2', 'type': 'read_page'},
+        {'id': 'other_tab', 'type': 'navigate', 'params': {'page': 'second'}},
+        {'id': 'go_again', 'type': 'navigate'}
+    )
+    
+    assert graph.dependencies['read1'] == {'go'}
+    assert graph.dependencies['read2'] == {'go'}
+    assert graph.dependencies['other_tab'] == set()
+    assert graph.dependencies['go_again'] == {'go', 'read1', 'read2'}
+
+
+def test_cycle_and_unknown_dependency_raise():
+    with pytest.raises(PlanCompileError, match="순환 의존성"):
+        build({'id': 'a', 'type': 'notify', 'depends_on': 'b'}, {'id': 'b', 'type': 'notify', 'depends_on': 'a'})
+    with pytest.raises(PlanCompileError, match="알 수 없는 의존 단계"):
+        build({'id': 'a', 'type': 'notify', 'depends_on': 'missing'})
+    with pytest.raises(PlanCompileError, match="중복된 단계 ID"):
+        build({'id': 'a', 'type': 'notify'}, {'id': 'a', 'type': 'notify'})
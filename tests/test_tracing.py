@@ -0,0 +1,74 @@
+"""
+작업 흐름 추적 테스트 (user-013)
+"""
+import json
+import threading
+
+import pytest
+
+from core import tracing
+
+
+def test_spans_are_noops_without_trace():
+    with tracing.span('idle') as span:
+        assert span is None
+    assert not tracing.is_tracing()
+
+
+def test_spans_nest_and_record_errors():
+    with tracing.trace('wf-1', workflow_id='wf-1') as active:
+        root = tracing.current_span()
+        with tracing.span('step', 'step', step_id='s1') as step:
+            with pytest.raises(ValueError):
+                with tracing.span('action', 'action'):
+                    raise ValueError("boom")
+    
+    names = {span.name: span for span in active.spans}
+    assert names['step'].parent_id == root.span_id
+    assert names['action'].parent_id == step.span_id
+    assert names['action'].status == 'error' and names['action'].attributes['error'] == 'boom'
+    assert names['wf-1'].attributes == {'workflow_id': 'wf-1'}
+    assert all(span.end_time is not None for span in active.spans)
+    assert not tracing.is_tracing() and tracing.current_span() is None
+
+
+def test_bind_carries_context_to_other_threads():
+    with tracing.trace('wf') as active:
+        parent = tracing.current_span()
+        
+        def work():
+            with tracing.span('worker', 'action'):
+                pass
+        
+        thread = threading.Thread(target=tracing.bind(work), name='helper')
+        thread.start()
+        thread.join()
+    
+    worker = next(span for span in active.spans if span.name == 'worker')
+    assert worker.parent_id == parent.span_id and worker.thread_name == 'helper'
+
+
+def test_exports_and_summary(tmp_path):
+    with tracing.trace('wf') as active:
+        for _ in range(2):
+            with tracing.span('click', 'action'):
+                pass
+    
+    chrome_path = tmp_path / 'trace.json'
+    jsonl_path = tmp_path / 'spans.jsonl'
+    active.export_chrome(str(chrome_path))
+    active.export_jsonl(str(jsonl_path))
+    
+    events = json.loads(chrome_path.read_text(encoding='utf-8'))['traceEvents']
+    assert sorted(event['name'] for event in events if event['ph'] == 'X') == ['click', 'click', 'wf']
+    assert {event['name'] for event in events if event['ph'] == 'M'} == {'process_name', 'thread_name'}
+    assert len(jsonl_path.read_text(encoding='utf-8').splitlines()) == 3
+    
+    summary = {(entry['category'], entry['name']): entry for entry in active.summary()}
+    assert summary[('action', 'click')]['count'] == 2
+
+
+def test_scalar_attributes_skip_containers_and_truncate():
+    attributes = tracing.scalar_attributes({'a': 'x' * 5, 'b': 1, 'c': None, 'd': {'nested': 1}}, max_length=3)
+    
+    assert attributes == {'a': 'xxx...', 'b': 1, 'c': None}
@@ -0,0 +1,150 @@
+"""
+작업 계획 컴파일러 테스트 (user-008)
+"""
+import pytest
+
+from core.workflow_compiler import ParamTemplate, PlanCompileError, WorkflowCompiler
+
+
+def handler(context, step):
+    return {}
+
+
+def make_compiler(**kwargs):
+    handlers = {'fetch': handler, 'notify': handler}
+    return WorkflowCompiler(handlers, {'fetch': {'data'}, 'notify': set()}, {}, **kwargs)
+
+
+def test_param_template_resolves_references():
+    template = ParamTemplate({
+        'url': '$site.url',
+        'options': {'retries': 3, 'label': '$label'},
+        'rows': [{'name': '$user.name'}, 'literal', '$not_resolved_in_lists'],
+        'fixed': 'plain'
+    })
+    state = {'site': {'url': 'https://example.com'}, 'label': 'L', 'user': {'name': 'kim'}}
+    
+    resolved = template.resolve(state)
+    
+    assert template.references == {'site', 'label', 'user'}
+    assert resolved == {
+        'url': 'https://example.com',
+        'options': {'retries': 3, 'label': 'L'},
+        'rows': [{'name': 'kim'}, 'literal', '$not_resolved_in_lists'],
+        'fixed': 'plain'
+    }
+
+
+def test_param_template_reports_missing_references():
+    missing = []
+    template = ParamTemplate({'a': '$absent', 'b': '$site.url.deeper'})
+    
+    resolved = template.resolve({'site': {'url': 'x'}}, on_missing=missing.append)
+    
+    assert resolved == {'a': '$absent', 'b': '$site.url.deeper'}
+    assert missing == ['$absent', '$site.url.deeper']
+
+
+def test_param_template_copies_static_subtrees():
+    options = {'headers': {'accept': 'json'}}
+    rows = [{'name': 'fixed'}, ['nested']]
+    template = ParamTemplate({'options': options, 'rows': rows, 'items': [{'id': '$v'}, ['x']], 'value': '$v'})
+    
+    first = template.resolve({'v': 1})
+    first['options']['headers']['accept'] = 'xml'
+    first['rows'][1].append('changed')
+    first['items'][1].append('changed')
+    second = template.resolve({'v': 2})
+    
+    assert template.is_static is False and ParamTemplate({'options': options}).is_static
+    assert second['options'] == {'headers': {'accept': 'json'}} and options['headers']['accept'] == 'json'
+    assert second['rows'] == [{'name': 'fixed'}, ['nested']] and second['items'] == [{'id': 2}, ['x']]
+    assert isinstance(second['rows'], list) and (first['value'], second['value']) == (1, 2)
+
+
+def test_handler_mutations_do_not_leak_into_cached_plans():
+    compiler = make_compiler()
+    plan = {'steps': [{'id': 'a', 'type': 'fetch', 'params': {'opts': {'n': 1}, 'tags': ['t']}}]}
+    
+    step = compiler.compile(plan).step_map['a']
+    params = step.params.resolve({})
+    params['opts']['n'] += 1
+    params['tags'].append('u')
+    again = compiler.compile(plan).step_map['a']
+    
+    assert again.params.resolve({}) == {'opts': {'n': 1}, 'tags': ['t']}
+    assert again.get('params')['opts']['n'] == 1
+    with pytest.raises(TypeError):
+        again.raw['params']['opts']['n'] = 5
+
+
+def test_compile_caches_by_plan_content():
+    compiler = make_compiler()
+    plan = {'id': 'one', 'steps': [{'id': 's1', 'type': 'fetch'}]}
+    
+    first = compiler.compile(plan)
+    second = compiler.compile(dict(plan, id='two', description='메타데이터만 다름'))
+    plan['steps'][0]['type'] = 'notify'
+    third = compiler.compile(plan)
+    
+    assert first is second
+    assert first.step_map['s1'].type == 'fetch' and third.step_map['s1'].type == 'notify'
+    assert compiler.get_stats() == {'cached_plans': 2, 'hits': 1, 'misses': 2}
+    
+    compiler.invalidate()
+    assert compiler.get_stats()['cached_plans'] == 0
+
+
+def test_compile_evicts_least_recently_used_plan():
+    compiler = make_compiler(cache_size=1)
+    
+    compiler.compile({'steps': [{'id': 'a', 'type': 'fetch'}]})
+    compiler.compile({'steps': [{'id': 'b', 'type': 'fetch'}]})
+    compiler.compile({'steps': [{'id': 'a', 'type': 'fetch'}]})
+    
+    assert compiler.get_stats() == {'cached_plans': 1, 'hits': 0, 'misses': 3}
+
+
+def test_compile_reports_all_errors_at_once():
+    compiler = make_compiler()
+    plan = {'steps': [
+        {'id': 'a', 'type': 'unknown'},
+        {'type': 'fetch'},
+        {'id': 'b', 'type': 'fetch', 'timeout': -1, 'params': {'element_from_step': 'ghost'}},
+        {'id': 'c', 'type': 'fetch', 'recovery_strategies': [{'type': 'retry', 'delay': 'soon'}]}
+    ]}
+    
+    with pytest.raises(PlanCompileError) as excinfo:
+        compiler.compile(plan)
+    
+    message = str(excinfo.value)
+    assert "처리할 수 없는 단계 유형: unknown" in message
+    assert "steps[1]: 단계 ID가 없음" in message
+    assert "잘못된 단계 기한: -1" in message
+    assert "잘못된 재시도 설정: delay" in message
+    assert "b: 알 수 없는 단계 참조: ghost" in message
+
+
+def test_compile_builds_graph_and_state_readers():
+    compiler = make_compiler()
+    compiled = compiler.compile({'steps': [
+        {'id': 'load', 'type': 'fetch'},
+        {'id': 'send', 'type': 'notify', 'params': {'body': '$data'},
+         'recovery_strategies': [{'type': 'alternative', 'step': {'type': 'notify', 'params': {'x': '$extra'}}}]}
+    ]})
+    
+    assert compiled.graph.dependencies['send'] == {'load'}
+    assert compiled.graph_error is None
+    assert dict(compiled.state_readers) == {'data': {'send'}, 'extra': {'send'}}
+    assert compiled.step_map['send'].recovery_strategies[0].step.id == 'send_alt'
+
+
+def test_graph_errors_only_fail_dag_plans():
+    compiler = make_compiler()
+    steps = [{'id': 'a', 'type': 'notify', 'depends_on': 'b'}, {'id': 'b', 'type': 'notify', 'depends_on': 'a'}]
+    
+    compiled = compiler.compile({'steps': steps})
+    
+    assert compiled.graph is None and "순환 의존성" in compiled.graph_error
+    with pytest.raises(PlanCompileError, match="순환 의존성"):
+        compiler.compile({'steps': steps, 'execution_mode': 'dag'})
@@ -0,0 +1,84 @@
+"""
+작업 흐름 이벤트 버스 테스트 (user-016)
+"""
+import threading
+
+import pytest
+
+from core.plugin_system import PluginManager
+from core.workflow_manager import WorkflowEventBus, WorkflowEventType, WorkflowManager
+
+
+def test_subscription_filters_by_workflow_and_type():
+    bus = WorkflowEventBus()
+    everything = bus.subscribe()
+    steps = bus.subscribe(workflow_id='wf-1', event_types=[WorkflowEventType.STEP_COMPLETED])
+    
+    bus.publish(WorkflowEventType.STEP_COMPLETED, 'wf-1', step_id='a')
+    bus.publish(WorkflowEventType.STEP_COMPLETED, 'wf-2', step_id='b')
+    bus.publish(WorkflowEventType.STATUS_CHANGED, 'wf-1', status='running')
+    
+    assert [event.seq for event in everything.drain(timeout=0)] == [1, 2, 3]
+    events = steps.drain(timeout=0)
+    assert [(event.workflow_id, event.data) for event in events] == [('wf-1', {'step_id': 'a'})]
+
+
+def test_publish_without_subscribers_creates_no_events():
+    bus = WorkflowEventBus()
+    bus.publish(WorkflowEventType.STATUS_CHANGED, 'wf')
+    
+    assert not bus.active and bus.get_stats()['published'] == 0
+
+
+@pytest.mark.parametrize('overflow, expected', [('drop_oldest', [2, 3]), ('drop_newest', [1, 2])])
+def test_overflow_policies_drop_events(overflow, expected):
+    bus = WorkflowEventBus()
+    subscription = bus.subscribe(maxsize=2, overflow=overflow)
+    for index in (1, 2, 3):
+        bus.publish(WorkflowEventType.STEP_STARTED, 'wf', index=index)
+    
+    assert [event.data['index'] for event in subscription.drain(timeout=0)] == expected
+    assert subscription.dropped == 1
+
+
+def test_block_policy_waits_for_consumer():
+    bus = WorkflowEventBus()
+    subscription = bus.subscribe(maxsize=1, overflow='block', block_timeout=2)
+    bus.publish(WorkflowEventType.STEP_STARTED, 'wf', index=1)
+    
+    publisher = threading.Thread(target=bus.publish, args=(WorkflowEventType.STEP_STARTED, 'wf'), kwargs={'index': 2})
+    publisher.start()
+    first = subscription.get(timeout=1)
+    second = subscription.get(timeout=1)
+    publisher.join()
+    
+    assert (first.data['index'], second.data['index']) == (1, 2) and subscription.dropped == 0
+
+
+def test_close_wakes_consumer_and_unsubscribes():
+    bus = WorkflowEventBus()
+    subscription = bus.subscribe()
+    threading.Timer(0.02, subscription.close).start()
+    
+    assert subscription.get(timeout=1) is None
+    assert subscription.closed and not bus.active
+
+
+def test_workflow_run_publishes_lifecycle_events():
+    manager = WorkflowManager(PluginManager())
+    manager.register_step_handler('probe', lambda context, params: {'value': 1}, outputs=['value'])
+    subscription = manager.events.subscribe()
+    plan = {'steps': [{'id': 'probe', 'type': 'probe', 'params': {}}]}
+    
+    workflow_id = manager.create_workflow(plan, {'workflow_plan': plan})
+    manager.execute_workflow(workflow_id)
+    
+    events = subscription.drain(timeout=0)
+    types = [event.type for event in events]
+    assert types[0] == WorkflowEventType.WORKFLOW_CREATED
+    assert WorkflowEventType.STEP_STARTED in types
+    assert types.index(WorkflowEventType.STEP_STARTED) < types.index(WorkflowEventType.STEP_COMPLETED)
+    assert types[-1] == WorkflowEventType.WORKFLOW_FINISHED
+    assert all(event.workflow_id == workflow_id for event in events)
+    completed = next(event for event in events if event.type == WorkflowEventType.STEP_COMPLETED)
+    assert completed.data['step_id'] == 'probe' and completed.data['completed_steps'] == 1
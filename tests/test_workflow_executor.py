@@ -0,0 +1,165 @@
+"""
+작업 흐름 실행기 테스트 (완료 작업 정리, 결과 보관, 페이지 임대 반납, 그룹 공정 스케줄링)
+"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core.workflow_executor import WorkflowExecutor
+
+BROWSER_PLAN = {'id': 'search', 'steps': [{'id': 'open', 'type': 'web_navigation', 'params': {}}]}
+
+
+class FakePlaywright:
+    """페이지 임대/반납을 기록하는 플러그인"""
+    
+    def __init__(self, fail_release=False):
+        self.fail_release = fail_release
+        self.calls = []
+    
+    def get_plugin_info(self):
+        return SimpleNamespace(id='playwright_automation')
+    
+    def execute_action(self, action_type, params=None):
+        self.calls.append((action_type, params['lease_id']))
+        if action_type == 'release_page' and self.fail_release:
+            raise RuntimeError("release failed")
+        return {'success': True, 'lease_id': params['lease_id']}
+
+
+class FakeWorkflowManager:
+    """작업 흐름 생성/실행/정리를 기록하는 관리자 (gate가 있으면 실행 전 대기)"""
+    
+    step_page_access = {'web_navigation'}
+    
+    def __init__(self, plugin=None, gate=None):
+        self.plugin = plugin or FakePlaywright()
+        self.plugin_manager = SimpleNamespace(get_plugin=lambda plugin_id: self.plugin,
+                                              initialized_plugins={'playwright_automation'})
+        self.gate = gate
+        self.active_workflows = {}
+        self.executed = []
+        self.cleaned = []
+    
+    def create_workflow(self, plan, settings):
+        self.active_workflows[plan['id']] = SimpleNamespace(settings=settings, page_lease=None)
+    
+    def execute_workflow(self, workflow_id):
+        if self.gate is not None:
+            self.gate.wait(5.0)
+        self.executed.append(workflow_id)
+        return {'status': 'completed', 'workflow_id': workflow_id}
+    
+    def cleanup_workflow(self, workflow_id):
+        self.cleaned.append(workflow_id)
+        self.active_workflows.pop(workflow_id, None)
+    
+    def cancel_workflow(self, workflow_id):
+        return False
+
+
+@pytest.fixture
+def make_executor():
+    executors = []
+    
+    def create(manager, **kwargs):
+        executor = WorkflowExecutor(manager, **kwargs)
+        executors.append(executor)
+        return executor
+    
+    yield create
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_pending=True)
+
+
+# user-007: 완료된 작업은 작업 목록에서 제거되고 결과는 제한된 수만 보관
+def test_finished_jobs_are_evicted_and_results_kept_in_bounded_lru(make_executor):
+    manager = FakeWorkflowManager()
+    executor = make_executor(manager, max_concurrent=1, max_finished=2)
+    
+    ids = [executor.submit({'steps': []}) for _ in range(3)]
+    for workflow_id in ids:
+        assert executor.wait(workflow_id, timeout=5.0)['status'] == 'completed'
+    
+    assert executor._jobs == {}
+    assert executor.get_future(ids[0]) is None
+    assert executor.get_future(ids[2]).result()['workflow_id'] == ids[2]
+    with pytest.raises(KeyError):
+        executor.wait(ids[0])
+    
+    stats = executor.get_stats()
+    assert (stats['completed'], stats['finished_retained'], stats['running']) == (3, 2, 0)
+
+
+def test_finished_workflow_id_can_be_resubmitted(make_executor):
+    manager = FakeWorkflowManager()
+    executor = make_executor(manager)
+    
+    first = executor.submit(BROWSER_PLAN)
+    executor.wait(first, timeout=5.0)
+    second = executor.submit(BROWSER_PLAN)
+    executor.wait(second, timeout=5.0)
+    
+    assert first == second == 'search'
+    assert manager.executed == ['search', 'search']
+    assert manager.plugin.calls == [('acquire_page', 'search'), ('release_page', 'search')] * 2
+
+
+def test_concurrent_duplicate_workflow_id_gets_new_id(make_executor):
+    gate = threading.Event()
+    executor = make_executor(FakeWorkflowManager(gate=gate))
+    
+    first = executor.submit(BROWSER_PLAN)
+    second = executor.submit(BROWSER_PLAN)
+    gate.set()
+    
+    assert first == 'search'
+    assert second.startswith('search-')
+    assert executor.wait(second, timeout=5.0)['workflow_id'] == second
+
+
+def test_release_failure_still_cleans_up_and_frees_slot(make_executor):
+    manager = FakeWorkflowManager(plugin=FakePlaywright(fail_release=True))
+    executor = make_executor(manager, max_concurrent=1)
+    
+    first = executor.submit(BROWSER_PLAN)
+    second = executor.submit(dict(BROWSER_PLAN, id='other'))
+    
+    assert executor.wait(first, timeout=5.0)['status'] == 'completed'
+    assert executor.wait(second, timeout=5.0)['status'] == 'completed'
+    assert manager.cleaned == ['search', 'other']
+    assert manager.active_workflows == {}
+    assert executor.get_stats()['running'] == 0
+
+
+def test_queued_job_cancel_keeps_cancelled_future(make_executor):
+    gate = threading.Event()
+    manager = FakeWorkflowManager(gate=gate)
+    executor = make_executor(manager, max_concurrent=1)
+    
+    running = executor.submit({'steps': []})
+    queued = executor.submit({'steps': []})
+    assert executor.cancel(queued)
+    gate.set()
+    
+    executor.wait(running, timeout=5.0)
+    assert executor.get_future(queued).cancelled()
+    assert queued in manager.cleaned
+    assert executor._jobs == {}
+
+
+def test_groups_are_scheduled_round_robin(make_executor):
+    gate = threading.Event()
+    manager = FakeWorkflowManager(gate=gate)
+    executor = make_executor(manager, max_concurrent=1)
+    
+    blocker = executor.submit({'id': 'blocker', 'steps': []}, group='a')
+    ids = [executor.submit({'id': f"a{i}", 'steps': []}, group='a') for i in range(2)]
+    ids += [executor.submit({'id': 'b0', 'steps': []}, group='b')]
+    gate.set()
+    for workflow_id in [blocker] + ids:
+        executor.wait(workflow_id, timeout=5.0)
+    
+    # 먼저 제출된 a1보다 b0이 먼저 실행
+    assert manager.executed == ['blocker', 'a0', 'b0', 'a1']
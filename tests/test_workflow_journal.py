@@ -0,0 +1,185 @@
+"""
+작업 흐름 저널 테스트 (쓰기 스레드 직렬화, fsync 시점, 단계 출력 기록과 재개)
+"""
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from core.plugin_system import PluginManager
+from core.workflow_journal import WorkflowJournal
+from core.workflow_manager import WorkflowManager
+
+
+class ThreadRecorder:
+    """직렬화된 스레드를 기록하는 값"""
+    
+    def __init__(self):
+        self.threads = []
+    
+    def to_json(self):
+        self.threads.append(threading.current_thread().name)
+        return 'recorded'
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journals = []
+    
+    def create(**kwargs):
+        kwargs.setdefault('flush_interval', 60.0)
+        instance = WorkflowJournal(str(tmp_path / 'journal'), **kwargs)
+        journals.append(instance)
+        return instance
+    
+    yield create
+    for instance in journals:
+        instance.close()
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(os, 'fsync', lambda fd: calls.append(fd))
+    return calls
+
+
+def read_events(journal, workflow_id):
+    path = journal._get_path(workflow_id)
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def wait_for(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < end:
+        time.sleep(0.01)
+    return predicate()
+
+
+# user-010: 직렬화는 쓰기 스레드에서
+def test_events_are_serialized_on_writer_thread(journal):
+    instance = journal(flush_interval=0.01)
+    value = ThreadRecorder()
+    instance.record('wf', 'state', updates={'value': value})
+    
+    assert wait_for(lambda: value.threads)
+    assert value.threads == ['workflow-journal']
+    assert wait_for(lambda: os.path.exists(instance._get_path('wf')))
+
+
+def test_fsync_only_on_sync_events_and_complete(journal, fsyncs):
+    instance = journal()
+    instance.record('wf', 'state', updates={'a': 1})
+    instance.record('wf', 'step', step_id='a', status='completed', output={}, state_keys=['a'])
+    instance.flush()
+    assert fsyncs == []
+    
+    instance.record('wf', 'checkpoint', checkpoint_id='a')
+    instance.flush()
+    assert len(fsyncs) == 1
+    
+    # 실패로 끝난 저널은 재개용으로 남기고 fsync
+    instance.complete('wf', completed=False)
+    instance.flush()
+    assert len(fsyncs) == 2
+    assert [event['seq'] for event in read_events(instance, 'wf')] == [1, 2, 3]
+
+
+def test_fsync_can_be_disabled(journal, fsyncs):
+    instance = journal(fsync=False)
+    instance.record('wf', 'status', status='completed')
+    instance.complete('wf', completed=False)
+    instance.flush()
+    assert fsyncs == []
+
+
+def test_begin_and_complete_do_not_write_on_caller_thread(journal):
+    instance = journal()
+    instance.record('wf', 'created', workflow_id='wf')
+    instance.flush()
+    path = instance._get_path('wf')
+    
+    # 쓰기 잠금을 잡아 쓰기 스레드가 끼어들지 못하게 하고 호출 스레드에서 파일이 바뀌지 않는지 확인
+    with instance._write_lock:
+        instance.begin('wf')
+        instance.record('wf', 'created', workflow_id='wf', run=2)
+        assert read_events(instance, 'wf')[0].get('run') is None
+    instance.flush()
+    assert [event.get('run') for event in read_events(instance, 'wf')] == [2]
+    
+    with instance._write_lock:
+        instance.complete('wf', completed=True)
+        assert os.path.exists(path)
+    instance.flush()
+    assert not os.path.exists(path)
+
+
+class FailingValue:
+    def to_json(self):
+        raise RuntimeError('dictionary changed size during iteration')
+
+
+def test_recorded_values_are_snapshotted_and_bad_events_skipped(journal):
+    instance = journal()
+    rows = [1, 2]
+    updates = {'rows': rows, 'meta': {'page': 1}}
+    
+    instance.record('wf', 'state', updates=updates)
+    rows.append(3)
+    updates['meta']['page'] = 2
+    updates['extra'] = True
+    instance.record('wf', 'state', updates={'bad': FailingValue()})
+    instance.record('wf', 'checkpoint', checkpoint_id='cp')
+    instance.flush()
+    
+    events = read_events(instance, 'wf')
+    assert [event['type'] for event in events] == ['state', 'checkpoint']
+    assert events[0]['updates'] == {'rows': [1, 2], 'meta': {'page': 1}}
+
+
+def test_completed_journal_is_kept_when_retained(journal):
+    instance = journal(retain_completed=True)
+    instance.record('wf', 'status', status='completed')
+    instance.complete('wf', completed=True)
+    instance.flush()
+    assert [event['type'] for event in read_events(instance, 'wf')] == ['status']
+
+
+# user-010: 단계 출력은 한 번만 기록하고 재개 시 상태에서 복원
+def test_step_output_is_written_once_and_replayed(journal):
+    instance = journal()
+    manager = WorkflowManager(PluginManager(), journal=instance)
+    attempts = []
+    
+    def fetch(context, params):
+        return {'html': '<html>' + 'x' * 1000 + '</html>'}
+    
+    def parse(context, params):
+        attempts.append(len(context.state['html']))
+        if len(attempts) == 1:
+            raise RuntimeError("parse failed")
+        return {'count': 1}
+    
+    manager.register_step_handler('fetch', fetch, outputs=['html'])
+    manager.register_step_handler('parse', parse, outputs=['count'])
+    plan = {'id': 'wf', 'steps': [{'id': 'fetch', 'type': 'fetch', 'params': {}},
+                                  {'id': 'parse', 'type': 'parse', 'params': {}}]}
+    workflow_id = manager.create_workflow(plan, {'workflow_plan': plan})
+    assert manager.execute_workflow(workflow_id)['status'] == 'failed'
+    manager.cleanup_workflow(workflow_id)
+    
+    instance.flush()
+    with open(instance._get_path('wf'), encoding='utf-8') as f:
+        assert f.read().count('x' * 1000) == 1
+    step = next(event for event in read_events(instance, 'wf') if event['type'] == 'step')
+    assert step['output'] == {} and step['state_keys'] == ['html']
+    
+    result = manager.resume_workflow_from_journal('wf')
+    assert result['status'] == 'completed'
+    assert attempts == [1013, 1013]
+    context = manager.active_workflows['wf']
+    assert context.get_step_result('fetch').output['html'] == '<html>' + 'x' * 1000 + '</html>'
+    manager.cleanup_workflow('wf')
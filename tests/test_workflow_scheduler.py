@@ -0,0 +1,161 @@
+"""
+작업 흐름 스케줄러 테스트 (cron 해석, 대기열 저장/복원, 시작 전 대기)
+"""
+import itertools
+from concurrent.futures import Future
+from datetime import datetime
+
+import pytest
+
+from core.workflow_scheduler import CronTrigger, IntervalTrigger, WorkflowScheduler, trigger_from_dict
+
+PLAN = {'steps': [{'id': 'fetch', 'type': 'web_navigation', 'params': {'url': 'https://example.com'}}]}
+
+
+class FakeExecutor:
+    """제출된 작업을 완료하지 않고 보관하는 실행기"""
+    
+    def __init__(self, max_concurrent=4):
+        self.max_concurrent = max_concurrent
+        self.submitted = []
+        self.futures = {}
+        self._ids = itertools.count(1)
+    
+    def submit(self, workflow_plan, settings=None, group='default'):
+        workflow_id = f"wf-{next(self._ids)}"
+        self.submitted.append((workflow_id, workflow_plan, group))
+        self.futures[workflow_id] = Future()
+        return workflow_id
+    
+    def get_future(self, workflow_id):
+        return self.futures[workflow_id]
+    
+    def complete(self, workflow_id, status='completed'):
+        self.futures[workflow_id].set_result({'status': status})
+
+
+def local_ts(*args):
+    return datetime(*args).timestamp()
+
+
+# user-019: cron 식 해석
+def test_cron_parses_ranges_lists_and_steps():
+    trigger = CronTrigger('*/15 9-17 1,15 * 1-5')
+    assert trigger.minutes == frozenset({0, 15, 30, 45})
+    assert trigger.hours == frozenset(range(9, 18))
+    assert trigger.days == frozenset({1, 15})
+    assert trigger.months == frozenset(range(1, 13))
+    assert trigger.weekdays == frozenset({1, 2, 3, 4, 5})
+    
+    # 7도 일요일
+    assert CronTrigger('0 0 * * 7').weekdays == frozenset({0})
+
+
+@pytest.mark.parametrize('expression', ['* * * *', '60 * * * *', '* 24 * * *', '5-1 * * * *', '*/0 * * * *', 'a * * * *'])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronTrigger(expression)
+
+
+def test_cron_next_fire():
+    # 2026-10-16은 금요일
+    trigger = CronTrigger('30 9 * * 1-5')
+    assert trigger.next_fire(local_ts(2026, 10, 16, 9, 0)) == local_ts(2026, 10, 16, 9, 30)
+    # 실행 시각 자체는 포함하지 않고, 주말은 건너뜀
+    assert trigger.next_fire(local_ts(2026, 10, 16, 9, 30)) == local_ts(2026, 10, 19, 9, 30)
+    
+    # 월 경계
+    assert CronTrigger('0 0 1 * *').next_fire(local_ts(2026, 12, 31, 12, 0)) == local_ts(2027, 1, 1, 0, 0)
+
+
+def test_cron_day_and_weekday_match_either():
+    # 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (13일 또는 금요일)
+    trigger = CronTrigger('0 12 13 * 5')
+    assert trigger.next_fire(local_ts(2026, 10, 10, 0, 0)) == local_ts(2026, 10, 13, 12, 0)
+    assert trigger.next_fire(local_ts(2026, 10, 13, 12, 0)) == local_ts(2026, 10, 16, 12, 0)
+
+
+def test_cron_without_fire_time_raises():
+    with pytest.raises(ValueError):
+        CronTrigger('0 0 30 2 *').next_fire(local_ts(2026, 1, 1))
+
+
+def test_interval_trigger_skips_missed_runs():
+    trigger = IntervalTrigger(60, anchor=1000.0)
+    assert trigger.next_fire(900.0) == 1000.0
+    assert trigger.next_fire(1000.0) == 1060.0
+    assert trigger.next_fire(1500.0) == 1500.0 + 40.0
+    
+    with pytest.raises(ValueError):
+        IntervalTrigger(0)
+
+
+def test_triggers_round_trip_through_dict():
+    cron = trigger_from_dict(CronTrigger('*/5 * * * *').to_dict())
+    assert isinstance(cron, CronTrigger) and cron.expression == '*/5 * * * *'
+    interval = trigger_from_dict(IntervalTrigger(30, anchor=5.0).to_dict())
+    assert (interval.seconds, interval.anchor) == (30.0, 5.0)
+    assert trigger_from_dict(None) is None
+
+
+# user-019: 대기열 저장/복원
+def test_runs_wait_until_start(tmp_path):
+    executor = FakeExecutor()
+    scheduler = WorkflowScheduler(executor, state_file=str(tmp_path / 'state.json'))
+    try:
+        scheduler.enqueue(PLAN, key='fetch')
+        assert executor.submitted == []
+        assert scheduler.get_stats()['queued'] == 1
+        
+        scheduler.start()
+        assert [group for _, _, group in executor.submitted] == ['default']
+        assert scheduler.get_stats()['running'] == 1
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_pending_and_running_runs_survive_restart(tmp_path):
+    state_file = str(tmp_path / 'state.json')
+    executor = FakeExecutor(max_concurrent=1)
+    scheduler = WorkflowScheduler(executor, state_file=state_file)
+    scheduler.add_schedule('rates', PLAN, trigger=CronTrigger('0 9 * * *'), priority=5)
+    scheduler.start()
+    scheduler.run_now('rates')
+    scheduler.enqueue(PLAN, key='notices')
+    assert len(executor.submitted) == 1
+    
+    # 실행 중이던 요청도 대기 요청으로 저장
+    scheduler.shutdown(wait=False)
+    
+    restarted_executor = FakeExecutor(max_concurrent=1)
+    restarted = WorkflowScheduler(restarted_executor, state_file=state_file)
+    try:
+        schedules = restarted.list_schedules()
+        assert [(s['name'], s['priority'], s['trigger']) for s in schedules] == \
+            [('rates', 5, {'type': 'cron', 'expression': '0 9 * * *'})]
+        assert restarted.get_stats()['queued'] == 2
+        assert restarted_executor.submitted == []
+        
+        # 우선순위가 높은 일정 요청부터 실행
+        restarted.start()
+        assert len(restarted_executor.submitted) == 1
+        restarted_executor.complete('wf-1')
+        assert restarted.wait_idle(timeout=0) is False
+        assert len(restarted_executor.submitted) == 2
+        restarted_executor.complete('wf-2')
+        assert restarted.wait_idle(timeout=1.0)
+        assert [entry['key'] for entry in restarted.get_history()] == ['rates', 'notices']
+    finally:
+        restarted.shutdown(wait=False)
+
+
+def test_pending_runs_for_same_key_are_coalesced(tmp_path):
+    executor = FakeExecutor()
+    scheduler = WorkflowScheduler(executor, state_file=str(tmp_path / 'state.json'))
+    try:
+        first = scheduler.enqueue(PLAN, key='fetch')
+        second = scheduler.enqueue(PLAN, key='fetch')
+        assert first == second
+        assert scheduler.get_stats()['coalesced'] == 1
+    finally:
+        scheduler.shutdown(wait=False)